@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
+from action_layer.runtime_async import AsyncActionLayerServer, serve
 from action_layer.services import (
     ActionRuntimeExecutionService,
     AgentProfileLoader,
@@ -12,10 +14,16 @@ from action_layer.services import (
     LLMConfigurationError,
     LLMRoutingConfig,
     RoutedLLMExecutor,
+    build_llm_response_cache_from_env,
 )
 from action_layer.services.agent_rules_registry_loader import (
     build_registry_mapping_with_fallback,
 )
+from action_layer.services.execution_admission import (
+    AdmissionConfig,
+    ExecutionAdmissionController,
+)
+from action_layer.services.execution_coalescing import ExecutionCoalescer
 
 
 def _json_bytes(payload: dict[str, object]) -> bytes:
@@ -38,12 +46,18 @@ class ActionLayerHandler(BaseHTTPRequestHandler):
         os.getenv(
             "ACTION_LAYER_AGENT_PROFILES_ROOT",
             ".agents/roles:action_layer/agents",
-        )
+        ),
+        revalidate_seconds=float(
+            os.getenv("ACTION_LAYER_AGENT_PROFILE_REVALIDATE_SECONDS", "1")
+        ),
+        audit_limit=int(os.getenv("ACTION_LAYER_AGENT_PROFILE_AUDIT_LIMIT", "1000")),
     )
     try:
         llm_config = LLMRoutingConfig.from_env()
         llm_executor = (
-            RoutedLLMExecutor(llm_config) if llm_config.mode == "llm" else None
+            RoutedLLMExecutor(llm_config, cache=build_llm_response_cache_from_env())
+            if llm_config.mode == "llm"
+            else None
         )
         llm_init_error = None
     except LLMConfigurationError as exc:
@@ -57,6 +71,7 @@ class ActionLayerHandler(BaseHTTPRequestHandler):
         llm_config=llm_config,
         llm_executor=llm_executor,
         llm_init_error=llm_init_error,
+        coalescer=ExecutionCoalescer.from_env(),
     )
 
     def do_GET(self) -> None:  # noqa: N802
@@ -77,6 +92,12 @@ class ActionLayerHandler(BaseHTTPRequestHandler):
         self._send_json(HTTPStatus.NOT_FOUND, {"detail": "not found"})
 
     def do_POST(self) -> None:  # noqa: N802
+        if self.path == "/execute/stream":
+            self._send_json(
+                HTTPStatus.NOT_IMPLEMENTED,
+                {"detail": "streaming requires ACTION_LAYER_SERVER_MODE=asyncio"},
+            )
+            return
         if self.path != "/execute":
             self._send_json(HTTPStatus.NOT_FOUND, {"detail": "not found"})
             return
@@ -126,8 +147,28 @@ def main() -> None:
 
     host = os.getenv("ACTION_LAYER_HOST", "127.0.0.1")
     port = int(os.getenv("ACTION_LAYER_PORT", "8100"))
+    server_mode = os.getenv("ACTION_LAYER_SERVER_MODE", "asyncio").strip().lower()
+    if server_mode == "threading":
+        _serve_threading(host, port)
+        return
+
+    server = AsyncActionLayerServer(
+        ActionLayerHandler.execution_service,
+        ExecutionAdmissionController(AdmissionConfig.from_env()),
+        host=host,
+        port=port,
+        keepalive_timeout_seconds=float(os.getenv("ACTION_LAYER_KEEPALIVE_SECONDS", "15")),
+        drain_timeout_seconds=float(os.getenv("ACTION_LAYER_DRAIN_SECONDS", "30")),
+    )
+    try:
+        asyncio.run(serve(server))
+    except KeyboardInterrupt:
+        pass
+
+
+def _serve_threading(host: str, port: int) -> None:
     server = ThreadingHTTPServer((host, port), ActionLayerHandler)
-    print(f"[action-layer] listening on http://{host}:{port}")
+    print(f"[action-layer] listening on http://{host}:{port} (threading)")
     try:
         server.serve_forever()
     except KeyboardInterrupt:
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import signal
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from http import HTTPStatus
+
+from action_layer.services import ActionRuntimeExecutionService
+from action_layer.services.execution_admission import (
+    ExecutionAdmissionController,
+    ExecutionRejectedError,
+)
+
+SERVER_VERSION = "WhereCodeActionLayer/0.2"
+MAX_HEADER_LINES = 100
+
+
+@dataclass(slots=True)
+class _Request:
+    method: str
+    path: str
+    version: str
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    @property
+    def keep_alive(self) -> bool:
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+
+@dataclass(slots=True)
+class _Response:
+    status: HTTPStatus
+    payload: dict[str, object]
+    headers: dict[str, str] = field(default_factory=dict)
+    events: AsyncIterator[dict[str, object]] | None = None
+    release: Callable[[], None] | None = None
+
+
+class _BadRequest(Exception):
+    def __init__(self, status: HTTPStatus, detail: str) -> None:
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+class AsyncActionLayerServer:
+    def __init__(
+        self,
+        execution_service: ActionRuntimeExecutionService,
+        admission: ExecutionAdmissionController,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 8100,
+        keepalive_timeout_seconds: float = 15.0,
+        max_body_bytes: int = 4 * 1024 * 1024,
+        drain_timeout_seconds: float = 30.0,
+    ) -> None:
+        self._execution_service = execution_service
+        self._admission = admission
+        self._host = host
+        self._port = port
+        self._keepalive_timeout_seconds = max(0.1, float(keepalive_timeout_seconds))
+        self._max_body_bytes = max(1, int(max_body_bytes))
+        self._drain_timeout_seconds = max(0.0, float(drain_timeout_seconds))
+        self._server: asyncio.Server | None = None
+        self._connections: set[asyncio.Task[None]] = set()
+        self._busy: set[asyncio.Task[None]] = set()
+
+    @property
+    def host(self) -> str:
+        return self._host
+
+    @property
+    def port(self) -> int:
+        if self._server is None or not self._server.sockets:
+            return self._port
+        return int(self._server.sockets[0].getsockname()[1])
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle_connection,
+            host=self._host,
+            port=self._port,
+        )
+
+    async def shutdown(self) -> bool:
+        if self._server is not None:
+            self._server.close()
+        drained = await self._admission.drain(self._drain_timeout_seconds)
+        # Idle keep-alive connections are closed; connections still writing a
+        # response get a short grace period after the execution pool drains.
+        for task in list(self._connections):
+            if task not in self._busy:
+                task.cancel()
+        if self._busy:
+            await asyncio.wait(list(self._busy), timeout=1.0)
+        for task in list(self._connections):
+            task.cancel()
+        if self._connections:
+            await asyncio.gather(*self._connections, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+        self._admission.close()
+        return drained
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections.add(task)
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(
+                        self._read_request(reader),
+                        timeout=self._keepalive_timeout_seconds,
+                    )
+                except (TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    return
+                except _BadRequest as exc:
+                    await self._write(writer, _Response(exc.status, {"detail": exc.detail}), False)
+                    return
+                if request is None:
+                    return
+
+                self._busy.add(task)
+                try:
+                    response = await self._dispatch(request)
+                    keep_alive = request.keep_alive and not self._admission.draining
+                    if response.events is not None:
+                        await self._write_event_stream(writer, response, keep_alive)
+                    else:
+                        await self._write(writer, response, keep_alive)
+                finally:
+                    self._busy.discard(task)
+                if not keep_alive:
+                    return
+        except (asyncio.CancelledError, ConnectionError):
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, asyncio.CancelledError):
+                pass
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> _Request | None:
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        parts = request_line.decode("latin-1").strip().split()
+        if len(parts) != 3:
+            raise _BadRequest(HTTPStatus.BAD_REQUEST, "malformed request line")
+        method, path, version = parts
+
+        headers: dict[str, str] = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = await reader.readline()
+            if line in {b"\r\n", b"\n", b""}:
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise _BadRequest(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "too many headers")
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise _BadRequest(HTTPStatus.LENGTH_REQUIRED, "chunked request body is not supported")
+        try:
+            content_length = int(headers.get("content-length", "0"))
+        except ValueError as exc:
+            raise _BadRequest(HTTPStatus.BAD_REQUEST, "invalid content-length") from exc
+        if content_length > self._max_body_bytes:
+            raise _BadRequest(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "request body too large")
+        body = await reader.readexactly(content_length) if content_length > 0 else b""
+        return _Request(method=method.upper(), path=path, version=version, headers=headers, body=body)
+
+    async def _dispatch(self, request: _Request) -> _Response:
+        if request.method == "GET":
+            if request.path == "/healthz":
+                payload = self._execution_service.build_health_payload()
+                payload["server_mode"] = "asyncio"
+                payload["admission"] = self._admission.snapshot()
+                return _Response(HTTPStatus.OK, payload)
+            if request.path == "/capabilities":
+                return _Response(
+                    HTTPStatus.OK,
+                    self._execution_service.build_capabilities_payload(),
+                )
+            return _Response(HTTPStatus.NOT_FOUND, {"detail": "not found"})
+
+        if request.method != "POST":
+            return _Response(
+                HTTPStatus.NOT_IMPLEMENTED,
+                {"detail": f"unsupported method ({request.method!r})"},
+            )
+        if request.path not in {"/execute", "/execute/stream"}:
+            return _Response(HTTPStatus.NOT_FOUND, {"detail": "not found"})
+
+        payload = self._parse_json_body(request.body)
+        if isinstance(payload, _Response):
+            return payload
+        target = self._execution_service.route_target(payload)
+        if request.path == "/execute/stream":
+            try:
+                release = await self._admission.acquire(target)
+            except ExecutionRejectedError as exc:
+                return self._rejected(exc)
+            # The admission slot is held for the whole stream and released
+            # once it is written out or the client goes away.
+            return _Response(
+                HTTPStatus.OK,
+                {},
+                events=self._execution_service.execute_stream(payload),
+                release=release,
+            )
+        try:
+            status, response_payload = await self._admission.run(
+                target,
+                lambda: self._execution_service.execute_async(payload),
+            )
+        except ExecutionRejectedError as exc:
+            return self._rejected(exc)
+        return _Response(status, response_payload)
+
+    @staticmethod
+    def _rejected(exc: ExecutionRejectedError) -> _Response:
+        headers = {}
+        if exc.retry_after_seconds is not None:
+            headers["Retry-After"] = str(exc.retry_after_seconds)
+        return _Response(exc.status, {"detail": exc.detail}, headers)
+
+    @staticmethod
+    def _parse_json_body(body: bytes) -> dict[str, object] | _Response:
+        if not body:
+            return _Response(HTTPStatus.BAD_REQUEST, {"detail": "empty request body"})
+        try:
+            data = json.loads(body.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return _Response(HTTPStatus.BAD_REQUEST, {"detail": "invalid json body"})
+        if not isinstance(data, dict):
+            return _Response(HTTPStatus.BAD_REQUEST, {"detail": "json body must be an object"})
+        return data
+
+    @staticmethod
+    async def _write(
+        writer: asyncio.StreamWriter,
+        response: _Response,
+        keep_alive: bool,
+    ) -> None:
+        body = json.dumps(response.payload, ensure_ascii=False).encode("utf-8")
+        status = response.status
+        lines = [
+            f"HTTP/1.1 {int(status)} {status.phrase}",
+            f"Server: {SERVER_VERSION}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+            *(f"{name}: {value}" for name, value in response.headers.items()),
+        ]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+    @staticmethod
+    async def _write_event_stream(
+        writer: asyncio.StreamWriter,
+        response: _Response,
+        keep_alive: bool,
+    ) -> None:
+        assert response.events is not None
+        lines = [
+            f"HTTP/1.1 {int(response.status)} {response.status.phrase}",
+            f"Server: {SERVER_VERSION}",
+            "Content-Type: text/event-stream; charset=utf-8",
+            "Cache-Control: no-cache",
+            "Transfer-Encoding: chunked",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        try:
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+            async with aclosing(response.events) as events:
+                async for event in events:
+                    name = str(event.get("event", "message"))
+                    data = json.dumps(event, ensure_ascii=False)
+                    chunk = f"event: {name}\ndata: {data}\n\n".encode("utf-8")
+                    writer.write(f"{len(chunk):x}\r\n".encode("latin-1") + chunk + b"\r\n")
+                    await writer.drain()
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+        finally:
+            if response.release is not None:
+                response.release()
+
+
+async def serve(server: AsyncActionLayerServer) -> None:
+    await server.start()
+    print(f"[action-layer] listening on http://{server.host}:{server.port} (asyncio)")
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass
+    try:
+        await stop.wait()
+    finally:
+        print("[action-layer] draining in-flight executions")
+        drained = await server.shutdown()
+        if not drained:
+            print("[action-layer] drain timeout reached; abandoning in-flight executions")
+        print("[action-layer] stopped")
@@ -20,6 +20,16 @@ from action_layer.services.llm_executor import (
     OpenAICompatibleLLMExecutor,
     RoutedLLMExecutor,
 )
+from action_layer.services.llm_executor_cache import (
+    InMemoryLLMResponseCacheBackend,
+    LLMResponseCache,
+    SqliteLLMResponseCacheBackend,
+    build_llm_response_cache_from_env,
+)
+from action_layer.services.llm_executor_transport import (
+    AsyncLLMTransport,
+    RetryPolicy,
+)
 from action_layer.services.runtime_execution import ActionRuntimeExecutionService
 from action_layer.services.agent_rules_registry_loader import (
     load_agent_registry_mapping_from_file,
@@ -41,6 +51,12 @@ __all__ = [
     "OpenAICompatibleLLMExecutor",
     "OllamaLLMExecutor",
     "RoutedLLMExecutor",
+    "AsyncLLMTransport",
+    "RetryPolicy",
+    "LLMResponseCache",
+    "InMemoryLLMResponseCacheBackend",
+    "SqliteLLMResponseCacheBackend",
+    "build_llm_response_cache_from_env",
     "ActionRuntimeExecutionService",
     "load_agent_registry_mapping_from_file",
     "build_registry_mapping_with_fallback",
@@ -3,9 +3,11 @@ from __future__ import annotations
 import hashlib
 import logging
 import os
+import time
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Callable, Literal
 
 
 logger = logging.getLogger("wherecode.action_layer.agent_profile_loader")
@@ -28,6 +30,15 @@ class AgentProfileAuditEvent:
     reason: str
 
 
+@dataclass(frozen=True, slots=True)
+class _CachedProfile:
+    profile: AgentProfile
+    resolved_path: Path
+    mtime_ns: int
+    size: int
+    checked_at: float
+
+
 class AgentProfileAccessError(PermissionError):
     def __init__(self, role: str, requested_path: str, allowed_path: str) -> None:
         super().__init__(
@@ -54,12 +65,20 @@ class AgentProfileLoader:
         self,
         profiles_root: str = ".agents/roles",
         fallback_roots: tuple[str, ...] | None = ("action_layer/agents",),
+        *,
+        revalidate_seconds: float = 1.0,
+        audit_limit: int = 1000,
+        clock: Callable[[], float] | None = None,
     ) -> None:
         self._profiles_roots = self._normalize_roots(
             profiles_root=profiles_root,
             fallback_roots=fallback_roots,
         )
-        self._audit_events: list[AgentProfileAuditEvent] = []
+        self._revalidate_seconds = max(0.0, float(revalidate_seconds))
+        self._clock = clock or time.monotonic
+        self._audit_events: deque[AgentProfileAuditEvent] = deque(maxlen=max(1, audit_limit))
+        self._allowed_paths_by_role: dict[str, tuple[Path, ...]] = {}
+        self._profile_cache: dict[str, _CachedProfile] = {}
 
     @staticmethod
     def _split_roots(value: str) -> list[str]:
@@ -100,18 +119,24 @@ class AgentProfileLoader:
         return normalized
 
     def _allowed_profile_paths(self, role: str) -> tuple[Path, ...]:
+        cached = self._allowed_paths_by_role.get(role)
+        if cached is not None:
+            return cached
         candidates: list[Path] = []
         for root in self._profiles_roots:
             role_root = (root / role).resolve()
             candidates.append((role_root / self._STANDARD_PROFILE_FILE).resolve())
             candidates.append((role_root / self._LEGACY_PROFILE_FILE).resolve())
-        return tuple(candidates)
+        allowed = tuple(candidates)
+        self._allowed_paths_by_role[role] = allowed
+        return allowed
 
     def _default_profile_path(self, role: str) -> Path:
-        for candidate in self._allowed_profile_paths(role):
+        allowed_paths = self._allowed_profile_paths(role)
+        for candidate in allowed_paths:
             if candidate.is_file():
                 return candidate
-        return self._allowed_profile_paths(role)[0]
+        return allowed_paths[0]
 
     def _resolve_requested_path(
         self,
@@ -175,8 +200,49 @@ class AgentProfileLoader:
     def get_audit_events(self) -> list[AgentProfileAuditEvent]:
         return list(self._audit_events)
 
+    def clear_cache(self) -> None:
+        self._profile_cache.clear()
+
+    def _cached_default_profile(self, role: str) -> AgentProfile | None:
+        entry = self._profile_cache.get(role)
+        if entry is None:
+            return None
+        now = self._clock()
+        if now - entry.checked_at < self._revalidate_seconds:
+            return entry.profile
+        # Revalidate: a higher-priority file may have appeared, or the
+        # selected file may have been edited or removed.
+        if self._default_profile_path(role) != entry.resolved_path:
+            return None
+        try:
+            stat = entry.resolved_path.stat()
+        except OSError:
+            return None
+        if stat.st_mtime_ns != entry.mtime_ns or stat.st_size != entry.size:
+            return None
+        self._profile_cache[role] = _CachedProfile(
+            profile=entry.profile,
+            resolved_path=entry.resolved_path,
+            mtime_ns=entry.mtime_ns,
+            size=entry.size,
+            checked_at=now,
+        )
+        return entry.profile
+
     def load(self, role: str, requested_path: str | None = None) -> AgentProfile:
         normalized_role = self._normalize_role(role)
+        if requested_path is None:
+            cached = self._cached_default_profile(normalized_role)
+            if cached is not None:
+                self._record_event(
+                    action="allow",
+                    role=normalized_role,
+                    requested_path=cached.path,
+                    resolved_path=Path(cached.path),
+                    reason="role_scoped_profile",
+                )
+                return cached
+            self._profile_cache.pop(normalized_role, None)
         allowed_paths = self._allowed_profile_paths(normalized_role)
         default_allowed = self._default_profile_path(normalized_role)
         requested = requested_path if requested_path is not None else str(default_allowed)
@@ -208,6 +274,7 @@ class AgentProfileLoader:
             )
             raise AgentProfileNotFoundError(role=normalized_role, expected_path=str(resolved))
 
+        stat = resolved.stat()
         content = resolved.read_text(encoding="utf-8")
         profile_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
         self._record_event(
@@ -217,9 +284,18 @@ class AgentProfileLoader:
             resolved_path=resolved,
             reason="role_scoped_profile",
         )
-        return AgentProfile(
+        profile = AgentProfile(
             role=normalized_role,
             path=str(resolved),
             profile_hash=profile_hash,
             content=content,
         )
+        if requested_path is None:
+            self._profile_cache[normalized_role] = _CachedProfile(
+                profile=profile,
+                resolved_path=resolved,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                checked_at=self._clock(),
+            )
+        return profile
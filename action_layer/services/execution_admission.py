@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class ExecutionRejectedError(Exception):
+    status: HTTPStatus
+    detail: str
+    retry_after_seconds: int | None = None
+
+    def __str__(self) -> str:
+        return self.detail
+
+
+@dataclass(frozen=True, slots=True)
+class AdmissionConfig:
+    max_concurrency: int = 16
+    max_queue: int = 64
+    queue_timeout_seconds: float = 30.0
+    default_target_limit: int = 0
+    target_limits: dict[str, int] | None = None
+
+    @classmethod
+    def from_env(cls) -> "AdmissionConfig":
+        return cls(
+            max_concurrency=max(1, _env_int("ACTION_LAYER_MAX_CONCURRENCY", 16)),
+            max_queue=max(0, _env_int("ACTION_LAYER_MAX_QUEUE", 64)),
+            queue_timeout_seconds=max(
+                0.0,
+                _env_float("ACTION_LAYER_QUEUE_TIMEOUT_SECONDS", 30.0),
+            ),
+            default_target_limit=max(0, _env_int("ACTION_LAYER_TARGET_MAX_CONCURRENCY", 0)),
+            target_limits=_parse_target_limits(
+                os.getenv("ACTION_LAYER_TARGET_CONCURRENCY_JSON", "")
+            ),
+        )
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)).strip())
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)).strip())
+    except ValueError:
+        return default
+
+
+def _parse_target_limits(raw: str) -> dict[str, int]:
+    if not raw.strip():
+        return {}
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    limits: dict[str, int] = {}
+    for key, value in data.items():
+        name = str(key).strip().lower()
+        try:
+            limit = int(value)
+        except (TypeError, ValueError):
+            continue
+        if name and limit > 0:
+            limits[name] = limit
+    return limits
+
+
+class ExecutionAdmissionController:
+    def __init__(self, config: AdmissionConfig | None = None) -> None:
+        self._config = config or AdmissionConfig()
+        self._tasks: set[asyncio.Task[object]] = set()
+        self._slots = asyncio.Semaphore(self._config.max_concurrency)
+        self._target_slots: dict[str, asyncio.Semaphore] = {}
+        self._waiting = 0
+        self._running = 0
+        self._draining = False
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._admitted_total = 0
+        self._rejected_queue_full = 0
+        self._rejected_timeout = 0
+        self._rejected_draining = 0
+
+    @property
+    def config(self) -> AdmissionConfig:
+        return self._config
+
+    @property
+    def draining(self) -> bool:
+        return self._draining
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "max_concurrency": self._config.max_concurrency,
+            "max_queue": self._config.max_queue,
+            "running": self._running,
+            "waiting": self._waiting,
+            "draining": self._draining,
+            "admitted_total": self._admitted_total,
+            "rejected_queue_full": self._rejected_queue_full,
+            "rejected_timeout": self._rejected_timeout,
+            "rejected_draining": self._rejected_draining,
+        }
+
+    async def acquire(self, target: str | None) -> Callable[[], None]:
+        if self._draining:
+            self._rejected_draining += 1
+            raise ExecutionRejectedError(
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                "action layer is draining",
+                retry_after_seconds=1,
+            )
+        target_slots = self._target_semaphore(target)
+        saturated = self._slots.locked() or (
+            target_slots is not None and target_slots.locked()
+        )
+        if saturated and self._waiting >= self._config.max_queue:
+            self._rejected_queue_full += 1
+            raise ExecutionRejectedError(
+                HTTPStatus.TOO_MANY_REQUESTS,
+                "action layer execution queue is full",
+                retry_after_seconds=1,
+            )
+
+        acquired = await self._admit(target_slots)
+        self._running += 1
+        self._admitted_total += 1
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                self._finish(acquired)
+
+        return release
+
+    async def run(self, target: str | None, fn: Callable[[], Awaitable[T]]) -> T:
+        release = await self.acquire(target)
+        try:
+            task = asyncio.ensure_future(fn())
+        except BaseException:
+            release()
+            raise
+        self._tasks.add(task)
+        # Slots are released when the execution finishes, not when the caller
+        # goes away, so a dropped connection cannot oversubscribe a target.
+        task.add_done_callback(lambda done: self._task_done(done, release))
+        return await asyncio.shield(task)
+
+    def _task_done(self, task: asyncio.Future[object], release: Callable[[], None]) -> None:
+        self._tasks.discard(task)  # type: ignore[arg-type]
+        if not task.cancelled():
+            task.exception()
+        release()
+
+    async def _admit(
+        self,
+        target_slots: asyncio.Semaphore | None,
+    ) -> list[asyncio.Semaphore]:
+        self._waiting += 1
+        self._idle.clear()
+        acquired: list[asyncio.Semaphore] = []
+        try:
+            async with asyncio.timeout(self._config.queue_timeout_seconds or None):
+                for semaphore in (target_slots, self._slots):
+                    if semaphore is None:
+                        continue
+                    await semaphore.acquire()
+                    acquired.append(semaphore)
+        except TimeoutError as exc:
+            self._release(acquired)
+            self._rejected_timeout += 1
+            raise ExecutionRejectedError(
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                "action layer execution queue wait timed out",
+                retry_after_seconds=max(1, int(self._config.queue_timeout_seconds)),
+            ) from exc
+        except BaseException:
+            self._release(acquired)
+            raise
+        finally:
+            self._waiting -= 1
+            self._update_idle()
+        return acquired
+
+    def _finish(self, acquired: list[asyncio.Semaphore]) -> None:
+        self._running -= 1
+        self._release(acquired)
+        self._update_idle()
+
+    @staticmethod
+    def _release(acquired: list[asyncio.Semaphore]) -> None:
+        for semaphore in reversed(acquired):
+            semaphore.release()
+
+    def _update_idle(self) -> None:
+        if self._running == 0 and self._waiting == 0:
+            self._idle.set()
+        else:
+            self._idle.clear()
+
+    async def drain(self, timeout_seconds: float) -> bool:
+        self._draining = True
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=max(0.0, timeout_seconds))
+        except TimeoutError:
+            return False
+        return True
+
+    def close(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+
+    def _target_semaphore(self, target: str | None) -> asyncio.Semaphore | None:
+        if not target:
+            return None
+        name = target.strip().lower()
+        limit = (self._config.target_limits or {}).get(name, self._config.default_target_limit)
+        if limit <= 0:
+            return None
+        semaphore = self._target_slots.get(name)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(limit)
+            self._target_slots[name] = semaphore
+        return semaphore
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+from action_layer.services.llm_executor_runtime_helpers import format_prompt_payload
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class _Flight:
+    done: threading.Event = field(default_factory=threading.Event)
+    result: object = None
+    error: BaseException | None = None
+
+
+# Single-flight for identical executions: the first caller for a key runs the
+# provider call, concurrent callers with the same key wait for its outcome.
+class ExecutionCoalescer:
+    def __init__(self, *, disabled_roles: set[str] | None = None) -> None:
+        self._disabled_roles = {role.strip().lower() for role in disabled_roles or set() if role}
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+        self._tasks: dict[str, asyncio.Future[object]] = {}
+        self._leaders = 0
+        self._coalesced = 0
+        self._bypassed = 0
+
+    @classmethod
+    def from_env(cls) -> "ExecutionCoalescer | None":
+        enabled = os.getenv("ACTION_LAYER_COALESCE_ENABLED", "true").strip().lower()
+        if enabled in {"0", "false", "no", "off"}:
+            return None
+        disabled_roles = {
+            item.strip()
+            for item in os.getenv("ACTION_LAYER_COALESCE_DISABLED_ROLES", "").split(",")
+            if item.strip()
+        }
+        return cls(disabled_roles=disabled_roles)
+
+    def key_for(
+        self,
+        payload: dict[str, object],
+        *,
+        target: str | None,
+        profile_hash: str | None,
+        model_settings: dict[str, object] | None = None,
+    ) -> str | None:
+        role = str(payload.get("role") or "").strip().lower()
+        if role in self._disabled_roles:
+            with self._lock:
+                self._bypassed += 1
+            return None
+        # Keyed on the full prompt the provider receives, identifiers
+        # included, so callers only share a response they would each get.
+        material = {
+            "target": target,
+            "profile_hash": profile_hash,
+            "model_settings": model_settings,
+            "prompt": format_prompt_payload(payload, fallback_agent="coding-agent"),
+        }
+        encoded = json.dumps(material, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def run(self, key: str, fn: Callable[[], T]) -> tuple[T, bool]:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = _Flight()
+                self._flights[key] = flight
+                self._leaders += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True  # type: ignore[return-value]
+
+        try:
+            flight.result = fn()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+        return flight.result, False  # type: ignore[return-value]
+
+    async def run_async(self, key: str, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._tasks.get(key)
+            leader = task is None or task.get_loop() is not loop
+            if leader:
+                task = asyncio.ensure_future(fn())
+                self._tasks[key] = task
+                task.add_done_callback(lambda done, key=key: self._task_done(key, done))
+                self._leaders += 1
+            else:
+                self._coalesced += 1
+        assert task is not None
+        # Shielded so one caller giving up does not cancel the shared call.
+        return await asyncio.shield(task), not leader  # type: ignore[return-value]
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "in_flight": len(self._flights) + len(self._tasks),
+                "leaders": self._leaders,
+                "coalesced": self._coalesced,
+                "bypassed": self._bypassed,
+                "disabled_roles": sorted(self._disabled_roles),
+            }
+
+    def _task_done(self, key: str, task: asyncio.Future[object]) -> None:
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+        if not task.cancelled():
+            # Retrieve the exception so abandoned flights do not log warnings.
+            task.exception()
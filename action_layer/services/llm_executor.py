@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
-from dataclasses import dataclass
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from dataclasses import dataclass, replace
 from typing import Callable
 
+from action_layer.services.llm_executor_cache import LLMResponseCache
 from action_layer.services.llm_executor_exceptions import (
     LLMConfigurationError,
     LLMExecutionError,
 )
 from action_layer.services.llm_executor_runtime_helpers import (
-    default_http_post as _default_http_post,
     extract_message_content as _extract_message_content,
     extract_ollama_content as _extract_ollama_content,
     extract_responses_content as _extract_responses_content,
@@ -19,6 +23,13 @@ from action_layer.services.llm_executor_runtime_helpers import (
     select_route_target as _select_route_target,
     validate_route_targets as _validate_route_targets,
 )
+from action_layer.services.llm_executor_streaming import (
+    StreamingResultScanner,
+    decode_chat_completions_line,
+    decode_ollama_line,
+    decode_responses_line,
+)
+from action_layer.services.llm_executor_transport import AsyncLLMTransport, resolve_proxy
 
 
 SUPPORTED_STATUSES = {"success", "failed", "needs_discussion"}
@@ -46,6 +57,7 @@ class LLMProviderConfig:
     max_tokens: int
     system_prompt: str
     wire_api: str = "chat_completions"
+    max_connections: int | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -212,6 +224,15 @@ def _parse_provider_config(target_name: str, raw: dict[str, object]) -> LLMProvi
         f"target={target_name}.max_tokens",
         800,
     )
+    max_connections = (
+        _parse_int(
+            raw.get("max_connections"),
+            f"target={target_name}.max_connections",
+            0,
+        )
+        if raw.get("max_connections") is not None
+        else None
+    )
     system_prompt = str(raw.get("system_prompt", DEFAULT_SYSTEM_PROMPT)).strip()
     if not system_prompt:
         system_prompt = DEFAULT_SYSTEM_PROMPT
@@ -227,6 +248,7 @@ def _parse_provider_config(target_name: str, raw: dict[str, object]) -> LLMProvi
         max_tokens=max_tokens,
         system_prompt=system_prompt,
         wire_api=wire_api,
+        max_connections=max_connections,
     )
 
 
@@ -296,20 +318,122 @@ def _load_route_mapping(env_name: str) -> dict[str, str]:
     return output
 
 
-class OpenAICompatibleLLMExecutor:
+@dataclass(frozen=True, slots=True)
+class _PreparedLLMRequest:
+    endpoint: str
+    headers: dict[str, str]
+    payload: dict[str, object]
+    agent: str
+
+
+class _TransportBackedExecutor(ABC):
     def __init__(
         self,
         config: LLMProviderConfig,
         http_post: HttpPostFn | None = None,
+        transport: AsyncLLMTransport | None = None,
     ) -> None:
         self._config = config
-        self._http_post = http_post or _default_http_post
+        self._transport = (
+            None
+            if http_post is not None
+            else transport or AsyncLLMTransport.from_env(max_connections=config.max_connections)
+        )
+        self._http_post: HttpPostFn = http_post or self._transport  # type: ignore[assignment]
 
     @property
     def config(self) -> LLMProviderConfig:
         return self._config
 
+    @property
+    def transport(self) -> AsyncLLMTransport | None:
+        return self._transport
+
     def execute(self, payload: dict[str, object]) -> dict[str, object]:
+        request = self._prepare(payload)
+        response_payload = self._http_post(
+            request.endpoint,
+            request.headers,
+            request.payload,
+            self._config.timeout_seconds,
+        )
+        return self._parse(request, response_payload)
+
+    async def execute_async(self, payload: dict[str, object]) -> dict[str, object]:
+        request = self._prepare(payload)
+        if self._transport is not None:
+            response_payload = await self._transport.post(
+                request.endpoint,
+                request.headers,
+                request.payload,
+                self._config.timeout_seconds,
+            )
+        else:
+            response_payload = await asyncio.to_thread(
+                self._http_post,
+                request.endpoint,
+                request.headers,
+                request.payload,
+                self._config.timeout_seconds,
+            )
+        return self._parse(request, response_payload)
+
+    async def stream(self, payload: dict[str, object]) -> AsyncIterator[dict[str, object]]:
+        request = self._prepare(payload)
+        if self._transport is None or resolve_proxy(request.endpoint) is not None:
+            # Injected blocking transports and proxied endpoints cannot
+            # stream; report the buffered result as the only event.
+            yield {"event": "result", "result": await self.execute_async(payload)}
+            return
+
+        request = replace(request, payload={**request.payload, "stream": True})
+        scanner = StreamingResultScanner()
+        async with aclosing(
+            self._transport.stream_lines(
+                request.endpoint,
+                request.headers,
+                request.payload,
+                self._config.timeout_seconds,
+            )
+        ) as lines:
+            async for line in lines:
+                text, done = self._decode_stream_line(line)
+                if text:
+                    yield {"event": "delta", "text": text}
+                    for event in scanner.feed(text):
+                        yield event
+                # A closed top-level object is terminal; leaving the loop
+                # closes the upstream stream instead of waiting for [DONE].
+                if done or scanner.complete:
+                    break
+        assistant_text = scanner.text.strip()
+        if not assistant_text:
+            raise LLMExecutionError("llm provider stream content is empty")
+        yield {"event": "result", "result": self._build_result(request, assistant_text)}
+
+    @abstractmethod
+    def _prepare(self, payload: dict[str, object]) -> _PreparedLLMRequest: ...
+
+    @abstractmethod
+    def _parse(
+        self,
+        request: _PreparedLLMRequest,
+        response_payload: dict[str, object],
+    ) -> dict[str, object]: ...
+
+    @abstractmethod
+    def _build_result(
+        self,
+        request: _PreparedLLMRequest,
+        assistant_text: str,
+    ) -> dict[str, object]: ...
+
+    @abstractmethod
+    def _decode_stream_line(self, line: bytes) -> tuple[str, bool]: ...
+
+
+class OpenAICompatibleLLMExecutor(_TransportBackedExecutor):
+    def _prepare(self, payload: dict[str, object]) -> _PreparedLLMRequest:
         prompt_input = _format_prompt_payload(payload, fallback_agent="coding-agent")
         agent = str(prompt_input["agent"])
         headers = {
@@ -354,25 +478,33 @@ class OpenAICompatibleLLMExecutor:
                 "temperature": self._config.temperature,
                 "max_tokens": self._config.max_tokens,
             }
-
-        response_payload = self._http_post(
-            endpoint,
-            headers,
-            request_payload,
-            self._config.timeout_seconds,
+        return _PreparedLLMRequest(
+            endpoint=endpoint,
+            headers=headers,
+            payload=request_payload,
+            agent=agent,
         )
+
+    def _parse(
+        self,
+        request: _PreparedLLMRequest,
+        response_payload: dict[str, object],
+    ) -> dict[str, object]:
         assistant_text = (
             _extract_responses_content(response_payload)
             if self._config.wire_api == "responses"
             else _extract_message_content(response_payload)
         )
+        return self._build_result(request, assistant_text)
+
+    def _build_result(self, request: _PreparedLLMRequest, assistant_text: str) -> dict[str, object]:
         result = _parse_llm_text_response(
             assistant_text,
             supported_statuses=SUPPORTED_STATUSES,
             provider=self._config.provider,
             model=self._config.model,
-            endpoint=endpoint,
-            agent=agent,
+            endpoint=request.endpoint,
+            agent=request.agent,
             route_target=self._config.target,
         )
         metadata = result.get("metadata")
@@ -382,23 +514,15 @@ class OpenAICompatibleLLMExecutor:
         result["metadata"] = metadata
         return result
 
+    def _decode_stream_line(self, line: bytes) -> tuple[str, bool]:
+        if self._config.wire_api == "responses":
+            return decode_responses_line(line)
+        return decode_chat_completions_line(line)
 
-class OllamaLLMExecutor:
-    def __init__(
-        self,
-        config: LLMProviderConfig,
-        http_post: HttpPostFn | None = None,
-    ) -> None:
-        self._config = config
-        self._http_post = http_post or _default_http_post
-
-    @property
-    def config(self) -> LLMProviderConfig:
-        return self._config
 
-    def execute(self, payload: dict[str, object]) -> dict[str, object]:
+class OllamaLLMExecutor(_TransportBackedExecutor):
+    def _prepare(self, payload: dict[str, object]) -> _PreparedLLMRequest:
         prompt_input = _format_prompt_payload(payload, fallback_agent="coding-agent")
-        agent = str(prompt_input["agent"])
         request_payload = {
             "model": self._config.model,
             "messages": [
@@ -414,35 +538,46 @@ class OllamaLLMExecutor:
                 "num_predict": self._config.max_tokens,
             },
         }
-
-        endpoint = f"{self._config.base_url}/api/chat"
-        response_payload = self._http_post(
-            endpoint,
-            {"Content-Type": "application/json"},
-            request_payload,
-            self._config.timeout_seconds,
+        return _PreparedLLMRequest(
+            endpoint=f"{self._config.base_url}/api/chat",
+            headers={"Content-Type": "application/json"},
+            payload=request_payload,
+            agent=str(prompt_input["agent"]),
         )
-        assistant_text = _extract_ollama_content(response_payload)
+
+    def _parse(
+        self,
+        request: _PreparedLLMRequest,
+        response_payload: dict[str, object],
+    ) -> dict[str, object]:
+        return self._build_result(request, _extract_ollama_content(response_payload))
+
+    def _build_result(self, request: _PreparedLLMRequest, assistant_text: str) -> dict[str, object]:
         return _parse_llm_text_response(
             assistant_text,
             supported_statuses=SUPPORTED_STATUSES,
             provider=self._config.provider,
             model=self._config.model,
-            endpoint=endpoint,
-            agent=agent,
+            endpoint=request.endpoint,
+            agent=request.agent,
             route_target=self._config.target,
         )
 
+    def _decode_stream_line(self, line: bytes) -> tuple[str, bool]:
+        return decode_ollama_line(line)
+
 
 class RoutedLLMExecutor:
     def __init__(
         self,
         config: LLMRoutingConfig,
         http_post: HttpPostFn | None = None,
+        cache: LLMResponseCache | None = None,
     ) -> None:
         if config.mode != "llm":
             raise LLMConfigurationError("RoutedLLMExecutor requires mode=llm")
         self._config = config
+        self._cache = cache
         self._executors: dict[str, OpenAICompatibleLLMExecutor | OllamaLLMExecutor] = {}
         for target_name, provider_config in config.targets.items():
             if provider_config.provider == "openai-compatible":
@@ -473,13 +608,119 @@ class RoutedLLMExecutor:
             return providers[0]
         return "multi"
 
-    def execute(self, payload: dict[str, object]) -> dict[str, object]:
-        target_name, route_reason = self._select_target(payload)
+    def execute(
+        self,
+        payload: dict[str, object],
+        *,
+        profile_hash: str | None = None,
+    ) -> dict[str, object]:
+        executor, route_reason = self._route(payload)
+        cache_key = self._cache_key(executor, payload, profile_hash)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return self._with_route_reason(cached, route_reason)
+        result = executor.execute(payload)
+        self._cache_put(cache_key, result)
+        return self._with_route_reason(result, route_reason)
+
+    async def execute_async(
+        self,
+        payload: dict[str, object],
+        *,
+        profile_hash: str | None = None,
+    ) -> dict[str, object]:
+        executor, route_reason = self._route(payload)
+        cache_key = self._cache_key(executor, payload, profile_hash)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return self._with_route_reason(cached, route_reason)
+        result = await executor.execute_async(payload)
+        self._cache_put(cache_key, result)
+        return self._with_route_reason(result, route_reason)
+
+    async def stream(
+        self,
+        payload: dict[str, object],
+        *,
+        profile_hash: str | None = None,
+    ) -> AsyncIterator[dict[str, object]]:
+        executor, route_reason = self._route(payload)
+        cache_key = self._cache_key(executor, payload, profile_hash)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            yield {"event": "result", "result": self._with_route_reason(cached, route_reason)}
+            return
+        async with aclosing(executor.stream(payload)) as events:
+            async for event in events:
+                if event.get("event") == "result" and isinstance(event.get("result"), dict):
+                    self._cache_put(cache_key, event["result"])
+                    event = {
+                        **event,
+                        "result": self._with_route_reason(event["result"], route_reason),
+                    }
+                yield event
+
+    def cache_snapshot(self) -> dict[str, object] | None:
+        return self._cache.snapshot() if self._cache is not None else None
+
+    def transport_snapshot(self) -> dict[str, dict[str, object]]:
+        return {
+            target_name: executor.transport.snapshot()
+            for target_name, executor in sorted(self._executors.items())
+            if executor.transport is not None
+        }
+
+    def close(self) -> None:
+        for executor in self._executors.values():
+            if executor.transport is not None:
+                executor.transport.close()
+        if self._cache is not None:
+            self._cache.close()
+
+    def _cache_key(
+        self,
+        executor: OpenAICompatibleLLMExecutor | OllamaLLMExecutor,
+        payload: dict[str, object],
+        profile_hash: str | None,
+    ) -> str | None:
+        if self._cache is None or not self._cache.enabled_for(payload.get("role")):
+            return None
+        provider_config = executor.config
+        return self._cache.build_key(
+            target=provider_config.target,
+            model=provider_config.model,
+            system_prompt=provider_config.system_prompt,
+            profile_hash=profile_hash,
+            prompt_payload=_format_prompt_payload(payload, fallback_agent="coding-agent"),
+            sampling={
+                "provider": provider_config.provider,
+                "wire_api": provider_config.wire_api,
+                "temperature": provider_config.temperature,
+                "max_tokens": provider_config.max_tokens,
+            },
+        )
+
+    def _cache_get(self, cache_key: str | None) -> dict[str, object] | None:
+        if self._cache is None or cache_key is None:
+            return None
+        return self._cache.get(cache_key)
+
+    def _cache_put(self, cache_key: str | None, result: dict[str, object]) -> None:
+        if self._cache is not None and cache_key is not None:
+            self._cache.put(cache_key, result)
+
+    def _route(
+        self,
+        payload: dict[str, object],
+    ) -> tuple[OpenAICompatibleLLMExecutor | OllamaLLMExecutor, str]:
+        target_name, route_reason = self.select_target(payload)
         executor = self._executors.get(target_name)
         if executor is None:
             raise LLMExecutionError(f"target executor not found: {target_name}")
+        return executor, route_reason
 
-        result = executor.execute(payload)
+    @staticmethod
+    def _with_route_reason(result: dict[str, object], route_reason: str) -> dict[str, object]:
         metadata = result.get("metadata")
         if not isinstance(metadata, dict):
             metadata = {}
@@ -487,7 +728,7 @@ class RoutedLLMExecutor:
         result["metadata"] = metadata
         return result
 
-    def _select_target(self, payload: dict[str, object]) -> tuple[str, str]:
+    def select_target(self, payload: dict[str, object]) -> tuple[str, str]:
         return _select_route_target(
             payload,
             module_prefix_routes=self._config.module_prefix_routes,
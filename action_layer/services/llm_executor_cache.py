@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Protocol
+from uuid import uuid4
+
+# Identifiers that vary between re-runs of the same work but do not change
+# what the model is asked to do.
+VOLATILE_PROMPT_FIELDS = ("task_id", "project_id", "requested_by")
+CACHEABLE_STATUSES = {"success", "needs_discussion"}
+
+
+def normalize_prompt_payload(prompt_payload: dict[str, object]) -> dict[str, object]:
+    return {
+        key: value
+        for key, value in prompt_payload.items()
+        if key not in VOLATILE_PROMPT_FIELDS and value not in (None, "")
+    }
+
+
+class LLMResponseCacheBackend(Protocol):
+    def get(self, key: str, now: float) -> dict[str, object] | None: ...
+
+    def set(self, key: str, value: dict[str, object], now: float) -> int: ...
+
+    def clear(self) -> None: ...
+
+    def size(self) -> int: ...
+
+
+class InMemoryLLMResponseCacheBackend:
+    def __init__(self, *, max_entries: int = 1024, ttl_seconds: float = 3600.0) -> None:
+        self._max_entries = max(1, int(max_entries))
+        self._ttl_seconds = max(0.0, float(ttl_seconds))
+        self._entries: OrderedDict[str, tuple[float, dict[str, object]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, now: float) -> dict[str, object] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self._ttl_seconds and now - stored_at > self._ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: dict[str, object], now: float) -> int:
+        with self._lock:
+            self._entries[key] = (now, value)
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+            return evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class SqliteLLMResponseCacheBackend:
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+    ) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_entries = max(1, int(max_entries))
+        self._ttl_seconds = max(0.0, float(ttl_seconds))
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_response_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_response_cache_accessed "
+            "ON llm_response_cache(accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str, now: float) -> dict[str, object] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at FROM llm_response_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            value, stored_at = row
+            if self._ttl_seconds and now - float(stored_at) > self._ttl_seconds:
+                self._conn.execute("DELETE FROM llm_response_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE llm_response_cache SET accessed_at = ? WHERE key = ?",
+                (now, key),
+            )
+            self._conn.commit()
+        try:
+            parsed = json.loads(value)
+        except json.JSONDecodeError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
+
+    def set(self, key: str, value: dict[str, object], now: float) -> int:
+        encoded = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO llm_response_cache(key, value, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT(key) DO UPDATE SET "
+                "value = excluded.value, stored_at = excluded.stored_at, "
+                "accessed_at = excluded.accessed_at",
+                (key, encoded, now, now),
+            )
+            evicted = 0
+            if self._ttl_seconds:
+                evicted += self._conn.execute(
+                    "DELETE FROM llm_response_cache WHERE stored_at < ?",
+                    (now - self._ttl_seconds,),
+                ).rowcount
+            overflow = self._size_locked() - self._max_entries
+            if overflow > 0:
+                evicted += self._conn.execute(
+                    "DELETE FROM llm_response_cache WHERE key IN ("
+                    "SELECT key FROM llm_response_cache ORDER BY accessed_at ASC LIMIT ?)",
+                    (overflow,),
+                ).rowcount
+            self._conn.commit()
+            return evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_response_cache")
+            self._conn.commit()
+
+    def size(self) -> int:
+        with self._lock:
+            return self._size_locked()
+
+    def _size_locked(self) -> int:
+        row = self._conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()
+        return int(row[0]) if row else 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class LLMResponseCache:
+    def __init__(
+        self,
+        backend: LLMResponseCacheBackend,
+        *,
+        backend_name: str = "memory",
+        disabled_roles: set[str] | None = None,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        self._backend = backend
+        self._backend_name = backend_name
+        self._disabled_roles = {role.strip().lower() for role in disabled_roles or set() if role}
+        self._clock = clock or time.time
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+        self._bypassed = 0
+
+    @staticmethod
+    def build_key(
+        *,
+        target: str,
+        model: str,
+        system_prompt: str,
+        profile_hash: str | None,
+        prompt_payload: dict[str, object],
+        sampling: dict[str, object] | None = None,
+    ) -> str:
+        material = {
+            "target": target,
+            "model": model,
+            "system_prompt": hashlib.sha256(system_prompt.encode("utf-8")).hexdigest(),
+            "profile_hash": profile_hash,
+            "prompt": normalize_prompt_payload(prompt_payload),
+            "sampling": sampling or {},
+        }
+        encoded = json.dumps(material, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def enabled_for(self, role: object) -> bool:
+        enabled = str(role or "").strip().lower() not in self._disabled_roles
+        if not enabled:
+            with self._lock:
+                self._bypassed += 1
+        return enabled
+
+    def get(self, key: str) -> dict[str, object] | None:
+        cached = self._backend.get(key, self._clock())
+        with self._lock:
+            if cached is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        result = copy.deepcopy(cached)
+        # Every execution keeps its own trace id even when the answer is reused.
+        result["trace_id"] = f"act_{uuid4().hex[:12]}"
+        metadata = result.get("metadata")
+        if not isinstance(metadata, dict):
+            metadata = {}
+        metadata["llm_cache"] = "hit"
+        result["metadata"] = metadata
+        return result
+
+    def put(self, key: str, result: dict[str, object]) -> None:
+        status = str(result.get("status", "")).strip().lower()
+        if status not in CACHEABLE_STATUSES:
+            return
+        stored = copy.deepcopy(result)
+        metadata = stored.get("metadata")
+        if isinstance(metadata, dict):
+            metadata.pop("llm_cache", None)
+        evicted = self._backend.set(key, stored, self._clock())
+        with self._lock:
+            self._stores += 1
+            self._evictions += evicted
+
+    def clear(self) -> None:
+        self._backend.clear()
+
+    def close(self) -> None:
+        close = getattr(self._backend, "close", None)
+        if callable(close):
+            close()
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "backend": self._backend_name,
+                "entries": self._backend.size(),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "stores": self._stores,
+                "evictions": self._evictions,
+                "bypassed": self._bypassed,
+                "disabled_roles": sorted(self._disabled_roles),
+            }
+
+
+def build_llm_response_cache_from_env() -> LLMResponseCache | None:
+    backend_name = os.getenv("ACTION_LAYER_LLM_CACHE_BACKEND", "off").strip().lower()
+    if backend_name in {"", "off", "none", "false"}:
+        return None
+    try:
+        max_entries = int(os.getenv("ACTION_LAYER_LLM_CACHE_MAX_ENTRIES", "1024"))
+    except ValueError:
+        max_entries = 1024
+    try:
+        ttl_seconds = float(os.getenv("ACTION_LAYER_LLM_CACHE_TTL_SECONDS", "3600"))
+    except ValueError:
+        ttl_seconds = 3600.0
+    disabled_roles = {
+        item.strip()
+        for item in os.getenv("ACTION_LAYER_LLM_CACHE_DISABLED_ROLES", "").split(",")
+        if item.strip()
+    }
+
+    backend: LLMResponseCacheBackend
+    if backend_name == "sqlite":
+        backend = SqliteLLMResponseCacheBackend(
+            os.getenv(
+                "ACTION_LAYER_LLM_CACHE_PATH",
+                ".wherecode/action_layer_llm_cache.sqlite3",
+            ),
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+        )
+    else:
+        backend_name = "memory"
+        backend = InMemoryLLMResponseCacheBackend(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+        )
+    return LLMResponseCache(
+        backend,
+        backend_name=backend_name,
+        disabled_roles=disabled_roles,
+    )
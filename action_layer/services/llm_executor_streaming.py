@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import json
+
+
+# Scans the model's JSON answer as tokens arrive: the top-level status is
+# reported once its string closes, each agent_trace.steps[] object as soon as it
+# closes, and `complete` flips when the top-level object closes.
+class StreamingResultScanner:
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._position = 0
+        self._stack: list[str] = []
+        self._keys: list[str | None] = []
+        self._expect_key = False
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._root_start = -1
+        self._root_end = -1
+        self._step_start = -1
+        self._step_index = 0
+        self.status: str | None = None
+
+    @property
+    def complete(self) -> bool:
+        return self._root_end >= 0
+
+    @property
+    def text(self) -> str:
+        if self._root_end >= 0:
+            return self._buffer[self._root_start : self._root_end + 1]
+        return self._buffer
+
+    def feed(self, chunk: str) -> list[dict[str, object]]:
+        if self.complete or not chunk:
+            return []
+        self._buffer += chunk
+        events: list[dict[str, object]] = []
+        buffer = self._buffer
+        while self._position < len(buffer) and not self.complete:
+            char = buffer[self._position]
+            if self._in_string:
+                self._scan_string_char(char, events)
+            else:
+                self._scan_structural_char(char, events)
+            self._position += 1
+        return events
+
+    def _scan_string_char(self, char: str, events: list[dict[str, object]]) -> None:
+        if self._escape:
+            self._escape = False
+            return
+        if char == "\\":
+            self._escape = True
+            return
+        if char != '"':
+            return
+        self._in_string = False
+        if not self._stack:
+            return
+        try:
+            value = json.loads(self._buffer[self._string_start : self._position + 1])
+        except json.JSONDecodeError:
+            return
+        if self._stack[-1] == "{" and self._expect_key:
+            self._keys[-1] = value
+            self._expect_key = False
+            return
+        if len(self._stack) == 1 and self._keys[-1] == "status" and self.status is None:
+            self.status = str(value).strip().lower()
+            events.append({"event": "status", "status": self.status})
+
+    def _scan_structural_char(self, char: str, events: list[dict[str, object]]) -> None:
+        if char == '"':
+            if not self._stack:
+                return
+            self._in_string = True
+            self._string_start = self._position
+            return
+        if char in "{[":
+            if not self._stack and char == "{":
+                self._root_start = self._position
+            elif not self._stack:
+                return
+            self._stack.append(char)
+            self._keys.append(None)
+            self._expect_key = char == "{"
+            if char == "{" and self._in_trace_steps(len(self._stack) - 1):
+                self._step_start = self._position
+            return
+        if char in "}]":
+            if not self._stack:
+                return
+            self._stack.pop()
+            self._keys.pop()
+            self._expect_key = False
+            if char == "}" and self._step_start >= 0 and self._in_trace_steps(len(self._stack)):
+                self._emit_step(events)
+            if not self._stack:
+                self._root_end = self._position
+            return
+        if char == "," and self._stack and self._stack[-1] == "{":
+            self._expect_key = True
+
+    def _in_trace_steps(self, depth: int) -> bool:
+        # depth counts open containers above the candidate step object:
+        # root object -> "agent_trace" object -> "steps" array.
+        return (
+            depth == 3
+            and self._stack[:3] == ["{", "{", "["]
+            and self._keys[0] == "agent_trace"
+            and self._keys[1] == "steps"
+        )
+
+    def _emit_step(self, events: list[dict[str, object]]) -> None:
+        raw = self._buffer[self._step_start : self._position + 1]
+        self._step_start = -1
+        try:
+            step = json.loads(raw)
+        except json.JSONDecodeError:
+            return
+        if not isinstance(step, dict):
+            return
+        self._step_index += 1
+        events.append({"event": "trace_step", "index": self._step_index, "step": step})
+
+
+def sse_data(line: bytes) -> str | None:
+    text = line.decode("utf-8", errors="ignore").strip()
+    if not text.startswith("data:"):
+        return None
+    return text[5:].strip()
+
+
+def decode_chat_completions_line(line: bytes) -> tuple[str, bool]:
+    data = sse_data(line)
+    if data is None or not data:
+        return "", False
+    if data == "[DONE]":
+        return "", True
+    chunk = _loads_object(data)
+    choices = chunk.get("choices")
+    if not isinstance(choices, list) or not choices or not isinstance(choices[0], dict):
+        return "", False
+    delta = choices[0].get("delta")
+    content = delta.get("content") if isinstance(delta, dict) else None
+    done = choices[0].get("finish_reason") not in {None, ""}
+    return (content if isinstance(content, str) else ""), done
+
+
+def decode_responses_line(line: bytes) -> tuple[str, bool]:
+    data = sse_data(line)
+    if data is None or not data:
+        return "", False
+    event = _loads_object(data)
+    event_type = str(event.get("type", ""))
+    if event_type == "response.output_text.delta":
+        delta = event.get("delta")
+        return (delta if isinstance(delta, str) else ""), False
+    return "", event_type in {"response.completed", "response.failed", "response.incomplete"}
+
+
+def decode_ollama_line(line: bytes) -> tuple[str, bool]:
+    text = line.decode("utf-8", errors="ignore").strip()
+    if not text:
+        return "", False
+    chunk = _loads_object(text)
+    message = chunk.get("message")
+    content = message.get("content") if isinstance(message, dict) else chunk.get("response")
+    return (content if isinstance(content, str) else ""), bool(chunk.get("done"))
+
+
+def _loads_object(raw: str) -> dict[str, object]:
+    try:
+        parsed = json.loads(raw)
+    except json.JSONDecodeError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
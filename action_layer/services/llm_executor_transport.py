@@ -0,0 +1,685 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import random
+import socket
+import ssl
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+from action_layer.services.llm_executor_exceptions import LLMExecutionError
+from action_layer.services.llm_executor_runtime_helpers import default_http_post
+
+DEFAULT_USER_AGENT = "wherecode-action-layer/0.1"
+MAX_RESPONSE_HEADER_LINES = 200
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    max_retries: int = 2
+    base_delay_seconds: float = 0.6
+    max_delay_seconds: float = 8.0
+    jitter_ratio: float = 0.5
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        return cls(
+            max_retries=max(0, _env_int("ACTION_LAYER_LLM_MAX_RETRIES", 2)),
+            base_delay_seconds=max(
+                0.0,
+                _env_float("ACTION_LAYER_LLM_RETRY_DELAY_SECONDS", 0.6),
+            ),
+            max_delay_seconds=max(
+                0.0,
+                _env_float("ACTION_LAYER_LLM_RETRY_MAX_DELAY_SECONDS", 8.0),
+            ),
+        )
+
+    def backoff(self, attempt: int) -> float:
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * (2**attempt))
+        jitter = ceiling * self.jitter_ratio
+        return ceiling - jitter + random.uniform(0.0, jitter)
+
+
+@dataclass(frozen=True, slots=True)
+class _Origin:
+    scheme: str
+    host: str
+    port: int
+
+
+@dataclass(slots=True)
+class _HttpResponse:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    reusable: bool
+
+
+class _RetryableError(Exception):
+    def __init__(self, detail: str, retry_after: float | None = None) -> None:
+        super().__init__(detail)
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)).strip())
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)).strip())
+    except ValueError:
+        return default
+
+
+def parse_retry_after(value: str | None, *, now: float | None = None) -> float | None:
+    if value is None or not value.strip():
+        return None
+    raw = value.strip()
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(raw)
+    except (TypeError, ValueError):
+        return None
+    current = time.time() if now is None else now
+    return max(0.0, retry_at.timestamp() - current)
+
+
+class _Connection:
+    __slots__ = ("reader", "writer", "idle_since")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.idle_since = time.monotonic()
+
+    def usable(self, keepalive_expiry: float) -> bool:
+        if self.writer.is_closing() or self.reader.at_eof():
+            return False
+        return time.monotonic() - self.idle_since < keepalive_expiry
+
+    def close(self) -> None:
+        try:
+            self.writer.close()
+        except RuntimeError:
+            # The owning loop is already closed; shut the socket down so the
+            # peer sees the close, and let the transport release the fd.
+            sock = self.writer.get_extra_info("socket")
+            if sock is not None:
+                with contextlib.suppress(OSError):
+                    sock.shutdown(socket.SHUT_RDWR)
+
+
+@dataclass(slots=True)
+class _LoopPool:
+    slots: asyncio.Semaphore
+    idle: dict[_Origin, deque[_Connection]] = field(default_factory=dict)
+
+    def idle_count(self) -> int:
+        return sum(len(items) for items in self.idle.values())
+
+    def close_idle(self, loop: asyncio.AbstractEventLoop) -> None:
+        connections = [connection for items in self.idle.values() for connection in items]
+        self.idle.clear()
+        for connection in connections:
+            if loop.is_closed() or _running_loop() is loop:
+                connection.close()
+            else:
+                loop.call_soon_threadsafe(connection.close)
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def resolve_proxy(url: str) -> str | None:
+    parts = urlsplit(url)
+    proxy = getproxies().get(parts.scheme)
+    if not proxy or not parts.hostname or proxy_bypass(parts.hostname):
+        return None
+    return proxy
+
+
+class AsyncLLMTransport:
+    def __init__(
+        self,
+        *,
+        max_connections: int = 8,
+        keepalive_expiry_seconds: float = 30.0,
+        retry_policy: RetryPolicy | None = None,
+        user_agent: str | None = None,
+    ) -> None:
+        self._max_connections = max(1, int(max_connections))
+        self._keepalive_expiry = max(0.0, float(keepalive_expiry_seconds))
+        self._retry_policy = retry_policy or RetryPolicy.from_env()
+        self._user_agent = (
+            user_agent
+            or os.getenv("ACTION_LAYER_LLM_USER_AGENT", DEFAULT_USER_AGENT).strip()
+            or DEFAULT_USER_AGENT
+        )
+        self._ssl_context: ssl.SSLContext | None = None
+        # Sockets and semaphores are bound to the loop that created them, so
+        # every loop gets its own pool; the connection cap applies per loop.
+        self._pools: dict[asyncio.AbstractEventLoop, _LoopPool] = {}
+        self._sync_loop: asyncio.AbstractEventLoop | None = None
+        self._sync_thread: threading.Thread | None = None
+        self._sync_lock = threading.Lock()
+        self._connections_opened = 0
+        self._requests_total = 0
+        self._retries_total = 0
+
+    @classmethod
+    def from_env(cls, *, max_connections: int | None = None) -> "AsyncLLMTransport":
+        return cls(
+            max_connections=(
+                max_connections
+                if max_connections is not None
+                else _env_int("ACTION_LAYER_LLM_MAX_CONNECTIONS_PER_TARGET", 8)
+            ),
+            keepalive_expiry_seconds=_env_float("ACTION_LAYER_LLM_KEEPALIVE_SECONDS", 30.0),
+        )
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "max_connections": self._max_connections,
+            "idle_connections": sum(pool.idle_count() for pool in list(self._pools.values())),
+            "connections_opened": self._connections_opened,
+            "requests_total": self._requests_total,
+            "retries_total": self._retries_total,
+        }
+
+    def __call__(
+        self,
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, object],
+        timeout_seconds: float,
+    ) -> dict[str, object]:
+        # Blocking callers share one background loop so pooled connections
+        # survive between calls made from different worker threads.
+        future = asyncio.run_coroutine_threadsafe(
+            self.post(url, headers, payload, timeout_seconds),
+            self._ensure_sync_loop(),
+        )
+        return future.result()
+
+    async def post(
+        self,
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, object],
+        timeout_seconds: float,
+    ) -> dict[str, object]:
+        if resolve_proxy(url) is not None:
+            # Proxied targets go through urllib, which honours HTTP(S)_PROXY
+            # and NO_PROXY; the pooled client only speaks to origins directly.
+            return await asyncio.to_thread(
+                default_http_post,
+                url,
+                headers,
+                payload,
+                timeout_seconds,
+            )
+        origin, target, body, request_headers = self._prepare(url, headers, payload)
+        for attempt in range(self._retry_policy.max_retries + 1):
+            self._requests_total += 1
+            try:
+                response = await self._send_once(
+                    origin,
+                    target,
+                    request_headers,
+                    body,
+                    timeout_seconds,
+                )
+            except _RetryableError as exc:
+                await asyncio.sleep(self._retry_delay(exc, attempt))
+                continue
+            return _decode_json_body(response.body)
+        raise LLMExecutionError("llm provider unavailable: retries exhausted")
+
+    async def stream_lines(
+        self,
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, object],
+        timeout_seconds: float,
+    ) -> AsyncIterator[bytes]:
+        # Failures before the response head arrives are retried like post();
+        # once lines are flowing, timeout_seconds bounds each gap between
+        # reads. Closing the iterator early drops the connection.
+        if resolve_proxy(url) is not None:
+            raise LLMExecutionError(
+                "llm provider streaming is not supported through an http proxy"
+            )
+        origin, target, body, request_headers = self._prepare(
+            url,
+            {**headers, "Accept": "text/event-stream, application/x-ndjson"},
+            payload,
+        )
+        for attempt in range(self._retry_policy.max_retries + 1):
+            self._requests_total += 1
+            pool = self._pool()
+            connection: _Connection | None = None
+            reusable = False
+            retry: _RetryableError | None = None
+            try:
+                async with asyncio.timeout(timeout_seconds):
+                    await pool.slots.acquire()
+            except TimeoutError as exc:
+                raise LLMExecutionError(
+                    f"llm provider unavailable: timed out after {timeout_seconds:.1f}s"
+                ) from exc
+            try:
+                try:
+                    async with asyncio.timeout(timeout_seconds):
+                        connection, status, response_headers = await self._open_exchange(
+                            pool,
+                            origin,
+                            target,
+                            request_headers,
+                            body,
+                        )
+                        if status >= 400:
+                            response_body, reusable = await self._read_body(
+                                connection.reader,
+                                response_headers,
+                            )
+                            _raise_for_status(
+                                _HttpResponse(status, response_headers, response_body, reusable)
+                            )
+                except _RetryableError as exc:
+                    retry = exc
+                except TimeoutError as exc:
+                    retry = _RetryableError(
+                        f"llm provider unavailable: timed out after {timeout_seconds:.1f}s"
+                    )
+                    retry.__cause__ = exc
+                except (OSError, asyncio.IncompleteReadError, ValueError) as exc:
+                    detail = str(exc).strip() or exc.__class__.__name__
+                    retry = _RetryableError(f"llm provider unavailable: {detail}")
+                    retry.__cause__ = exc
+
+                if retry is None:
+                    assert connection is not None
+                    async for line in self._iter_lines(
+                        connection.reader,
+                        response_headers,
+                        timeout_seconds,
+                    ):
+                        yield line
+                    reusable = response_headers.get("connection", "").lower() != "close" and (
+                        "chunked" in response_headers.get("transfer-encoding", "").lower()
+                        or "content-length" in response_headers
+                    )
+            finally:
+                if connection is not None:
+                    self._release(pool, origin, connection, reusable)
+                pool.slots.release()
+            if retry is None:
+                return
+            await asyncio.sleep(self._retry_delay(retry, attempt))
+        raise LLMExecutionError("llm provider unavailable: retries exhausted")
+
+    def _retry_delay(self, exc: _RetryableError, attempt: int) -> float:
+        policy = self._retry_policy
+        if attempt >= policy.max_retries:
+            raise LLMExecutionError(exc.detail) from exc
+        if exc.retry_after is not None and exc.retry_after > policy.max_delay_seconds:
+            raise LLMExecutionError(
+                f"{exc.detail} (retry-after {exc.retry_after:.1f}s exceeds "
+                f"{policy.max_delay_seconds:.1f}s)"
+            ) from exc
+        self._retries_total += 1
+        return exc.retry_after if exc.retry_after is not None else policy.backoff(attempt)
+
+    def _prepare(
+        self,
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, object],
+    ) -> tuple[_Origin, str, bytes, dict[str, str]]:
+        parts = urlsplit(url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            raise LLMExecutionError(f"llm provider unavailable: unsupported url {url}")
+        origin = _Origin(
+            scheme=parts.scheme,
+            host=parts.hostname,
+            port=parts.port or (443 if parts.scheme == "https" else 80),
+        )
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        return origin, target, body, self._request_headers(origin, headers, len(body))
+
+    async def aclose(self) -> None:
+        pools = self._pools
+        self._pools = {}
+        for loop, pool in pools.items():
+            pool.close_idle(loop)
+
+    def close(self) -> None:
+        with self._sync_lock:
+            loop = self._sync_loop
+            thread = self._sync_thread
+            self._sync_loop = None
+            self._sync_thread = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.aclose(), loop).result(timeout=5)
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+
+    def _ensure_sync_loop(self) -> asyncio.AbstractEventLoop:
+        with self._sync_lock:
+            if self._sync_loop is not None:
+                return self._sync_loop
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name="action-layer-llm-transport",
+                daemon=True,
+            )
+            thread.start()
+            self._sync_loop = loop
+            self._sync_thread = thread
+            return loop
+
+    def _pool(self) -> _LoopPool:
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is None:
+            # Pools of loops that have since closed are dropped here, closing
+            # their idle connections instead of leaking the sockets.
+            for stale_loop in [item for item in self._pools if item.is_closed()]:
+                self._pools.pop(stale_loop).close_idle(stale_loop)
+            pool = _LoopPool(slots=asyncio.Semaphore(self._max_connections))
+            self._pools[loop] = pool
+        return pool
+
+    def _request_headers(
+        self,
+        origin: _Origin,
+        headers: dict[str, str],
+        content_length: int,
+    ) -> dict[str, str]:
+        default_port = 443 if origin.scheme == "https" else 80
+        host = origin.host if origin.port == default_port else f"{origin.host}:{origin.port}"
+        output = {"Host": host}
+        output.update(headers)
+        if not any(key.lower() == "user-agent" for key in output):
+            output["User-Agent"] = self._user_agent
+        output["Content-Length"] = str(content_length)
+        output["Connection"] = "keep-alive"
+        output.setdefault("Accept", "application/json")
+        return output
+
+    async def _send_once(
+        self,
+        origin: _Origin,
+        target: str,
+        headers: dict[str, str],
+        body: bytes,
+        timeout_seconds: float,
+    ) -> _HttpResponse:
+        pool = self._pool()
+        connection: _Connection | None = None
+        reusable = False
+        try:
+            async with asyncio.timeout(timeout_seconds):
+                async with pool.slots:
+                    connection, status, response_headers = await self._open_exchange(
+                        pool,
+                        origin,
+                        target,
+                        headers,
+                        body,
+                    )
+                    response_body, reusable = await self._read_body(
+                        connection.reader,
+                        response_headers,
+                    )
+        except TimeoutError as exc:
+            raise _RetryableError(
+                f"llm provider unavailable: timed out after {timeout_seconds:.1f}s"
+            ) from exc
+        except (OSError, asyncio.IncompleteReadError, ValueError) as exc:
+            detail = str(exc).strip() or exc.__class__.__name__
+            raise _RetryableError(f"llm provider unavailable: {detail}") from exc
+        finally:
+            if connection is not None:
+                self._release(pool, origin, connection, reusable)
+
+        response = _HttpResponse(status, response_headers, response_body, reusable)
+        _raise_for_status(response)
+        return response
+
+    async def _open_exchange(
+        self,
+        pool: _LoopPool,
+        origin: _Origin,
+        target: str,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> tuple[_Connection, int, dict[str, str]]:
+        connection, reused = await self._acquire(pool, origin)
+        try:
+            status, response_headers = await self._send_request(connection, target, headers, body)
+        except (OSError, asyncio.IncompleteReadError):
+            connection.close()
+            if not reused:
+                raise
+            # The peer may have dropped an idle keep-alive socket; one fresh
+            # connection does not count as a retry.
+            connection = await self._open(origin)
+            try:
+                status, response_headers = await self._send_request(
+                    connection,
+                    target,
+                    headers,
+                    body,
+                )
+            except BaseException:
+                connection.close()
+                raise
+        except BaseException:
+            connection.close()
+            raise
+        return connection, status, response_headers
+
+    async def _acquire(self, pool: _LoopPool, origin: _Origin) -> tuple[_Connection, bool]:
+        idle = pool.idle.get(origin)
+        while idle:
+            connection = idle.pop()
+            if connection.usable(self._keepalive_expiry):
+                return connection, True
+            connection.close()
+        return await self._open(origin), False
+
+    async def _open(self, origin: _Origin) -> _Connection:
+        reader, writer = await asyncio.open_connection(
+            origin.host,
+            origin.port,
+            ssl=self._ssl() if origin.scheme == "https" else None,
+        )
+        self._connections_opened += 1
+        return _Connection(reader, writer)
+
+    def _release(
+        self,
+        pool: _LoopPool,
+        origin: _Origin,
+        connection: _Connection,
+        reusable: bool,
+    ) -> None:
+        if not reusable or self._keepalive_expiry <= 0 or self._pools.get(
+            asyncio.get_running_loop()
+        ) is not pool:
+            connection.close()
+            return
+        connection.idle_since = time.monotonic()
+        pool.idle.setdefault(origin, deque()).append(connection)
+
+    def _ssl(self) -> ssl.SSLContext:
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context()
+        return self._ssl_context
+
+    @staticmethod
+    async def _send_request(
+        connection: _Connection,
+        target: str,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> tuple[int, dict[str, str]]:
+        head = [f"POST {target} HTTP/1.1"]
+        head.extend(f"{name}: {value}" for name, value in headers.items())
+        connection.writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        await connection.writer.drain()
+
+        reader = connection.reader
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("connection closed before response")
+        parts = status_line.decode("latin-1").split(" ", 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+            raise ValueError("malformed response status line")
+        status = int(parts[1])
+
+        response_headers: dict[str, str] = {}
+        for _ in range(MAX_RESPONSE_HEADER_LINES):
+            line = await reader.readline()
+            if line in {b"\r\n", b"\n", b""}:
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+        else:
+            raise ValueError("too many response headers")
+        return status, response_headers
+
+    @staticmethod
+    async def _read_body(
+        reader: asyncio.StreamReader,
+        response_headers: dict[str, str],
+    ) -> tuple[bytes, bool]:
+        reusable = response_headers.get("connection", "").lower() != "close"
+        if "chunked" in response_headers.get("transfer-encoding", "").lower():
+            return await _read_chunked(reader), reusable
+        if "content-length" in response_headers:
+            return await reader.readexactly(int(response_headers["content-length"])), reusable
+        return await reader.read(), False
+
+    @staticmethod
+    async def _iter_lines(
+        reader: asyncio.StreamReader,
+        response_headers: dict[str, str],
+        idle_timeout_seconds: float,
+    ) -> AsyncIterator[bytes]:
+        async def read(awaitable):
+            try:
+                async with asyncio.timeout(idle_timeout_seconds):
+                    return await awaitable
+            except TimeoutError as exc:
+                raise LLMExecutionError(
+                    f"llm provider stream stalled for {idle_timeout_seconds:.1f}s"
+                ) from exc
+            except (OSError, asyncio.IncompleteReadError) as exc:
+                raise LLMExecutionError(f"llm provider stream interrupted: {exc}") from exc
+
+        if "chunked" in response_headers.get("transfer-encoding", "").lower():
+            pending = b""
+            while True:
+                size_line = await read(reader.readline())
+                try:
+                    size = _chunk_size(size_line)
+                except ValueError as exc:
+                    raise LLMExecutionError(
+                        "llm provider stream interrupted: malformed chunk size"
+                    ) from exc
+                if size == 0:
+                    while (await read(reader.readline())) not in {b"\r\n", b"\n", b""}:
+                        pass
+                    break
+                pending += await read(reader.readexactly(size))
+                await read(reader.readexactly(2))
+                *lines, pending = pending.split(b"\n")
+                for line in lines:
+                    yield line
+            if pending:
+                yield pending
+            return
+
+        remaining = (
+            int(response_headers["content-length"])
+            if "content-length" in response_headers
+            else None
+        )
+        while remaining is None or remaining > 0:
+            line = await read(reader.readline())
+            if not line:
+                return
+            if remaining is not None:
+                remaining -= len(line)
+            yield line.rstrip(b"\n")
+
+
+def _chunk_size(size_line: bytes) -> int:
+    return int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        size = _chunk_size(await reader.readline())
+        if size == 0:
+            while (await reader.readline()) not in {b"\r\n", b"\n", b""}:
+                pass
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+
+
+def _raise_for_status(response: _HttpResponse) -> None:
+    if response.status == 429 or response.status >= 500:
+        raise _RetryableError(
+            _status_detail(response),
+            retry_after=parse_retry_after(response.headers.get("retry-after")),
+        )
+    if response.status >= 400:
+        raise LLMExecutionError(_status_detail(response))
+
+
+def _status_detail(response: _HttpResponse) -> str:
+    detail = response.body.decode("utf-8", errors="ignore").strip()
+    return f"llm provider request failed: HTTP {response.status} {detail}".strip()
+
+
+def _decode_json_body(body: bytes) -> dict[str, object]:
+    try:
+        response_json = json.loads(body.decode("utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+        raise LLMExecutionError("llm provider returned invalid json response") from exc
+    if not isinstance(response_json, dict):
+        raise LLMExecutionError("llm provider returned unexpected response object")
+    return response_json
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import copy
 import os
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from http import HTTPStatus
 from typing import Any
 from uuid import uuid4
@@ -11,6 +14,7 @@ from action_layer.services.agent_profile_loader import (
     AgentProfileNotFoundError,
 )
 from action_layer.services.agent_registry import AgentRegistry, UnknownAgentRoleError
+from action_layer.services.execution_coalescing import ExecutionCoalescer
 from action_layer.services.llm_executor import (
     LLMExecutionError,
     LLMRoutingConfig,
@@ -27,12 +31,14 @@ class ActionRuntimeExecutionService:
         llm_config: LLMRoutingConfig | None,
         llm_executor: RoutedLLMExecutor | None,
         llm_init_error: str | None,
+        coalescer: ExecutionCoalescer | None = None,
     ) -> None:
         self._registry = registry
         self._profile_loader = profile_loader
         self._llm_config = llm_config
         self._llm_executor = llm_executor
         self._llm_init_error = llm_init_error
+        self._coalescer = coalescer
 
     @staticmethod
     def require_llm() -> bool:
@@ -67,6 +73,15 @@ class ActionRuntimeExecutionService:
             "by_module_prefix": self._llm_config.module_prefix_routes,
         }
 
+    def route_target(self, payload: dict[str, object]) -> str | None:
+        if self.execution_mode() != "llm" or self._llm_executor is None:
+            return None
+        try:
+            target, _ = self._llm_executor.select_target(payload)
+        except LLMExecutionError:
+            return None
+        return target
+
     def build_health_payload(self) -> dict[str, object]:
         mode = self.execution_mode()
         if self.require_llm() and not self.llm_ready():
@@ -83,6 +98,11 @@ class ActionRuntimeExecutionService:
             "llm_ready": self.llm_ready(),
             "llm_required": self.require_llm(),
             "llm_init_error": self._llm_init_error,
+            "llm_transport": (
+                self._llm_executor.transport_snapshot()
+                if self._llm_executor is not None
+                else {}
+            ),
         }
 
     def build_capabilities_payload(self) -> dict[str, object]:
@@ -98,8 +118,21 @@ class ActionRuntimeExecutionService:
             "llm_ready": self.llm_ready(),
             "llm_required": self.require_llm(),
             "llm_init_error": self._llm_init_error,
+            "llm_cache": (
+                self._llm_executor.cache_snapshot()
+                if self._llm_executor is not None
+                else None
+            ),
+            "execution_coalescing": (
+                self._coalescer.snapshot() if self._coalescer is not None else None
+            ),
         }
 
+    @staticmethod
+    def _profile_hash(base_metadata: dict[str, object]) -> str | None:
+        profile_hash = base_metadata.get("profile_hash")
+        return str(profile_hash) if profile_hash else None
+
     @staticmethod
     def _agent_standard_metadata() -> dict[str, object]:
         return {
@@ -262,11 +295,149 @@ class ActionRuntimeExecutionService:
         return payload
 
     def execute(self, payload: dict[str, object]) -> tuple[HTTPStatus, dict[str, object]]:
+        early_response, text, base_metadata = self._prepare_execution(payload)
+        if early_response is not None:
+            return early_response
+        if self.execution_mode() == "llm" and self.llm_ready():
+            coalesce_key = self._coalesce_key(payload, base_metadata)
+            if coalesce_key is None:
+                result = self._execute_with_llm(payload, base_metadata)
+            else:
+                assert self._coalescer is not None
+                shared, coalesced = self._coalescer.run(
+                    coalesce_key,
+                    lambda: self._execute_with_llm(payload, base_metadata),
+                )
+                result = self._fan_out(shared, coalesced)
+            return HTTPStatus.OK, self._with_standard_agent_contract(result, text=text)
+        return self._execute_without_llm(text, payload, base_metadata)
+
+    async def execute_async(
+        self,
+        payload: dict[str, object],
+    ) -> tuple[HTTPStatus, dict[str, object]]:
+        early_response, text, base_metadata = self._prepare_execution(payload)
+        if early_response is not None:
+            return early_response
+        if self.execution_mode() == "llm" and self.llm_ready():
+            coalesce_key = self._coalesce_key(payload, base_metadata)
+            if coalesce_key is None:
+                result = await self._execute_with_llm_async(payload, base_metadata)
+            else:
+                assert self._coalescer is not None
+                shared, coalesced = await self._coalescer.run_async(
+                    coalesce_key,
+                    lambda: self._execute_with_llm_async(payload, base_metadata),
+                )
+                result = self._fan_out(shared, coalesced)
+            return HTTPStatus.OK, self._with_standard_agent_contract(result, text=text)
+        return self._execute_without_llm(text, payload, base_metadata)
+
+    async def execute_stream(
+        self,
+        payload: dict[str, object],
+    ) -> AsyncIterator[dict[str, object]]:
+        early_response, text, base_metadata = self._prepare_execution(payload)
+        if early_response is not None:
+            yield self._stream_result_event(*early_response)
+            return
+        if not (self.execution_mode() == "llm" and self.llm_ready()):
+            yield self._stream_result_event(
+                *self._execute_without_llm(text, payload, base_metadata)
+            )
+            return
+        assert self._llm_executor is not None
+
+        result: dict[str, object] | None = None
+        try:
+            events_source = self._llm_executor.stream(
+                payload,
+                profile_hash=self._profile_hash(base_metadata),
+            )
+            async with aclosing(events_source) as events:
+                async for event in events:
+                    if event.get("event") == "result":
+                        raw_result = event.get("result")
+                        result = self._merge_llm_result(
+                            payload,
+                            base_metadata,
+                            raw_result if isinstance(raw_result, dict) else {},
+                        )
+                        continue
+                    yield event
+        except LLMExecutionError as exc:
+            result = self._llm_failure(payload, base_metadata, str(exc))
+        if result is None:
+            result = self._llm_failure(payload, base_metadata, "llm stream ended without result")
+        yield self._stream_result_event(
+            HTTPStatus.OK,
+            self._with_standard_agent_contract(result, text=text),
+        )
+
+    def _coalesce_key(
+        self,
+        payload: dict[str, object],
+        base_metadata: dict[str, object],
+    ) -> str | None:
+        if self._coalescer is None:
+            return None
+        target = self.route_target(payload)
+        return self._coalescer.key_for(
+            payload,
+            target=target,
+            profile_hash=self._profile_hash(base_metadata),
+            model_settings=self._model_settings(target),
+        )
+
+    def _model_settings(self, target: str | None) -> dict[str, object] | None:
+        if self._llm_config is None or target is None:
+            return None
+        provider_config = self._llm_config.targets.get(target)
+        if provider_config is None:
+            return None
+        return {
+            "provider": provider_config.provider,
+            "base_url": provider_config.base_url,
+            "model": provider_config.model,
+            "wire_api": provider_config.wire_api,
+            "temperature": provider_config.temperature,
+            "max_tokens": provider_config.max_tokens,
+            "system_prompt": provider_config.system_prompt,
+        }
+
+    @staticmethod
+    def _fan_out(shared: dict[str, object], coalesced: bool) -> dict[str, object]:
+        # Every caller gets its own copy; followers also get their own trace id.
+        result = copy.deepcopy(shared)
+        if coalesced:
+            result["trace_id"] = f"act_{uuid4().hex[:12]}"
+            metadata = result.get("metadata")
+            if not isinstance(metadata, dict):
+                metadata = {}
+            metadata["coalesced"] = True
+            result["metadata"] = metadata
+        return result
+
+    @staticmethod
+    def _stream_result_event(
+        status: HTTPStatus,
+        body: dict[str, object],
+    ) -> dict[str, object]:
+        if status == HTTPStatus.OK:
+            return {"event": "result", "status_code": int(status), "result": body}
+        return {"event": "error", "status_code": int(status), **body}
+
+    def _prepare_execution(
+        self,
+        payload: dict[str, object],
+    ) -> tuple[tuple[HTTPStatus, dict[str, object]] | None, str, dict[str, object]]:
         text = str(payload.get("text", "")).strip()
         if not text:
-            return HTTPStatus.UNPROCESSABLE_ENTITY, {
-                "detail": "text must be a non-empty string"
-            }
+            return (
+                (HTTPStatus.UNPROCESSABLE_ENTITY, {"detail": "text must be a non-empty string"}),
+                text,
+                {},
+            )
 
         requested_role = str(payload.get("role", "")).strip().lower()
         requested_agent = str(payload.get("agent", "")).strip()
@@ -279,13 +450,13 @@ class ActionRuntimeExecutionService:
                 profile_hash = profile.profile_hash
                 resolved_role = profile.role
             except (AgentProfileAccessError, AgentProfileNotFoundError) as exc:
-                return HTTPStatus.UNPROCESSABLE_ENTITY, {"detail": str(exc)}
+                return (HTTPStatus.UNPROCESSABLE_ENTITY, {"detail": str(exc)}), text, {}
 
             if not requested_agent:
                 try:
                     requested_agent = self._registry.resolve(requested_role)
                 except UnknownAgentRoleError as exc:
-                    return HTTPStatus.UNPROCESSABLE_ENTITY, {"detail": str(exc)}
+                    return (HTTPStatus.UNPROCESSABLE_ENTITY, {"detail": str(exc)}), text, {}
 
         if not requested_agent:
             requested_agent = "coding-agent"
@@ -317,18 +488,26 @@ class ActionRuntimeExecutionService:
                 },
                 "metadata": base_metadata,
             }
-            return HTTPStatus.OK, self._with_standard_agent_contract(result, text=text)
+            return (
+                (HTTPStatus.OK, self._with_standard_agent_contract(result, text=text)),
+                text,
+                base_metadata,
+            )
+        return None, text, base_metadata
 
-        if self.execution_mode() == "llm" and self.llm_ready():
-            result = self._execute_with_llm(payload, base_metadata)
-            return HTTPStatus.OK, self._with_standard_agent_contract(result, text=text)
+    def _execute_without_llm(
+        self,
+        text: str,
+        payload: dict[str, object],
+        base_metadata: dict[str, object],
+    ) -> tuple[HTTPStatus, dict[str, object]]:
         if self.require_llm():
             return HTTPStatus.SERVICE_UNAVAILABLE, {
                 "detail": "llm execution is required but not ready",
                 "mode": self.execution_mode(),
                 "llm_init_error": self._llm_init_error,
             }
-        result = self._execute_mock(text, requested_agent, base_metadata)
+        result = self._execute_mock(text, str(payload["agent"]), base_metadata)
         return HTTPStatus.OK, self._with_standard_agent_contract(result, text=text)
 
     def _execute_with_llm(
@@ -337,29 +516,66 @@ class ActionRuntimeExecutionService:
         base_metadata: dict[str, object],
     ) -> dict[str, object]:
         if self._llm_executor is None:
-            failed_metadata = dict(base_metadata)
-            failed_metadata["llm_error"] = "llm executor not initialized"
-            return {
-                "status": "failed",
-                "summary": "llm execution unavailable",
-                "agent": str(payload.get("agent", "")).strip() or "coding-agent",
-                "trace_id": f"act_{uuid4().hex[:12]}",
-                "metadata": failed_metadata,
-            }
+            return self._llm_failure(
+                payload,
+                base_metadata,
+                "llm executor not initialized",
+                summary="llm execution unavailable",
+            )
+        try:
+            result = self._llm_executor.execute(
+                payload,
+                profile_hash=self._profile_hash(base_metadata),
+            )
+        except LLMExecutionError as exc:
+            return self._llm_failure(payload, base_metadata, str(exc))
+        return self._merge_llm_result(payload, base_metadata, result)
 
+    async def _execute_with_llm_async(
+        self,
+        payload: dict[str, object],
+        base_metadata: dict[str, object],
+    ) -> dict[str, object]:
+        if self._llm_executor is None:
+            return self._llm_failure(
+                payload,
+                base_metadata,
+                "llm executor not initialized",
+                summary="llm execution unavailable",
+            )
         try:
-            result = self._llm_executor.execute(payload)
+            result = await self._llm_executor.execute_async(
+                payload,
+                profile_hash=self._profile_hash(base_metadata),
+            )
         except LLMExecutionError as exc:
-            failed_metadata = dict(base_metadata)
-            failed_metadata["llm_error"] = str(exc)
-            return {
-                "status": "failed",
-                "summary": "llm execution failed",
-                "agent": str(payload.get("agent", "")).strip() or "coding-agent",
-                "trace_id": f"act_{uuid4().hex[:12]}",
-                "metadata": failed_metadata,
-            }
+            return self._llm_failure(payload, base_metadata, str(exc))
+        return self._merge_llm_result(payload, base_metadata, result)
 
+    @staticmethod
+    def _llm_failure(
+        payload: dict[str, object],
+        base_metadata: dict[str, object],
+        detail: str,
+        *,
+        summary: str = "llm execution failed",
+    ) -> dict[str, object]:
+        failed_metadata = dict(base_metadata)
+        failed_metadata["llm_error"] = detail
+        return {
+            "status": "failed",
+            "summary": summary,
+            "agent": str(payload.get("agent", "")).strip() or "coding-agent",
+            "trace_id": f"act_{uuid4().hex[:12]}",
+            "metadata": failed_metadata,
+        }
+
+    @staticmethod
+    def _merge_llm_result(
+        payload: dict[str, object],
+        base_metadata: dict[str, object],
+        result: dict[str, object],
+    ) -> dict[str, object]:
         merged_metadata = dict(base_metadata)
         raw_metadata = result.get("metadata")
         if isinstance(raw_metadata, dict):
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from control_center.models import (
     ActionExecuteRequest,
     ActionExecuteResponse,
+    ActionExecuteStreamEvent,
+    ActionLayerClientMetricsResponse,
     ActionLayerHealthResponse,
 )
 from control_center.services import ActionLayerClientError
@@ -18,6 +22,10 @@ def create_action_layer_router(
     action_layer_execute_handler: Callable[
         [ActionExecuteRequest], Awaitable[ActionExecuteResponse]
     ],
+    action_layer_client_metrics_handler: Callable[[], ActionLayerClientMetricsResponse],
+    action_layer_execute_stream_handler: Callable[
+        [ActionExecuteRequest], AsyncIterator[ActionExecuteStreamEvent]
+    ],
 ) -> APIRouter:
     router = APIRouter()
 
@@ -35,4 +43,47 @@ def create_action_layer_router(
         except ActionLayerClientError as exc:
             raise HTTPException(status_code=503, detail=str(exc)) from exc
 
+    @router.post("/action-layer/execute/stream")
+    async def action_layer_execute_stream(payload: ActionExecuteRequest) -> StreamingResponse:
+        events = action_layer_execute_stream_handler(payload)
+        # Pull the first event eagerly so connection errors still surface as
+        # a 503 instead of an empty 200 stream.
+        try:
+            first = await anext(events)
+        except StopAsyncIteration:
+            first = None
+        except ActionLayerClientError as exc:
+            raise HTTPException(status_code=503, detail=str(exc)) from exc
+
+        async def relay() -> AsyncIterator[bytes]:
+            try:
+                if first is not None:
+                    yield _sse_frame(first)
+                async for event in events:
+                    yield _sse_frame(event)
+            except ActionLayerClientError as exc:
+                yield _sse_frame(
+                    ActionExecuteStreamEvent(event="error", data={"detail": str(exc)})
+                )
+            finally:
+                await events.aclose()
+
+        return StreamingResponse(
+            relay(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
+        )
+
+    @router.get(
+        "/action-layer/client-metrics",
+        response_model=ActionLayerClientMetricsResponse,
+    )
+    async def action_layer_client_metrics() -> ActionLayerClientMetricsResponse:
+        return action_layer_client_metrics_handler()
+
     return router
+
+
+def _sse_frame(event: ActionExecuteStreamEvent) -> bytes:
+    data = json.dumps(event.data, ensure_ascii=False)
+    return f"event: {event.event}\ndata: {data}\n\n".encode("utf-8")
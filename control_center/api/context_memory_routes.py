@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
 from control_center.models import (
     ContextMemoryDeleteResponse,
@@ -13,6 +13,8 @@ from control_center.models import (
 )
 from control_center.services.context_memory_store import ContextMemoryStore
 
+NEXT_CURSOR_HEADER = "X-WhereCode-Next-Cursor"
+
 
 def create_context_memory_router(
     *,
@@ -66,21 +68,26 @@ def create_context_memory_router(
     )
     async def list_context_memory_namespace_items(
         scope: MemoryNamespaceScope,
+        response: Response,
         project_id: str | None = None,
         run_id: str | None = None,
         prefix: str | None = None,
         limit: int = 200,
+        cursor: str | None = None,
     ) -> list[ContextMemoryItemResponse]:
         try:
-            records = _store().list_namespace(
+            records, next_cursor = _store().list_namespace_page(
                 scope=scope,
                 project_id=project_id,
                 run_id=run_id,
                 prefix=prefix,
                 limit=limit,
+                cursor=cursor,
             )
         except ValueError as exc:
             raise HTTPException(status_code=422, detail=str(exc)) from exc
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
         return [ContextMemoryItemResponse(**item) for item in records]
 
     @router.delete("/context/memory/items", response_model=ContextMemoryDeleteResponse)
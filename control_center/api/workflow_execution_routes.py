@@ -11,6 +11,8 @@ from control_center.models import (
     InterruptWorkflowRunRequest,
     InterruptWorkflowRunResponse,
     ResolveDiscussionRequest,
+    SubmitWorkflowRunRequest,
+    WorkflowRunExecutionStatusResponse,
 )
 from control_center.services import WorkflowScheduler
 
@@ -23,6 +25,12 @@ def create_workflow_execution_router(
     interrupt_workflow_run_handler: Callable[
         [str, InterruptWorkflowRunRequest], Awaitable[InterruptWorkflowRunResponse]
     ],
+    submit_workflow_run_handler: Callable[
+        [str, SubmitWorkflowRunRequest], Awaitable[WorkflowRunExecutionStatusResponse]
+    ],
+    workflow_run_execution_handler: Callable[
+        [str], Awaitable[WorkflowRunExecutionStatusResponse]
+    ],
     workflow_scheduler: WorkflowScheduler | None = None,
     workflow_scheduler_provider: Callable[[], WorkflowScheduler] | None = None,
 ) -> APIRouter:
@@ -49,6 +57,24 @@ def create_workflow_execution_router(
     ) -> ExecuteWorkflowRunResponse:
         return await execute_workflow_run_handler(run_id, payload)
 
+    @router.post(
+        "/v3/workflows/runs/{run_id}/submit",
+        response_model=WorkflowRunExecutionStatusResponse,
+        status_code=202,
+    )
+    async def submit_workflow_run(
+        run_id: str,
+        payload: SubmitWorkflowRunRequest,
+    ) -> WorkflowRunExecutionStatusResponse:
+        return await submit_workflow_run_handler(run_id, payload)
+
+    @router.get(
+        "/v3/workflows/runs/{run_id}/execution",
+        response_model=WorkflowRunExecutionStatusResponse,
+    )
+    async def get_workflow_run_execution(run_id: str) -> WorkflowRunExecutionStatusResponse:
+        return await workflow_run_execution_handler(run_id)
+
     @router.post(
         "/v3/workflows/runs/{run_id}/interrupt",
         response_model=InterruptWorkflowRunResponse,
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_CONFIG_RECHECK_SECONDS = 1.0
+
+_FileSignature = tuple[int, int, int] | None
+
+
+def file_signature(path: Path) -> _FileSignature:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+# Holds an immutable snapshot built from a config file. `current()` stats the
+# file at most once per `min_recheck_seconds` and swaps in a freshly built
+# snapshot when the file signature changes; between checks it is a plain read.
+class ConfigFileWatcher(Generic[T]):
+    def __init__(
+        self,
+        path: str | Path,
+        load: Callable[[], T],
+        *,
+        min_recheck_seconds: float = DEFAULT_CONFIG_RECHECK_SECONDS,
+        clock: Callable[[], float] | None = None,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self._path = Path(path)
+        self._load = load
+        self._min_recheck_seconds = max(0.0, float(min_recheck_seconds))
+        self._clock = clock or time.monotonic
+        self._logger = logger or logging.getLogger("wherecode.control_center.config_watch")
+        self._lock = threading.Lock()
+        self._signature: _FileSignature = None
+        self._next_check_at = 0.0
+        self._reload_count = 0
+        self._value: T = self.reload()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def reload_count(self) -> int:
+        return self._reload_count
+
+    def current(self) -> T:
+        if self._clock() < self._next_check_at:
+            return self._value
+        # Only one caller re-checks; concurrent callers keep the current snapshot.
+        if not self._lock.acquire(blocking=False):
+            return self._value
+        try:
+            self._next_check_at = self._clock() + self._min_recheck_seconds
+            signature = file_signature(self._path)
+            if signature == self._signature:
+                return self._value
+            # Remember the signature even when the load fails so a broken file
+            # is parsed once per change, not on every check.
+            self._signature = signature
+            try:
+                self._value = self._load()
+                self._reload_count += 1
+            except Exception as exc:  # noqa: BLE001
+                self._logger.warning(
+                    "config reload failed; keeping previous snapshot path=%s reason=%s",
+                    self._path,
+                    exc,
+                )
+            return self._value
+        finally:
+            self._lock.release()
+
+    def reload(self) -> T:
+        with self._lock:
+            signature = file_signature(self._path)
+            value = self._load()
+            self._value = value
+            self._signature = signature
+            self._next_check_at = self._clock() + self._min_recheck_seconds
+            self._reload_count += 1
+            return value
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass
 from pathlib import Path
 
 from pydantic import BaseModel
 
 from control_center.executors.contracts import ExecutionStrategy
+from control_center.core.config_watch import (
+    DEFAULT_CONFIG_RECHECK_SECONDS,
+    ConfigFileWatcher,
+)
 
 
 class RoleRoute(BaseModel):
@@ -16,13 +21,25 @@ class RoleRoute(BaseModel):
     model: str | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class _RoleRoutingTable:
+    default_route: RoleRoute
+    routes: dict[str, RoleRoute]
+
+
 class RoleRoutingPolicyService:
-    def __init__(self, policy_file: str) -> None:
+    def __init__(
+        self,
+        policy_file: str,
+        *,
+        recheck_seconds: float = DEFAULT_CONFIG_RECHECK_SECONDS,
+    ) -> None:
         self._policy_file = Path(policy_file)
-        self._mtime_ns: int | None = None
-        self._default_route = RoleRoute()
-        self._routes: dict[str, RoleRoute] = {}
-        self.reload()
+        self._watch = ConfigFileWatcher(
+            self._policy_file,
+            self._build_table,
+            min_recheck_seconds=recheck_seconds,
+        )
 
     def _load_json(self) -> dict[str, object]:
         payload = json.loads(self._policy_file.read_text(encoding="utf-8"))
@@ -62,6 +79,9 @@ class RoleRoutingPolicyService:
         )
 
     def reload(self) -> None:
+        self._watch.reload()
+
+    def _build_table(self) -> _RoleRoutingTable:
         payload = self._load_json()
         roles_raw = payload.get("roles")
         if not isinstance(roles_raw, dict):
@@ -93,18 +113,11 @@ class RoleRoutingPolicyService:
                 raw=raw_value,
             )
 
-        self._default_route = default_route
-        self._routes = routes
-        self._mtime_ns = self._policy_file.stat().st_mtime_ns
-
-    def _reload_if_changed(self) -> None:
-        current_mtime = self._policy_file.stat().st_mtime_ns
-        if self._mtime_ns is None or current_mtime != self._mtime_ns:
-            self.reload()
+        return _RoleRoutingTable(default_route=default_route, routes=routes)
 
     def resolve(self, role: str) -> RoleRoute:
-        self._reload_if_changed()
+        table = self._watch.current()
         normalized_role = role.strip()
         if not normalized_role:
-            return self._default_route
-        return self._routes.get(normalized_role, self._default_route)
+            return table.default_route
+        return table.routes.get(normalized_role, table.default_route)
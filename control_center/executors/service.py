@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from control_center.core.config_watch import DEFAULT_CONFIG_RECHECK_SECONDS
 from control_center.executors.adapters.opencode import OpenCodeAdapter
 from control_center.executors.contracts import (
     ExecutionError,
@@ -21,8 +22,12 @@ class ExecutorService:
         role_routing_policy_file: str,
         action_executor=None,
         default_timeout_seconds: int = 180,
+        role_routing_recheck_seconds: float = DEFAULT_CONFIG_RECHECK_SECONDS,
     ) -> None:
-        self._role_routing = RoleRoutingPolicyService(role_routing_policy_file)
+        self._role_routing = RoleRoutingPolicyService(
+            role_routing_policy_file,
+            recheck_seconds=role_routing_recheck_seconds,
+        )
         self._opencode = OpenCodeAdapter(action_executor=action_executor)
         self._default_timeout_seconds = default_timeout_seconds
 
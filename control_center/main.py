@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
 import logging
 
@@ -17,7 +18,28 @@ from control_center.services.app_wiring import (
 )
 from control_center.models.hierarchy import now_utc
 
-app = FastAPI(title="WhereCode Control Center")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    await action_layer.start()
+    await store.start_command_workers()
+    if bootstrap_config.workflow_run_executor_enabled:
+        await workflow_run_executor.start()
+    if bootstrap_config.metrics_rollback_approval_expiry_interval_seconds > 0:
+        await metrics_alert_policy_store.start_rollback_approval_expiry(
+            interval_seconds=bootstrap_config.metrics_rollback_approval_expiry_interval_seconds,
+            logger=logger,
+        )
+    try:
+        yield
+    finally:
+        await metrics_alert_policy_store.stop_rollback_approval_expiry()
+        await workflow_run_executor.stop()
+        await store.stop_command_workers()
+        await action_layer.close()
+
+
+app = FastAPI(title="WhereCode Control Center", lifespan=lifespan)
 logger = logging.getLogger("wherecode.control_center")
 bootstrap_config = load_control_center_bootstrap_config()
 if not logging.getLogger().handlers:
@@ -29,8 +51,16 @@ ACTION_LAYER_TIMEOUT_SECONDS = bootstrap_config.action_layer_timeout_seconds
 action_layer = ActionLayerClient(
     base_url=bootstrap_config.action_layer_base_url,
     timeout_seconds=ACTION_LAYER_TIMEOUT_SECONDS,
+    max_connections=bootstrap_config.action_layer_max_connections,
+    max_keepalive_connections=bootstrap_config.action_layer_max_keepalive_connections,
+    keepalive_expiry_seconds=bootstrap_config.action_layer_keepalive_expiry_seconds,
+    http2=bootstrap_config.action_layer_http2,
+    logger=logger,
+)
+agent_router = AgentRouter(
+    bootstrap_config.agent_routing_file,
+    recheck_seconds=bootstrap_config.config_recheck_seconds,
 )
-agent_router = AgentRouter(bootstrap_config.agent_routing_file)
 AUTH_ENABLED = bootstrap_config.auth_enabled
 AUTH_TOKEN = bootstrap_config.auth_token
 DECOMPOSE_REQUIRE_EXPLICIT_MAP = bootstrap_config.decompose_require_explicit_map
@@ -81,6 +111,7 @@ state_store = runtime_bundle.state_store
 store = runtime_bundle.store
 workflow_scheduler = runtime_bundle.workflow_scheduler
 workflow_engine = runtime_bundle.workflow_engine
+workflow_run_executor = runtime_bundle.workflow_run_executor
 command_dispatch_service = runtime_bundle.command_dispatch_service
 workflow_api_handlers_service = runtime_bundle.workflow_api_handlers_service
 command_orchestration_policy_service = (
@@ -89,7 +120,15 @@ command_orchestration_policy_service = (
 agent_rules_registry_service = runtime_bundle.agent_rules_registry_service
 metrics_alert_policy_store = runtime_bundle.metrics_alert_policy_store
 metrics_authorization_service = runtime_bundle.metrics_authorization_service
-context_memory_store = ContextMemoryStore(state_store=state_store)
+context_memory_store = ContextMemoryStore(
+    state_store=state_store,
+    max_items_per_namespace=bootstrap_config.context_memory_max_items_per_namespace,
+    max_value_bytes=bootstrap_config.context_memory_max_value_bytes,
+    max_resident_run_namespaces=(
+        bootstrap_config.context_memory_max_resident_run_namespaces
+    ),
+)
+context_memory_store.attach_workflow_scheduler(workflow_scheduler)
 
 control_center_root = Path(__file__).resolve().parents[1]
 ops_check_runtime = build_ops_check_runtime(
@@ -130,8 +169,14 @@ include_control_center_routers(
     agent_router_provider=lambda: agent_router,
     action_layer_health_handler=lambda: action_layer.get_health(),
     action_layer_execute_handler=lambda payload: action_layer.execute(payload),
+    action_layer_client_metrics_handler=lambda: action_layer.metrics_snapshot(),
+    action_layer_execute_stream_handler=lambda payload: action_layer.execute_stream(payload),
     execute_workflow_run_handler=workflow_api_handlers_service.execute_workflow_run,
     interrupt_workflow_run_handler=workflow_api_handlers_service.interrupt_workflow_run,
+    submit_workflow_run_handler=workflow_api_handlers_service.submit_workflow_run,
+    workflow_run_execution_handler=(
+        workflow_api_handlers_service.get_workflow_run_execution
+    ),
     decompose_bootstrap_handler=(
         workflow_api_handlers_service.decompose_bootstrap_workflow_run
     ),
@@ -15,6 +15,9 @@ from control_center.models.hierarchy import (
 from control_center.models.api import (
     ActionExecuteRequest,
     ActionExecuteResponse,
+    ActionExecuteStreamEvent,
+    ActionLayerClientMetricsResponse,
+    ActionLayerEndpointLatency,
     ActionLayerHealthResponse,
     AgentExecutionTrace,
     AgentRoutingConfigResponse,
@@ -89,7 +92,9 @@ from control_center.models.api_workflow import (
     ResolveDiscussionRequest,
     RestartWorkflowRunRequest,
     RestartWorkflowRunResponse,
+    SubmitWorkflowRunRequest,
     WorkflowRunArtifactsResponse,
+    WorkflowRunExecutionStatusResponse,
     WorkflowRunOrchestrateDecomposePayload,
     WorkflowRunOrchestrateDecisionMachineReport,
     WorkflowRunOrchestrateDecisionReport,
@@ -183,6 +188,8 @@ __all__ = [
     "RestartWorkflowRunRequest",
     "RestartWorkflowRunResponse",
     "ResolveDiscussionRequest",
+    "SubmitWorkflowRunRequest",
+    "WorkflowRunExecutionStatusResponse",
     "HierarchySnapshot",
     "Project",
     "ProjectDetail",
@@ -193,6 +200,9 @@ __all__ = [
     "ApproveCommandRequest",
     "ActionExecuteRequest",
     "ActionExecuteResponse",
+    "ActionExecuteStreamEvent",
+    "ActionLayerClientMetricsResponse",
+    "ActionLayerEndpointLatency",
     "ActionLayerHealthResponse",
     "CommandOrchestratePolicyConfigResponse",
     "AgentRoutingConfigResponse",
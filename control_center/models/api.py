@@ -44,6 +44,31 @@ class ActionLayerHealthResponse(BaseModel):
     transport: str
 
 
+class ActionLayerEndpointLatency(BaseModel):
+    count: int
+    error_count: int
+    average_ms: float
+    p95_ms: float
+    max_ms: float
+    last_ms: float
+
+
+class ActionLayerClientMetricsResponse(BaseModel):
+    base_url: str
+    http2: bool
+    max_connections: int | None = None
+    max_keepalive_connections: int
+    keepalive_expiry_seconds: float
+    client_open: bool
+    clients_created: int
+    in_flight_utilization: float | None = None
+    in_flight: int
+    max_in_flight: int
+    requests_total: int
+    errors_total: int
+    endpoints: dict[str, ActionLayerEndpointLatency] = Field(default_factory=dict)
+
+
 class ActionExecuteRequest(BaseModel):
     text: str = Field(min_length=1)
     agent: str | None = Field(default=None, min_length=1)
@@ -89,6 +114,11 @@ class ActionExecuteResponse(BaseModel):
     agent_trace: AgentExecutionTrace | None = None
 
 
+class ActionExecuteStreamEvent(BaseModel):
+    event: str
+    data: dict[str, object] = Field(default_factory=dict)
+
+
 class MetricsWindowSummary(BaseModel):
     window_minutes: int
     total_commands: int
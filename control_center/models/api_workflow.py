@@ -282,6 +282,31 @@ class InterruptWorkflowRunResponse(BaseModel):
     reason: str | None = None
 
 
+class SubmitWorkflowRunRequest(BaseModel):
+    max_loops: int = Field(default=20, ge=1, le=1000)
+    submitted_by: str | None = None
+
+
+class WorkflowRunExecutionStatusResponse(BaseModel):
+    run_id: str
+    run_status: WorkflowRunStatus
+    background_enabled: bool = False
+    executor_state: str = "not_submitted"
+    executor_running: bool = False
+    queue_depth: int = 0
+    max_loops: int | None = None
+    drives: int = 0
+    submitted_by: str | None = None
+    submitted_at: datetime | None = None
+    last_drive_started_at: datetime | None = None
+    last_drive_finished_at: datetime | None = None
+    last_executed_count: int = 0
+    last_failed_count: int = 0
+    last_error: str | None = None
+    next_action_hint: str | None = None
+    blocked_reason: str | None = None
+
+
 class RestartWorkflowRunRequest(BaseModel):
     requested_by: str | None = None
     reason: str | None = None
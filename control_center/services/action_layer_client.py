@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import json as jsonlib
+import logging
+import time
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 
 import httpx
@@ -7,8 +13,11 @@ import httpx
 from control_center.models.api import (
     ActionExecuteRequest,
     ActionExecuteResponse,
+    ActionExecuteStreamEvent,
+    ActionLayerClientMetricsResponse,
     ActionLayerHealthResponse,
 )
+from control_center.services.action_layer_client_metrics import ActionLayerRequestMetrics
 
 
 @dataclass(slots=True)
@@ -20,9 +29,58 @@ class ActionLayerClientError(Exception):
 
 
 class ActionLayerClient:
-    def __init__(self, base_url: str, timeout_seconds: float = 30.0) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        timeout_seconds: float = 30.0,
+        *,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry_seconds: float = 30.0,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+        logger: logging.Logger | None = None,
+    ) -> None:
         self._base_url = base_url.rstrip("/")
         self._timeout_seconds = timeout_seconds
+        self._limits = httpx.Limits(
+            max_connections=None if max_connections is None else max(1, int(max_connections)),
+            max_keepalive_connections=max(0, int(max_keepalive_connections)),
+            keepalive_expiry=max(0.0, float(keepalive_expiry_seconds)),
+        )
+        self._logger = logger or logging.getLogger("wherecode.control_center.action_layer")
+        self._http2 = bool(http2)
+        if self._http2 and importlib.util.find_spec("h2") is None:
+            self._logger.warning(
+                "ACTION_LAYER_HTTP2 requested but the 'h2' package is not installed; "
+                "falling back to HTTP/1.1 keep-alive"
+            )
+            self._http2 = False
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._clients_created = 0
+        self._retiring: set[asyncio.Future[object]] = set()
+        self._metrics = ActionLayerRequestMetrics()
+
+    @property
+    def http2(self) -> bool:
+        return self._http2
+
+    async def start(self) -> None:
+        self._ensure_client()
+
+    async def close(self) -> None:
+        client = self._client
+        client_loop = self._client_loop
+        self._client = None
+        self._client_loop = None
+        if client is not None and client_loop is not None:
+            closing = self._close_on_owning_loop(client, client_loop)
+            if closing is not None:
+                await closing
+        if self._retiring:
+            await asyncio.gather(*self._retiring, return_exceptions=True)
 
     async def get_health(self) -> ActionLayerHealthResponse:
         payload = await self._request("GET", "/healthz")
@@ -32,6 +90,134 @@ class ActionLayerClient:
         payload = await self._request("POST", "/execute", json=request.model_dump())
         return ActionExecuteResponse(**payload)
 
+    async def execute_stream(
+        self,
+        request: ActionExecuteRequest,
+    ) -> AsyncIterator[ActionExecuteStreamEvent]:
+        path = "/execute/stream"
+        client = self._ensure_client()
+        failed = True
+        started = time.perf_counter()
+        self._metrics.begin()
+        try:
+            async with client.stream(
+                "POST",
+                f"{self._base_url}{path}",
+                json=request.model_dump(),
+                headers={"Accept": "text/event-stream"},
+            ) as response:
+                if response.status_code >= 400:
+                    raise ActionLayerClientError(
+                        f"action layer request failed: HTTP {response.status_code}"
+                    )
+                event_name = "message"
+                async for line in response.aiter_lines():
+                    if line.startswith("event:"):
+                        event_name = line[6:].strip() or "message"
+                    elif line.startswith("data:"):
+                        try:
+                            data = jsonlib.loads(line[5:].strip())
+                        except jsonlib.JSONDecodeError as exc:
+                            raise ActionLayerClientError(
+                                "action layer returned malformed stream event"
+                            ) from exc
+                        yield ActionExecuteStreamEvent(
+                            event=event_name,
+                            data=data if isinstance(data, dict) else {"value": data},
+                        )
+                    elif not line.strip():
+                        event_name = "message"
+            failed = False
+        except GeneratorExit:
+            # The consumer stopped reading (typically after the result event).
+            failed = False
+            raise
+        except httpx.ReadTimeout as exc:
+            raise ActionLayerClientError(
+                f"action layer unavailable: ReadTimeout after {self._timeout_seconds:.1f}s"
+            ) from exc
+        except httpx.HTTPError as exc:
+            detail = str(exc).strip() or exc.__class__.__name__
+            raise ActionLayerClientError(f"action layer unavailable: {detail}") from exc
+        finally:
+            self._metrics.finish(
+                f"POST {path}",
+                (time.perf_counter() - started) * 1000,
+                failed=failed,
+            )
+
+    def metrics_snapshot(self) -> ActionLayerClientMetricsResponse:
+        request_metrics = self._metrics.snapshot()
+        max_connections = self._limits.max_connections
+        return ActionLayerClientMetricsResponse(
+            base_url=self._base_url,
+            http2=self._http2,
+            max_connections=max_connections,
+            max_keepalive_connections=self._limits.max_keepalive_connections or 0,
+            keepalive_expiry_seconds=float(self._limits.keepalive_expiry or 0.0),
+            client_open=self._client is not None and not self._client.is_closed,
+            clients_created=self._clients_created,
+            # In-flight requests over the connection cap; httpx has no public
+            # pool introspection, so socket-level counts are not reported.
+            in_flight_utilization=(
+                None
+                if max_connections is None
+                else round(self._metrics.in_flight / max_connections, 4)
+            ),
+            **request_metrics,
+        )
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._client
+        if client is not None and self._client_loop is loop and not client.is_closed:
+            return client
+        # Pooled connections are bound to the loop that opened them; a client
+        # left over from another loop (request-scoped test clients, app
+        # restart) is closed there and a fresh pool is opened on this loop.
+        if client is not None and self._client_loop is not None:
+            closing = self._close_on_owning_loop(client, self._client_loop)
+            if closing is not None:
+                self._retiring.add(closing)
+                closing.add_done_callback(self._retiring.discard)
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                timeout=self._timeout_seconds,
+                connect=min(self._timeout_seconds, 10.0),
+            ),
+            limits=self._limits,
+            http2=self._http2,
+            transport=self._transport,
+        )
+        self._client = client
+        self._client_loop = loop
+        self._clients_created += 1
+        return client
+
+    def _close_on_owning_loop(
+        self,
+        client: httpx.AsyncClient,
+        client_loop: asyncio.AbstractEventLoop,
+    ) -> asyncio.Future[object] | None:
+        if client.is_closed:
+            return None
+        if client_loop is asyncio.get_running_loop():
+            return asyncio.ensure_future(client.aclose())
+        if client_loop.is_closed():
+            # Nothing can run on a closed loop; its sockets were torn down
+            # with it, so the client is only dropped.
+            self._logger.debug("dropping action layer client of a closed event loop")
+            return None
+        if client_loop.is_running():
+            return asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+            )
+        # A stopped loop can still be driven to finish the close, off this
+        # thread since the current thread already runs a loop.
+        return asyncio.ensure_future(
+            asyncio.to_thread(client_loop.run_until_complete, client.aclose())
+        )
+
     async def _request(
         self,
         method: str,
@@ -39,18 +225,18 @@ class ActionLayerClient:
         json: dict[str, object] | None = None,
     ) -> dict[str, object]:
         url = f"{self._base_url}{path}"
-        timeout = httpx.Timeout(
-            timeout=self._timeout_seconds,
-            connect=min(self._timeout_seconds, 10.0),
-        )
+        client = self._ensure_client()
+        failed = True
+        started = time.perf_counter()
+        self._metrics.begin()
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.request(method, url, json=json)
-                response.raise_for_status()
-                payload = response.json()
-                if not isinstance(payload, dict):
-                    raise ActionLayerClientError("action layer returned unexpected response")
-                return payload
+            response = await client.request(method, url, json=json)
+            response.raise_for_status()
+            payload = response.json()
+            if not isinstance(payload, dict):
+                raise ActionLayerClientError("action layer returned unexpected response")
+            failed = False
+            return payload
         except httpx.ReadTimeout as exc:
             raise ActionLayerClientError(
                 f"action layer unavailable: ReadTimeout after {self._timeout_seconds:.1f}s"
@@ -62,3 +248,9 @@ class ActionLayerClient:
         except httpx.HTTPError as exc:
             detail = str(exc).strip() or exc.__class__.__name__
             raise ActionLayerClientError(f"action layer unavailable: {detail}") from exc
+        finally:
+            self._metrics.finish(
+                f"{method} {path}",
+                (time.perf_counter() - started) * 1000,
+                failed=failed,
+            )
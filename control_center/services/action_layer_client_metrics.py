@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class _EndpointLatency:
+    count: int = 0
+    error_count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_ms: float = 0.0
+    samples: deque[float] = field(default_factory=lambda: deque(maxlen=256))
+
+    def record(self, elapsed_ms: float, *, failed: bool) -> None:
+        self.count += 1
+        if failed:
+            self.error_count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.last_ms = elapsed_ms
+        self.samples.append(elapsed_ms)
+
+    def snapshot(self) -> dict[str, float | int]:
+        ordered = sorted(self.samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] if ordered else 0.0
+        return {
+            "count": self.count,
+            "error_count": self.error_count,
+            "average_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "p95_ms": round(p95, 2),
+            "max_ms": round(self.max_ms, 2),
+            "last_ms": round(self.last_ms, 2),
+        }
+
+
+class ActionLayerRequestMetrics:
+    def __init__(self) -> None:
+        self._endpoints: dict[str, _EndpointLatency] = {}
+        self._in_flight = 0
+        self._max_in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def begin(self) -> None:
+        self._in_flight += 1
+        self._max_in_flight = max(self._max_in_flight, self._in_flight)
+
+    def finish(self, endpoint: str, elapsed_ms: float, *, failed: bool) -> None:
+        self._in_flight = max(0, self._in_flight - 1)
+        latency = self._endpoints.get(endpoint)
+        if latency is None:
+            latency = _EndpointLatency()
+            self._endpoints[endpoint] = latency
+        latency.record(elapsed_ms, failed=failed)
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "in_flight": self._in_flight,
+            "max_in_flight": self._max_in_flight,
+            "requests_total": sum(item.count for item in self._endpoints.values()),
+            "errors_total": sum(item.error_count for item in self._endpoints.values()),
+            "endpoints": {
+                endpoint: latency.snapshot()
+                for endpoint, latency in sorted(self._endpoints.items())
+            },
+        }
@@ -4,6 +4,12 @@ import json
 from dataclasses import dataclass
 from pathlib import Path
 
+from control_center.core.config_watch import (
+    DEFAULT_CONFIG_RECHECK_SECONDS,
+    ConfigFileWatcher,
+)
+from control_center.services.agent_router_matcher import KeywordMatcher
+
 
 @dataclass(frozen=True, slots=True)
 class AgentRoutingDecision:
@@ -22,27 +28,61 @@ class AgentRule:
     enabled: bool
 
 
+@dataclass(frozen=True, slots=True)
+class _AgentRoutingTable:
+    default_agent: str
+    rules: tuple[AgentRule, ...]
+    # (rule, keyword) in match precedence order; a matcher rank indexes it.
+    candidates: tuple[tuple[AgentRule, str], ...]
+    matcher: KeywordMatcher
+
+    @classmethod
+    def build(cls, default_agent: str, rules: tuple[AgentRule, ...]) -> "_AgentRoutingTable":
+        candidates = tuple(
+            (rule, keyword)
+            for rule in rules
+            if rule.enabled
+            for keyword in rule.keywords
+        )
+        return cls(
+            default_agent=default_agent,
+            rules=rules,
+            candidates=candidates,
+            matcher=KeywordMatcher(
+                (keyword, rank) for rank, (_, keyword) in enumerate(candidates)
+            ),
+        )
+
+
 class AgentRouter:
-    def __init__(self, config_path: str) -> None:
+    def __init__(
+        self,
+        config_path: str,
+        *,
+        recheck_seconds: float = DEFAULT_CONFIG_RECHECK_SECONDS,
+    ) -> None:
         self._config_path = Path(config_path)
-        self._default_agent = "coding-agent"
-        self._rules: list[AgentRule] = []
-        self._load_config()
+        self._watch = ConfigFileWatcher(
+            self._config_path,
+            self._load_config,
+            min_recheck_seconds=recheck_seconds,
+        )
 
     @property
     def default_agent(self) -> str:
-        return self._default_agent
+        return self._watch.current().default_agent
 
     @property
     def rules(self) -> list[AgentRule]:
-        return list(self._rules)
+        return list(self._watch.current().rules)
 
     def reload(self) -> None:
-        self._load_config()
+        self._watch.reload()
 
     def get_config(self) -> dict:
+        table = self._watch.current()
         return {
-            "default_agent": self._default_agent,
+            "default_agent": table.default_agent,
             "rules": [
                 {
                     "id": rule.rule_id,
@@ -51,7 +91,7 @@ class AgentRouter:
                     "enabled": rule.enabled,
                     "keywords": list(rule.keywords),
                 }
-                for rule in self._rules
+                for rule in table.rules
             ],
         }
 
@@ -65,18 +105,16 @@ class AgentRouter:
             json.dumps(payload, ensure_ascii=False, indent=2) + "\n",
             encoding="utf-8",
         )
-        self._load_config()
+        self._watch.reload()
 
-    def _load_config(self) -> None:
+    def _load_config(self) -> _AgentRoutingTable:
         if not self._config_path.exists():
-            self._set_default_rules()
-            return
+            return self._default_table()
 
         try:
             payload = json.loads(self._config_path.read_text(encoding="utf-8"))
             if not isinstance(payload, dict):
-                self._set_default_rules()
-                return
+                return self._default_table()
             default_agent = payload.get("default_agent")
             rules = payload.get("rules")
             if not isinstance(default_agent, str) or not default_agent.strip():
@@ -122,35 +160,47 @@ class AgentRouter:
                         ),
                     )
                 )
-            self._default_agent = default_agent.strip()
-            self._rules = [
-                rule
-                for _, rule in sorted(
-                    parsed_rules,
-                    key=lambda pair: (pair[1].priority, pair[0]),
-                )
-            ]
+            return _AgentRoutingTable.build(
+                default_agent.strip(),
+                tuple(
+                    rule
+                    for _, rule in sorted(
+                        parsed_rules,
+                        key=lambda pair: (pair[1].priority, pair[0]),
+                    )
+                ),
+            )
         except Exception:  # noqa: BLE001
-            self._set_default_rules()
-
-    def _set_default_rules(self) -> None:
-        self._default_agent = "coding-agent"
-        self._rules = [
-            AgentRule(
-                rule_id="rule_test_keywords",
-                agent="test-agent",
-                keywords=("pytest", "unit test", "run tests", "integration test", "coverage", "test"),
-                priority=10,
-                enabled=True,
-            ),
-            AgentRule(
-                rule_id="rule_review_keywords",
-                agent="review-agent",
-                keywords=("review", "security", "audit", "risk"),
-                priority=20,
-                enabled=True,
+            return self._default_table()
+
+    @staticmethod
+    def _default_table() -> _AgentRoutingTable:
+        return _AgentRoutingTable.build(
+            "coding-agent",
+            (
+                AgentRule(
+                    rule_id="rule_test_keywords",
+                    agent="test-agent",
+                    keywords=(
+                        "pytest",
+                        "unit test",
+                        "run tests",
+                        "integration test",
+                        "coverage",
+                        "test",
+                    ),
+                    priority=10,
+                    enabled=True,
+                ),
+                AgentRule(
+                    rule_id="rule_review_keywords",
+                    agent="review-agent",
+                    keywords=("review", "security", "audit", "risk"),
+                    priority=20,
+                    enabled=True,
+                ),
             ),
-        ]
+        )
 
     def select_agent(self, task_assignee_agent: str, command_text: str) -> str:
         return self.route(task_assignee_agent, command_text).agent
@@ -163,19 +213,17 @@ class AgentRouter:
                 reason="explicit_assignee",
             )
 
-        lowered = command_text.lower()
-        for rule in self._rules:
-            if not rule.enabled:
-                continue
-            for keyword in rule.keywords:
-                if keyword in lowered:
-                    return AgentRoutingDecision(
-                        agent=rule.agent,
-                        reason="keyword_rule",
-                        matched_keyword=str(keyword),
-                        rule_id=rule.rule_id,
-                    )
+        table = self._watch.current()
+        rank = table.matcher.best_rank(command_text.lower())
+        if rank is not None:
+            rule, keyword = table.candidates[rank]
+            return AgentRoutingDecision(
+                agent=rule.agent,
+                reason="keyword_rule",
+                matched_keyword=keyword,
+                rule_id=rule.rule_id,
+            )
         return AgentRoutingDecision(
-            agent=self._default_agent,
+            agent=table.default_agent,
             reason="default_agent",
         )
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+
+_NO_MATCH = -1
+# Below this many keywords C-level `in` checks beat a Python-level automaton
+# walk (see scripts/bench_agent_router.py).
+LINEAR_SCAN_MAX_KEYWORDS = 160
+
+
+# Aho-Corasick automaton over lowercase keywords. Each keyword carries a rank
+# (lower wins); `best_rank` scans the text once and returns the lowest rank of
+# any keyword occurring in it, which reproduces "first enabled rule in priority
+# order, first keyword in rule order" without a per-rule substring scan.
+class KeywordMatcher:
+    __slots__ = ("_goto", "_best", "_linear")
+
+    def __init__(
+        self,
+        ranked_keywords: Iterable[tuple[str, int]],
+        *,
+        linear_scan_max_keywords: int = LINEAR_SCAN_MAX_KEYWORDS,
+    ) -> None:
+        ranked = sorted(
+            ((keyword, rank) for keyword, rank in ranked_keywords if keyword),
+            key=lambda item: item[1],
+        )
+        self._linear: tuple[tuple[str, int], ...] | None = None
+        self._goto: list[dict[str, int]] = []
+        self._best: list[int] = []
+        if len(ranked) <= linear_scan_max_keywords:
+            self._linear = tuple(ranked)
+            return
+
+        goto: list[dict[str, int]] = [{}]
+        own_rank: list[int] = [_NO_MATCH]
+        for keyword, rank in ranked:
+            node = 0
+            for char in keyword:
+                next_node = goto[node].get(char)
+                if next_node is None:
+                    next_node = len(goto)
+                    goto[node][char] = next_node
+                    goto.append({})
+                    own_rank.append(_NO_MATCH)
+                node = next_node
+            if own_rank[node] == _NO_MATCH or rank < own_rank[node]:
+                own_rank[node] = rank
+
+        # Breadth-first so every failure target is final before it is used;
+        # each node inherits its failure node's transitions (the root's are
+        # looked up at scan time instead of being copied everywhere) and the
+        # best rank of any keyword ending at a suffix of the node.
+        fail = [0] * len(goto)
+        best = list(own_rank)
+        queue: deque[int] = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            children = list(goto[node].items())
+            if node and fail[node]:
+                for char, target in goto[fail[node]].items():
+                    goto[node].setdefault(char, target)
+            for char, child in children:
+                if node:
+                    fail[child] = goto[fail[node]].get(char, goto[0].get(char, 0))
+                inherited = best[fail[child]]
+                if inherited != _NO_MATCH and (best[child] == _NO_MATCH or inherited < best[child]):
+                    best[child] = inherited
+                queue.append(child)
+
+        self._goto = goto
+        self._best = best
+
+    def best_rank(self, text: str) -> int | None:
+        if self._linear is not None:
+            for keyword, rank in self._linear:
+                if keyword in text:
+                    return rank
+            return None
+        goto = self._goto
+        best = self._best
+        root = goto[0]
+        node = 0
+        result = _NO_MATCH
+        for char in text:
+            node = goto[node].get(char)
+            if node is None:
+                node = root.get(char, 0)
+            rank = best[node]
+            if rank != _NO_MATCH and (result == _NO_MATCH or rank < result):
+                result = rank
+                if result == 0:
+                    break
+        return None if result == _NO_MATCH else result
@@ -2,8 +2,14 @@ from __future__ import annotations
 
 import json
 import logging
+from dataclasses import dataclass
 from pathlib import Path
 
+from control_center.core.config_watch import (
+    DEFAULT_CONFIG_RECHECK_SECONDS,
+    ConfigFileWatcher,
+)
+
 
 DEFAULT_AGENT_RULES_REGISTRY: dict[str, object] = {
     "version": "1",
@@ -73,19 +79,29 @@ DEFAULT_AGENT_RULES_REGISTRY: dict[str, object] = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class _AgentRulesTable:
+    version: str
+    updated_at: str | None
+    scopes: dict[str, list[dict[str, object]]]
+
+
 class AgentRulesRegistryService:
     def __init__(
         self,
         registry_path: str,
         *,
         logger: logging.Logger | None = None,
+        recheck_seconds: float = DEFAULT_CONFIG_RECHECK_SECONDS,
     ) -> None:
         self._registry_path = Path(registry_path)
         self._logger = logger or logging.getLogger("wherecode.control_center.agent_rules")
-        self._version = "1"
-        self._updated_at: str | None = None
-        self._scopes: dict[str, list[dict[str, object]]] = {}
-        self.reload()
+        self._watch = ConfigFileWatcher(
+            self._registry_path,
+            self._build_table,
+            min_recheck_seconds=recheck_seconds,
+            logger=self._logger,
+        )
 
     @staticmethod
     def _normalize_text(value: object) -> str:
@@ -154,6 +170,10 @@ class AgentRulesRegistryService:
         return output
 
     def reload(self) -> dict[str, object]:
+        self._watch.reload()
+        return self.export()
+
+    def _build_table(self) -> _AgentRulesTable:
         payload = self._load_payload()
         version = str(payload.get("version", "1")).strip() or "1"
         updated_at_raw = payload.get("updated_at")
@@ -170,18 +190,20 @@ class AgentRulesRegistryService:
                 continue
             normalized_scopes[scope] = self._normalize_scope_rules(scope, records)
 
-        self._version = version
-        self._updated_at = updated_at
-        self._scopes = normalized_scopes
-        return self.export()
+        return _AgentRulesTable(
+            version=version,
+            updated_at=updated_at,
+            scopes=normalized_scopes,
+        )
 
     def export(self) -> dict[str, object]:
-        total_roles = sum(len(items) for items in self._scopes.values())
+        table = self._watch.current()
+        total_roles = sum(len(items) for items in table.scopes.values())
         return {
-            "version": self._version,
-            "updated_at": self._updated_at,
+            "version": table.version,
+            "updated_at": table.updated_at,
             "source_path": str(self._registry_path),
-            "scopes": {key: list(value) for key, value in self._scopes.items()},
+            "scopes": {key: list(value) for key, value in table.scopes.items()},
             "total_roles": total_roles,
         }
 
@@ -190,9 +212,10 @@ class AgentRulesRegistryService:
         *,
         scopes: tuple[str, ...] = ("subproject", "main"),
     ) -> dict[str, str]:
+        table = self._watch.current()
         mapping: dict[str, str] = {}
         for scope in scopes:
-            records = self._scopes.get(self._normalize_text(scope), [])
+            records = table.scopes.get(self._normalize_text(scope), [])
             for item in records:
                 role = str(item.get("role", "")).strip()
                 executor = str(item.get("executor", "")).strip()
@@ -201,11 +224,12 @@ class AgentRulesRegistryService:
         return mapping
 
     def list_roles(self, scope: str | None = None) -> list[str]:
+        table = self._watch.current()
         if scope is not None:
-            records = self._scopes.get(self._normalize_text(scope), [])
+            records = table.scopes.get(self._normalize_text(scope), [])
             return sorted({str(item.get("role", "")).strip() for item in records if item.get("role")})
         roles: set[str] = set()
-        for records in self._scopes.values():
+        for records in table.scopes.values():
             for item in records:
                 role = str(item.get("role", "")).strip()
                 if role:
@@ -79,6 +79,7 @@ def configure_control_center_middlewares(
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-WhereCode-Next-Cursor"],
     )
 
     @app.middleware("http")
@@ -131,8 +132,12 @@ def include_control_center_routers(
     agent_router_provider: Callable[[], Any],
     action_layer_health_handler: Callable[[], Any],
     action_layer_execute_handler: Callable[..., Any],
+    action_layer_client_metrics_handler: Callable[[], Any],
+    action_layer_execute_stream_handler: Callable[..., Any],
     execute_workflow_run_handler: Callable[..., Any],
     interrupt_workflow_run_handler: Callable[..., Any],
+    submit_workflow_run_handler: Callable[..., Any],
+    workflow_run_execution_handler: Callable[..., Any],
     decompose_bootstrap_handler: Callable[..., Any],
     decompose_pending_handler: Callable[..., Any],
     decompose_status_handler: Callable[..., Any],
@@ -173,6 +178,8 @@ def include_control_center_routers(
         create_workflow_execution_router(
             execute_workflow_run_handler=execute_workflow_run_handler,
             interrupt_workflow_run_handler=interrupt_workflow_run_handler,
+            submit_workflow_run_handler=submit_workflow_run_handler,
+            workflow_run_execution_handler=workflow_run_execution_handler,
             workflow_scheduler_provider=workflow_scheduler_provider,
         )
     )
@@ -202,6 +209,8 @@ def include_control_center_routers(
         create_action_layer_router(
             action_layer_health_handler=action_layer_health_handler,
             action_layer_execute_handler=action_layer_execute_handler,
+            action_layer_client_metrics_handler=action_layer_client_metrics_handler,
+            action_layer_execute_stream_handler=action_layer_execute_stream_handler,
         )
     )
     app.include_router(
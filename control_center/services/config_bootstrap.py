@@ -4,12 +4,22 @@ import os
 from dataclasses import dataclass
 from typing import Callable
 
+from control_center.services.sqlite_state_store import (
+    normalize_journal_mode,
+    normalize_synchronous_mode,
+)
+from control_center.services.workflow_engine_concurrency import parse_role_limits
+
 
 @dataclass(slots=True)
 class ControlCenterBootstrapConfig:
     log_level: str
     action_layer_timeout_seconds: float
     action_layer_base_url: str
+    action_layer_max_connections: int
+    action_layer_max_keepalive_connections: int
+    action_layer_keepalive_expiry_seconds: float
+    action_layer_http2: bool
     agent_routing_file: str
     auth_enabled: bool
     auth_token: str
@@ -20,19 +30,39 @@ class ControlCenterBootstrapConfig:
     metrics_alert_policy_update_roles: set[str]
     metrics_rollback_requires_approval: bool
     metrics_rollback_approval_ttl_seconds: int
+    metrics_rollback_approval_expiry_interval_seconds: float
     metrics_rollback_approver_roles: set[str]
     command_orchestrate_policy_enabled: bool
     command_orchestrate_prefixes: tuple[str, ...]
     command_orchestrate_default_max_modules: int
     command_orchestrate_default_strategy: str
     command_orchestrate_restart_canceled_policy: str
+    command_worker_count: int
     dev_routing_matrix_file: str
     agent_rules_registry_file: str
     state_backend: str
     sqlite_path: str
+    sqlite_journal_mode: str
+    sqlite_synchronous: str
+    workflow_hydration_mode: str
+    workflow_terminal_run_cache_size: int
+    workflow_archive_path: str
+    workflow_archive_retention_days: int
+    context_memory_max_items_per_namespace: int
+    context_memory_max_value_bytes: int
+    context_memory_max_resident_run_namespaces: int
+    context_memory_tombstone_retention_days: int
     max_module_reflows: int
     release_approval_required: bool
+    workflow_max_parallel_workitems: int
+    workflow_global_max_parallel_workitems: int
+    workflow_role_parallel_limits: dict[str, int]
+    workflow_module_parallel_limit: int
+    workflow_run_executor_enabled: bool
+    workflow_run_executor_workers: int
+    workflow_run_executor_drain_seconds: int
     role_routing_policy_file: str
+    config_recheck_seconds: float
     metrics_alert_policy_file: str
     metrics_alert_audit_file: str
     metrics_rollback_approval_file: str
@@ -108,6 +138,27 @@ def load_control_center_bootstrap_config(
             "ACTION_LAYER_BASE_URL",
             "http://127.0.0.1:8100",
         ),
+        action_layer_max_connections=_clamp(
+            _parse_int(env_get("ACTION_LAYER_MAX_CONNECTIONS", "100"), default=100),
+            minimum=1,
+            maximum=1000,
+        ),
+        action_layer_max_keepalive_connections=_clamp(
+            _parse_int(
+                env_get("ACTION_LAYER_MAX_KEEPALIVE_CONNECTIONS", "20"),
+                default=20,
+            ),
+            minimum=0,
+            maximum=1000,
+        ),
+        action_layer_keepalive_expiry_seconds=max(
+            0.0,
+            _parse_float(
+                env_get("ACTION_LAYER_KEEPALIVE_EXPIRY_SECONDS", "30"),
+                default=30.0,
+            ),
+        ),
+        action_layer_http2=_parse_bool(env_get("ACTION_LAYER_HTTP2", "false")),
         agent_routing_file=env_get(
             "WHERECODE_AGENT_ROUTING_FILE",
             "control_center/agents.routing.json",
@@ -139,6 +190,13 @@ def load_control_center_bootstrap_config(
             env_get("WHERECODE_METRICS_ROLLBACK_APPROVAL_TTL_SECONDS", "86400"),
             default=86400,
         ),
+        metrics_rollback_approval_expiry_interval_seconds=max(
+            0.0,
+            _parse_float(
+                env_get("WHERECODE_METRICS_ROLLBACK_APPROVAL_EXPIRY_INTERVAL_SECONDS", "0"),
+                default=0.0,
+            ),
+        ),
         metrics_rollback_approver_roles=_parse_roles_csv(
             env_get(
                 "WHERECODE_METRICS_ROLLBACK_APPROVER_ROLES",
@@ -165,6 +223,11 @@ def load_control_center_bootstrap_config(
                 "off",
             )
         ),
+        command_worker_count=_clamp(
+            _parse_int(env_get("WHERECODE_COMMAND_WORKERS", "4"), default=4),
+            minimum=1,
+            maximum=64,
+        ),
         dev_routing_matrix_file=env_get(
             "WHERECODE_DEV_ROUTING_MATRIX_FILE",
             "control_center/capabilities/dev_routing_matrix.json",
@@ -175,6 +238,69 @@ def load_control_center_bootstrap_config(
         ).strip(),
         state_backend=env_get("WHERECODE_STATE_BACKEND", "memory").lower(),
         sqlite_path=env_get("WHERECODE_SQLITE_PATH", ".wherecode/state.db"),
+        sqlite_journal_mode=normalize_journal_mode(
+            env_get("WHERECODE_SQLITE_JOURNAL_MODE", "WAL")
+        ),
+        sqlite_synchronous=normalize_synchronous_mode(
+            env_get("WHERECODE_SQLITE_SYNCHRONOUS", "NORMAL")
+        ),
+        workflow_hydration_mode=(
+            "lazy"
+            if env_get("WHERECODE_WORKFLOW_HYDRATION_MODE", "eager").strip().lower() == "lazy"
+            else "eager"
+        ),
+        workflow_terminal_run_cache_size=_clamp(
+            _parse_int(
+                env_get("WHERECODE_WORKFLOW_TERMINAL_RUN_CACHE_SIZE", "64"),
+                default=64,
+            ),
+            minimum=1,
+            maximum=10000,
+        ),
+        workflow_archive_path=env_get(
+            "WHERECODE_WORKFLOW_ARCHIVE_PATH",
+            ".wherecode/state.archive.db",
+        ).strip(),
+        workflow_archive_retention_days=_clamp(
+            _parse_int(
+                env_get("WHERECODE_WORKFLOW_ARCHIVE_RETENTION_DAYS", "30"),
+                default=30,
+            ),
+            minimum=0,
+            maximum=3650,
+        ),
+        context_memory_max_items_per_namespace=_clamp(
+            _parse_int(
+                env_get("WHERECODE_CONTEXT_MEMORY_MAX_ITEMS_PER_NAMESPACE", "10000"),
+                default=10000,
+            ),
+            minimum=0,
+            maximum=1_000_000,
+        ),
+        context_memory_max_value_bytes=_clamp(
+            _parse_int(
+                env_get("WHERECODE_CONTEXT_MEMORY_MAX_VALUE_BYTES", "262144"),
+                default=262144,
+            ),
+            minimum=0,
+            maximum=64 * 1024 * 1024,
+        ),
+        context_memory_max_resident_run_namespaces=_clamp(
+            _parse_int(
+                env_get("WHERECODE_CONTEXT_MEMORY_MAX_RESIDENT_RUN_NAMESPACES", "256"),
+                default=256,
+            ),
+            minimum=1,
+            maximum=100_000,
+        ),
+        context_memory_tombstone_retention_days=_clamp(
+            _parse_int(
+                env_get("WHERECODE_CONTEXT_MEMORY_TOMBSTONE_RETENTION_DAYS", "7"),
+                default=7,
+            ),
+            minimum=0,
+            maximum=3650,
+        ),
         max_module_reflows=_parse_int(
             env_get("WHERECODE_MAX_MODULE_REFLOWS", "1"),
             default=1,
@@ -182,10 +308,63 @@ def load_control_center_bootstrap_config(
         release_approval_required=_parse_bool(
             env_get("WHERECODE_RELEASE_APPROVAL_REQUIRED", "false")
         ),
+        workflow_max_parallel_workitems=_clamp(
+            _parse_int(
+                env_get("WHERECODE_WORKFLOW_MAX_PARALLEL_WORKITEMS", "1"),
+                default=1,
+            ),
+            minimum=1,
+            maximum=64,
+        ),
+        workflow_global_max_parallel_workitems=_clamp(
+            _parse_int(
+                env_get("WHERECODE_WORKFLOW_GLOBAL_MAX_PARALLEL_WORKITEMS", "0"),
+                default=0,
+            ),
+            minimum=0,
+            maximum=1024,
+        ),
+        workflow_role_parallel_limits=parse_role_limits(
+            env_get("WHERECODE_WORKFLOW_ROLE_PARALLEL_LIMITS", "")
+        ),
+        workflow_module_parallel_limit=_clamp(
+            _parse_int(
+                env_get("WHERECODE_WORKFLOW_MODULE_PARALLEL_LIMIT", "0"),
+                default=0,
+            ),
+            minimum=0,
+            maximum=64,
+        ),
+        workflow_run_executor_enabled=_parse_bool(
+            env_get("WHERECODE_WORKFLOW_RUN_EXECUTOR_ENABLED", "true")
+        ),
+        workflow_run_executor_workers=_clamp(
+            _parse_int(
+                env_get("WHERECODE_WORKFLOW_RUN_EXECUTOR_WORKERS", "2"),
+                default=2,
+            ),
+            minimum=1,
+            maximum=32,
+        ),
+        workflow_run_executor_drain_seconds=_clamp(
+            _parse_int(
+                env_get("WHERECODE_WORKFLOW_RUN_EXECUTOR_DRAIN_SECONDS", "30"),
+                default=30,
+            ),
+            minimum=0,
+            maximum=600,
+        ),
         role_routing_policy_file=env_get(
             "WHERECODE_ROLE_ROUTING_POLICY_FILE",
             ".agents/policies/role_routing.v3.json",
         ).strip(),
+        config_recheck_seconds=max(
+            0.0,
+            _parse_float(
+                env_get("WHERECODE_CONFIG_RECHECK_SECONDS", "1"),
+                default=1.0,
+            ),
+        ),
         metrics_alert_policy_file=env_get(
             "WHERECODE_METRICS_ALERT_POLICY_FILE",
             "control_center/metrics_alert_policy.json",
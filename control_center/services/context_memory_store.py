@@ -6,23 +6,124 @@ from datetime import datetime
 
 from control_center.models.api_context_memory import MemoryNamespaceScope
 from control_center.models.hierarchy import now_utc
+from control_center.services.context_memory_store_index import (
+    ContextMemoryNamespace,
+    decode_memory_cursor,
+    encode_memory_cursor,
+)
+from control_center.services.context_memory_store_tiering import (
+    CONTEXT_MEMORY_ENTITY_TYPE,
+    RUN_NAMESPACE_PREFIX,
+    ResidentRunNamespaces,
+    load_namespace_records,
+    measure_value_bytes,
+)
 from control_center.services.sqlite_state_store import SQLiteStateStore
+from control_center.services.workflow_scheduler_hydration import TERMINAL_RUN_STATUSES
 
 
 class ContextMemoryStore:
-    ENTITY_TYPE = "context_memory_item"
+    ENTITY_TYPE = CONTEXT_MEMORY_ENTITY_TYPE
 
     def __init__(
         self,
         *,
         state_store: SQLiteStateStore | None = None,
         now_utc_handler: Callable[[], datetime] = now_utc,
+        max_items_per_namespace: int = 10000,
+        max_value_bytes: int = 262144,
+        max_resident_run_namespaces: int = 256,
+        run_terminal_provider: Callable[[str], bool] | None = None,
     ) -> None:
         self._state_store = state_store
         self._now_utc = now_utc_handler
-        self._items_by_namespace: dict[str, dict[str, dict[str, object]]] = defaultdict(dict)
+        self._max_items_per_namespace = max(0, int(max_items_per_namespace))
+        self._max_value_bytes = max(0, int(max_value_bytes))
+        self._items_by_namespace: dict[str, ContextMemoryNamespace] = defaultdict(
+            ContextMemoryNamespace
+        )
+        # With a state store, run namespaces are a cold tier: hydrated on
+        # access, kept in a bounded LRU and dropped once their run is terminal.
+        self._resident_runs = ResidentRunNamespaces(max_resident_run_namespaces)
+        self._run_terminal_provider = run_terminal_provider
+        self._pending_terminal_checks: set[str] = set()
         self._load_state()
 
+    def attach_workflow_scheduler(self, scheduler) -> None:
+        def is_terminal(run_id: str) -> bool:
+            try:
+                return scheduler.get_run(run_id).status in TERMINAL_RUN_STATUSES
+            except KeyError:
+                return False
+
+        self._run_terminal_provider = is_terminal
+        scheduler.add_transition_listener(self.on_workitem_transition)
+
+    def on_workitem_transition(self, item, _previous) -> None:
+        # The scheduler refreshes run status after its listeners fire, so the
+        # terminal check is deferred to the next store access.
+        self._pending_terminal_checks.add(str(item.workflow_run_id))
+
+    def resident_run_namespace_ids(self) -> list[str]:
+        self._release_terminal_runs()
+        return self._resident_runs.ids()
+
+    def _release_terminal_runs(self) -> None:
+        if not self._pending_terminal_checks:
+            return
+        run_ids = self._pending_terminal_checks
+        self._pending_terminal_checks = set()
+        if self._run_terminal_provider is None:
+            return
+        for run_id in run_ids:
+            namespace_id = f"{RUN_NAMESPACE_PREFIX}{run_id}"
+            if namespace_id in self._resident_runs and self._run_terminal_provider(run_id):
+                self._resident_runs.pop(namespace_id)
+
+    def _namespace(
+        self,
+        namespace_id: str,
+        *,
+        create: bool = False,
+    ) -> ContextMemoryNamespace | None:
+        if self._state_store is None or not namespace_id.startswith(RUN_NAMESPACE_PREFIX):
+            if create:
+                return self._items_by_namespace[namespace_id]
+            return self._items_by_namespace.get(namespace_id)
+        self._release_terminal_runs()
+        namespace = self._resident_runs.get(namespace_id)
+        if namespace is not None:
+            return namespace
+        namespace = load_namespace_records(
+            self._state_store,
+            namespace_id=namespace_id,
+        ).get(namespace_id)
+        if namespace is None:
+            if not create:
+                return None
+            namespace = ContextMemoryNamespace()
+        self._resident_runs.put(namespace_id, namespace)
+        return namespace
+
+    def _check_limits(
+        self,
+        namespace_id: str,
+        namespace: ContextMemoryNamespace,
+        key: str,
+        value: object | None,
+    ) -> None:
+        if self._max_value_bytes and measure_value_bytes(value) > self._max_value_bytes:
+            raise ValueError(f"memory value exceeds {self._max_value_bytes} bytes")
+        if (
+            self._max_items_per_namespace
+            and key not in namespace
+            and len(namespace) >= self._max_items_per_namespace
+        ):
+            raise ValueError(
+                f"memory namespace {namespace_id} is full "
+                f"({self._max_items_per_namespace} items)"
+            )
+
     @staticmethod
     def _normalize_optional(value: str | None) -> str | None:
         if value is None:
@@ -101,19 +202,10 @@ class ContextMemoryStore:
     def _load_state(self) -> None:
         if self._state_store is None:
             return
-        for payload in self._state_store.list(self.ENTITY_TYPE):
-            if not isinstance(payload, dict):
-                continue
-            if payload.get("deleted") is True:
-                continue
-            namespace_id = str(payload.get("namespace_id", "")).strip()
-            key = str(payload.get("key", "")).strip()
-            scope = str(payload.get("scope", "")).strip()
-            if not namespace_id or not key:
-                continue
-            if scope not in {"shared", "project", "run"}:
-                continue
-            self._items_by_namespace[namespace_id][key] = dict(payload)
+        # Run namespaces stay in the cold tier until first accessed.
+        self._items_by_namespace.update(
+            load_namespace_records(self._state_store, scope=["shared", "project"])
+        )
 
     def upsert(
         self,
@@ -134,7 +226,9 @@ class ContextMemoryStore:
         actor = self._normalize_actor(updated_by)
         now = self._now_utc()
 
-        existing = self._items_by_namespace[namespace_id].get(normalized_key)
+        namespace = self._namespace(namespace_id, create=True)
+        self._check_limits(namespace_id, namespace, normalized_key, value)
+        existing = namespace.get(normalized_key)
         if existing is None:
             created_at = now.isoformat()
             version = 1
@@ -158,7 +252,7 @@ class ContextMemoryStore:
             "version": version,
             "deleted": False,
         }
-        self._items_by_namespace[namespace_id][normalized_key] = record
+        namespace.put(normalized_key, record)
         self._persist(record)
         return dict(record)
 
@@ -176,7 +270,8 @@ class ContextMemoryStore:
             run_id=run_id,
         )
         normalized_key = self._normalize_key(key)
-        item = self._items_by_namespace.get(namespace_id, {}).get(normalized_key)
+        namespace = self._namespace(namespace_id)
+        item = namespace.get(normalized_key) if namespace is not None else None
         return dict(item) if item is not None else None
 
     def delete(
@@ -196,8 +291,8 @@ class ContextMemoryStore:
         normalized_key = self._normalize_key(key)
         actor = self._normalize_actor(deleted_by)
         now = self._now_utc().isoformat()
-        deleted = normalized_key in self._items_by_namespace.get(namespace_id, {})
-        self._items_by_namespace.get(namespace_id, {}).pop(normalized_key, None)
+        namespace = self._namespace(namespace_id)
+        deleted = namespace is not None and namespace.pop(normalized_key) is not None
         tombstone = {
             "scope": scope,
             "namespace_id": namespace_id,
@@ -220,23 +315,43 @@ class ContextMemoryStore:
         prefix: str | None = None,
         limit: int = 200,
     ) -> list[dict[str, object]]:
+        records, _next_cursor = self.list_namespace_page(
+            scope=scope,
+            project_id=project_id,
+            run_id=run_id,
+            prefix=prefix,
+            limit=limit,
+        )
+        return records
+
+    def list_namespace_page(
+        self,
+        *,
+        scope: MemoryNamespaceScope,
+        project_id: str | None = None,
+        run_id: str | None = None,
+        prefix: str | None = None,
+        limit: int = 200,
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, object]], str | None]:
         namespace_id, _project_id, _run_id = self._resolve_namespace(
             scope=scope,
             project_id=project_id,
             run_id=run_id,
         )
+        after = decode_memory_cursor(cursor) if cursor else None
         if limit < 1:
-            return []
-        records = list(self._items_by_namespace.get(namespace_id, {}).values())
-        normalized_prefix = (prefix or "").strip()
-        if normalized_prefix:
-            records = [
-                item
-                for item in records
-                if str(item.get("key", "")).startswith(normalized_prefix)
-            ]
-        records.sort(key=lambda item: str(item.get("updated_at", "")), reverse=True)
-        return [dict(item) for item in records[:limit]]
+            return [], None
+        namespace = self._namespace(namespace_id)
+        if namespace is None:
+            return [], None
+        records, next_position = namespace.page(
+            prefix=(prefix or "").strip(),
+            limit=limit,
+            after=after,
+        )
+        next_cursor = encode_memory_cursor(next_position) if next_position else None
+        return [dict(item) for item in records], next_cursor
 
     def resolve(
         self,
@@ -253,17 +368,28 @@ class ContextMemoryStore:
         if normalized_run_id:
             scope_chain.append(f"run:{normalized_run_id}")
 
-        selected_keys: set[str] | None = None
+        selected_keys: list[str] | None = None
         if keys is not None:
-            cleaned = {self._normalize_key(key) for key in keys if key is not None}
-            selected_keys = cleaned if cleaned else set()
+            selected_keys = list(
+                dict.fromkeys(self._normalize_key(key) for key in keys if key is not None)
+            )
 
         values: dict[str, object | None] = {}
         source_namespaces: dict[str, str] = {}
         for namespace_id in scope_chain:
-            for key, item in self._items_by_namespace.get(namespace_id, {}).items():
-                if selected_keys is not None and key not in selected_keys:
-                    continue
+            namespace = self._namespace(namespace_id)
+            if namespace is None:
+                continue
+            if selected_keys is None:
+                matched = namespace.items()
+            else:
+                # Point lookups: cost follows len(keys), not the namespace size.
+                matched = (
+                    (key, item)
+                    for key in selected_keys
+                    if (item := namespace.get(key)) is not None
+                )
+            for key, item in matched:
                 values[key] = item.get("value")
                 source_namespaces[key] = namespace_id
 
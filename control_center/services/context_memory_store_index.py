@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import base64
+import heapq
+import json
+from bisect import bisect_left, insort
+from collections.abc import Iterator
+
+# Position in the listing order: (updated_at, key). Listings run newest first,
+# ties broken by key descending, so a cursor is the position of the last item
+# returned and the next page starts strictly below it.
+ListingPosition = tuple[str, str]
+
+
+def encode_memory_cursor(position: ListingPosition) -> str:
+    raw = json.dumps(list(position), ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_memory_cursor(cursor: str) -> ListingPosition:
+    try:
+        padded = cursor.strip() + "=" * (-len(cursor.strip()) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as exc:
+        raise ValueError("invalid memory cursor") from exc
+    if (
+        not isinstance(payload, list)
+        or len(payload) != 2
+        or not all(isinstance(part, str) for part in payload)
+    ):
+        raise ValueError("invalid memory cursor")
+    return payload[0], payload[1]
+
+
+class ContextMemoryNamespace:
+    __slots__ = ("_items", "_keys", "_by_updated")
+
+    def __init__(self) -> None:
+        self._items: dict[str, dict[str, object]] = {}
+        self._keys: list[str] = []
+        self._by_updated: list[ListingPosition] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._items
+
+    def get(self, key: str) -> dict[str, object] | None:
+        return self._items.get(key)
+
+    def items(self):
+        return self._items.items()
+
+    def put(self, key: str, record: dict[str, object]) -> None:
+        previous = self._items.get(key)
+        if previous is None:
+            insort(self._keys, key)
+        else:
+            self._discard_position(self._position(key, previous))
+        self._items[key] = record
+        insort(self._by_updated, self._position(key, record))
+
+    def pop(self, key: str) -> dict[str, object] | None:
+        record = self._items.pop(key, None)
+        if record is None:
+            return None
+        index = bisect_left(self._keys, key)
+        del self._keys[index]
+        self._discard_position(self._position(key, record))
+        return record
+
+    def prefix_keys(self, prefix: str) -> Iterator[str]:
+        keys = self._keys
+        for index in range(bisect_left(keys, prefix), len(keys)):
+            key = keys[index]
+            if not key.startswith(prefix):
+                return
+            yield key
+
+    def page(
+        self,
+        *,
+        prefix: str,
+        limit: int,
+        after: ListingPosition | None,
+    ) -> tuple[list[dict[str, object]], ListingPosition | None]:
+        if prefix:
+            # Range-scan the sorted keys, then keep the newest `limit` matches.
+            candidates = (
+                self._position(key, self._items[key]) for key in self.prefix_keys(prefix)
+            )
+            if after is not None:
+                candidates = (position for position in candidates if position < after)
+            selected = heapq.nlargest(limit + 1, candidates)
+            has_more = len(selected) > limit
+            selected = selected[:limit]
+        else:
+            end = len(self._by_updated) if after is None else bisect_left(self._by_updated, after)
+            start = max(0, end - limit)
+            selected = self._by_updated[start:end][::-1]
+            has_more = start > 0
+        records = [self._items[key] for _, key in selected]
+        return records, (selected[-1] if has_more and selected else None)
+
+    @staticmethod
+    def _position(key: str, record: dict[str, object]) -> ListingPosition:
+        return str(record.get("updated_at", "")), key
+
+    def _discard_position(self, position: ListingPosition) -> None:
+        index = bisect_left(self._by_updated, position)
+        if index < len(self._by_updated) and self._by_updated[index] == position:
+            del self._by_updated[index]
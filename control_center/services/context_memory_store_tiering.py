@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from datetime import datetime
+
+from control_center.services.context_memory_store_index import ContextMemoryNamespace
+from control_center.services.sqlite_state_store import SQLiteStateStore
+
+CONTEXT_MEMORY_ENTITY_TYPE = "context_memory_item"
+RUN_NAMESPACE_PREFIX = "run:"
+
+
+def measure_value_bytes(value: object | None) -> int:
+    encoded = json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+    return len(encoded.encode("utf-8"))
+
+
+def load_namespace_records(
+    state_store: SQLiteStateStore,
+    **filters: object,
+) -> dict[str, ContextMemoryNamespace]:
+    namespaces: dict[str, ContextMemoryNamespace] = {}
+    for payload in state_store.query(CONTEXT_MEMORY_ENTITY_TYPE, deleted="false", **filters):
+        if not isinstance(payload, dict):
+            continue
+        namespace_id = str(payload.get("namespace_id", "")).strip()
+        key = str(payload.get("key", "")).strip()
+        scope = str(payload.get("scope", "")).strip()
+        if not namespace_id or not key:
+            continue
+        if scope not in {"shared", "project", "run"}:
+            continue
+        namespaces.setdefault(namespace_id, ContextMemoryNamespace()).put(key, dict(payload))
+    return namespaces
+
+
+def purge_context_memory_tombstones(
+    state_store: SQLiteStateStore,
+    *,
+    cutoff: datetime,
+) -> int:
+    return state_store.delete_where(
+        CONTEXT_MEMORY_ENTITY_TYPE,
+        deleted="true",
+        updated_before=cutoff,
+    )
+
+
+# LRU of run-scoped namespaces hydrated from the state store. Every item is
+# persisted on write, so dropping a namespace only releases memory; the next
+# access reloads it with one indexed query.
+class ResidentRunNamespaces:
+    __slots__ = ("_capacity", "_namespaces")
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = max(1, int(capacity))
+        self._namespaces: OrderedDict[str, ContextMemoryNamespace] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._namespaces)
+
+    def __contains__(self, namespace_id: str) -> bool:
+        return namespace_id in self._namespaces
+
+    def get(self, namespace_id: str) -> ContextMemoryNamespace | None:
+        namespace = self._namespaces.get(namespace_id)
+        if namespace is not None:
+            self._namespaces.move_to_end(namespace_id)
+        return namespace
+
+    def put(self, namespace_id: str, namespace: ContextMemoryNamespace) -> list[str]:
+        self._namespaces[namespace_id] = namespace
+        self._namespaces.move_to_end(namespace_id)
+        evicted: list[str] = []
+        while len(self._namespaces) > self._capacity:
+            evicted_id, _ = self._namespaces.popitem(last=False)
+            evicted.append(evicted_id)
+        return evicted
+
+    def ids(self) -> list[str]:
+        return list(self._namespaces)
+
+    def pop(self, namespace_id: str) -> ContextMemoryNamespace | None:
+        return self._namespaces.pop(namespace_id, None)
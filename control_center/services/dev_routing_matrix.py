@@ -5,23 +5,17 @@ import re
 from pathlib import Path
 from typing import Any
 
+from control_center.core.config_watch import (
+    DEFAULT_CONFIG_RECHECK_SECONDS,
+    ConfigFileWatcher,
+)
+from control_center.services.dev_routing_matrix_index import (
+    CompiledRoutingMatrix,
+    normalize_text_list,
+)
 
-def normalize_text_list(value: object) -> list[str]:
-    output: list[str] = []
-    if isinstance(value, str):
-        raw_items = [value]
-    elif isinstance(value, list):
-        raw_items = value
-    else:
-        return output
-
-    for item in raw_items:
-        normalized = str(item).strip().lower()
-        if not normalized:
-            continue
-        if normalized not in output:
-            output.append(normalized)
-    return output
+SIGNAL_CACHE_LIMIT = 4096
+SIGNAL_PROFILE_FIELDS = ("coverage_tags", "domain", "stack", "language", "task_type", "risk")
 
 
 def normalize_task_routing(value: object) -> dict[str, object]:
@@ -67,14 +61,28 @@ def normalize_task_routing(value: object) -> dict[str, object]:
 
 
 class DevRoutingMatrixService:
-    def __init__(self, matrix_path: str, logger: Any | None = None) -> None:
+    def __init__(
+        self,
+        matrix_path: str,
+        logger: Any | None = None,
+        *,
+        recheck_seconds: float = DEFAULT_CONFIG_RECHECK_SECONDS,
+    ) -> None:
         self._matrix_path = matrix_path
         self._logger = logger
-        self._matrix = self._load_matrix(matrix_path)
+        self._watch = ConfigFileWatcher(
+            matrix_path,
+            lambda: CompiledRoutingMatrix.compile(self._load_matrix(matrix_path)),
+            min_recheck_seconds=recheck_seconds,
+        )
+        # (module_key, normalized profile fields) -> inferred signals
+        self._signal_cache: dict[
+            tuple[str, tuple[tuple[str, ...], ...]], dict[str, tuple[str, ...]]
+        ] = {}
 
     @property
     def matrix(self) -> dict[str, object]:
-        return self._matrix
+        return self._watch.current().matrix
 
     @property
     def matrix_path(self) -> str:
@@ -217,83 +225,39 @@ class DevRoutingMatrixService:
             "risk": risk,
         }
 
-    @staticmethod
-    def _matrix_rule_matches(
+    def _module_signals(
+        self,
         *,
-        rule_match: dict[str, object],
-        signals: dict[str, list[str]],
-    ) -> bool:
-        for key, expected_raw in rule_match.items():
-            expected = normalize_text_list(expected_raw)
-            if not expected:
-                continue
-            actual = normalize_text_list(signals.get(str(key), []))
-            if not actual:
-                continue
-            if set(actual).isdisjoint(set(expected)):
-                return False
-        return True
+        module_key: str,
+        profile: dict[str, object] | None,
+    ) -> dict[str, list[str]]:
+        fields = profile if isinstance(profile, dict) else {}
+        cache_key = (
+            module_key,
+            tuple(tuple(normalize_text_list(fields.get(name))) for name in SIGNAL_PROFILE_FIELDS),
+        )
+        cached = self._signal_cache.get(cache_key)
+        if cached is None:
+            inferred = self._infer_module_routing_signals(module_key=module_key, profile=profile)
+            cached = {key: tuple(values) for key, values in inferred.items()}
+            if len(self._signal_cache) >= SIGNAL_CACHE_LIMIT:
+                self._signal_cache.clear()
+            self._signal_cache[cache_key] = cached
+        return {key: list(values) for key, values in cached.items()}
 
     def _select_rule(
         self,
         *,
         signals: dict[str, list[str]],
     ) -> tuple[str, dict[str, object], list[str], list[str], bool]:
-        matrix = self._matrix
-        default_target = matrix.get("default_target")
-        target = default_target if isinstance(default_target, dict) else {}
-        fallback_role = str(target.get("role", "module-dev")).strip().lower() or "module-dev"
-        fallback_capability = (
-            str(target.get("capability_id", "builtin.skill.general-dev")).strip()
-            or "builtin.skill.general-dev"
+        selection = self._watch.current().select(signals)
+        return (
+            selection.rule_id,
+            dict(selection.target),
+            list(selection.required_checks),
+            list(selection.handoff_roles),
+            selection.requires_human_confirmation,
         )
-        fallback_executor = str(target.get("executor", "coding-agent")).strip() or "coding-agent"
-        fallback_target = {
-            "role": fallback_role,
-            "capability_id": fallback_capability,
-            "executor": fallback_executor,
-        }
-
-        rules = matrix.get("rules")
-        if not isinstance(rules, list):
-            return "default", fallback_target, [], [], False
-
-        sorted_rules = sorted(
-            [item for item in rules if isinstance(item, dict)],
-            key=lambda item: int(item.get("priority", 9999))
-            if isinstance(item.get("priority"), int)
-            else 9999,
-        )
-        for rule in sorted_rules:
-            match = rule.get("match")
-            if not isinstance(match, dict):
-                continue
-            if not self._matrix_rule_matches(rule_match=match, signals=signals):
-                continue
-            target_raw = rule.get("target")
-            if not isinstance(target_raw, dict):
-                continue
-            role = str(target_raw.get("role", "")).strip().lower()
-            capability_id = str(target_raw.get("capability_id", "")).strip()
-            executor = str(target_raw.get("executor", "")).strip()
-            if not role or not capability_id or not executor:
-                continue
-            required_checks = normalize_text_list(rule.get("required_checks"))
-            handoff_roles = normalize_text_list(rule.get("handoff_roles"))
-            requires_human_confirmation = bool(rule.get("requires_human_confirmation", False))
-            return (
-                str(rule.get("id", "")).strip() or "unnamed-rule",
-                {
-                    "role": role,
-                    "capability_id": capability_id,
-                    "executor": executor,
-                },
-                required_checks,
-                handoff_roles,
-                requires_human_confirmation,
-            )
-
-        return "default", fallback_target, [], [], False
 
     def apply(
         self,
@@ -310,7 +274,7 @@ class DevRoutingMatrixService:
             tasks = module_task_packages.get(module, [])
             if not isinstance(tasks, list):
                 continue
-            signals = self._infer_module_routing_signals(
+            signals = self._module_signals(
                 module_key=module,
                 profile=profile_map.get(module),
             )
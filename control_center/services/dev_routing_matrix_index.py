@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+DEFAULT_ROLE = "module-dev"
+DEFAULT_CAPABILITY_ID = "builtin.skill.general-dev"
+DEFAULT_EXECUTOR = "coding-agent"
+SELECTION_CACHE_LIMIT = 1024
+
+
+def normalize_text_list(value: object) -> list[str]:
+    output: list[str] = []
+    if isinstance(value, str):
+        raw_items = [value]
+    elif isinstance(value, list):
+        raw_items = value
+    else:
+        return output
+
+    for item in raw_items:
+        normalized = str(item).strip().lower()
+        if not normalized:
+            continue
+        if normalized not in output:
+            output.append(normalized)
+    return output
+
+
+def _normalize_values(value: object) -> tuple[str, ...]:
+    return tuple(normalize_text_list(value))
+
+
+@dataclass(frozen=True, slots=True)
+class RoutingSelection:
+    rule_id: str
+    target: dict[str, str]
+    required_checks: tuple[str, ...] = ()
+    handoff_roles: tuple[str, ...] = ()
+    requires_human_confirmation: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRoutingRule:
+    position: int
+    match: dict[str, frozenset[str]]
+    selection: RoutingSelection
+
+
+# Dev routing matrix compiled once per load: usable rules in priority order,
+# match lists as frozensets, and an inverted index (signal key, value) -> rule
+# positions. A rule matches when every key it constrains is either absent from
+# the signals or shares a value with them.
+@dataclass(slots=True)
+class CompiledRoutingMatrix:
+    matrix: dict[str, object]
+    fallback: RoutingSelection
+    rules: tuple[CompiledRoutingRule, ...]
+    constrained_by_key: dict[str, frozenset[int]]
+    index: dict[tuple[str, str], frozenset[int]]
+    _selection_cache: dict[tuple[tuple[str, tuple[str, ...]], ...], RoutingSelection] = field(
+        default_factory=dict
+    )
+
+    @classmethod
+    def compile(cls, matrix: dict[str, object]) -> "CompiledRoutingMatrix":
+        default_target = matrix.get("default_target")
+        target = default_target if isinstance(default_target, dict) else {}
+        fallback = RoutingSelection(
+            rule_id="default",
+            target={
+                "role": str(target.get("role", DEFAULT_ROLE)).strip().lower() or DEFAULT_ROLE,
+                "capability_id": str(
+                    target.get("capability_id", DEFAULT_CAPABILITY_ID)
+                ).strip()
+                or DEFAULT_CAPABILITY_ID,
+                "executor": str(target.get("executor", DEFAULT_EXECUTOR)).strip()
+                or DEFAULT_EXECUTOR,
+            },
+        )
+
+        raw_rules = matrix.get("rules")
+        ordered = sorted(
+            [item for item in raw_rules if isinstance(item, dict)]
+            if isinstance(raw_rules, list)
+            else [],
+            key=lambda item: int(item.get("priority", 9999))
+            if isinstance(item.get("priority"), int)
+            else 9999,
+        )
+        rules: list[CompiledRoutingRule] = []
+        constrained: dict[str, set[int]] = {}
+        index: dict[tuple[str, str], set[int]] = {}
+        for rule in ordered:
+            compiled = cls._compile_rule(rule, position=len(rules))
+            if compiled is None:
+                continue
+            rules.append(compiled)
+            for key, values in compiled.match.items():
+                constrained.setdefault(key, set()).add(compiled.position)
+                for value in values:
+                    index.setdefault((key, value), set()).add(compiled.position)
+
+        return cls(
+            matrix=matrix,
+            fallback=fallback,
+            rules=tuple(rules),
+            constrained_by_key={key: frozenset(value) for key, value in constrained.items()},
+            index={key: frozenset(value) for key, value in index.items()},
+        )
+
+    @staticmethod
+    def _compile_rule(rule: dict[str, object], *, position: int) -> CompiledRoutingRule | None:
+        match = rule.get("match")
+        target_raw = rule.get("target")
+        if not isinstance(match, dict) or not isinstance(target_raw, dict):
+            return None
+        role = str(target_raw.get("role", "")).strip().lower()
+        capability_id = str(target_raw.get("capability_id", "")).strip()
+        executor = str(target_raw.get("executor", "")).strip()
+        if not role or not capability_id or not executor:
+            return None
+        compiled_match: dict[str, frozenset[str]] = {}
+        for key, expected_raw in match.items():
+            expected = _normalize_values(expected_raw)
+            if expected:
+                compiled_match[str(key)] = frozenset(expected)
+        return CompiledRoutingRule(
+            position=position,
+            match=compiled_match,
+            selection=RoutingSelection(
+                rule_id=str(rule.get("id", "")).strip() or "unnamed-rule",
+                target={"role": role, "capability_id": capability_id, "executor": executor},
+                required_checks=_normalize_values(rule.get("required_checks")),
+                handoff_roles=_normalize_values(rule.get("handoff_roles")),
+                requires_human_confirmation=bool(rule.get("requires_human_confirmation", False)),
+            ),
+        )
+
+    def select(self, signals: dict[str, list[str]]) -> RoutingSelection:
+        cache_key = tuple(
+            sorted((str(key), _normalize_values(values)) for key, values in signals.items())
+        )
+        cached = self._selection_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        candidates = set(range(len(self.rules)))
+        for key, actual in cache_key:
+            constrained = self.constrained_by_key.get(key)
+            if not constrained or not actual:
+                continue
+            allowed: set[int] = set()
+            for value in actual:
+                allowed.update(self.index.get((key, value), ()))
+            candidates.difference_update(constrained - allowed)
+            if not candidates:
+                break
+        selection = self.rules[min(candidates)].selection if candidates else self.fallback
+
+        if len(self._selection_cache) >= SELECTION_CACHE_LIMIT:
+            self._selection_cache.clear()
+        self._selection_cache[cache_key] = selection
+        return selection
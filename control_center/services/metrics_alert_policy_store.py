@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime
 from pathlib import Path
 
 from control_center.models.hierarchy import new_id, now_utc
@@ -24,9 +25,27 @@ from control_center.services.metrics_alert_policy_store_io import (
     persist_default_policy as persist_default_policy_io,
     persist_default_verify_policy_registry as persist_default_verify_policy_registry_io,
 )
+from control_center.services.metrics_alert_policy_store_expiry import (
+    RollbackApprovalExpiryHeap,
+    RollbackApprovalExpiryTask,
+)
+from control_center.services.metrics_alert_policy_store_index import (
+    build_approval_index,
+    build_audit_indexes,
+    build_created_at_index,
+    extend_created_at_index,
+    index_audit_entry,
+    select_by_created_at,
+)
+from control_center.services.metrics_alert_policy_store_journal import (
+    ROLLBACK_APPROVAL_TIMESTAMP_KEYS,
+    rollback_approval_delta,
+    serialize_timestamps,
+    should_compact_rollback_approvals,
+)
 from control_center.services.metrics_alert_policy_store_rollback import (
     append_rollback_approval_purge_audit,
-    find_rollback_approval,
+    append_rollback_approval_records,
     is_older_than,
     is_timestamp_after,
     is_timestamp_before,
@@ -34,7 +53,7 @@ from control_center.services.metrics_alert_policy_store_rollback import (
     load_rollback_approvals,
     persist_rollback_approval_purge_audits,
     persist_rollback_approvals,
-    refresh_rollback_approval_statuses,
+    expire_rollback_approvals,
 )
 from control_center.services.metrics_alert_policy_store_verify import (
     normalize_verify_policy_registry,
@@ -42,7 +61,6 @@ from control_center.services.metrics_alert_policy_store_verify import (
 )
 from control_center.services.metrics_alert_policy_store_policy import (
     deserialize_audit_timestamps,
-    find_rollback_by_request_id,
     normalize_policy,
 )
 
@@ -105,8 +123,21 @@ class MetricsAlertPolicyStore:
         self._policy: dict[str, int] = dict(DEFAULT_POLICY)
         self._updated_at = now_utc()
         self._audit_entries: list[dict[str, object]] = []
+        self._audit_by_id: dict[str, dict[str, object]] = {}
+        self._rollback_by_request_id: dict[str, dict[str, object]] = {}
         self._rollback_approvals: list[dict[str, object]] = []
+        self._rollback_approval_by_id: dict[str, dict[str, object]] = {}
+        self._rollback_approval_expiry = RollbackApprovalExpiryHeap()
+        # Expired in memory by a non-persisting refresh (dry-run purge);
+        # written with the next persisted refresh.
+        self._unpersisted_expired_approvals: list[dict[str, object]] = []
+        self._rollback_approval_expiry_task: RollbackApprovalExpiryTask | None = None
+        # Records in the append-only approval log since the last snapshot.
+        self._rollback_approval_log_records = 0
         self._rollback_approval_purge_audits: list[dict[str, object]] = []
+        # Sorted (created_at, position) over purge audits; rebuilt lazily.
+        self._purge_audit_time_index: list[tuple[datetime, int]] | None = None
+        self._purge_audit_time_index_stale = True
         self._verify_policy_registry: dict[str, object] = dict(DEFAULT_VERIFY_POLICY_REGISTRY)
         self._verify_policy_registry_updated_at = now_utc()
         self._verify_policy_registry_audits: list[dict[str, object]] = []
@@ -201,8 +232,7 @@ class MetricsAlertPolicyStore:
             "reason": reason,
             "policy": dict(self._policy),
         }
-        self._audit_entries.append(entry)
-        self._append_audit(entry)
+        self._record_audit(entry)
         return self.get_policy()
 
     def list_audits(self, *, limit: int = 20) -> list[dict[str, object]]:
@@ -231,10 +261,8 @@ class MetricsAlertPolicyStore:
         )
 
     def get_audit(self, audit_id: str) -> dict[str, object] | None:
-        for entry in reversed(self._audit_entries):
-            if str(entry.get("id", "")).strip() == audit_id:
-                return dict(entry)
-        return None
+        entry = self._audit_by_id.get(audit_id)
+        return dict(entry) if entry is not None else None
 
     def create_rollback_approval(
         self,
@@ -355,48 +383,151 @@ class MetricsAlertPolicyStore:
         return is_timestamp_before(timestamp, threshold)
 
     def _find_rollback_by_request_id(self, request_id: str) -> dict[str, object] | None:
-        return find_rollback_by_request_id(self._audit_entries, request_id)
+        entry = self._rollback_by_request_id.get(request_id)
+        return dict(entry) if entry is not None else None
+
+    async def start_rollback_approval_expiry(
+        self,
+        *,
+        interval_seconds: float,
+        logger=None,
+    ) -> None:
+        if self._rollback_approval_expiry_task is None:
+            self._rollback_approval_expiry_task = RollbackApprovalExpiryTask(
+                self._refresh_rollback_approval_statuses,
+                interval_seconds=interval_seconds,
+                logger=logger,
+            )
+        await self._rollback_approval_expiry_task.start()
+
+    async def stop_rollback_approval_expiry(self) -> None:
+        if self._rollback_approval_expiry_task is not None:
+            await self._rollback_approval_expiry_task.stop()
 
     def _refresh_rollback_approval_statuses(self, *, persist: bool = True) -> int:
-        return refresh_rollback_approval_statuses(
-            self._rollback_approvals,
-            persist=persist,
-            persist_handler=self._persist_rollback_approvals,
+        now = now_utc()
+        changed = expire_rollback_approvals(
+            self._rollback_approval_expiry.pop_expired(now, self._find_rollback_approval),
+            now=now,
         )
+        self._unpersisted_expired_approvals.extend(changed)
+        if persist and self._unpersisted_expired_approvals:
+            pending = self._unpersisted_expired_approvals
+            self._unpersisted_expired_approvals = []
+            self._record_rollback_approval_changes(pending, fields=("status", "updated_at"))
+        return len(changed)
 
     def _find_rollback_approval(self, approval_id: str) -> dict[str, object] | None:
-        return find_rollback_approval(self._rollback_approvals, approval_id)
+        return self._rollback_approval_by_id.get(approval_id)
+
+    def _set_rollback_approvals(self, approvals: list[dict[str, object]]) -> None:
+        self._rollback_approvals = approvals
+        self._rollback_approval_by_id = build_approval_index(approvals)
+        self._rollback_approval_expiry.rebuild(approvals)
 
     def _load_rollback_approvals(self) -> None:
-        self._rollback_approvals = load_rollback_approvals(
+        approvals, self._rollback_approval_log_records = load_rollback_approvals(
             self._rollback_approval_path,
             deserialize_audit=self._deserialize_audit,
         )
+        self._set_rollback_approvals(approvals)
 
     def _persist_rollback_approvals(self) -> None:
-        persist_rollback_approvals(
+        # Snapshot: atomically rewrites the log as one record per approval.
+        # Entries may have been edited in place, so re-sync the expiry heap.
+        self._rollback_approval_log_records = persist_rollback_approvals(
             self._rollback_approval_path,
             self._rollback_approvals,
         )
+        self._unpersisted_expired_approvals = []
+        self._rollback_approval_expiry.rebuild(self._rollback_approvals)
+
+    def _append_rollback_approval(self, entry: dict[str, object]) -> None:
+        self._rollback_approvals.append(entry)
+        self._rollback_approval_by_id.setdefault(str(entry.get("id", "")).strip(), entry)
+        self._rollback_approval_expiry.push(entry)
+        self._append_rollback_approval_records(
+            [serialize_timestamps(entry, ROLLBACK_APPROVAL_TIMESTAMP_KEYS)]
+        )
+
+    def _record_rollback_approval_changes(
+        self,
+        entries: list[dict[str, object]],
+        *,
+        fields: tuple[str, ...],
+    ) -> None:
+        self._append_rollback_approval_records(
+            [rollback_approval_delta(entry, fields) for entry in entries]
+        )
+
+    def _append_rollback_approval_records(self, records: list[dict[str, object]]) -> None:
+        self._rollback_approval_log_records += append_rollback_approval_records(
+            self._rollback_approval_path,
+            records,
+        )
+        if should_compact_rollback_approvals(
+            self._rollback_approval_log_records,
+            len(self._rollback_approvals),
+        ):
+            self._persist_rollback_approvals()
 
     def _load_rollback_approval_purge_audits(self) -> None:
-        self._rollback_approval_purge_audits = load_rollback_approval_purge_audits(
-            self._rollback_approval_purge_audit_path,
-            deserialize_audit=self._deserialize_audit,
+        self._set_rollback_approval_purge_audits(
+            load_rollback_approval_purge_audits(
+                self._rollback_approval_purge_audit_path,
+                deserialize_audit=self._deserialize_audit,
+            )
         )
 
+    def _set_rollback_approval_purge_audits(self, entries: list[dict[str, object]]) -> None:
+        self._rollback_approval_purge_audits = entries
+        self._purge_audit_time_index_stale = True
+
     def _append_rollback_approval_purge_audit(self, entry: dict[str, object]) -> None:
+        self._rollback_approval_purge_audits.append(entry)
+        if not self._purge_audit_time_index_stale and not extend_created_at_index(
+            self._purge_audit_time_index,
+            entry,
+            len(self._rollback_approval_purge_audits) - 1,
+        ):
+            self._purge_audit_time_index_stale = True
         append_rollback_approval_purge_audit(
             self._rollback_approval_purge_audit_path,
             entry,
         )
 
     def _persist_rollback_approval_purge_audits(self) -> None:
+        # Entries may have been edited in place; re-sort on next time query.
+        self._purge_audit_time_index_stale = True
         persist_rollback_approval_purge_audits(
             self._rollback_approval_purge_audit_path,
             self._rollback_approval_purge_audits,
         )
 
+    def _purge_audits_in_window(
+        self,
+        *,
+        created_after,
+        created_before,
+    ) -> list[dict[str, object]] | None:
+        # None when the index cannot answer (incomparable timestamps).
+        if self._purge_audit_time_index_stale:
+            self._purge_audit_time_index = build_created_at_index(
+                self._rollback_approval_purge_audits
+            )
+            self._purge_audit_time_index_stale = False
+        if self._purge_audit_time_index is None:
+            return None
+        try:
+            return select_by_created_at(
+                self._rollback_approval_purge_audits,
+                self._purge_audit_time_index,
+                created_after=created_after,
+                created_before=created_before,
+            )
+        except TypeError:
+            return None
+
     def _load_verify_policy_registry(self) -> None:
         load_verify_policy_registry_io(self)
 
@@ -440,6 +571,14 @@ class MetricsAlertPolicyStore:
 
     def _load_audits(self) -> None:
         self._audit_entries = load_audits_io(self)
+        self._audit_by_id, self._rollback_by_request_id = build_audit_indexes(
+            self._audit_entries
+        )
+
+    def _record_audit(self, entry: dict[str, object]) -> None:
+        self._audit_entries.append(entry)
+        index_audit_entry(self._audit_by_id, self._rollback_by_request_id, entry)
+        self._append_audit(entry)
 
     def _append_audit(self, entry: dict[str, object]) -> None:
         append_audit_line(self._audit_path, entry, timestamp_key="updated_at")
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+from collections.abc import Callable, Iterable
+from datetime import datetime
+
+EXPIRABLE_STATUSES = frozenset({"pending", "approved"})
+
+
+def _expirable_deadline(entry: dict[str, object]) -> datetime | None:
+    if str(entry.get("status", "")).strip().lower() not in EXPIRABLE_STATUSES:
+        return None
+    expires_at = entry.get("expires_at")
+    return expires_at if isinstance(expires_at, datetime) else None
+
+
+# Min-heap of (expires_at, seq, approval_id) over pending/approved approvals.
+# Deletion is lazy: entries that were used, purged or had their deadline moved
+# are discarded or re-pushed when they reach the top, so a refresh only
+# touches approvals whose deadline has actually passed.
+class RollbackApprovalExpiryHeap:
+    __slots__ = ("_heap", "_seq")
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[datetime, int, str]] = []
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def rebuild(self, approvals: Iterable[dict[str, object]]) -> None:
+        self._heap = []
+        for entry in approvals:
+            deadline = _expirable_deadline(entry)
+            if deadline is not None:
+                self._seq += 1
+                self._heap.append((deadline, self._seq, str(entry.get("id", "")).strip()))
+        heapq.heapify(self._heap)
+
+    def push(self, entry: dict[str, object]) -> None:
+        deadline = _expirable_deadline(entry)
+        if deadline is not None:
+            self._push(deadline, str(entry.get("id", "")).strip())
+
+    def pop_expired(
+        self,
+        now: datetime,
+        lookup: Callable[[str], dict[str, object] | None],
+    ) -> list[dict[str, object]]:
+        expired: list[dict[str, object]] = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, approval_id = heapq.heappop(self._heap)
+            entry = lookup(approval_id)
+            if entry is None:
+                continue
+            deadline = _expirable_deadline(entry)
+            if deadline is None:
+                continue
+            if deadline > now:
+                self._push(deadline, approval_id)
+                continue
+            expired.append(entry)
+        return expired
+
+    def _push(self, deadline: datetime, approval_id: str) -> None:
+        self._seq += 1
+        heapq.heappush(self._heap, (deadline, self._seq, approval_id))
+
+
+class RollbackApprovalExpiryTask:
+    def __init__(
+        self,
+        expire: Callable[[], int],
+        *,
+        interval_seconds: float,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self._expire = expire
+        self._interval_seconds = max(0.05, float(interval_seconds))
+        self._logger = logger or logging.getLogger("wherecode.control_center")
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run(), name="rollback-approval-expiry")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _run(self) -> None:
+        # Every tick expires all approvals that came due since the last one
+        # and persists them as a single appended batch.
+        while True:
+            await asyncio.sleep(self._interval_seconds)
+            try:
+                self._expire()
+            except Exception:  # noqa: BLE001
+                self._logger.exception("rollback approval expiry tick failed")
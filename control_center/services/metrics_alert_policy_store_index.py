@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from operator import itemgetter
+
+_TIMESTAMP = itemgetter(0)
+
+
+def index_audit_entry(
+    audit_by_id: dict[str, dict[str, object]],
+    rollback_by_request_id: dict[str, dict[str, object]],
+    entry: dict[str, object],
+) -> None:
+    # Later entries win, matching the reverse scans these indexes replace.
+    audit_id = str(entry.get("id", "")).strip()
+    if audit_id:
+        audit_by_id[audit_id] = entry
+    request_id = str(entry.get("rollback_request_id", "") or "").strip()
+    if request_id:
+        rollback_by_request_id[request_id] = entry
+
+
+def build_audit_indexes(
+    entries: list[dict[str, object]],
+) -> tuple[dict[str, dict[str, object]], dict[str, dict[str, object]]]:
+    audit_by_id: dict[str, dict[str, object]] = {}
+    rollback_by_request_id: dict[str, dict[str, object]] = {}
+    for entry in entries:
+        index_audit_entry(audit_by_id, rollback_by_request_id, entry)
+    return audit_by_id, rollback_by_request_id
+
+
+def build_approval_index(
+    approvals: list[dict[str, object]],
+) -> dict[str, dict[str, object]]:
+    index: dict[str, dict[str, object]] = {}
+    for entry in approvals:
+        index.setdefault(str(entry.get("id", "")).strip(), entry)
+    return index
+
+
+# Sorted (created_at, position) pairs over a record list. Records without a
+# datetime `created_at` never match a time filter, so they are left out.
+# None means the timestamps are not mutually comparable (naive mixed with
+# aware); callers then fall back to a linear filter.
+def build_created_at_index(
+    records: list[dict[str, object]],
+) -> list[tuple[datetime, int]] | None:
+    pairs = [
+        (timestamp, position)
+        for position, record in enumerate(records)
+        if isinstance(timestamp := record.get("created_at"), datetime)
+    ]
+    try:
+        pairs.sort(key=_TIMESTAMP)
+    except TypeError:
+        return None
+    return pairs
+
+
+def extend_created_at_index(
+    index: list[tuple[datetime, int]] | None,
+    record: dict[str, object],
+    position: int,
+) -> bool:
+    # Appends in time order keep the index valid; anything else asks the
+    # caller to rebuild it.
+    if index is None:
+        return False
+    timestamp = record.get("created_at")
+    if not isinstance(timestamp, datetime):
+        return True
+    try:
+        if index and timestamp < index[-1][0]:
+            return False
+    except TypeError:
+        return False
+    index.append((timestamp, position))
+    return True
+
+
+def select_by_created_at(
+    records: list[dict[str, object]],
+    index: list[tuple[datetime, int]],
+    *,
+    created_after,
+    created_before,
+) -> list[dict[str, object]]:
+    for threshold in (created_after, created_before):
+        if threshold is not None and not hasattr(threshold, "tzinfo"):
+            return []
+    low = 0 if created_after is None else bisect_left(index, created_after, key=_TIMESTAMP)
+    high = (
+        len(index)
+        if created_before is None
+        else bisect_right(index, created_before, key=_TIMESTAMP)
+    )
+    if low >= high:
+        return []
+    return [records[position] for position in sorted(item[1] for item in index[low:high])]
@@ -3,6 +3,11 @@ from __future__ import annotations
 import json
 
 from control_center.models.hierarchy import now_utc
+from control_center.services.metrics_alert_policy_store_journal import (
+    append_jsonl,
+    iter_jsonl_records,
+    serialize_timestamps,
+)
 
 
 def load_verify_policy_registry(store) -> None:
@@ -45,31 +50,17 @@ def load_verify_policy_registry_audits(store) -> list[dict[str, object]]:
     if not store._verify_policy_registry_audit_path.exists():
         return []
     try:
-        entries: list[dict[str, object]] = []
-        for line in store._verify_policy_registry_audit_path.read_text(
-            encoding="utf-8"
-        ).splitlines():
-            if not line.strip():
-                continue
-            payload = json.loads(line)
-            if not isinstance(payload, dict):
-                continue
-            if "id" not in payload:
-                continue
-            entries.append(store._deserialize_audit(payload))
-        return entries
+        return [
+            store._deserialize_audit(payload)
+            for payload in iter_jsonl_records(store._verify_policy_registry_audit_path)
+            if "id" in payload
+        ]
     except Exception:  # noqa: BLE001
         return []
 
 
 def append_audit_line(path, entry: dict[str, object], *, timestamp_key: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    serializable = dict(entry)
-    timestamp = serializable.get(timestamp_key)
-    if timestamp is not None and hasattr(timestamp, "isoformat"):
-        serializable[timestamp_key] = timestamp.isoformat()
-    with path.open("a", encoding="utf-8") as file:
-        file.write(json.dumps(serializable, ensure_ascii=False) + "\n")
+    append_jsonl(path, [serialize_timestamps(entry, (timestamp_key,))])
 
 
 def load_policy(store) -> None:
@@ -105,16 +96,10 @@ def load_audits(store) -> list[dict[str, object]]:
     if not store._audit_path.exists():
         return []
     try:
-        entries: list[dict[str, object]] = []
-        for line in store._audit_path.read_text(encoding="utf-8").splitlines():
-            if not line.strip():
-                continue
-            payload = json.loads(line)
-            if not isinstance(payload, dict):
-                continue
-            if "id" not in payload:
-                continue
-            entries.append(store._deserialize_audit(payload))
-        return entries
+        return [
+            store._deserialize_audit(payload)
+            for payload in iter_jsonl_records(store._audit_path)
+            if "id" in payload
+        ]
     except Exception:  # noqa: BLE001
         return []
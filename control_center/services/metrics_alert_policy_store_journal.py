@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+
+ROLLBACK_APPROVAL_TIMESTAMP_KEYS = ("created_at", "updated_at", "expires_at")
+# Rewrite the approval log once it holds this many records and more than
+# twice the live approval count; smaller logs are left to grow.
+ROLLBACK_APPROVAL_COMPACT_MIN_RECORDS = 256
+DELTA_OP = "set"
+
+
+def serialize_timestamps(entry: dict[str, object], keys: Iterable[str]) -> dict[str, object]:
+    serializable = dict(entry)
+    for key in keys:
+        value = serializable.get(key)
+        if value is not None and hasattr(value, "isoformat"):
+            serializable[key] = value.isoformat()
+    return serializable
+
+
+def iter_jsonl_records(path: Path) -> Iterator[dict[str, object]]:
+    # A crash mid-append can only leave a torn last line; skip undecodable
+    # lines instead of discarding everything that was loaded before them.
+    with path.open("r", encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                payload = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(payload, dict):
+                yield payload
+
+
+def append_jsonl(path: Path, records: Iterable[dict[str, object]]) -> int:
+    lines = [json.dumps(record, ensure_ascii=False) + "\n" for record in records]
+    if not lines:
+        return 0
+    payload = "".join(lines)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a+b") as file:
+        # Terminate a torn tail so it cannot swallow the record appended now.
+        if file.tell() > 0:
+            file.seek(-1, os.SEEK_END)
+            if file.read(1) != b"\n":
+                payload = "\n" + payload
+        file.write(payload.encode("utf-8"))
+    return len(lines)
+
+
+def write_jsonl_atomic(path: Path, records: Iterable[dict[str, object]]) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            for record in records:
+                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return count
+
+
+def rollback_approval_delta(entry: dict[str, object], fields: Iterable[str]) -> dict[str, object]:
+    changed = serialize_timestamps(
+        {key: entry.get(key) for key in fields},
+        ROLLBACK_APPROVAL_TIMESTAMP_KEYS,
+    )
+    return {"op": DELTA_OP, "id": str(entry.get("id", "")), "fields": changed}
+
+
+def replay_rollback_approval_log(
+    path: Path,
+    *,
+    deserialize_audit: Callable[[dict[str, object]], dict[str, object]],
+) -> tuple[list[dict[str, object]], int]:
+    # Full records (the snapshot format) upsert by id; delta records patch
+    # fields of an approval already seen. Returns approvals in creation order
+    # plus the number of records read, which drives compaction.
+    if not path.exists():
+        return [], 0
+    approvals: dict[str, dict[str, object]] = {}
+    records = 0
+    for payload in iter_jsonl_records(path):
+        records += 1
+        if payload.get("op") == DELTA_OP:
+            current = approvals.get(str(payload.get("id", "")))
+            fields = payload.get("fields")
+            if current is not None and isinstance(fields, dict):
+                current.update(fields)
+            continue
+        if "id" not in payload or "audit_id" not in payload:
+            continue
+        approvals[str(payload["id"])] = payload
+    return [deserialize_audit(payload) for payload in approvals.values()], records
+
+
+def should_compact_rollback_approvals(records: int, live: int) -> bool:
+    return records >= ROLLBACK_APPROVAL_COMPACT_MIN_RECORDS and records > 2 * live
@@ -111,8 +111,7 @@ def rollback_to_audit(
         "rollback_approval_id": normalized_approval_id,
         "policy": dict(store._policy),
     }
-    store._audit_entries.append(entry)
-    store._append_audit(entry)
+    store._record_audit(entry)
     return {
         "source_audit_id": audit_id,
         "dry_run": False,
@@ -147,8 +146,7 @@ def create_rollback_approval(
         "updated_at": now,
         "expires_at": expires_at,
     }
-    store._rollback_approvals.append(entry)
-    store._persist_rollback_approvals()
+    store._append_rollback_approval(entry)
     return dict(entry)
 
 
@@ -175,7 +173,10 @@ def approve_rollback_approval(
     approval["status"] = "approved"
     approval["approved_by"] = approved_by.strip()
     approval["updated_at"] = now_utc()
-    store._persist_rollback_approvals()
+    store._record_rollback_approval_changes(
+        [approval],
+        fields=("status", "approved_by", "updated_at"),
+    )
     return dict(approval)
 
 
@@ -208,7 +209,10 @@ def consume_rollback_approval(
     approval["status"] = "used"
     approval["used_by"] = used_by.strip()
     approval["updated_at"] = now_utc()
-    store._persist_rollback_approvals()
+    store._record_rollback_approval_changes(
+        [approval],
+        fields=("status", "used_by", "updated_at"),
+    )
     return dict(approval)
 
 
@@ -251,7 +255,7 @@ def purge_rollback_approvals(
     )
 
     if not dry_run:
-        store._rollback_approvals = keep
+        store._set_rollback_approvals(keep)
         if removed_used or removed_expired:
             store._persist_rollback_approvals()
 
@@ -277,7 +281,6 @@ def purge_rollback_approvals(
             "remaining_total": len(keep),
             "created_at": now_utc(),
         }
-        store._rollback_approval_purge_audits.append(audit_entry)
         store._append_rollback_approval_purge_audit(audit_entry)
         result["purge_audit_id"] = str(audit_entry["id"])
     return result
@@ -293,8 +296,17 @@ def list_rollback_approval_purge_audits(
 ) -> list[dict[str, object]]:
     if limit < 1:
         return []
+    records = store._rollback_approval_purge_audits
+    if created_after is not None or created_before is not None:
+        in_window = store._purge_audits_in_window(
+            created_after=created_after,
+            created_before=created_before,
+        )
+        if in_window is not None:
+            records = in_window
+            created_after = created_before = None
     records = filter_rollback_approval_purge_audits(
-        store._rollback_approval_purge_audits,
+        records,
         event_type=event_type,
         created_after=created_after,
         created_before=created_before,
@@ -322,7 +334,7 @@ def purge_rollback_approval_purge_audits(
     )
 
     if not dry_run:
-        store._rollback_approval_purge_audits = keep
+        store._set_rollback_approval_purge_audits(keep)
         if removed_total:
             store._persist_rollback_approval_purge_audits()
 
@@ -343,7 +355,6 @@ def purge_rollback_approval_purge_audits(
             "remaining_total": len(keep),
             "created_at": now_utc(),
         }
-        store._rollback_approval_purge_audits.append(audit_entry)
         store._append_rollback_approval_purge_audit(audit_entry)
         result["purge_audit_gc_id"] = str(audit_entry["id"])
     return result
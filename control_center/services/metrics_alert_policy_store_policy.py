@@ -27,17 +27,6 @@ def normalize_policy(
     return normalized
 
 
-def find_rollback_by_request_id(
-    audit_entries: list[dict[str, object]],
-    request_id: str,
-) -> dict[str, object] | None:
-    for entry in reversed(audit_entries):
-        rollback_request_id = str(entry.get("rollback_request_id", "")).strip()
-        if rollback_request_id == request_id:
-            return dict(entry)
-    return None
-
-
 def build_rollback_approval_stats(
     approvals: list[dict[str, object]],
 ) -> dict[str, int]:
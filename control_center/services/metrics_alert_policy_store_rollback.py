@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-import json
 from collections.abc import Callable
 from pathlib import Path
 
-from control_center.models.hierarchy import now_utc
+from control_center.services.metrics_alert_policy_store_journal import (
+    ROLLBACK_APPROVAL_TIMESTAMP_KEYS,
+    append_jsonl,
+    iter_jsonl_records,
+    replay_rollback_approval_log,
+    serialize_timestamps,
+    write_jsonl_atomic,
+)
 
 
 def is_older_than(
@@ -38,25 +44,13 @@ def is_timestamp_before(timestamp, threshold) -> bool:
     return timestamp <= threshold
 
 
-def find_rollback_approval(
-    approvals: list[dict[str, object]],
-    approval_id: str,
-) -> dict[str, object] | None:
-    for entry in approvals:
-        if str(entry.get("id", "")).strip() == approval_id:
-            return entry
-    return None
-
-
-def refresh_rollback_approval_statuses(
-    approvals: list[dict[str, object]],
+def expire_rollback_approvals(
+    candidates: list[dict[str, object]],
     *,
-    persist: bool,
-    persist_handler: Callable[[], None],
-) -> int:
-    now = now_utc()
-    changed = 0
-    for entry in approvals:
+    now,
+) -> list[dict[str, object]]:
+    changed: list[dict[str, object]] = []
+    for entry in candidates:
         status = str(entry.get("status", "")).strip().lower()
         if status not in {"pending", "approved"}:
             continue
@@ -66,9 +60,7 @@ def refresh_rollback_approval_statuses(
         if expires_at <= now:
             entry["status"] = "expired"
             entry["updated_at"] = now
-            changed += 1
-    if changed and persist:
-        persist_handler()
+            changed.append(entry)
     return changed
 
 
@@ -76,40 +68,31 @@ def load_rollback_approvals(
     rollback_approval_path: Path,
     *,
     deserialize_audit: Callable[[dict[str, object]], dict[str, object]],
-) -> list[dict[str, object]]:
-    if not rollback_approval_path.exists():
-        return []
+) -> tuple[list[dict[str, object]], int]:
     try:
-        approvals: list[dict[str, object]] = []
-        for line in rollback_approval_path.read_text(encoding="utf-8").splitlines():
-            if not line.strip():
-                continue
-            payload = json.loads(line)
-            if not isinstance(payload, dict):
-                continue
-            if "id" not in payload or "audit_id" not in payload:
-                continue
-            approvals.append(deserialize_audit(payload))
-        return approvals
+        return replay_rollback_approval_log(
+            rollback_approval_path,
+            deserialize_audit=deserialize_audit,
+        )
     except Exception:  # noqa: BLE001
-        return []
+        return [], 0
+
+
+def append_rollback_approval_records(
+    rollback_approval_path: Path,
+    records: list[dict[str, object]],
+) -> int:
+    return append_jsonl(rollback_approval_path, records)
 
 
 def persist_rollback_approvals(
     rollback_approval_path: Path,
     approvals: list[dict[str, object]],
-) -> None:
-    rollback_approval_path.parent.mkdir(parents=True, exist_ok=True)
-    lines: list[str] = []
-    for entry in approvals:
-        serializable = dict(entry)
-        for key in ("created_at", "updated_at", "expires_at"):
-            value = serializable.get(key)
-            if value is not None and hasattr(value, "isoformat"):
-                serializable[key] = value.isoformat()
-        lines.append(json.dumps(serializable, ensure_ascii=False))
-    payload = "\n".join(lines) + ("\n" if lines else "")
-    rollback_approval_path.write_text(payload, encoding="utf-8")
+) -> int:
+    return write_jsonl_atomic(
+        rollback_approval_path,
+        (serialize_timestamps(entry, ROLLBACK_APPROVAL_TIMESTAMP_KEYS) for entry in approvals),
+    )
 
 
 def load_rollback_approval_purge_audits(
@@ -120,19 +103,11 @@ def load_rollback_approval_purge_audits(
     if not rollback_approval_purge_audit_path.exists():
         return []
     try:
-        entries: list[dict[str, object]] = []
-        for line in rollback_approval_purge_audit_path.read_text(
-            encoding="utf-8"
-        ).splitlines():
-            if not line.strip():
-                continue
-            payload = json.loads(line)
-            if not isinstance(payload, dict):
-                continue
-            if "id" not in payload:
-                continue
-            entries.append(deserialize_audit(payload))
-        return entries
+        return [
+            deserialize_audit(payload)
+            for payload in iter_jsonl_records(rollback_approval_purge_audit_path)
+            if "id" in payload
+        ]
     except Exception:  # noqa: BLE001
         return []
 
@@ -141,26 +116,17 @@ def append_rollback_approval_purge_audit(
     rollback_approval_purge_audit_path: Path,
     entry: dict[str, object],
 ) -> None:
-    rollback_approval_purge_audit_path.parent.mkdir(parents=True, exist_ok=True)
-    serializable = dict(entry)
-    created_at = serializable.get("created_at")
-    if created_at is not None and hasattr(created_at, "isoformat"):
-        serializable["created_at"] = created_at.isoformat()
-    with rollback_approval_purge_audit_path.open("a", encoding="utf-8") as file:
-        file.write(json.dumps(serializable, ensure_ascii=False) + "\n")
+    append_jsonl(
+        rollback_approval_purge_audit_path,
+        [serialize_timestamps(entry, ("created_at",))],
+    )
 
 
 def persist_rollback_approval_purge_audits(
     rollback_approval_purge_audit_path: Path,
     entries: list[dict[str, object]],
 ) -> None:
-    rollback_approval_purge_audit_path.parent.mkdir(parents=True, exist_ok=True)
-    lines: list[str] = []
-    for entry in entries:
-        serializable = dict(entry)
-        created_at = serializable.get("created_at")
-        if created_at is not None and hasattr(created_at, "isoformat"):
-            serializable["created_at"] = created_at.isoformat()
-        lines.append(json.dumps(serializable, ensure_ascii=False))
-    payload = "\n".join(lines) + ("\n" if lines else "")
-    rollback_approval_purge_audit_path.write_text(payload, encoding="utf-8")
+    write_jsonl_atomic(
+        rollback_approval_purge_audit_path,
+        (serialize_timestamps(entry, ("created_at",)) for entry in entries),
+    )
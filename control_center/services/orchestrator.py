@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from collections import defaultdict
-from datetime import timedelta
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Awaitable, Callable
 
 from fastapi import HTTPException
@@ -24,6 +26,8 @@ from control_center.models.hierarchy import (
     TaskStatus,
     now_utc,
 )
+from control_center.services.orchestrator_metrics import CommandMetricsAggregator
+from control_center.services.orchestrator_workers import CommandWorkerPool
 from control_center.services.sqlite_state_store import SQLiteStateStore
 
 ActionExecutor = Callable[[Command, Task], Awaitable[ActionExecuteResponse]]
@@ -34,6 +38,9 @@ class InMemoryOrchestrator:
         self,
         action_executor: ActionExecutor | None = None,
         state_store: SQLiteStateStore | None = None,
+        *,
+        command_worker_count: int = 4,
+        logger: logging.Logger | None = None,
     ) -> None:
         self._projects: dict[str, Project] = {}
         self._tasks: dict[str, Task] = {}
@@ -44,6 +51,14 @@ class InMemoryOrchestrator:
         self._action_executor = action_executor
         self._state_store = state_store
         self._lock = asyncio.Lock()
+        self._task_locks: dict[str, asyncio.Lock] = {}
+        self._executing_command_ids: set[str] = set()
+        self._command_metrics = CommandMetricsAggregator()
+        self._command_workers = CommandWorkerPool(
+            self._execute_queued_command,
+            worker_count=command_worker_count,
+            logger=logger,
+        )
         self._load_state()
 
     def reset(self) -> None:
@@ -53,9 +68,40 @@ class InMemoryOrchestrator:
         self._project_tasks.clear()
         self._task_commands.clear()
         self._task_sequence.clear()
+        self._task_locks.clear()
+        self._executing_command_ids.clear()
+        self._command_metrics.clear()
+        self._command_workers.clear()
         if self._state_store is not None:
             self._state_store.clear()
 
+    @property
+    def command_worker_count(self) -> int:
+        return self._command_workers.worker_count
+
+    async def start_command_workers(self) -> None:
+        self._command_workers.start(self._pending_commands())
+
+    async def stop_command_workers(self, timeout_seconds: float = 30.0) -> None:
+        await self._command_workers.stop(timeout_seconds)
+
+    def _pending_commands(self) -> list[tuple[str, str]]:
+        pending = [
+            command
+            for command in self._commands.values()
+            if command.id not in self._executing_command_ids
+            and command.status in {CommandStatus.QUEUED, CommandStatus.RUNNING}
+        ]
+        pending.sort(key=lambda command: (command.created_at, command.sequence))
+        return [(command.id, command.task_id) for command in pending]
+
+    def _task_lock(self, task_id: str) -> asyncio.Lock:
+        lock = self._task_locks.get(task_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._task_locks[task_id] = lock
+        return lock
+
     def _load_state(self) -> None:
         if self._state_store is None:
             return
@@ -68,6 +114,7 @@ class InMemoryOrchestrator:
         self._tasks = {task.id: task for task in tasks}
         self._commands = {command.id: command for command in commands}
         self._rebuild_indexes()
+        self._command_metrics.rebuild(commands)
 
     def _rebuild_indexes(self) -> None:
         self._project_tasks = defaultdict(list)
@@ -85,6 +132,14 @@ class InMemoryOrchestrator:
             if command.sequence > self._task_sequence[command.task_id]:
                 self._task_sequence[command.task_id] = command.sequence
 
+    @contextmanager
+    def _unit_of_work_locked(self) -> Iterator[None]:
+        if self._state_store is None:
+            yield
+            return
+        with self._state_store.unit_of_work():
+            yield
+
     def _persist_project_locked(self, project: Project) -> None:
         if self._state_store is None:
             return
@@ -96,6 +151,7 @@ class InMemoryOrchestrator:
         self._state_store.upsert("task", task.id, task.model_dump(mode="json"))
 
     def _persist_command_locked(self, command: Command) -> None:
+        self._command_metrics.observe(command)
         if self._state_store is None:
             return
         self._state_store.upsert("command", command.id, command.model_dump(mode="json"))
@@ -152,85 +208,97 @@ class InMemoryOrchestrator:
         self._persist_task_locked(task)
         self._recompute_project_active_count_locked(task.project_id)
 
-    async def _advance_task_commands_locked(self, task_id: str) -> None:
-        for command_id in self._task_commands.get(task_id, []):
-            await self._advance_command_locked(command_id)
-
-    async def _advance_all_commands_locked(self) -> None:
-        for command_id in list(self._commands.keys()):
-            await self._advance_command_locked(command_id)
-
-    async def _advance_command_locked(self, command_id: str) -> None:
+    async def _execute_queued_command(self, command_id: str) -> None:
         command = self._commands.get(command_id)
         if command is None:
             return
-        if command.status in {
-            CommandStatus.SUCCESS,
-            CommandStatus.FAILED,
-            CommandStatus.CANCELED,
-            CommandStatus.WAITING_APPROVAL,
-        }:
-            return
-
-        if command.status == CommandStatus.QUEUED:
-            command.status = CommandStatus.RUNNING
-            command.started_at = now_utc()
-            command.updated_at = now_utc()
-            self._persist_command_locked(command)
-            self._refresh_task_and_project_state_locked(command.task_id)
-            return
-
-        if command.status != CommandStatus.RUNNING:
-            return
-
-        started_at = command.started_at or now_utc()
-        if now_utc() - started_at < timedelta(milliseconds=200):
-            return
-
         task = self._tasks.get(command.task_id)
         if task is None:
             return
 
-        await self._complete_command_execution_locked(command, task)
+        async with self._task_lock(task.id):
+            # RUNNING here means the previous worker died with its event loop.
+            if command.status not in {CommandStatus.QUEUED, CommandStatus.RUNNING}:
+                return
+            if command_id in self._executing_command_ids:
+                return
+            self._executing_command_ids.add(command_id)
+            with self._unit_of_work_locked():
+                command.status = CommandStatus.RUNNING
+                command.started_at = now_utc()
+                command.updated_at = now_utc()
+                self._persist_command_locked(command)
+                self._refresh_task_and_project_state_locked(task.id)
 
-        command.finished_at = now_utc()
-        command.updated_at = now_utc()
-        self._persist_command_locked(command)
-        self._refresh_task_and_project_state_locked(task.id)
+        try:
+            outcome = await self._execute_command_action(command, task)
+        except asyncio.CancelledError:
+            async with self._task_lock(task.id):
+                with self._unit_of_work_locked():
+                    command.status = CommandStatus.QUEUED
+                    command.started_at = None
+                    command.updated_at = now_utc()
+                    self._persist_command_locked(command)
+                    self._refresh_task_and_project_state_locked(task.id)
+            self._executing_command_ids.discard(command_id)
+            raise
 
-    async def _complete_command_execution_locked(self, command: Command, task: Task) -> None:
+        try:
+            async with self._task_lock(task.id):
+                with self._unit_of_work_locked():
+                    self._apply_command_outcome_locked(command, task, outcome)
+                    command.finished_at = now_utc()
+                    command.updated_at = now_utc()
+                    self._persist_command_locked(command)
+                    self._persist_task_locked(task)
+                    self._refresh_task_and_project_state_locked(task.id)
+        finally:
+            self._executing_command_ids.discard(command_id)
+
+    async def _execute_command_action(
+        self,
+        command: Command,
+        task: Task,
+    ) -> ActionExecuteResponse | Exception | None:
+        # Runs without the task lock; the caller applies the outcome under it.
         if self._action_executor is None:
-            self._apply_mock_execution_locked(command, task)
-            self._persist_command_locked(command)
-            return
-
+            return None
         try:
-            result = await self._action_executor(command, task)
+            return await self._action_executor(command, task)
         except Exception as exc:  # noqa: BLE001
+            return exc
+
+    def _apply_command_outcome_locked(
+        self,
+        command: Command,
+        task: Task,
+        outcome: ActionExecuteResponse | Exception | None,
+    ) -> None:
+        if outcome is None:
+            self._apply_mock_execution(command, task)
+            return
+        if isinstance(outcome, Exception):
             command.status = CommandStatus.FAILED
-            command.error_message = f"execution failed: {exc}"
+            command.error_message = f"execution failed: {outcome}"
             task.failed_count += 1
-            self._persist_command_locked(command)
             return
 
-        command.executor_agent = result.agent
-        command.trace_id = result.trace_id
+        command.executor_agent = outcome.agent
+        command.trace_id = outcome.trace_id
         command.output_summary = None
         command.error_message = None
 
-        if result.status == CommandStatus.SUCCESS.value:
+        if outcome.status == CommandStatus.SUCCESS.value:
             command.status = CommandStatus.SUCCESS
-            command.output_summary = result.summary
+            command.output_summary = outcome.summary
             task.success_count += 1
-            self._persist_command_locked(command)
             return
 
         command.status = CommandStatus.FAILED
-        command.error_message = result.summary
+        command.error_message = outcome.summary
         task.failed_count += 1
-        self._persist_command_locked(command)
 
-    def _apply_mock_execution_locked(self, command: Command, task: Task) -> None:
+    def _apply_mock_execution(self, command: Command, task: Task) -> None:
         lowered = command.text.lower()
         if "fail" in lowered or "error" in lowered:
             command.status = CommandStatus.FAILED
@@ -243,9 +311,7 @@ class InMemoryOrchestrator:
         task.success_count += 1
 
     async def list_projects(self) -> list[Project]:
-        async with self._lock:
-            await self._advance_all_commands_locked()
-            return list(self._projects.values())
+        return list(self._projects.values())
 
     async def create_task(self, project_id: str, payload: CreateTaskRequest) -> Task:
         async with self._lock:
@@ -264,33 +330,28 @@ class InMemoryOrchestrator:
             self._project_tasks[project_id].append(task.id)
 
             project.task_count += 1
-            self._persist_task_locked(task)
-            self._persist_project_locked(project)
-            self._refresh_task_and_project_state_locked(task.id)
+            with self._unit_of_work_locked():
+                self._persist_task_locked(task)
+                self._persist_project_locked(project)
+                self._refresh_task_and_project_state_locked(task.id)
             return task
 
     async def list_tasks(self, project_id: str) -> list[Task]:
-        async with self._lock:
-            if project_id not in self._projects:
-                raise HTTPException(status_code=404, detail="project not found")
-            for task_id in self._project_tasks[project_id]:
-                await self._advance_task_commands_locked(task_id)
-            return [self._tasks[task_id] for task_id in self._project_tasks[project_id]]
+        if project_id not in self._projects:
+            raise HTTPException(status_code=404, detail="project not found")
+        return [self._tasks[task_id] for task_id in self._project_tasks[project_id]]
 
     async def get_task(self, task_id: str) -> Task:
-        async with self._lock:
-            task = self._tasks.get(task_id)
-            if task is None:
-                raise HTTPException(status_code=404, detail="task not found")
-            await self._advance_task_commands_locked(task_id)
-            return task
+        task = self._tasks.get(task_id)
+        if task is None:
+            raise HTTPException(status_code=404, detail="task not found")
+        return task
 
     async def create_command(self, task_id: str, payload: CreateCommandRequest) -> Command:
-        async with self._lock:
-            task = self._tasks.get(task_id)
-            if task is None:
-                raise HTTPException(status_code=404, detail="task not found")
-
+        task = self._tasks.get(task_id)
+        if task is None:
+            raise HTTPException(status_code=404, detail="task not found")
+        async with self._task_lock(task_id):
             self._task_sequence[task_id] += 1
             command = Command(
                 project_id=task.project_id,
@@ -312,32 +373,31 @@ class InMemoryOrchestrator:
 
             task.command_count += 1
             task.last_command_id = command.id
-            self._persist_command_locked(command)
-            self._persist_task_locked(task)
-            self._refresh_task_and_project_state_locked(task_id)
+            with self._unit_of_work_locked():
+                self._persist_command_locked(command)
+                self._persist_task_locked(task)
+                self._refresh_task_and_project_state_locked(task_id)
 
+        if command.status == CommandStatus.QUEUED:
+            self._command_workers.submit(command.id, lane=task_id)
         return command
 
     async def list_commands(self, task_id: str) -> list[Command]:
-        async with self._lock:
-            if task_id not in self._tasks:
-                raise HTTPException(status_code=404, detail="task not found")
-            await self._advance_task_commands_locked(task_id)
-            return [self._commands[command_id] for command_id in self._task_commands[task_id]]
+        if task_id not in self._tasks:
+            raise HTTPException(status_code=404, detail="task not found")
+        return [self._commands[command_id] for command_id in self._task_commands[task_id]]
 
     async def get_command(self, command_id: str) -> Command:
-        async with self._lock:
-            command = self._commands.get(command_id)
-            if command is None:
-                raise HTTPException(status_code=404, detail="command not found")
-            await self._advance_command_locked(command_id)
-            return command
+        command = self._commands.get(command_id)
+        if command is None:
+            raise HTTPException(status_code=404, detail="command not found")
+        return command
 
     async def approve_command(self, command_id: str, approved_by: str) -> Command:
-        async with self._lock:
-            command = self._commands.get(command_id)
-            if command is None:
-                raise HTTPException(status_code=404, detail="command not found")
+        command = self._commands.get(command_id)
+        if command is None:
+            raise HTTPException(status_code=404, detail="command not found")
+        async with self._task_lock(command.task_id):
             if not command.requires_approval:
                 raise HTTPException(status_code=409, detail="command does not require approval")
             if command.status != CommandStatus.WAITING_APPROVAL:
@@ -346,149 +406,29 @@ class InMemoryOrchestrator:
             command.approved_by = approved_by
             command.status = CommandStatus.QUEUED
             command.updated_at = now_utc()
-            self._persist_command_locked(command)
-
-            self._refresh_task_and_project_state_locked(command.task_id)
+            with self._unit_of_work_locked():
+                self._persist_command_locked(command)
+                self._refresh_task_and_project_state_locked(command.task_id)
 
+        self._command_workers.submit(command.id, lane=command.task_id)
         return command
 
     async def get_project_detail(self, project_id: str) -> ProjectDetail:
-        async with self._lock:
-            project = self._projects.get(project_id)
-            if project is None:
-                raise HTTPException(status_code=404, detail="project not found")
-            for task_id in self._project_tasks[project_id]:
-                await self._advance_task_commands_locked(task_id)
+        project = self._projects.get(project_id)
+        if project is None:
+            raise HTTPException(status_code=404, detail="project not found")
 
-            task_details: list[TaskDetail] = []
-            for task_id in self._project_tasks[project_id]:
-                task = self._tasks[task_id]
-                commands = [self._commands[cid] for cid in self._task_commands[task_id]]
-                task_details.append(TaskDetail(**task.model_dump(), commands=commands))
+        task_details: list[TaskDetail] = []
+        for task_id in self._project_tasks[project_id]:
+            task = self._tasks[task_id]
+            commands = [self._commands[cid] for cid in self._task_commands[task_id]]
+            task_details.append(TaskDetail(**task.model_dump(), commands=commands))
 
-            return ProjectDetail(**project.model_dump(), tasks=task_details)
+        return ProjectDetail(**project.model_dump(), tasks=task_details)
 
     async def get_metrics_summary(self) -> MetricsSummaryResponse:
-        async with self._lock:
-            await self._advance_all_commands_locked()
-            commands = list(self._commands.values())
-            now = now_utc()
-            total_commands = len(commands)
-            in_flight_command_count = sum(
-                1
-                for command in commands
-                if command.status in {CommandStatus.QUEUED, CommandStatus.RUNNING}
-            )
-            waiting_approval_count = sum(
-                1
-                for command in commands
-                if command.status == CommandStatus.WAITING_APPROVAL
-            )
-            success_count = sum(
-                1 for command in commands if command.status == CommandStatus.SUCCESS
-            )
-            failed_count = sum(
-                1 for command in commands if command.status == CommandStatus.FAILED
-            )
-            resolved_count = success_count + failed_count
-            success_rate = (
-                round(success_count / resolved_count, 4) if resolved_count > 0 else 0.0
-            )
-
-            durations_ms: list[float] = []
-            for command in commands:
-                if (
-                    command.status in {CommandStatus.SUCCESS, CommandStatus.FAILED}
-                    and command.started_at is not None
-                    and command.finished_at is not None
-                ):
-                    durations_ms.append(
-                        (command.finished_at - command.started_at).total_seconds() * 1000
-                    )
-            average_duration_ms = (
-                round(sum(durations_ms) / len(durations_ms), 2) if durations_ms else 0.0
-            )
-
-            executor_agent_counts: dict[str, int] = {}
-            routing_reason_counts: dict[str, int] = {}
-            routing_keyword_counts: dict[str, int] = {}
-            routing_rule_counts: dict[str, int] = {}
-            for command in commands:
-                agent = command.executor_agent
-                if agent:
-                    executor_agent_counts[agent] = executor_agent_counts.get(agent, 0) + 1
-                reason = command.metadata.get("routing_reason")
-                if isinstance(reason, str) and reason:
-                    routing_reason_counts[reason] = routing_reason_counts.get(reason, 0) + 1
-                keyword = command.metadata.get("routing_keyword")
-                if isinstance(keyword, str) and keyword:
-                    routing_keyword_counts[keyword] = (
-                        routing_keyword_counts.get(keyword, 0) + 1
-                    )
-                rule_id = command.metadata.get("routing_rule_id")
-                if isinstance(rule_id, str) and rule_id:
-                    routing_rule_counts[rule_id] = routing_rule_counts.get(rule_id, 0) + 1
-
-            recent_windows = []
-            for minutes in (5, 15, 60):
-                window_start = now - timedelta(minutes=minutes)
-                window_commands = [
-                    command for command in commands if command.created_at >= window_start
-                ]
-                window_success = [
-                    command
-                    for command in commands
-                    if command.status == CommandStatus.SUCCESS
-                    and command.finished_at is not None
-                    and command.finished_at >= window_start
-                ]
-                window_failed = [
-                    command
-                    for command in commands
-                    if command.status == CommandStatus.FAILED
-                    and command.finished_at is not None
-                    and command.finished_at >= window_start
-                ]
-                completed_count = len(window_success) + len(window_failed)
-                window_success_rate = (
-                    round(len(window_success) / completed_count, 4)
-                    if completed_count > 0
-                    else 0.0
-                )
-                window_durations = [
-                    (command.finished_at - command.started_at).total_seconds() * 1000
-                    for command in [*window_success, *window_failed]
-                    if command.started_at is not None and command.finished_at is not None
-                ]
-                window_avg_duration = (
-                    round(sum(window_durations) / len(window_durations), 2)
-                    if window_durations
-                    else 0.0
-                )
-                recent_windows.append(
-                    {
-                        "window_minutes": minutes,
-                        "total_commands": len(window_commands),
-                        "success_count": len(window_success),
-                        "failed_count": len(window_failed),
-                        "success_rate": window_success_rate,
-                        "average_duration_ms": window_avg_duration,
-                    }
-                )
-
-            return MetricsSummaryResponse(
-                total_projects=len(self._projects),
-                total_tasks=len(self._tasks),
-                total_commands=total_commands,
-                in_flight_command_count=in_flight_command_count,
-                waiting_approval_count=waiting_approval_count,
-                success_count=success_count,
-                failed_count=failed_count,
-                success_rate=success_rate,
-                average_duration_ms=average_duration_ms,
-                executor_agent_counts=executor_agent_counts,
-                routing_reason_counts=routing_reason_counts,
-                routing_keyword_counts=routing_keyword_counts,
-                routing_rule_counts=routing_rule_counts,
-                recent_windows=recent_windows,
-            )
+        return MetricsSummaryResponse(
+            total_projects=len(self._projects),
+            total_tasks=len(self._tasks),
+            **self._command_metrics.snapshot(now_utc()),
+        )
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+from control_center.models.hierarchy import Command, CommandStatus
+
+BUCKET_SECONDS = 10
+WINDOW_MINUTES = (5, 15, 60)
+RESOLVED_STATUSES = frozenset({CommandStatus.SUCCESS, CommandStatus.FAILED})
+IN_FLIGHT_STATUSES = frozenset({CommandStatus.QUEUED, CommandStatus.RUNNING})
+
+
+def bucket_index(moment: datetime) -> int:
+    return int(moment.timestamp() // BUCKET_SECONDS)
+
+
+def _duration_ms(command: Command) -> float | None:
+    if command.started_at is None or command.finished_at is None:
+        return None
+    return (command.finished_at - command.started_at).total_seconds() * 1000
+
+
+@dataclass(frozen=True, slots=True)
+class _Contribution:
+    status: CommandStatus
+    created_at: datetime
+    finished_at: datetime | None
+    duration_ms: float | None
+    executor_agent: str | None
+    routing_reason: str | None
+    routing_keyword: str | None
+    routing_rule_id: str | None
+
+    @property
+    def resolved(self) -> bool:
+        return self.status in RESOLVED_STATUSES
+
+    @classmethod
+    def of(cls, command: Command) -> _Contribution:
+        resolved = command.status in RESOLVED_STATUSES
+        return cls(
+            status=command.status,
+            created_at=command.created_at,
+            finished_at=command.finished_at if resolved else None,
+            duration_ms=_duration_ms(command) if resolved else None,
+            executor_agent=command.executor_agent or None,
+            routing_reason=_metadata_label(command, "routing_reason"),
+            routing_keyword=_metadata_label(command, "routing_keyword"),
+            routing_rule_id=_metadata_label(command, "routing_rule_id"),
+        )
+
+
+def _metadata_label(command: Command, key: str) -> str | None:
+    value = command.metadata.get(key)
+    return value if isinstance(value, str) and value else None
+
+
+@dataclass(slots=True)
+class _Bucket:
+    index: int
+    created: dict[str, datetime] = field(default_factory=dict)
+    finished: dict[str, _Contribution] = field(default_factory=dict)
+    success_count: int = 0
+    failed_count: int = 0
+    duration_total_ms: float = 0.0
+    duration_count: int = 0
+
+    def add_finished(self, command_id: str, contribution: _Contribution) -> None:
+        self.finished[command_id] = contribution
+        self._apply(contribution, 1)
+
+    def remove_finished(self, command_id: str) -> None:
+        contribution = self.finished.pop(command_id, None)
+        if contribution is not None:
+            self._apply(contribution, -1)
+
+    def _apply(self, contribution: _Contribution, sign: int) -> None:
+        if contribution.status == CommandStatus.SUCCESS:
+            self.success_count += sign
+        else:
+            self.failed_count += sign
+        if contribution.duration_ms is not None:
+            self.duration_total_ms += sign * contribution.duration_ms
+            self.duration_count += sign
+
+
+@dataclass(slots=True)
+class _WindowTotals:
+    total_commands: int = 0
+    success_count: int = 0
+    failed_count: int = 0
+    duration_total_ms: float = 0.0
+    duration_count: int = 0
+
+
+class _BucketRing:
+    def __init__(self, span_seconds: int) -> None:
+        self._size = span_seconds // BUCKET_SECONDS + 2
+        self._slots: list[_Bucket | None] = [None] * self._size
+        self._newest = -1
+
+    def clear(self) -> None:
+        self._slots = [None] * self._size
+        self._newest = -1
+
+    def get(self, index: int) -> _Bucket | None:
+        bucket = self._slots[index % self._size]
+        if bucket is None or bucket.index != index:
+            return None
+        return bucket
+
+    def acquire(self, index: int) -> _Bucket | None:
+        if index <= self._newest - self._size:
+            return None
+        slot = index % self._size
+        bucket = self._slots[slot]
+        if bucket is None or bucket.index != index:
+            bucket = _Bucket(index=index)
+            self._slots[slot] = bucket
+        self._newest = max(self._newest, index)
+        return bucket
+
+    def window(self, since: datetime, now: datetime) -> _WindowTotals:
+        totals = _WindowTotals()
+        first = bucket_index(since)
+        last = max(bucket_index(now), self._newest)
+        for index in range(max(first, last - self._size + 1), last + 1):
+            bucket = self.get(index)
+            if bucket is None:
+                continue
+            if index > first:
+                totals.total_commands += len(bucket.created)
+                totals.success_count += bucket.success_count
+                totals.failed_count += bucket.failed_count
+                totals.duration_total_ms += bucket.duration_total_ms
+                totals.duration_count += bucket.duration_count
+                continue
+            # The oldest bucket straddles the window start; count it exactly.
+            totals.total_commands += sum(
+                1 for created_at in bucket.created.values() if created_at >= since
+            )
+            for contribution in bucket.finished.values():
+                assert contribution.finished_at is not None
+                if contribution.finished_at < since:
+                    continue
+                if contribution.status == CommandStatus.SUCCESS:
+                    totals.success_count += 1
+                else:
+                    totals.failed_count += 1
+                if contribution.duration_ms is not None:
+                    totals.duration_total_ms += contribution.duration_ms
+                    totals.duration_count += 1
+        return totals
+
+
+class CommandMetricsAggregator:
+    def __init__(self, window_minutes: Iterable[int] = WINDOW_MINUTES) -> None:
+        self._window_minutes = tuple(window_minutes)
+        self._contributions: dict[str, _Contribution] = {}
+        self._status_counts: Counter[CommandStatus] = Counter()
+        self._duration_total_ms = 0.0
+        self._duration_count = 0
+        self._executor_agent_counts: Counter[str] = Counter()
+        self._routing_reason_counts: Counter[str] = Counter()
+        self._routing_keyword_counts: Counter[str] = Counter()
+        self._routing_rule_counts: Counter[str] = Counter()
+        self._ring = _BucketRing(max(self._window_minutes, default=0) * 60)
+
+    def clear(self) -> None:
+        self._contributions.clear()
+        self._status_counts.clear()
+        self._duration_total_ms = 0.0
+        self._duration_count = 0
+        self._executor_agent_counts.clear()
+        self._routing_reason_counts.clear()
+        self._routing_keyword_counts.clear()
+        self._routing_rule_counts.clear()
+        self._ring.clear()
+
+    def rebuild(self, commands: Iterable[Command]) -> None:
+        self.clear()
+        for command in sorted(commands, key=lambda item: item.created_at):
+            self.observe(command)
+
+    def observe(self, command: Command) -> None:
+        contribution = _Contribution.of(command)
+        previous = self._contributions.get(command.id)
+        if previous == contribution:
+            return
+        if previous is not None:
+            self._apply(command.id, previous, -1)
+        self._contributions[command.id] = contribution
+        self._apply(command.id, contribution, 1)
+
+    def snapshot(self, now: datetime) -> dict[str, Any]:
+        success_count = self._status_counts[CommandStatus.SUCCESS]
+        failed_count = self._status_counts[CommandStatus.FAILED]
+        return {
+            "total_commands": len(self._contributions),
+            "in_flight_command_count": sum(
+                self._status_counts[status] for status in IN_FLIGHT_STATUSES
+            ),
+            "waiting_approval_count": self._status_counts[CommandStatus.WAITING_APPROVAL],
+            "success_count": success_count,
+            "failed_count": failed_count,
+            "success_rate": _rate(success_count, success_count + failed_count),
+            "average_duration_ms": _average(self._duration_total_ms, self._duration_count),
+            "executor_agent_counts": dict(self._executor_agent_counts),
+            "routing_reason_counts": dict(self._routing_reason_counts),
+            "routing_keyword_counts": dict(self._routing_keyword_counts),
+            "routing_rule_counts": dict(self._routing_rule_counts),
+            "recent_windows": [
+                self._window_summary(minutes, now) for minutes in self._window_minutes
+            ],
+        }
+
+    def _window_summary(self, minutes: int, now: datetime) -> dict[str, Any]:
+        totals = self._ring.window(now - timedelta(minutes=minutes), now)
+        return {
+            "window_minutes": minutes,
+            "total_commands": totals.total_commands,
+            "success_count": totals.success_count,
+            "failed_count": totals.failed_count,
+            "success_rate": _rate(
+                totals.success_count,
+                totals.success_count + totals.failed_count,
+            ),
+            "average_duration_ms": _average(
+                totals.duration_total_ms,
+                totals.duration_count,
+            ),
+        }
+
+    def _apply(self, command_id: str, contribution: _Contribution, sign: int) -> None:
+        self._status_counts[contribution.status] += sign
+        if contribution.duration_ms is not None:
+            self._duration_total_ms += sign * contribution.duration_ms
+            self._duration_count += sign
+        for counter, label in (
+            (self._executor_agent_counts, contribution.executor_agent),
+            (self._routing_reason_counts, contribution.routing_reason),
+            (self._routing_keyword_counts, contribution.routing_keyword),
+            (self._routing_rule_counts, contribution.routing_rule_id),
+        ):
+            if label is None:
+                continue
+            counter[label] += sign
+            if counter[label] <= 0:
+                del counter[label]
+
+        if sign > 0:
+            created_bucket = self._ring.acquire(bucket_index(contribution.created_at))
+            if created_bucket is not None:
+                created_bucket.created[command_id] = contribution.created_at
+            if contribution.finished_at is not None:
+                finished_bucket = self._ring.acquire(bucket_index(contribution.finished_at))
+                if finished_bucket is not None:
+                    finished_bucket.add_finished(command_id, contribution)
+            return
+
+        created_bucket = self._ring.get(bucket_index(contribution.created_at))
+        if created_bucket is not None:
+            created_bucket.created.pop(command_id, None)
+        if contribution.finished_at is not None:
+            finished_bucket = self._ring.get(bucket_index(contribution.finished_at))
+            if finished_bucket is not None:
+                finished_bucket.remove_finished(command_id)
+
+
+def _rate(numerator: int, denominator: int) -> float:
+    return round(numerator / denominator, 4) if denominator > 0 else 0.0
+
+
+def _average(total: float, count: int) -> float:
+    return round(total / count, 2) if count > 0 else 0.0
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+
+
+class CommandWorkerPool:
+    def __init__(
+        self,
+        handler: Callable[[str], Awaitable[None]],
+        *,
+        worker_count: int = 4,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self._handler = handler
+        self._worker_count = max(1, int(worker_count))
+        self._logger = logger or logging.getLogger("wherecode.control_center.command_workers")
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # The queue carries lane keys; each lane runs its items one at a time
+        # in submission order, and different lanes run in parallel.
+        self._queue: asyncio.Queue[str | None] | None = None
+        self._lanes: dict[str, deque[str]] = {}
+        self._workers: list[asyncio.Task[None]] = []
+        self._queued: set[str] = set()
+        self._closing = False
+
+    @property
+    def worker_count(self) -> int:
+        return self._worker_count
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queued)
+
+    def bound_to_running_loop(self) -> bool:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return (
+            self._loop is loop
+            and not self._closing
+            and any(not task.done() for task in self._workers)
+        )
+
+    def start(self, pending: Iterable[tuple[str, str]] = ()) -> None:
+        if self.bound_to_running_loop():
+            return
+        # A pool bound to a finished loop (request-scoped test clients, or a
+        # restarted app) is abandoned; its unfinished work is re-submitted.
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._lanes = {}
+        self._queued = set()
+        self._closing = False
+        self._workers = [
+            asyncio.create_task(self._worker(self._queue), name=f"command-worker-{index}")
+            for index in range(self._worker_count)
+        ]
+        for item_id, lane in pending:
+            self.submit(item_id, lane=lane)
+
+    async def stop(self, timeout_seconds: float = 30.0) -> None:
+        if not self._workers or self._queue is None:
+            return
+        self._closing = True
+        for _ in self._workers:
+            self._queue.put_nowait(None)
+        _, pending = await asyncio.wait(self._workers, timeout=max(0.0, timeout_seconds))
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._loop = None
+        self._lanes = {}
+        self._queued.clear()
+
+    def submit(self, item_id: str, *, lane: str | None = None) -> bool:
+        if self._queue is None or self._closing or item_id in self._queued:
+            return False
+        lane_key = lane or item_id
+        self._queued.add(item_id)
+        items = self._lanes.get(lane_key)
+        if items is not None:
+            # The lane is already scheduled or running; it picks this up next.
+            items.append(item_id)
+            return True
+        self._lanes[lane_key] = deque([item_id])
+        self._queue.put_nowait(lane_key)
+        return True
+
+    def clear(self) -> None:
+        self._queued.clear()
+        self._lanes = {}
+        if self._queue is None:
+            return
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
+
+    async def _worker(self, queue: asyncio.Queue[str | None]) -> None:
+        while True:
+            lane = await queue.get()
+            try:
+                if lane is None or self._closing:
+                    return
+                items = self._lanes.get(lane)
+                if not items:
+                    continue
+                # The running item stays at the head so later submits queue
+                # behind it instead of scheduling the lane a second time.
+                item_id = items[0]
+                self._queued.discard(item_id)
+                try:
+                    await self._handler(item_id)
+                except Exception:
+                    self._logger.exception("command worker failed: %s", item_id)
+                finally:
+                    self._advance_lane(queue, lane, items)
+            finally:
+                queue.task_done()
+
+    def _advance_lane(
+        self,
+        queue: asyncio.Queue[str | None],
+        lane: str,
+        items: deque[str],
+    ) -> None:
+        if self._lanes.get(lane) is not items:
+            return
+        items.popleft()
+        if items and not self._closing:
+            queue.put_nowait(lane)
+        else:
+            del self._lanes[lane]
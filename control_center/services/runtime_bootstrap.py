@@ -34,6 +34,7 @@ from control_center.services.workflow_decompose_preview_support import (
 from control_center.services.workflow_decompose_runtime import WorkflowDecomposeRuntimeService
 from control_center.services.workflow_decompose_support import WorkflowDecomposeSupportService
 from control_center.services.workflow_engine import WorkflowEngine
+from control_center.services.workflow_engine_concurrency import WorkitemConcurrencyLimits
 from control_center.services.workflow_execution_runtime import WorkflowExecutionRuntimeService
 from control_center.services.workflow_orchestration_runtime import (
     WorkflowOrchestrationRuntimeService,
@@ -41,6 +42,8 @@ from control_center.services.workflow_orchestration_runtime import (
 from control_center.services.workflow_orchestration_support import (
     WorkflowOrchestrationSupportService,
 )
+from control_center.services.workflow_run_archive import WorkflowRunArchive
+from control_center.services.workflow_run_executor import WorkflowRunExecutor
 from control_center.services.workflow_scheduler import WorkflowScheduler
 
 
@@ -50,6 +53,7 @@ class ControlCenterRuntimeBundle:
     store: InMemoryOrchestrator
     workflow_scheduler: WorkflowScheduler
     workflow_engine: WorkflowEngine
+    workflow_run_executor: WorkflowRunExecutor
     command_dispatch_service: CommandDispatchService
     workflow_api_handlers_service: WorkflowAPIHandlersService
     command_orchestration_policy_service: CommandOrchestrationPolicyService
@@ -86,14 +90,20 @@ def build_control_center_runtime(
     dev_routing_matrix_service = DevRoutingMatrixService(
         bootstrap_config.dev_routing_matrix_file,
         logger=logger,
+        recheck_seconds=bootstrap_config.config_recheck_seconds,
     )
     agent_rules_registry_service = AgentRulesRegistryService(
         bootstrap_config.agent_rules_registry_file,
         logger=logger,
+        recheck_seconds=bootstrap_config.config_recheck_seconds,
     )
 
     state_store = (
-        SQLiteStateStore(bootstrap_config.sqlite_path)
+        SQLiteStateStore(
+            bootstrap_config.sqlite_path,
+            journal_mode=bootstrap_config.sqlite_journal_mode,
+            synchronous=bootstrap_config.sqlite_synchronous,
+        )
         if bootstrap_config.state_backend == "sqlite"
         else None
     )
@@ -113,8 +123,20 @@ def build_control_center_runtime(
     store = InMemoryOrchestrator(
         action_executor=command_dispatch_service.execute_command,
         state_store=state_store,
+        command_worker_count=bootstrap_config.command_worker_count,
+        logger=logger,
+    )
+    run_archive = (
+        WorkflowRunArchive(bootstrap_config.workflow_archive_path)
+        if state_store is not None
+        else None
+    )
+    workflow_scheduler = WorkflowScheduler(
+        state_store=state_store,
+        hydration_mode=bootstrap_config.workflow_hydration_mode,
+        terminal_run_cache_size=bootstrap_config.workflow_terminal_run_cache_size,
+        run_archive=run_archive,
     )
-    workflow_scheduler = WorkflowScheduler(state_store=state_store)
     workflow_agent_registry = AgentRegistry(
         mapping=agent_rules_registry_service.executor_mapping(
             scopes=("subproject", "main"),
@@ -122,6 +144,7 @@ def build_control_center_runtime(
     )
     executor_service = ExecutorService(
         role_routing_policy_file=bootstrap_config.role_routing_policy_file,
+        role_routing_recheck_seconds=bootstrap_config.config_recheck_seconds,
         action_executor=action_layer_execute_handler,
         default_timeout_seconds=int(bootstrap_config.action_layer_timeout_seconds),
     )
@@ -132,6 +155,12 @@ def build_control_center_runtime(
         agent_registry=workflow_agent_registry,
         max_module_reflows=bootstrap_config.max_module_reflows,
         release_requires_approval=bootstrap_config.release_approval_required,
+        concurrency_limits=WorkitemConcurrencyLimits(
+            per_run=bootstrap_config.workflow_max_parallel_workitems,
+            global_limit=bootstrap_config.workflow_global_max_parallel_workitems,
+            per_role=bootstrap_config.workflow_role_parallel_limits,
+            per_module=bootstrap_config.workflow_module_parallel_limit,
+        ),
     )
     resolved_workflow_scheduler_provider = (
         workflow_scheduler_provider
@@ -179,6 +208,15 @@ def build_control_center_runtime(
         get_pending_confirmation_status=(
             workflow_decompose_preview_support_service.get_pending_confirmation_status
         ),
+        workflow_run_executor_provider=lambda: workflow_run_executor,
+    )
+    workflow_run_executor = WorkflowRunExecutor(
+        workflow_scheduler_provider=resolved_workflow_scheduler_provider,
+        workflow_engine_provider=resolved_workflow_engine_provider,
+        after_drive_handler=workflow_execution_runtime_service.finalize_execution,
+        worker_count=bootstrap_config.workflow_run_executor_workers,
+        drain_timeout_seconds=bootstrap_config.workflow_run_executor_drain_seconds,
+        logger=logger,
     )
     workflow_decompose_support_service = WorkflowDecomposeSupportService(
         select_decomposition_for_preview_handler=(
@@ -383,6 +421,7 @@ def build_control_center_runtime(
         store=store,
         workflow_scheduler=workflow_scheduler,
         workflow_engine=workflow_engine,
+        workflow_run_executor=workflow_run_executor,
         command_dispatch_service=command_dispatch_service,
         workflow_api_handlers_service=workflow_api_handlers_service,
         command_orchestration_policy_service=command_orchestration_policy_service,
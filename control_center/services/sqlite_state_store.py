@@ -2,20 +2,112 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from enum import Enum
 from pathlib import Path
 
+from control_center.services.sqlite_state_store_schema import (
+    INDEXED_ENTITY_TABLES,
+    build_indexed_row,
+    build_indexed_upsert_sql,
+    migrate_schema,
+    normalize_timestamp,
+)
+
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+
+
+def normalize_synchronous_mode(value: str) -> str:
+    normalized = value.strip().upper()
+    if normalized not in SYNCHRONOUS_MODES:
+        raise ValueError(
+            f"unsupported sqlite synchronous mode: {value} "
+            f"(expected one of {', '.join(SYNCHRONOUS_MODES)})"
+        )
+    return normalized
+
+
+def normalize_journal_mode(value: str) -> str:
+    normalized = value.strip().upper()
+    if normalized not in JOURNAL_MODES:
+        raise ValueError(
+            f"unsupported sqlite journal mode: {value} "
+            f"(expected one of {', '.join(JOURNAL_MODES)})"
+        )
+    return normalized
+
+
+def _column_value(value: object) -> str:
+    if isinstance(value, Enum):
+        return str(value.value)
+    return str(value)
+
 
 class SQLiteStateStore:
-    def __init__(self, db_path: str) -> None:
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+        busy_timeout_ms: int = 5000,
+    ) -> None:
         self._db_path = Path(db_path)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._journal_mode = normalize_journal_mode(journal_mode)
+        self._synchronous = normalize_synchronous_mode(synchronous)
+        self._busy_timeout_ms = max(0, int(busy_timeout_ms))
+        self._lock = threading.RLock()
+        self._transaction_depth = 0
+        self._conn: sqlite3.Connection | None = None
+        self._conn = self._connect()
+        self._schema_version = 0
+        self._indexed_upsert_sql = {
+            entity_type: build_indexed_upsert_sql(spec)
+            for entity_type, spec in INDEXED_ENTITY_TABLES.items()
+        }
         self._init_db()
 
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    @property
+    def journal_mode(self) -> str:
+        return self._journal_mode
+
+    @property
+    def synchronous(self) -> str:
+        return self._synchronous
+
+    @property
+    def schema_version(self) -> int:
+        return self._schema_version
+
     def _connect(self) -> sqlite3.Connection:
-        return sqlite3.connect(self._db_path)
+        conn = sqlite3.connect(
+            self._db_path,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        conn.execute(f"PRAGMA busy_timeout = {self._busy_timeout_ms}")
+        row = conn.execute(f"PRAGMA journal_mode = {self._journal_mode}").fetchone()
+        if row is not None and isinstance(row[0], str):
+            self._journal_mode = row[0].upper()
+        conn.execute(f"PRAGMA synchronous = {self._synchronous}")
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            raise RuntimeError(f"sqlite state store is closed: {self._db_path}")
+        return self._conn
 
     def _init_db(self) -> None:
-        with self._connect() as conn:
+        with self.unit_of_work():
+            conn = self._connection()
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS entities (
@@ -26,30 +118,251 @@ class SQLiteStateStore:
                 )
                 """
             )
-            conn.commit()
+            self._schema_version = migrate_schema(conn)
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[SQLiteStateStore]:
+        with self._lock:
+            conn = self._connection()
+            outermost = self._transaction_depth == 0
+            if outermost:
+                conn.execute("BEGIN IMMEDIATE")
+            self._transaction_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._transaction_depth -= 1
+                if outermost:
+                    conn.execute("ROLLBACK")
+                raise
+            self._transaction_depth -= 1
+            if outermost:
+                try:
+                    conn.execute("COMMIT")
+                except sqlite3.Error:
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
+                    raise
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._transaction_depth > 0
 
     def upsert(self, entity_type: str, entity_id: str, payload: dict[str, object]) -> None:
-        with self._connect() as conn:
-            conn.execute(
-                """
+        self.upsert_many(entity_type, [(entity_id, payload)])
+
+    def upsert_many(
+        self,
+        entity_type: str,
+        rows: Iterable[tuple[str, dict[str, object]]],
+    ) -> int:
+        spec = INDEXED_ENTITY_TABLES.get(entity_type)
+        if spec is None:
+            sql = """
                 INSERT INTO entities (entity_type, entity_id, payload)
                 VALUES (?, ?, ?)
                 ON CONFLICT(entity_type, entity_id)
                 DO UPDATE SET payload=excluded.payload
-                """,
-                (entity_type, entity_id, json.dumps(payload, ensure_ascii=False)),
-            )
-            conn.commit()
+                """
+            params = [
+                (entity_type, entity_id, json.dumps(payload, ensure_ascii=False))
+                for entity_id, payload in rows
+            ]
+        else:
+            sql = self._indexed_upsert_sql[entity_type]
+            params = [
+                build_indexed_row(spec, entity_id, payload) for entity_id, payload in rows
+            ]
+        if not params:
+            return 0
+        with self.unit_of_work():
+            self._connection().executemany(sql, params)
+        return len(params)
 
     def list(self, entity_type: str) -> list[dict[str, object]]:
-        with self._connect() as conn:
-            rows = conn.execute(
+        spec = INDEXED_ENTITY_TABLES.get(entity_type)
+        if spec is not None:
+            return self.query(entity_type)
+        with self._lock:
+            rows = self._connection().execute(
                 "SELECT payload FROM entities WHERE entity_type = ?",
                 (entity_type,),
             ).fetchall()
         return [json.loads(row[0]) for row in rows]
 
+    def get(self, entity_type: str, entity_id: str) -> dict[str, object] | None:
+        spec = INDEXED_ENTITY_TABLES.get(entity_type)
+        if spec is None:
+            sql = "SELECT payload FROM entities WHERE entity_type = ? AND entity_id = ?"
+            params: tuple[object, ...] = (entity_type, entity_id)
+        else:
+            sql = f"SELECT payload FROM {spec.table} WHERE entity_id = ?"
+            params = (entity_id,)
+        with self._lock:
+            row = self._connection().execute(sql, params).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def _build_filter_clause(
+        self,
+        entity_type: str,
+        filters: dict[str, object],
+        *,
+        updated_before: object | None = None,
+    ) -> tuple[str, str, list[object]]:
+        spec = INDEXED_ENTITY_TABLES.get(entity_type)
+        if spec is None:
+            raise ValueError(f"entity type is not indexed: {entity_type}")
+        clauses: list[str] = []
+        params: list[object] = []
+        if updated_before is not None:
+            clauses.append("updated_at < ?")
+            params.append(normalize_timestamp(updated_before))
+        for column, value in filters.items():
+            if column not in spec.columns:
+                raise ValueError(f"unknown indexed column for {entity_type}: {column}")
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set, frozenset)):
+                values = [_column_value(item) for item in value]
+                if not values:
+                    clauses.append("0")
+                    continue
+                clauses.append(f"{column} IN ({', '.join('?' for _ in values)})")
+                params.extend(values)
+                continue
+            clauses.append(f"{column} = ?")
+            params.append(_column_value(value))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return spec.table, where, params
+
+    def query(
+        self,
+        entity_type: str,
+        *,
+        updated_before: object | None = None,
+        limit: int | None = None,
+        **filters: object,
+    ) -> list[dict[str, object]]:
+        table, where, params = self._build_filter_clause(
+            entity_type,
+            filters,
+            updated_before=updated_before,
+        )
+        sql = f"SELECT payload FROM {table}{where} ORDER BY created_at, rowid"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(max(0, int(limit)))
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def query_ids(
+        self,
+        entity_type: str,
+        *,
+        updated_before: object | None = None,
+        limit: int | None = None,
+        **filters: object,
+    ) -> list[str]:
+        table, where, params = self._build_filter_clause(
+            entity_type,
+            filters,
+            updated_before=updated_before,
+        )
+        sql = f"SELECT entity_id FROM {table}{where} ORDER BY created_at, rowid"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(max(0, int(limit)))
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        return [row[0] for row in rows]
+
+    def count(self, entity_type: str, **filters: object) -> int:
+        table, where, params = self._build_filter_clause(entity_type, filters)
+        with self._lock:
+            row = self._connection().execute(
+                f"SELECT COUNT(*) FROM {table}{where}",
+                params,
+            ).fetchone()
+        return int(row[0])
+
+    def group_counts(self, entity_type: str, field: str) -> dict[str, int]:
+        spec = INDEXED_ENTITY_TABLES.get(entity_type)
+        if spec is None:
+            raise ValueError(f"entity type is not indexed: {entity_type}")
+        params: list[object] = []
+        if field in spec.columns:
+            expression = field
+        elif field.isidentifier():
+            expression = "json_extract(payload, ?)"
+            params.append(f"$.{field}")
+        else:
+            raise ValueError(f"invalid group field for {entity_type}: {field}")
+        with self._lock:
+            rows = self._connection().execute(
+                f"SELECT {expression} AS bucket, COUNT(*) FROM {spec.table} "
+                "GROUP BY bucket",
+                params,
+            ).fetchall()
+        return {str(bucket): int(total) for bucket, total in rows if bucket is not None}
+
+    def delete(self, entity_type: str, entity_ids: Iterable[str]) -> int:
+        spec = INDEXED_ENTITY_TABLES.get(entity_type)
+        if spec is None:
+            sql = "DELETE FROM entities WHERE entity_type = ? AND entity_id = ?"
+            params = [(entity_type, entity_id) for entity_id in entity_ids]
+        else:
+            sql = f"DELETE FROM {spec.table} WHERE entity_id = ?"
+            params = [(entity_id,) for entity_id in entity_ids]
+        if not params:
+            return 0
+        with self.unit_of_work():
+            conn = self._connection()
+            before = conn.total_changes
+            conn.executemany(sql, params)
+            return conn.total_changes - before
+
+    def delete_where(
+        self,
+        entity_type: str,
+        *,
+        updated_before: object | None = None,
+        **filters: object,
+    ) -> int:
+        table, where, params = self._build_filter_clause(
+            entity_type,
+            filters,
+            updated_before=updated_before,
+        )
+        if not where:
+            raise ValueError("delete_where requires at least one filter")
+        with self.unit_of_work():
+            cursor = self._connection().execute(f"DELETE FROM {table}{where}", params)
+            return int(cursor.rowcount)
+
+    def vacuum(self) -> None:
+        with self._lock:
+            if self._transaction_depth > 0:
+                raise RuntimeError("cannot vacuum sqlite state store inside unit_of_work")
+            conn = self._connection()
+            if self._journal_mode == "WAL":
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            conn.execute("VACUUM")
+            if self._journal_mode == "WAL":
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
     def clear(self) -> None:
-        with self._connect() as conn:
+        with self.unit_of_work():
+            conn = self._connection()
             conn.execute("DELETE FROM entities")
-            conn.commit()
+            for spec in INDEXED_ENTITY_TABLES.values():
+                conn.execute(f"DELETE FROM {spec.table}")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            if self._transaction_depth > 0:
+                raise RuntimeError("cannot close sqlite state store inside unit_of_work")
+            self._conn.close()
+            self._conn = None
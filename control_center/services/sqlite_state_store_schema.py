@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+SCHEMA_VERSION = 3
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedEntityTable:
+    entity_type: str
+    table: str
+    columns: tuple[str, ...]
+    indexes: tuple[tuple[str, ...], ...]
+    extract: Callable[[dict[str, object]], dict[str, object | None]]
+    resolve_run_via_workitem: bool = False
+
+
+def normalize_timestamp(value: object) -> str | None:
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str) and value.strip():
+        try:
+            parsed = datetime.fromisoformat(value.strip())
+        except ValueError:
+            return value
+    else:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _text(payload: dict[str, object], key: str) -> str | None:
+    value = payload.get(key)
+    if value is None:
+        return None
+    return str(value)
+
+
+def _extract_run(payload: dict[str, object]) -> dict[str, object | None]:
+    return {
+        "project_id": _text(payload, "project_id"),
+        "status": _text(payload, "status"),
+        "created_at": normalize_timestamp(payload.get("created_at")),
+        "updated_at": normalize_timestamp(payload.get("updated_at")),
+    }
+
+
+def _extract_workitem(payload: dict[str, object]) -> dict[str, object | None]:
+    return {
+        "workflow_run_id": _text(payload, "workflow_run_id"),
+        "status": _text(payload, "status"),
+        "module_key": _text(payload, "module_key"),
+        "role": _text(payload, "role"),
+        "created_at": normalize_timestamp(payload.get("created_at")),
+        "updated_at": normalize_timestamp(payload.get("updated_at")),
+    }
+
+
+def _extract_discussion(payload: dict[str, object]) -> dict[str, object | None]:
+    return {
+        "workflow_run_id": _text(payload, "workflow_run_id"),
+        "workitem_id": _text(payload, "workitem_id"),
+        "status": _text(payload, "status"),
+        "created_at": normalize_timestamp(payload.get("created_at")),
+        "updated_at": normalize_timestamp(payload.get("updated_at")),
+    }
+
+
+def _extract_gate(payload: dict[str, object]) -> dict[str, object | None]:
+    return {
+        "workflow_run_id": _text(payload, "workflow_run_id"),
+        "workitem_id": _text(payload, "workitem_id"),
+        "status": _text(payload, "status"),
+        "created_at": normalize_timestamp(payload.get("created_at")),
+        "updated_at": normalize_timestamp(
+            payload.get("updated_at") or payload.get("created_at")
+        ),
+    }
+
+
+def _extract_artifact(payload: dict[str, object]) -> dict[str, object | None]:
+    owner_type = _text(payload, "owner_type")
+    owner_id = _text(payload, "owner_id")
+    return {
+        "workflow_run_id": owner_id if owner_type == "workflow_run" else None,
+        "workitem_id": owner_id if owner_type == "workitem" else None,
+        "status": None,
+        "created_at": normalize_timestamp(payload.get("created_at")),
+        "updated_at": normalize_timestamp(
+            payload.get("updated_at") or payload.get("created_at")
+        ),
+    }
+
+
+def _extract_context_memory_item(payload: dict[str, object]) -> dict[str, object | None]:
+    return {
+        "namespace_id": _text(payload, "namespace_id"),
+        "scope": _text(payload, "scope"),
+        "deleted": "true" if payload.get("deleted") is True else "false",
+        "created_at": normalize_timestamp(payload.get("created_at")),
+        "updated_at": normalize_timestamp(payload.get("updated_at")),
+    }
+
+
+INDEXED_ENTITY_TABLES: dict[str, IndexedEntityTable] = {
+    spec.entity_type: spec
+    for spec in (
+        IndexedEntityTable(
+            entity_type="workflow_run",
+            table="wf_run",
+            columns=("project_id", "status", "created_at", "updated_at"),
+            indexes=(("status",), ("project_id", "created_at"), ("created_at",)),
+            extract=_extract_run,
+        ),
+        IndexedEntityTable(
+            entity_type="workitem",
+            table="wf_workitem",
+            columns=(
+                "workflow_run_id",
+                "status",
+                "module_key",
+                "role",
+                "created_at",
+                "updated_at",
+            ),
+            indexes=(
+                ("workflow_run_id", "created_at"),
+                ("workflow_run_id", "status"),
+                ("status",),
+            ),
+            extract=_extract_workitem,
+        ),
+        IndexedEntityTable(
+            entity_type="discussion_session",
+            table="wf_discussion_session",
+            columns=("workflow_run_id", "workitem_id", "status", "created_at", "updated_at"),
+            indexes=(("workitem_id", "created_at"), ("workflow_run_id",), ("status",)),
+            extract=_extract_discussion,
+        ),
+        IndexedEntityTable(
+            entity_type="gate_check",
+            table="wf_gate_check",
+            columns=("workflow_run_id", "workitem_id", "status", "created_at", "updated_at"),
+            indexes=(("workflow_run_id", "created_at"), ("workitem_id",), ("status",)),
+            extract=_extract_gate,
+        ),
+        IndexedEntityTable(
+            entity_type="artifact",
+            table="wf_artifact",
+            columns=("workflow_run_id", "workitem_id", "status", "created_at", "updated_at"),
+            indexes=(("workflow_run_id", "created_at"), ("workitem_id",)),
+            extract=_extract_artifact,
+            resolve_run_via_workitem=True,
+        ),
+        IndexedEntityTable(
+            entity_type="context_memory_item",
+            table="ctx_memory_item",
+            columns=("namespace_id", "scope", "deleted", "created_at", "updated_at"),
+            indexes=(
+                ("namespace_id", "deleted"),
+                ("scope", "deleted"),
+                ("deleted", "updated_at"),
+            ),
+            extract=_extract_context_memory_item,
+        ),
+    )
+}
+
+
+def create_indexed_tables(conn: sqlite3.Connection) -> None:
+    for spec in INDEXED_ENTITY_TABLES.values():
+        column_defs = ", ".join(
+            ["entity_id TEXT PRIMARY KEY"]
+            + [f"{column} TEXT" for column in spec.columns]
+            + ["payload TEXT NOT NULL"]
+        )
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {spec.table} ({column_defs})")
+        for index_columns in spec.indexes:
+            index_name = f"idx_{spec.table}_{'_'.join(index_columns)}"
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {index_name} "
+                f"ON {spec.table} ({', '.join(index_columns)})"
+            )
+
+
+def build_indexed_row(
+    spec: IndexedEntityTable,
+    entity_id: str,
+    payload: dict[str, object],
+) -> tuple[object | None, ...]:
+    extracted = spec.extract(payload)
+    values: list[object | None] = [entity_id]
+    for column in spec.columns:
+        values.append(extracted.get(column))
+        if column == "workflow_run_id" and spec.resolve_run_via_workitem:
+            values.append(extracted.get("workitem_id"))
+    values.append(json.dumps(payload, ensure_ascii=False))
+    return tuple(values)
+
+
+def build_indexed_upsert_sql(spec: IndexedEntityTable) -> str:
+    columns = ("entity_id", *spec.columns, "payload")
+    placeholders = ["?"] * len(columns)
+    if spec.resolve_run_via_workitem:
+        run_position = columns.index("workflow_run_id")
+        workitem_table = INDEXED_ENTITY_TABLES["workitem"].table
+        placeholders[run_position] = (
+            f"COALESCE(?, (SELECT workflow_run_id FROM {workitem_table} "
+            f"WHERE entity_id = ?))"
+        )
+    updates = ", ".join(f"{column}=excluded.{column}" for column in columns[1:])
+    return (
+        f"INSERT INTO {spec.table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join(placeholders)}) "
+        f"ON CONFLICT(entity_id) DO UPDATE SET {updates}"
+    )
+
+
+def migrate_schema(conn: sqlite3.Connection) -> int:
+    create_indexed_tables(conn)
+    current = int(conn.execute("PRAGMA user_version").fetchone()[0])
+    if current >= SCHEMA_VERSION:
+        return current
+
+    for spec in INDEXED_ENTITY_TABLES.values():
+        legacy_rows = conn.execute(
+            "SELECT entity_id, payload FROM entities WHERE entity_type = ?",
+            (spec.entity_type,),
+        ).fetchall()
+        if not legacy_rows:
+            continue
+        sql = build_indexed_upsert_sql(spec)
+        conn.executemany(
+            sql,
+            [
+                build_indexed_row(spec, entity_id, json.loads(payload))
+                for entity_id, payload in legacy_rows
+            ],
+        )
+        conn.execute("DELETE FROM entities WHERE entity_type = ?", (spec.entity_type,))
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return SCHEMA_VERSION
@@ -18,6 +18,8 @@ from control_center.models import (
     ExecuteWorkflowRunResponse,
     InterruptWorkflowRunRequest,
     InterruptWorkflowRunResponse,
+    SubmitWorkflowRunRequest,
+    WorkflowRunExecutionStatusResponse,
     WorkflowRunOrchestrateLatestTelemetryResponse,
     WorkflowRunOrchestrateRecoveryExecuteRequest,
     WorkflowRunOrchestrateRecoveryExecuteResponse,
@@ -168,6 +170,24 @@ class WorkflowAPIHandlersService:
             payload,
         )
 
+    async def submit_workflow_run(
+        self,
+        run_id: str,
+        payload: SubmitWorkflowRunRequest,
+    ) -> WorkflowRunExecutionStatusResponse:
+        return await self._workflow_execution_runtime_service_provider().submit_workflow_run(
+            run_id,
+            payload,
+        )
+
+    async def get_workflow_run_execution(
+        self,
+        run_id: str,
+    ) -> WorkflowRunExecutionStatusResponse:
+        return self._workflow_execution_runtime_service_provider().get_workflow_run_execution(
+            run_id
+        )
+
     async def interrupt_workflow_run(
         self,
         run_id: str,
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Any
 from typing import Awaitable, Callable
 
@@ -22,6 +25,11 @@ from control_center.models import (
     WorkflowRunStatus,
 )
 from control_center.services.gatekeeper import Gatekeeper
+from control_center.services.workflow_engine_concurrency import (
+    RunExecutionSlots,
+    WorkitemConcurrencyLimiter,
+    WorkitemConcurrencyLimits,
+)
 from control_center.services.workflow_engine_bootstrap_helpers import (
     build_default_module_task_package,
     build_task_package_item_spec,
@@ -37,6 +45,7 @@ from control_center.services.workflow_engine_runtime_helpers import (
     rewrite_integration_dependencies,
 )
 from control_center.services.workflow_scheduler import WorkflowScheduler
+from control_center.services.workflow_scheduler_hydration import TERMINAL_RUN_STATUSES
 
 ActionExecutor = Callable[[ActionExecuteRequest], Awaitable[ActionExecuteResponse]]
 
@@ -65,6 +74,7 @@ class WorkflowEngine:
         gatekeeper: Gatekeeper | None = None,
         max_module_reflows: int = 1,
         release_requires_approval: bool = False,
+        concurrency_limits: WorkitemConcurrencyLimits | None = None,
     ) -> None:
         self._scheduler = scheduler
         self._action_executor = action_executor
@@ -73,6 +83,14 @@ class WorkflowEngine:
         self._gatekeeper = gatekeeper or Gatekeeper()
         self._max_module_reflows = max_module_reflows
         self._release_requires_approval = release_requires_approval
+        self._concurrency = WorkitemConcurrencyLimiter(concurrency_limits)
+
+    @property
+    def concurrency_limits(self) -> WorkitemConcurrencyLimits:
+        return self._concurrency.limits
+
+    def get_concurrency_snapshot(self) -> dict[str, int]:
+        return self._concurrency.snapshot()
 
     def bootstrap_standard_pipeline(
         self,
@@ -81,81 +99,82 @@ class WorkflowEngine:
         *,
         module_task_packages: dict[str, list[dict[str, Any]]] | None = None,
     ) -> BootstrapResult:
-        if self._scheduler.list_workitems(run_id):
-            raise ValueError("workflow already has workitems")
-
-        normalized_modules = self._normalize_modules(modules)
-        created: list[WorkItem] = []
-        module_terminal_ids: list[str] = []
-        module_terminal_id_map: dict[str, str] = {}
-        module_terminal_ids_map: dict[str, list[str]] = {}
-
-        for module in normalized_modules:
-            package = None
-            if isinstance(module_task_packages, dict):
-                raw_package = module_task_packages.get(module)
-                if isinstance(raw_package, list) and raw_package:
-                    package = raw_package
-
-            if package is None:
-                package = build_default_module_task_package(
+        with self._scheduler.unit_of_work():
+            if self._scheduler.list_workitems(run_id):
+                raise ValueError("workflow already has workitems")
+
+            normalized_modules = self._normalize_modules(modules)
+            created: list[WorkItem] = []
+            module_terminal_ids: list[str] = []
+            module_terminal_id_map: dict[str, str] = {}
+            module_terminal_ids_map: dict[str, list[str]] = {}
+
+            for module in normalized_modules:
+                package = None
+                if isinstance(module_task_packages, dict):
+                    raw_package = module_task_packages.get(module)
+                    if isinstance(raw_package, list) and raw_package:
+                        package = raw_package
+
+                if package is None:
+                    package = build_default_module_task_package(
+                        module=module,
+                        module_stages=self.MODULE_STAGES,
+                    )
+
+                module_result = self._bootstrap_module_workitems(
+                    run_id=run_id,
                     module=module,
-                    module_stages=self.MODULE_STAGES,
+                    task_package=package,
                 )
-
-            module_result = self._bootstrap_module_workitems(
-                run_id=run_id,
-                module=module,
-                task_package=package,
-            )
-            created.extend(module_result.workitems)
-            module_terminal_ids.extend(module_result.terminal_ids)
-            module_terminal_id_map[module] = module_result.terminal_ids[-1]
-            module_terminal_ids_map[module] = module_result.terminal_ids
-
-        global_depends_on = list(dict.fromkeys(module_terminal_ids))
-        for role in self.GLOBAL_STAGES:
-            metadata: dict[str, Any] = {
-                "task_source": "chief_decomposition",
-                "task_objective": f"execute {role} stage for global",
-            }
-            workitem = self._scheduler.add_workitem(
-                run_id=run_id,
-                role=role,
-                module_key="global",
-                depends_on=global_depends_on,
-                requires_approval=(role == "release-manager" and self._release_requires_approval),
-                metadata=metadata,
-            )
-            created.append(workitem)
-            global_depends_on = [workitem.id]
-
-        run = self._scheduler.get_run(run_id)
-        run.metadata["module_terminal_workitems"] = module_terminal_id_map
-        run.metadata["module_terminal_workitem_ids"] = module_terminal_ids_map
-        run.metadata["reflow_attempts"] = {}
-        run.requirement_status = RequirementStatus.CONFIRMED
-        run.current_stage = SDDStage.TASKS
-        run.blocked_reason = None
-        run.next_action_hint = "execute_workflow_run"
-        stage_artifacts = run.metadata.get("sdd_stage_artifacts")
-        if not isinstance(stage_artifacts, dict):
-            stage_artifacts = {}
-        for stage in ("intent", "spec", "design", "tasks"):
-            artifact_id = stage_artifacts.get(stage)
-            if isinstance(artifact_id, str) and artifact_id.strip():
-                continue
-            artifact = self._scheduler.create_run_artifact(
-                run_id=run.id,
-                artifact_type=ArtifactType.PLAN,
-                title=f"SDD {stage}",
-                uri_or_path=f"artifacts/{run.id}/sdd/{stage}.md",
-                created_by="chief-architect",
-            )
-            stage_artifacts[stage] = artifact.id
-        run.metadata["sdd_stage_artifacts"] = stage_artifacts
-        self._scheduler.persist_run(run.id)
-        return BootstrapResult(workitems=created)
+                created.extend(module_result.workitems)
+                module_terminal_ids.extend(module_result.terminal_ids)
+                module_terminal_id_map[module] = module_result.terminal_ids[-1]
+                module_terminal_ids_map[module] = module_result.terminal_ids
+
+            global_depends_on = list(dict.fromkeys(module_terminal_ids))
+            for role in self.GLOBAL_STAGES:
+                metadata: dict[str, Any] = {
+                    "task_source": "chief_decomposition",
+                    "task_objective": f"execute {role} stage for global",
+                }
+                workitem = self._scheduler.add_workitem(
+                    run_id=run_id,
+                    role=role,
+                    module_key="global",
+                    depends_on=global_depends_on,
+                    requires_approval=(role == "release-manager" and self._release_requires_approval),
+                    metadata=metadata,
+                )
+                created.append(workitem)
+                global_depends_on = [workitem.id]
+
+            run = self._scheduler.get_run(run_id)
+            run.metadata["module_terminal_workitems"] = module_terminal_id_map
+            run.metadata["module_terminal_workitem_ids"] = module_terminal_ids_map
+            run.metadata["reflow_attempts"] = {}
+            run.requirement_status = RequirementStatus.CONFIRMED
+            run.current_stage = SDDStage.TASKS
+            run.blocked_reason = None
+            run.next_action_hint = "execute_workflow_run"
+            stage_artifacts = run.metadata.get("sdd_stage_artifacts")
+            if not isinstance(stage_artifacts, dict):
+                stage_artifacts = {}
+            for stage in ("intent", "spec", "design", "tasks"):
+                artifact_id = stage_artifacts.get(stage)
+                if isinstance(artifact_id, str) and artifact_id.strip():
+                    continue
+                artifact = self._scheduler.create_run_artifact(
+                    run_id=run.id,
+                    artifact_type=ArtifactType.PLAN,
+                    title=f"SDD {stage}",
+                    uri_or_path=f"artifacts/{run.id}/sdd/{stage}.md",
+                    created_by="chief-architect",
+                )
+                stage_artifacts[stage] = artifact.id
+            run.metadata["sdd_stage_artifacts"] = stage_artifacts
+            self._scheduler.persist_run(run.id)
+            return BootstrapResult(workitems=created)
 
     def _bootstrap_module_workitems(
         self,
@@ -221,51 +240,36 @@ class WorkflowEngine:
         executed: list[str] = []
         failed: list[str] = []
 
+        if self._concurrency.parallel:
+            await self._execute_parallel(
+                run_id,
+                max_loops=max_loops,
+                executed=executed,
+                failed=failed,
+            )
+            return build_execute_response(
+                scheduler=self._scheduler,
+                run_id=run_id,
+                executed=executed,
+                failed=failed,
+            )
+
         for _ in range(max_loops):
-            if self._scheduler.get_run(run_id).status == WorkflowRunStatus.CANCELED:
-                break
-            ready = [
-                item
-                for item in self._scheduler.list_workitems(run_id)
-                if item.status == WorkItemStatus.READY
-            ]
-            if not ready:
-                ready = self._scheduler.tick(run_id)
+            ready = self._next_ready_workitems(run_id)
             if not ready:
                 break
-            ready = sorted(ready, key=lambda item: (item.priority, item.created_at))
 
             for workitem in ready:
                 if self._scheduler.get_run(run_id).status == WorkflowRunStatus.CANCELED:
                     break
                 self._scheduler.start_workitem(workitem.id)
                 execution_status = await self._execute_one_workitem(workitem)
-                refreshed_workitem = self._scheduler.get_workitem(workitem.id)
-                if refreshed_workitem.status != WorkItemStatus.RUNNING:
-                    continue
-
-                executed.append(workitem.id)
-
-                if execution_status == "success":
-                    gated = self._apply_gate_and_reflow_if_needed(workitem)
-                    if gated == "success":
-                        self._scheduler.complete_workitem(workitem.id, success=True)
-                        self._emit_artifacts_for_workitem(workitem)
-                    elif gated == "reflowed":
-                        self._scheduler.mark_workitem_skipped(
-                            workitem.id,
-                            reason="gate_failed_reflow",
-                        )
-                    else:
-                        self._scheduler.complete_workitem(workitem.id, success=False)
-                        failed.append(workitem.id)
-                    continue
-
-                if execution_status == "needs_discussion":
-                    continue
-
-                self._scheduler.complete_workitem(workitem.id, success=False)
-                failed.append(workitem.id)
+                self._finalize_workitem(
+                    workitem,
+                    execution_status,
+                    executed=executed,
+                    failed=failed,
+                )
 
         return build_execute_response(
             scheduler=self._scheduler,
@@ -274,6 +278,130 @@ class WorkflowEngine:
             failed=failed,
         )
 
+    def _next_ready_workitems(self, run_id: str) -> list[WorkItem]:
+        if self._scheduler.get_run(run_id).status == WorkflowRunStatus.CANCELED:
+            return []
+        ready = self._scheduler.list_ready_workitems(run_id)
+        if not ready:
+            ready = self._scheduler.tick(run_id)
+        return ready
+
+    async def _execute_parallel(
+        self,
+        run_id: str,
+        *,
+        max_loops: int,
+        executed: list[str],
+        failed: list[str],
+    ) -> None:
+        # Workitems are dispatched as soon as they become READY, but results
+        # are finalized in the order serial mode would apply them: by
+        # (generation, priority, created_at). A workitem's generation is one
+        # past the finalized item that released it; max_loops bounds it the
+        # same way it bounds loop iterations in serial mode. Finished results
+        # wait in a buffer until every item ahead of them has been finalized,
+        # so gates and reflow never depend on provider latency.
+        slots = self._concurrency.open_run(run_id)
+        order: list[tuple[int, int, datetime, str]] = []
+        in_flight: dict[str, tuple[WorkItem, asyncio.Task[str]]] = {}
+        first_error: BaseException | None = None
+
+        def dispatch(generation: int) -> None:
+            if first_error is not None or generation > max_loops:
+                return
+            for workitem in self._next_ready_workitems(run_id):
+                if self._scheduler.get_run(run_id).status == WorkflowRunStatus.CANCELED:
+                    break
+                self._scheduler.start_workitem(workitem.id)
+                task = asyncio.create_task(self._execute_with_limits(slots, workitem))
+                in_flight[workitem.id] = (workitem, task)
+                heapq.heappush(
+                    order,
+                    (generation, workitem.priority, workitem.created_at, workitem.id),
+                )
+
+        try:
+            dispatch(1)
+            while order:
+                generation, _, _, workitem_id = order[0]
+                workitem, task = in_flight[workitem_id]
+                if not task.done():
+                    done, _ = await asyncio.wait(
+                        [item_task for _, item_task in in_flight.values() if not item_task.done()],
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    for done_task in done:
+                        # Stop launching as soon as any item fails, not only
+                        # once it reaches the head of the order.
+                        first_error = first_error or done_task.exception()
+                    continue
+                heapq.heappop(order)
+                del in_flight[workitem_id]
+                if task.exception() is not None:
+                    continue
+                self._finalize_workitem(
+                    workitem,
+                    task.result(),
+                    executed=executed,
+                    failed=failed,
+                )
+                dispatch(generation + 1)
+        finally:
+            for _, task in in_flight.values():
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(
+                    *(task for _, task in in_flight.values()),
+                    return_exceptions=True,
+                )
+            if self._scheduler.get_run(run_id).status in TERMINAL_RUN_STATUSES:
+                self._concurrency.close_run(run_id)
+        if first_error is not None:
+            raise first_error
+
+    async def _execute_with_limits(
+        self,
+        slots: RunExecutionSlots,
+        workitem: WorkItem,
+    ) -> str:
+        async with self._concurrency.acquire(slots, workitem):
+            return await self._execute_one_workitem(workitem)
+
+    def _finalize_workitem(
+        self,
+        workitem: WorkItem,
+        execution_status: str,
+        *,
+        executed: list[str],
+        failed: list[str],
+    ) -> None:
+        refreshed_workitem = self._scheduler.get_workitem(workitem.id)
+        if refreshed_workitem.status != WorkItemStatus.RUNNING:
+            return
+
+        executed.append(workitem.id)
+        if execution_status == "needs_discussion":
+            return
+
+        with self._scheduler.unit_of_work():
+            if execution_status == "success":
+                gated = self._apply_gate_and_reflow_if_needed(workitem)
+                if gated == "success":
+                    self._scheduler.complete_workitem(workitem.id, success=True)
+                    self._emit_artifacts_for_workitem(workitem)
+                elif gated == "reflowed":
+                    self._scheduler.mark_workitem_skipped(
+                        workitem.id,
+                        reason="gate_failed_reflow",
+                    )
+                else:
+                    self._scheduler.complete_workitem(workitem.id, success=False)
+                    failed.append(workitem.id)
+                return
+
+            self._scheduler.complete_workitem(workitem.id, success=False)
+            failed.append(workitem.id)
+
     async def _execute_one_workitem(self, workitem: WorkItem) -> str:
         run = self._scheduler.get_run(workitem.workflow_run_id)
         if self._executor_service is not None:
@@ -431,7 +559,6 @@ class WorkflowEngine:
 
         if isinstance(old_terminal_id, str) and old_terminal_id:
             self._rewire_integration_dependencies(
-                run.id,
                 old_terminal_id=old_terminal_id,
                 new_terminal_id=new_terminal.id,
             )
@@ -445,12 +572,11 @@ class WorkflowEngine:
 
     def _rewire_integration_dependencies(
         self,
-        run_id: str,
         *,
         old_terminal_id: str,
         new_terminal_id: str,
     ) -> None:
-        for item in self._scheduler.list_workitems(run_id):
+        for item in self._scheduler.list_dependent_workitems(old_terminal_id):
             if item.role != "integration-test":
                 continue
             updated = rewrite_integration_dependencies(
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import weakref
+from collections.abc import AsyncIterator, Mapping
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+
+from control_center.models import WorkItem
+
+
+@dataclass(frozen=True, slots=True)
+class WorkitemConcurrencyLimits:
+    per_run: int = 1
+    global_limit: int = 0
+    per_role: Mapping[str, int] = field(default_factory=dict)
+    per_module: int = 0
+
+    @property
+    def parallel(self) -> bool:
+        return self.per_run > 1
+
+
+def parse_role_limits(value: str) -> dict[str, int]:
+    limits: dict[str, int] = {}
+    for entry in value.split(","):
+        role, separator, raw_limit = entry.partition("=")
+        role = role.strip().lower()
+        if not role or not separator:
+            continue
+        try:
+            limit = int(raw_limit.strip())
+        except ValueError:
+            continue
+        if limit > 0:
+            limits[role] = limit
+    return limits
+
+
+@dataclass(slots=True)
+class RunExecutionSlots:
+    run_slots: asyncio.Semaphore
+    module_slots: dict[str, asyncio.Semaphore] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class _LoopSemaphores:
+    global_slots: asyncio.Semaphore | None
+    role_slots: dict[str, asyncio.Semaphore] = field(default_factory=dict)
+    run_slots: dict[str, RunExecutionSlots] = field(default_factory=dict)
+
+
+class WorkitemConcurrencyLimiter:
+    def __init__(self, limits: WorkitemConcurrencyLimits | None = None) -> None:
+        self._limits = limits or WorkitemConcurrencyLimits()
+        self._per_loop: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopSemaphores
+        ] = weakref.WeakKeyDictionary()
+        self._in_flight = 0
+        self._max_in_flight = 0
+
+    @property
+    def limits(self) -> WorkitemConcurrencyLimits:
+        return self._limits
+
+    @property
+    def parallel(self) -> bool:
+        return self._limits.parallel
+
+    def snapshot(self) -> dict[str, int]:
+        return {"in_flight": self._in_flight, "max_in_flight": self._max_in_flight}
+
+    def open_run(self, run_id: str) -> RunExecutionSlots:
+        # Every driver of a run shares one set of run/module slots, so the caps
+        # hold across overlapping execute calls.
+        shared = self._loop_semaphores()
+        slots = shared.run_slots.get(run_id)
+        if slots is None:
+            slots = RunExecutionSlots(
+                run_slots=asyncio.Semaphore(max(1, self._limits.per_run)),
+            )
+            shared.run_slots[run_id] = slots
+        return slots
+
+    def close_run(self, run_id: str) -> None:
+        for shared in list(self._per_loop.values()):
+            shared.run_slots.pop(run_id, None)
+
+    def _loop_semaphores(self) -> _LoopSemaphores:
+        loop = asyncio.get_running_loop()
+        shared = self._per_loop.get(loop)
+        if shared is None:
+            global_limit = self._limits.global_limit
+            shared = _LoopSemaphores(
+                global_slots=asyncio.Semaphore(global_limit) if global_limit > 0 else None,
+            )
+            self._per_loop[loop] = shared
+        return shared
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        slots: RunExecutionSlots,
+        workitem: WorkItem,
+    ) -> AsyncIterator[None]:
+        shared = self._loop_semaphores()
+        ordered: list[asyncio.Semaphore] = []
+
+        role = workitem.role.strip().lower()
+        role_limit = self._limits.per_role.get(role)
+        if role_limit:
+            role_slots = shared.role_slots.get(role)
+            if role_slots is None:
+                role_slots = asyncio.Semaphore(role_limit)
+                shared.role_slots[role] = role_slots
+            ordered.append(role_slots)
+
+        module = (workitem.module_key or "global").strip()
+        if self._limits.per_module > 0:
+            module_slots = slots.module_slots.get(module)
+            if module_slots is None:
+                module_slots = asyncio.Semaphore(self._limits.per_module)
+                slots.module_slots[module] = module_slots
+            ordered.append(module_slots)
+
+        ordered.append(slots.run_slots)
+        if shared.global_slots is not None:
+            ordered.append(shared.global_slots)
+
+        async with AsyncExitStack() as stack:
+            for semaphore in ordered:
+                await stack.enter_async_context(semaphore)
+            self._in_flight += 1
+            self._max_in_flight = max(self._max_in_flight, self._in_flight)
+            try:
+                yield
+            finally:
+                self._in_flight -= 1
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 
 from fastapi import HTTPException
 
@@ -14,11 +15,19 @@ from control_center.models import (
     InterruptWorkflowRunResponse,
     RequirementStatus,
     SDDStage,
+    SubmitWorkflowRunRequest,
     WorkflowRun,
+    WorkflowRunExecutionStatusResponse,
     WorkflowRunStatus,
 )
 from control_center.services.workflow_engine import WorkflowEngine
+from control_center.services.workflow_run_executor import (
+    BACKGROUND_EXECUTION_KEY,
+    WorkflowRunExecutor,
+    WorkflowRunExecutorNotRunningError,
+)
 from control_center.services.workflow_scheduler import WorkflowScheduler
+from control_center.services.workflow_scheduler_hydration import TERMINAL_RUN_STATUSES
 
 
 class WorkflowExecutionRuntimeService:
@@ -33,6 +42,7 @@ class WorkflowExecutionRuntimeService:
         ],
         get_pending_decomposition: Callable[[WorkflowRun], dict[str, object] | None],
         get_pending_confirmation_status: Callable[[dict[str, object]], str],
+        workflow_run_executor_provider: Callable[[], WorkflowRunExecutor | None] | None = None,
     ) -> None:
         self._workflow_scheduler_provider = workflow_scheduler_provider
         self._workflow_engine_provider = workflow_engine_provider
@@ -41,6 +51,7 @@ class WorkflowExecutionRuntimeService:
         )
         self._get_pending_decomposition = get_pending_decomposition
         self._get_pending_confirmation_status = get_pending_confirmation_status
+        self._workflow_run_executor_provider = workflow_run_executor_provider
 
     async def execute_workflow_run(
         self,
@@ -70,52 +81,18 @@ class WorkflowExecutionRuntimeService:
                 raise HTTPException(status_code=404, detail=str(exc)) from exc
 
         scheduler = self._workflow_scheduler_provider()
-        try:
-            run = scheduler.get_run(run_id)
-        except KeyError as exc:
-            raise HTTPException(status_code=404, detail=str(exc)) from exc
-
-        pending = self._get_pending_decomposition(run)
-        if pending is not None and self._get_pending_confirmation_status(pending) == "pending":
-            detail = "decomposition confirmation required before execute"
-            if auto_advance_result is not None and auto_advance_result.steps:
-                last_step = auto_advance_result.steps[-1]
-                if last_step.reason:
-                    detail = f"{detail}: {last_step.reason}"
-            raise HTTPException(status_code=409, detail=detail)
-
-        if run.requirement_status != RequirementStatus.CONFIRMED:
-            run.blocked_reason = "requirement_not_confirmed"
-            run.next_action_hint = "awaiting_clarification"
-            scheduler.persist_run(run.id)
-            raise HTTPException(
-                status_code=409,
-                detail=(
-                    "requirement is not confirmed; "
-                    "clarification is required before implement stage"
-                ),
-            )
-
-        missing_stages = self._missing_pre_implement_stages(run)
-        if missing_stages:
-            run.requirement_status = RequirementStatus.BLOCKED
-            run.blocked_reason = f"missing_sdd_artifacts:{','.join(missing_stages)}"
-            run.next_action_hint = "provide_missing_sdd_artifacts"
-            scheduler.persist_run(run.id)
-            raise HTTPException(
-                status_code=409,
-                detail=f"missing required SDD artifacts before implement: {', '.join(missing_stages)}",
-            )
-        run.current_stage = SDDStage.IMPLEMENT
-        run.next_action_hint = "execute_workflow_run"
-        run.blocked_reason = None
-        scheduler.persist_run(run.id)
+        self._prepare_implement_stage(
+            scheduler,
+            run_id,
+            auto_advance_result=auto_advance_result,
+        )
 
         try:
-            execution_result = await self._workflow_engine_provider().execute_until_blocked(
-                run_id=run_id,
-                max_loops=payload.max_loops,
-            )
+            async with self._run_guard(run_id):
+                execution_result = await self._workflow_engine_provider().execute_until_blocked(
+                    run_id=run_id,
+                    max_loops=payload.max_loops,
+                )
         except ValueError as exc:
             raise HTTPException(status_code=422, detail=str(exc)) from exc
 
@@ -130,6 +107,75 @@ class WorkflowExecutionRuntimeService:
         self._update_stage_and_acceptance_after_execute(scheduler, run_id)
         return merged_result
 
+    async def submit_workflow_run(
+        self,
+        run_id: str,
+        payload: SubmitWorkflowRunRequest,
+    ) -> WorkflowRunExecutionStatusResponse:
+        executor = self._run_executor()
+        if executor is None or not executor.running:
+            raise HTTPException(status_code=503, detail="workflow run executor is not running")
+        scheduler = self._workflow_scheduler_provider()
+        try:
+            run = scheduler.get_run(run_id)
+        except KeyError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+        if run.status in TERMINAL_RUN_STATUSES:
+            raise HTTPException(
+                status_code=409,
+                detail=f"workflow run {run_id} is already {run.status.value}",
+            )
+        self._prepare_implement_stage(scheduler, run_id)
+        try:
+            executor.submit(
+                run_id,
+                max_loops=payload.max_loops,
+                submitted_by=payload.submitted_by,
+            )
+        except WorkflowRunExecutorNotRunningError as exc:
+            raise HTTPException(status_code=503, detail=str(exc)) from exc
+        return self.get_workflow_run_execution(run_id)
+
+    def get_workflow_run_execution(self, run_id: str) -> WorkflowRunExecutionStatusResponse:
+        scheduler = self._workflow_scheduler_provider()
+        try:
+            run = scheduler.get_run(run_id)
+        except KeyError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+        executor = self._run_executor()
+        state = run.metadata.get(BACKGROUND_EXECUTION_KEY)
+        if not isinstance(state, dict):
+            state = {}
+        return WorkflowRunExecutionStatusResponse(
+            run_id=run.id,
+            run_status=run.status,
+            background_enabled=bool(state.get("enabled")),
+            executor_state=(
+                executor.executor_state(run)
+                if executor is not None
+                else ("idle" if state.get("enabled") else "not_submitted")
+            ),
+            executor_running=executor is not None and executor.running,
+            queue_depth=executor.queue_depth if executor is not None else 0,
+            max_loops=state.get("max_loops"),
+            drives=int(state.get("drives") or 0),
+            submitted_by=state.get("submitted_by"),
+            submitted_at=state.get("submitted_at"),
+            last_drive_started_at=state.get("last_drive_started_at"),
+            last_drive_finished_at=state.get("last_drive_finished_at"),
+            last_executed_count=int(state.get("last_executed_count") or 0),
+            last_failed_count=int(state.get("last_failed_count") or 0),
+            last_error=state.get("last_error"),
+            next_action_hint=run.next_action_hint,
+            blocked_reason=run.blocked_reason,
+        )
+
+    def finalize_execution(self, run_id: str) -> None:
+        self._update_stage_and_acceptance_after_execute(
+            self._workflow_scheduler_provider(),
+            run_id,
+        )
+
     async def interrupt_workflow_run(
         self,
         run_id: str,
@@ -160,6 +206,69 @@ class WorkflowExecutionRuntimeService:
             reason=payload.reason,
         )
 
+    def _prepare_implement_stage(
+        self,
+        scheduler: WorkflowScheduler,
+        run_id: str,
+        *,
+        auto_advance_result: DecomposeBootstrapAdvanceLoopResponse | None = None,
+    ) -> WorkflowRun:
+        try:
+            run = scheduler.get_run(run_id)
+        except KeyError as exc:
+            raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+        pending = self._get_pending_decomposition(run)
+        if pending is not None and self._get_pending_confirmation_status(pending) == "pending":
+            detail = "decomposition confirmation required before execute"
+            if auto_advance_result is not None and auto_advance_result.steps:
+                last_step = auto_advance_result.steps[-1]
+                if last_step.reason:
+                    detail = f"{detail}: {last_step.reason}"
+            raise HTTPException(status_code=409, detail=detail)
+
+        if run.requirement_status != RequirementStatus.CONFIRMED:
+            run.blocked_reason = "requirement_not_confirmed"
+            run.next_action_hint = "awaiting_clarification"
+            scheduler.persist_run(run.id)
+            raise HTTPException(
+                status_code=409,
+                detail=(
+                    "requirement is not confirmed; "
+                    "clarification is required before implement stage"
+                ),
+            )
+
+        missing_stages = self._missing_pre_implement_stages(run)
+        if missing_stages:
+            run.requirement_status = RequirementStatus.BLOCKED
+            run.blocked_reason = f"missing_sdd_artifacts:{','.join(missing_stages)}"
+            run.next_action_hint = "provide_missing_sdd_artifacts"
+            scheduler.persist_run(run.id)
+            raise HTTPException(
+                status_code=409,
+                detail=f"missing required SDD artifacts before implement: {', '.join(missing_stages)}",
+            )
+        run.current_stage = SDDStage.IMPLEMENT
+        run.next_action_hint = "execute_workflow_run"
+        run.blocked_reason = None
+        scheduler.persist_run(run.id)
+        return run
+
+    def _run_executor(self) -> WorkflowRunExecutor | None:
+        if self._workflow_run_executor_provider is None:
+            return None
+        return self._workflow_run_executor_provider()
+
+    @asynccontextmanager
+    async def _run_guard(self, run_id: str) -> AsyncIterator[None]:
+        executor = self._run_executor()
+        if executor is None:
+            yield
+            return
+        async with executor.run_guard(run_id):
+            yield
+
     @staticmethod
     def _missing_pre_implement_stages(run: WorkflowRun) -> list[str]:
         stage_artifacts = run.metadata.get("sdd_stage_artifacts")
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import zlib
+from collections.abc import Iterable
+from pathlib import Path
+
+from control_center.models import (
+    Artifact,
+    ArtifactOwnerType,
+    DiscussionSession,
+    GateCheck,
+    WorkItem,
+    WorkflowRun,
+)
+from control_center.models.hierarchy import now_utc
+from control_center.services.sqlite_state_store_schema import normalize_timestamp
+from control_center.services.workflow_scheduler_hydration import RunStateBundle
+
+ARCHIVE_FORMAT_VERSION = 1
+
+
+def split_bundle_by_run(bundle: RunStateBundle) -> dict[str, RunStateBundle]:
+    per_run = {run.id: RunStateBundle(runs=[run]) for run in bundle.runs}
+    workitem_run: dict[str, str] = {}
+    for item in bundle.workitems:
+        target = per_run.get(item.workflow_run_id)
+        if target is None:
+            continue
+        target.workitems.append(item)
+        workitem_run[item.id] = item.workflow_run_id
+    for session in bundle.discussions:
+        target = per_run.get(session.workflow_run_id)
+        if target is not None:
+            target.discussions.append(session)
+    for gate in bundle.gate_checks:
+        target = per_run.get(gate.workflow_run_id)
+        if target is not None:
+            target.gate_checks.append(gate)
+    for artifact in bundle.artifacts:
+        if artifact.owner_type == ArtifactOwnerType.WORKFLOW_RUN:
+            run_id = artifact.owner_id
+        else:
+            run_id = workitem_run.get(artifact.owner_id, "")
+        target = per_run.get(run_id)
+        if target is not None:
+            target.artifacts.append(artifact)
+    return per_run
+
+
+def serialize_run_bundle(bundle: RunStateBundle) -> bytes:
+    document = {
+        "format_version": ARCHIVE_FORMAT_VERSION,
+        "run": bundle.runs[0].model_dump(mode="json"),
+        "workitems": [item.model_dump(mode="json") for item in bundle.workitems],
+        "discussions": [item.model_dump(mode="json") for item in bundle.discussions],
+        "gate_checks": [item.model_dump(mode="json") for item in bundle.gate_checks],
+        "artifacts": [item.model_dump(mode="json") for item in bundle.artifacts],
+    }
+    encoded = json.dumps(document, ensure_ascii=False, separators=(",", ":"))
+    return encoded.encode("utf-8")
+
+
+def deserialize_run_bundle(blob: bytes) -> RunStateBundle:
+    document = json.loads(zlib.decompress(blob).decode("utf-8"))
+    version = int(document.get("format_version", 0))
+    if version != ARCHIVE_FORMAT_VERSION:
+        raise ValueError(f"unsupported workflow archive format version: {version}")
+    return RunStateBundle(
+        runs=[WorkflowRun(**document["run"])],
+        workitems=[WorkItem(**item) for item in document.get("workitems", [])],
+        discussions=[
+            DiscussionSession(**item) for item in document.get("discussions", [])
+        ],
+        gate_checks=[GateCheck(**item) for item in document.get("gate_checks", [])],
+        artifacts=[Artifact(**item) for item in document.get("artifacts", [])],
+    )
+
+
+class WorkflowRunArchive:
+    def __init__(self, db_path: str, *, compression_level: int = 6) -> None:
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._compression_level = min(9, max(1, int(compression_level)))
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = sqlite3.connect(
+            self._db_path,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS archived_runs (
+              run_id TEXT PRIMARY KEY,
+              project_id TEXT NOT NULL,
+              status TEXT NOT NULL,
+              created_at TEXT,
+              updated_at TEXT,
+              archived_at TEXT NOT NULL,
+              raw_bytes INTEGER NOT NULL,
+              payload BLOB NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_archived_runs_project "
+            "ON archived_runs (project_id, created_at)"
+        )
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            raise RuntimeError(f"workflow run archive is closed: {self._db_path}")
+        return self._conn
+
+    def append(self, bundles: Iterable[RunStateBundle]) -> list[str]:
+        archived_at = normalize_timestamp(now_utc())
+        rows: list[tuple[object, ...]] = []
+        for bundle in bundles:
+            run = bundle.runs[0]
+            raw = serialize_run_bundle(bundle)
+            rows.append(
+                (
+                    run.id,
+                    run.project_id,
+                    run.status.value,
+                    normalize_timestamp(run.created_at),
+                    normalize_timestamp(run.updated_at),
+                    archived_at,
+                    len(raw),
+                    zlib.compress(raw, self._compression_level),
+                )
+            )
+        if not rows:
+            return []
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(
+                    """
+                    INSERT INTO archived_runs (
+                      run_id, project_id, status, created_at, updated_at,
+                      archived_at, raw_bytes, payload
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(run_id) DO NOTHING
+                    """,
+                    rows,
+                )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        return [str(row[0]) for row in rows]
+
+    def get(self, run_id: str) -> RunStateBundle | None:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT payload FROM archived_runs WHERE run_id = ?",
+                (run_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return deserialize_run_bundle(row[0])
+
+    def contains(self, run_id: str) -> bool:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT 1 FROM archived_runs WHERE run_id = ?",
+                (run_id,),
+            ).fetchone()
+        return row is not None
+
+    def list_run_ids(self, *, project_id: str | None = None) -> list[str]:
+        sql = "SELECT run_id FROM archived_runs"
+        params: list[object] = []
+        if project_id is not None:
+            sql += " WHERE project_id = ?"
+            params.append(project_id)
+        sql += " ORDER BY created_at, rowid"
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        return [row[0] for row in rows]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(raw_bytes), 0), "
+                "COALESCE(SUM(LENGTH(payload)), 0) FROM archived_runs"
+            ).fetchone()
+        return {
+            "runs": int(row[0]),
+            "raw_bytes": int(row[1]),
+            "compressed_bytes": int(row[2]),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any
+
+from control_center.models import WorkItem, WorkItemStatus, WorkflowRun
+from control_center.models.hierarchy import now_utc
+from control_center.services.workflow_engine import WorkflowEngine
+from control_center.services.workflow_scheduler import WorkflowScheduler
+from control_center.services.workflow_scheduler_hydration import TERMINAL_RUN_STATUSES
+
+BACKGROUND_EXECUTION_KEY = "background_execution"
+WAKE_STATUSES = frozenset(
+    {
+        WorkItemStatus.READY,
+        WorkItemStatus.SUCCEEDED,
+        WorkItemStatus.SKIPPED,
+    }
+)
+RESUME_REQUEUE_REASON = "run_executor_resume"
+
+
+class WorkflowRunExecutorNotRunningError(RuntimeError):
+    pass
+
+
+class WorkflowRunExecutor:
+    def __init__(
+        self,
+        *,
+        workflow_scheduler_provider: Callable[[], WorkflowScheduler],
+        workflow_engine_provider: Callable[[], WorkflowEngine],
+        after_drive_handler: Callable[[str], None] | None = None,
+        worker_count: int = 2,
+        drain_timeout_seconds: float = 30.0,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self._workflow_scheduler_provider = workflow_scheduler_provider
+        self._workflow_engine_provider = workflow_engine_provider
+        self._after_drive_handler = after_drive_handler
+        self._worker_count = max(1, int(worker_count))
+        self._drain_timeout_seconds = max(0.0, float(drain_timeout_seconds))
+        self._logger = logger or logging.getLogger("wherecode.control_center.run_executor")
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[str | None] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._listening_scheduler: WorkflowScheduler | None = None
+        self._tracked: dict[str, int] = {}
+        self._queued: set[str] = set()
+        self._active: dict[str, int] = {}
+        self._run_locks: dict[str, asyncio.Lock] = {}
+        self._closing = False
+        self._drives = 0
+        self._resumed_runs = 0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers) and not self._closing
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queued)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "running": self.running,
+            "workers": len(self._workers),
+            "tracked_runs": len(self._tracked),
+            "queued_runs": len(self._queued),
+            "active_runs": len(self._active),
+            "drives": self._drives,
+            "resumed_runs": self._resumed_runs,
+        }
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._closing = False
+        scheduler = self._workflow_scheduler_provider()
+        scheduler.add_transition_listener(self._on_transition)
+        self._listening_scheduler = scheduler
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"workflow-run-executor-{index}")
+            for index in range(self._worker_count)
+        ]
+        self._resume_submitted_runs(scheduler)
+
+    async def stop(self, timeout_seconds: float | None = None) -> None:
+        if not self._workers:
+            return
+        self._closing = True
+        if self._listening_scheduler is not None:
+            self._listening_scheduler.remove_transition_listener(self._on_transition)
+            self._listening_scheduler = None
+        assert self._queue is not None
+        for _ in self._workers:
+            self._queue.put_nowait(None)
+
+        timeout = self._drain_timeout_seconds if timeout_seconds is None else timeout_seconds
+        _, pending = await asyncio.wait(self._workers, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        if pending:
+            self._logger.warning(
+                "workflow run executor stopped with %s in-flight drive(s) canceled; "
+                "they resume on next start",
+                len(pending),
+            )
+        self._workers = []
+        self._queue = None
+        self._loop = None
+        self._queued.clear()
+        self._tracked.clear()
+
+    def submit(
+        self,
+        run_id: str,
+        *,
+        max_loops: int,
+        submitted_by: str | None = None,
+    ) -> WorkflowRun:
+        if not self.running:
+            raise WorkflowRunExecutorNotRunningError("workflow run executor is not running")
+        scheduler = self._workflow_scheduler_provider()
+        run = scheduler.get_run(run_id)
+        state = self._state(run)
+        state.update(
+            {
+                "enabled": True,
+                "max_loops": int(max_loops),
+                "submitted_by": submitted_by,
+                "submitted_at": now_utc().isoformat(),
+                "last_error": None,
+            }
+        )
+        run.metadata[BACKGROUND_EXECUTION_KEY] = state
+        scheduler.persist_run(run.id)
+        self._tracked[run.id] = int(max_loops)
+        self._enqueue(run.id)
+        return run
+
+    def notify(self, run_id: str) -> None:
+        loop = self._loop
+        if loop is None or self._closing or run_id not in self._tracked:
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            self._enqueue(run_id)
+            return
+        try:
+            loop.call_soon_threadsafe(self._enqueue, run_id)
+        except RuntimeError:
+            return
+
+    def executor_state(self, run: WorkflowRun) -> str:
+        if run.id in self._active:
+            return "running"
+        if run.id in self._queued:
+            return "queued"
+        state = run.metadata.get(BACKGROUND_EXECUTION_KEY)
+        if not isinstance(state, dict) or not state.get("enabled"):
+            return "not_submitted"
+        if run.status in TERMINAL_RUN_STATUSES:
+            return "finished"
+        return "idle"
+
+    @asynccontextmanager
+    async def run_guard(self, run_id: str) -> AsyncIterator[None]:
+        lock = self._run_locks.get(run_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._run_locks[run_id] = lock
+        self._active[run_id] = self._active.get(run_id, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            remaining = self._active[run_id] - 1
+            if remaining:
+                self._active[run_id] = remaining
+            else:
+                del self._active[run_id]
+                self._run_locks.pop(run_id, None)
+
+    def _on_transition(self, item: WorkItem, previous: WorkItemStatus) -> None:
+        if item.status in WAKE_STATUSES:
+            self.notify(item.workflow_run_id)
+
+    def _enqueue(self, run_id: str) -> None:
+        if (
+            self._queue is None
+            or self._closing
+            or run_id not in self._tracked
+            or run_id in self._queued
+            or run_id in self._active
+        ):
+            return
+        self._queued.add(run_id)
+        self._queue.put_nowait(run_id)
+
+    def _resume_submitted_runs(self, scheduler: WorkflowScheduler) -> None:
+        for run_id in scheduler.list_active_run_ids():
+            run = scheduler.get_run(run_id)
+            state = run.metadata.get(BACKGROUND_EXECUTION_KEY)
+            if not isinstance(state, dict) or not state.get("enabled"):
+                continue
+            scheduler.requeue_running_workitems(run_id, reason=RESUME_REQUEUE_REASON)
+            self._tracked[run_id] = int(state.get("max_loops") or 20)
+            self._resumed_runs += 1
+            self._enqueue(run_id)
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            run_id = await queue.get()
+            try:
+                if run_id is None or self._closing:
+                    return
+                self._queued.discard(run_id)
+                await self._drive(run_id)
+            except Exception:
+                self._logger.exception("workflow run executor drive failed: %s", run_id)
+            finally:
+                queue.task_done()
+
+    async def _drive(self, run_id: str) -> None:
+        scheduler = self._workflow_scheduler_provider()
+        try:
+            run = scheduler.get_run(run_id)
+        except KeyError:
+            self._tracked.pop(run_id, None)
+            return
+        if run.status in TERMINAL_RUN_STATUSES:
+            self._tracked.pop(run_id, None)
+            return
+
+        max_loops = self._tracked.get(run_id, 20)
+        async with self.run_guard(run_id):
+            self._record_drive(scheduler, run_id, last_drive_started_at=now_utc())
+            try:
+                result = await self._workflow_engine_provider().execute_until_blocked(
+                    run_id=run_id,
+                    max_loops=max_loops,
+                )
+            except Exception as exc:
+                self._record_drive(
+                    scheduler,
+                    run_id,
+                    last_drive_finished_at=now_utc(),
+                    last_error=str(exc) or exc.__class__.__name__,
+                )
+                raise
+            if self._after_drive_handler is not None:
+                self._after_drive_handler(run_id)
+            self._drives += 1
+            run = self._record_drive(
+                scheduler,
+                run_id,
+                last_drive_finished_at=now_utc(),
+                last_executed_count=result.executed_count,
+                last_failed_count=result.failed_count,
+                last_error=None,
+                drives_increment=1,
+            )
+
+        if run.status in TERMINAL_RUN_STATUSES:
+            self._tracked.pop(run_id, None)
+        elif result.executed_count > 0 and scheduler.has_runnable_workitems(run_id):
+            # max_loops ran out with work left; requeue behind other runs
+            # instead of monopolizing the worker.
+            self._enqueue(run_id)
+
+    def _record_drive(
+        self,
+        scheduler: WorkflowScheduler,
+        run_id: str,
+        *,
+        drives_increment: int = 0,
+        **fields: Any,
+    ) -> WorkflowRun:
+        run = scheduler.get_run(run_id)
+        state = self._state(run)
+        for key, value in fields.items():
+            state[key] = value.isoformat() if isinstance(value, datetime) else value
+        state["drives"] = int(state.get("drives") or 0) + drives_increment
+        run.metadata[BACKGROUND_EXECUTION_KEY] = state
+        scheduler.persist_run(run_id)
+        return run
+
+    @staticmethod
+    def _state(run: WorkflowRun) -> dict[str, Any]:
+        state = run.metadata.get(BACKGROUND_EXECUTION_KEY)
+        return dict(state) if isinstance(state, dict) else {}
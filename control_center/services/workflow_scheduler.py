@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from copy import deepcopy
+from datetime import datetime, timedelta
 
 from control_center.models import (
     Artifact,
@@ -19,22 +22,35 @@ from control_center.models import (
 )
 from control_center.models.hierarchy import now_utc
 from control_center.services.sqlite_state_store import SQLiteStateStore
+from control_center.services.workflow_run_archive import WorkflowRunArchive
 from control_center.services.workflow_scheduler_dependencies import (
-    dependencies_satisfied,
     normalize_dependency_update_ids,
-    select_pending_ready_for_transition,
     validate_dependency_ids,
 )
+from control_center.services.workflow_scheduler_graph import RunDependencyGraph
 from control_center.services.workflow_scheduler_indexes import (
     build_artifact_indexes,
     build_discussion_indexes,
     build_gate_indexes,
     build_workitem_indexes,
 )
+from control_center.services.workflow_scheduler_archive import (
+    archive_terminal_runs as archive_terminal_runs_impl,
+    hydrate_archived_run,
+)
+from control_center.services.workflow_scheduler_hydration import (
+    TERMINAL_RUN_STATUSES,
+    evict_run,
+    load_active_run_bundle,
+    load_run_bundle,
+    merge_run_bundle,
+    normalize_hydration_mode,
+)
 from control_center.services.workflow_scheduler_status import (
-    build_scheduler_metrics,
-    derive_run_status,
+    build_store_scheduler_metrics,
+    derive_run_status_from_counts,
 )
+from control_center.services.workflow_scheduler_counters import SchedulerStatusCounters
 from control_center.services.workflow_scheduler_discussion import (
     mark_needs_discussion as mark_needs_discussion_impl,
     resolve_discussion as resolve_discussion_impl,
@@ -48,7 +64,14 @@ class WorkflowScheduler:
     GATE_ENTITY_TYPE = "gate_check"
     ARTIFACT_ENTITY_TYPE = "artifact"
 
-    def __init__(self, state_store: SQLiteStateStore | None = None) -> None:
+    def __init__(
+        self,
+        state_store: SQLiteStateStore | None = None,
+        *,
+        hydration_mode: str = "eager",
+        terminal_run_cache_size: int = 64,
+        run_archive: WorkflowRunArchive | None = None,
+    ) -> None:
         self._runs: dict[str, WorkflowRun] = {}
         self._workitems: dict[str, WorkItem] = {}
         self._run_workitems: dict[str, list[str]] = defaultdict(list)
@@ -61,12 +84,47 @@ class WorkflowScheduler:
         self._artifacts: dict[str, Artifact] = {}
         self._run_artifacts: dict[str, list[str]] = defaultdict(list)
         self._workitem_artifacts: dict[str, list[str]] = defaultdict(list)
+        self._run_graphs: dict[str, RunDependencyGraph] = {}
+        self._status_counters = SchedulerStatusCounters()
         self._state_store = state_store
+        self._hydration_mode = (
+            normalize_hydration_mode(hydration_mode) if state_store is not None else "eager"
+        )
+        self._terminal_run_cache_size = max(1, int(terminal_run_cache_size))
+        self._hydrated_terminal_runs: OrderedDict[str, None] = OrderedDict()
+        self._run_archive = run_archive
+        self._archive_hydrated_run_ids: set[str] = set()
+        self._transition_listeners: list[Callable[[WorkItem, WorkItemStatus], None]] = []
         self._load_state()
 
+    @property
+    def hydration_mode(self) -> str:
+        return self._hydration_mode
+
+    @property
+    def run_archive(self) -> WorkflowRunArchive | None:
+        return self._run_archive
+
+    def add_transition_listener(
+        self,
+        listener: Callable[[WorkItem, WorkItemStatus], None],
+    ) -> None:
+        if listener not in self._transition_listeners:
+            self._transition_listeners.append(listener)
+
+    def remove_transition_listener(
+        self,
+        listener: Callable[[WorkItem, WorkItemStatus], None],
+    ) -> None:
+        if listener in self._transition_listeners:
+            self._transition_listeners.remove(listener)
+
     def _load_state(self) -> None:
         if self._state_store is None:
             return
+        if self._hydration_mode == "lazy":
+            merge_run_bundle(self, load_active_run_bundle(self._state_store))
+            return
 
         runs = [
             WorkflowRun(**payload)
@@ -97,6 +155,7 @@ class WorkflowScheduler:
         self._rebuild_indexes()
 
     def _rebuild_indexes(self) -> None:
+        self._run_graphs = {}
         self._run_workitems, self._workitem_run = build_workitem_indexes(self._workitems)
         self._workitem_discussions = build_discussion_indexes(self._discussions)
         self._run_gate_checks, self._workitem_gate_checks = build_gate_indexes(
@@ -106,8 +165,31 @@ class WorkflowScheduler:
             self._artifacts,
             self._workitem_run,
         )
+        self._status_counters = SchedulerStatusCounters()
+        self._status_counters.observe_bundle(
+            runs=self._runs.values(),
+            workitems=self._workitems.values(),
+            gate_checks=self._gate_checks.values(),
+            artifacts=self._artifacts.values(),
+        )
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        if self._state_store is None:
+            yield
+            return
+        with self._state_store.unit_of_work():
+            yield
+
+    def _require_live_run(self, run_id: str) -> None:
+        # Runs read back from the archive are copies; writing them would split
+        # a run between the archive and the live store.
+        if run_id in self._archive_hydrated_run_ids:
+            raise ValueError(f"workflow run {run_id} is archived and read-only")
 
     def _persist_run(self, run: WorkflowRun) -> None:
+        self._require_live_run(run.id)
+        self._status_counters.observe_run(run)
         if self._state_store is None:
             return
         self._state_store.upsert(
@@ -117,6 +199,7 @@ class WorkflowScheduler:
         )
 
     def _persist_workitem(self, workitem: WorkItem) -> None:
+        self._require_live_run(workitem.workflow_run_id)
         if self._state_store is None:
             return
         self._state_store.upsert(
@@ -126,6 +209,7 @@ class WorkflowScheduler:
         )
 
     def _persist_discussion(self, session: DiscussionSession) -> None:
+        self._require_live_run(session.workflow_run_id)
         if self._state_store is None:
             return
         self._state_store.upsert(
@@ -135,6 +219,7 @@ class WorkflowScheduler:
         )
 
     def _persist_gate(self, gate: GateCheck) -> None:
+        self._require_live_run(gate.workflow_run_id)
         if self._state_store is None:
             return
         self._state_store.upsert(
@@ -144,6 +229,10 @@ class WorkflowScheduler:
         )
 
     def _persist_artifact(self, artifact: Artifact) -> None:
+        if artifact.owner_type == ArtifactOwnerType.WORKFLOW_RUN:
+            self._require_live_run(artifact.owner_id)
+        else:
+            self._require_live_run(self._workitem_run.get(artifact.owner_id, ""))
         if self._state_store is None:
             return
         self._state_store.upsert(
@@ -154,6 +243,7 @@ class WorkflowScheduler:
 
     def persist_run(self, run_id: str) -> WorkflowRun:
         run = self.get_run(run_id)
+        self._require_live_run(run.id)
         run.updated_at = now_utc()
         self._persist_run(run)
         return run
@@ -183,10 +273,60 @@ class WorkflowScheduler:
 
     def get_run(self, run_id: str) -> WorkflowRun:
         run = self._runs.get(run_id)
+        if run is None:
+            run = self._hydrate_run(run_id)
+        if run is None:
+            run = hydrate_archived_run(self, run_id)
         if run is None:
             raise KeyError(f"workflow run not found: {run_id}")
+        if run.status in TERMINAL_RUN_STATUSES and (
+            self._hydration_mode == "lazy" or run.id in self._archive_hydrated_run_ids
+        ):
+            self._touch_terminal_run(run.id)
         return run
 
+    def _hydrate_run(self, run_id: str) -> WorkflowRun | None:
+        if self._hydration_mode != "lazy":
+            return None
+        payload = self._state_store.get(self.RUN_ENTITY_TYPE, run_id)
+        if payload is None:
+            return None
+        run = WorkflowRun(**payload)
+        merge_run_bundle(self, load_run_bundle(self._state_store, runs=[run]))
+        return run
+
+    def _touch_terminal_run(self, run_id: str) -> None:
+        self._hydrated_terminal_runs[run_id] = None
+        self._hydrated_terminal_runs.move_to_end(run_id)
+        while len(self._hydrated_terminal_runs) > self._terminal_run_cache_size:
+            evicted_run_id, _ = self._hydrated_terminal_runs.popitem(last=False)
+            evict_run(self, evicted_run_id)
+            self._archive_hydrated_run_ids.discard(evicted_run_id)
+
+    def _track_terminal_run(self, run: WorkflowRun) -> None:
+        # Resident runs join the terminal LRU when they finish, not only when
+        # hydrated, so lazy mode does not keep every completed run in memory.
+        if self._hydration_mode != "lazy":
+            return
+        if run.status in TERMINAL_RUN_STATUSES:
+            self._touch_terminal_run(run.id)
+        else:
+            self._hydrated_terminal_runs.pop(run.id, None)
+
+    def list_hydrated_run_ids(self) -> list[str]:
+        return list(self._runs.keys())
+
+    def archive_terminal_runs(
+        self,
+        *,
+        retention_seconds: float,
+        limit: int | None = None,
+        now: datetime | None = None,
+    ) -> list[str]:
+        reference = now or now_utc()
+        cutoff = reference - timedelta(seconds=max(0.0, float(retention_seconds)))
+        return archive_terminal_runs_impl(self, cutoff=cutoff, limit=limit)
+
     def add_workitem(
         self,
         run_id: str,
@@ -201,35 +341,55 @@ class WorkflowScheduler:
         discussion_timeout_seconds: int = 120,
         metadata: dict[str, object] | None = None,
     ) -> WorkItem:
-        run = self.get_run(run_id)
-        normalized_depends = depends_on or []
-        self._validate_dependencies(run.id, normalized_depends)
-
-        workitem = WorkItem(
-            workflow_run_id=run.id,
-            module_key=module_key,
-            role=role,
-            assignee_agent=assignee_agent,
-            depends_on=normalized_depends,
-            priority=priority,
-            requires_approval=requires_approval,
-            discussion_budget=discussion_budget,
-            discussion_timeout_seconds=discussion_timeout_seconds,
-            status=WorkItemStatus.PENDING,
-            metadata=metadata or {},
-        )
-        self._workitems[workitem.id] = workitem
-        self._run_workitems[run.id].append(workitem.id)
-        self._workitem_run[workitem.id] = run.id
-        run.updated_at = now_utc()
-        self._persist_workitem(workitem)
-        self._persist_run(run)
-        return workitem
+        with self.unit_of_work():
+            run = self.get_run(run_id)
+            self._require_live_run(run.id)
+            normalized_depends = depends_on or []
+            self._validate_dependencies(run.id, normalized_depends)
+
+            workitem = WorkItem(
+                workflow_run_id=run.id,
+                module_key=module_key,
+                role=role,
+                assignee_agent=assignee_agent,
+                depends_on=normalized_depends,
+                priority=priority,
+                requires_approval=requires_approval,
+                discussion_budget=discussion_budget,
+                discussion_timeout_seconds=discussion_timeout_seconds,
+                status=WorkItemStatus.PENDING,
+                metadata=metadata or {},
+            )
+            self._workitems[workitem.id] = workitem
+            self._run_workitems[run.id].append(workitem.id)
+            self._workitem_run[workitem.id] = run.id
+            graph = self._run_graphs.get(run.id)
+            if graph is not None:
+                graph.add(workitem)
+            self._status_counters.observe_workitem(workitem)
+            run.updated_at = now_utc()
+            self._persist_workitem(workitem)
+            self._persist_run(run)
+            return workitem
 
     def get_workitem(self, workitem_id: str) -> WorkItem:
         workitem = self._workitems.get(workitem_id)
+        if workitem is None and self._hydration_mode == "lazy":
+            payload = self._state_store.get(self.WORKITEM_ENTITY_TYPE, workitem_id)
+            if payload is not None:
+                run_id = str(payload.get("workflow_run_id", ""))
+                if run_id not in self._runs:
+                    self._hydrate_run(run_id)
+                workitem = self._workitems.get(workitem_id)
         if workitem is None:
             raise KeyError(f"workitem not found: {workitem_id}")
+        run = self._runs.get(workitem.workflow_run_id)
+        if (
+            self._hydration_mode == "lazy"
+            and run is not None
+            and run.status in TERMINAL_RUN_STATUSES
+        ):
+            self._touch_terminal_run(run.id)
         return workitem
 
     def list_workitems(self, run_id: str) -> list[WorkItem]:
@@ -252,6 +412,7 @@ class WorkflowScheduler:
     ) -> GateCheck:
         item = self.get_workitem(workitem_id)
         run_id = item.workflow_run_id
+        self._require_live_run(run_id)
         attempt = len(self._workitem_gate_checks[workitem_id]) + 1
         gate = GateCheck(
             workflow_run_id=run_id,
@@ -266,6 +427,7 @@ class WorkflowScheduler:
         self._gate_checks[gate.id] = gate
         self._run_gate_checks[run_id].append(gate.id)
         self._workitem_gate_checks[workitem_id].append(gate.id)
+        self._status_counters.observe_gate_check(gate)
         self._persist_gate(gate)
         return gate
 
@@ -284,6 +446,7 @@ class WorkflowScheduler:
         checksum: str | None = None,
     ) -> Artifact:
         item = self.get_workitem(workitem_id)
+        self._require_live_run(item.workflow_run_id)
         artifact = Artifact(
             owner_type=ArtifactOwnerType.WORKITEM,
             owner_id=workitem_id,
@@ -296,6 +459,7 @@ class WorkflowScheduler:
         self._artifacts[artifact.id] = artifact
         self._run_artifacts[item.workflow_run_id].append(artifact.id)
         self._workitem_artifacts[workitem_id].append(artifact.id)
+        self._status_counters.observe_artifact(artifact)
         self._persist_artifact(artifact)
         return artifact
 
@@ -309,7 +473,8 @@ class WorkflowScheduler:
         created_by: str,
         checksum: str | None = None,
     ) -> Artifact:
-        _ = self.get_run(run_id)
+        run = self.get_run(run_id)
+        self._require_live_run(run.id)
         artifact = Artifact(
             owner_type=ArtifactOwnerType.WORKFLOW_RUN,
             owner_id=run_id,
@@ -321,6 +486,7 @@ class WorkflowScheduler:
         )
         self._artifacts[artifact.id] = artifact
         self._run_artifacts[run_id].append(artifact.id)
+        self._status_counters.observe_artifact(artifact)
         self._persist_artifact(artifact)
         return artifact
 
@@ -329,79 +495,83 @@ class WorkflowScheduler:
         return [self._artifacts[item_id] for item_id in self._run_artifacts[run_id]]
 
     def get_metrics(self) -> dict[str, object]:
-        return build_scheduler_metrics(
-            runs=self._runs,
-            workitems=self._workitems,
-            gate_checks=self._gate_checks,
-            artifacts=self._artifacts,
-        )
+        if self._hydration_mode == "lazy" and self._state_store is not None:
+            return build_store_scheduler_metrics(self._state_store)
+        return self._status_counters.snapshot()
 
     def tick(self, run_id: str) -> list[WorkItem]:
-        run = self.get_run(run_id)
-        if run.status == WorkflowRunStatus.CANCELED:
-            return []
-        ready: list[WorkItem] = []
-        pending_ready = select_pending_ready_for_transition(
-            run_workitem_ids=self._run_workitems[run_id],
-            workitems=self._workitems,
-        )
-        for item in pending_ready:
-            if item.requires_approval:
-                item.status = WorkItemStatus.WAITING_APPROVAL
-            else:
-                item.status = WorkItemStatus.READY
-            item.updated_at = now_utc()
-            self._persist_workitem(item)
-            if item.status == WorkItemStatus.READY:
-                ready.append(item)
-        self._refresh_run_status(run)
-        return sorted(ready, key=lambda item: (item.priority, item.created_at))
+        with self.unit_of_work():
+            run = self.get_run(run_id)
+            self._require_live_run(run.id)
+            if run.status == WorkflowRunStatus.CANCELED:
+                return []
+            ready: list[WorkItem] = []
+            for item in self._dependency_graph(run.id).pending_ready_items():
+                if item.requires_approval:
+                    self._set_workitem_status(item, WorkItemStatus.WAITING_APPROVAL)
+                else:
+                    self._set_workitem_status(item, WorkItemStatus.READY)
+                item.updated_at = now_utc()
+                self._persist_workitem(item)
+                if item.status == WorkItemStatus.READY:
+                    ready.append(item)
+            self._refresh_run_status(run)
+            return sorted(ready, key=lambda item: (item.priority, item.created_at))
 
     def start_workitem(self, workitem_id: str) -> WorkItem:
-        item = self.get_workitem(workitem_id)
-        run = self.get_run(self._workitem_run[workitem_id])
-        if run.status == WorkflowRunStatus.CANCELED:
-            raise ValueError(f"workflow run {run.id} is canceled")
-        if item.status != WorkItemStatus.READY:
-            raise ValueError(f"workitem {workitem_id} is not ready")
-        item.status = WorkItemStatus.RUNNING
-        item.started_at = now_utc()
-        item.updated_at = now_utc()
-        self._persist_workitem(item)
-        self._refresh_run_status(run)
-        return item
+        with self.unit_of_work():
+            item = self.get_workitem(workitem_id)
+            run = self.get_run(self._workitem_run[workitem_id])
+            self._require_live_run(run.id)
+            if run.status == WorkflowRunStatus.CANCELED:
+                raise ValueError(f"workflow run {run.id} is canceled")
+            if item.status != WorkItemStatus.READY:
+                raise ValueError(f"workitem {workitem_id} is not ready")
+            self._set_workitem_status(item, WorkItemStatus.RUNNING)
+            item.started_at = now_utc()
+            item.updated_at = now_utc()
+            self._persist_workitem(item)
+            self._refresh_run_status(run)
+            return item
 
     def complete_workitem(self, workitem_id: str, *, success: bool) -> WorkItem:
-        item = self.get_workitem(workitem_id)
-        run = self.get_run(self._workitem_run[workitem_id])
-        if run.status == WorkflowRunStatus.CANCELED:
-            raise ValueError(f"workflow run {run.id} is canceled")
-        if item.status not in {WorkItemStatus.RUNNING, WorkItemStatus.READY}:
-            raise ValueError(f"workitem {workitem_id} is not running")
-        if item.started_at is None:
-            item.started_at = now_utc()
-        item.status = WorkItemStatus.SUCCEEDED if success else WorkItemStatus.FAILED
-        item.finished_at = now_utc()
-        item.updated_at = now_utc()
-        self._persist_workitem(item)
-        self._refresh_run_status(run)
-        return item
+        with self.unit_of_work():
+            item = self.get_workitem(workitem_id)
+            run = self.get_run(self._workitem_run[workitem_id])
+            self._require_live_run(run.id)
+            if run.status == WorkflowRunStatus.CANCELED:
+                raise ValueError(f"workflow run {run.id} is canceled")
+            if item.status not in {WorkItemStatus.RUNNING, WorkItemStatus.READY}:
+                raise ValueError(f"workitem {workitem_id} is not running")
+            if item.started_at is None:
+                item.started_at = now_utc()
+            self._set_workitem_status(
+                item,
+                WorkItemStatus.SUCCEEDED if success else WorkItemStatus.FAILED,
+            )
+            item.finished_at = now_utc()
+            item.updated_at = now_utc()
+            self._persist_workitem(item)
+            self._refresh_run_status(run)
+            return item
 
     def approve_workitem(self, workitem_id: str, *, approved_by: str) -> WorkItem:
-        item = self.get_workitem(workitem_id)
-        run = self.get_run(self._workitem_run[workitem_id])
-        if run.status == WorkflowRunStatus.CANCELED:
-            raise ValueError(f"workflow run {run.id} is canceled")
-        if not item.requires_approval:
-            raise ValueError(f"workitem {workitem_id} does not require approval")
-        if item.status != WorkItemStatus.WAITING_APPROVAL:
-            raise ValueError(f"workitem {workitem_id} is not waiting approval")
-        item.status = WorkItemStatus.READY
-        item.updated_at = now_utc()
-        item.metadata["approved_by"] = approved_by
-        self._persist_workitem(item)
-        self._refresh_run_status(run)
-        return item
+        with self.unit_of_work():
+            item = self.get_workitem(workitem_id)
+            run = self.get_run(self._workitem_run[workitem_id])
+            self._require_live_run(run.id)
+            if run.status == WorkflowRunStatus.CANCELED:
+                raise ValueError(f"workflow run {run.id} is canceled")
+            if not item.requires_approval:
+                raise ValueError(f"workitem {workitem_id} does not require approval")
+            if item.status != WorkItemStatus.WAITING_APPROVAL:
+                raise ValueError(f"workitem {workitem_id} is not waiting approval")
+            self._set_workitem_status(item, WorkItemStatus.READY)
+            item.updated_at = now_utc()
+            item.metadata["approved_by"] = approved_by
+            self._persist_workitem(item)
+            self._refresh_run_status(run)
+            return item
 
     def mark_needs_discussion(
         self,
@@ -413,15 +583,16 @@ class WorkflowScheduler:
         impact: str | None = None,
         fingerprint: str | None = None,
     ) -> DiscussionSession:
-        return mark_needs_discussion_impl(
-            self,
-            workitem_id,
-            question=question,
-            options=options,
-            recommendation=recommendation,
-            impact=impact,
-            fingerprint=fingerprint,
-        )
+        with self.unit_of_work():
+            return mark_needs_discussion_impl(
+                self,
+                workitem_id,
+                question=question,
+                options=options,
+                recommendation=recommendation,
+                impact=impact,
+                fingerprint=fingerprint,
+            )
 
     def resolve_discussion(
         self,
@@ -431,54 +602,107 @@ class WorkflowScheduler:
         resolved_by_role: str,
         discussion_id: str | None = None,
     ) -> DiscussionSession:
-        return resolve_discussion_impl(
-            self,
-            workitem_id,
-            decision=decision,
-            resolved_by_role=resolved_by_role,
-            discussion_id=discussion_id,
-        )
+        with self.unit_of_work():
+            return resolve_discussion_impl(
+                self,
+                workitem_id,
+                decision=decision,
+                resolved_by_role=resolved_by_role,
+                discussion_id=discussion_id,
+            )
 
     def update_workitem_dependencies(
         self,
         workitem_id: str,
         dependency_ids: list[str],
     ) -> WorkItem:
-        item = self.get_workitem(workitem_id)
-        run_id = self._workitem_run[workitem_id]
-        run = self.get_run(run_id)
-        if run.status == WorkflowRunStatus.CANCELED:
-            raise ValueError(f"workflow run {run.id} is canceled")
-        self._validate_dependencies(run_id, dependency_ids)
-        normalized = normalize_dependency_update_ids(
-            workitem_id=item.id,
-            dependency_ids=dependency_ids,
-        )
-        item.depends_on = normalized
-        item.updated_at = now_utc()
-        self._persist_workitem(item)
-        self._refresh_run_status(run)
-        return item
+        with self.unit_of_work():
+            item = self.get_workitem(workitem_id)
+            run_id = self._workitem_run[workitem_id]
+            run = self.get_run(run_id)
+            self._require_live_run(run.id)
+            if run.status == WorkflowRunStatus.CANCELED:
+                raise ValueError(f"workflow run {run.id} is canceled")
+            self._validate_dependencies(run_id, dependency_ids)
+            normalized = normalize_dependency_update_ids(
+                workitem_id=item.id,
+                dependency_ids=dependency_ids,
+            )
+            previous_dependencies = list(item.depends_on)
+            item.depends_on = normalized
+            item.updated_at = now_utc()
+            graph = self._run_graphs.get(run_id)
+            if graph is not None:
+                graph.on_dependencies_change(item, previous_dependencies)
+            self._persist_workitem(item)
+            self._refresh_run_status(run)
+            return item
 
     def mark_workitem_skipped(self, workitem_id: str, *, reason: str) -> WorkItem:
-        item = self.get_workitem(workitem_id)
-        if item.status in {WorkItemStatus.SUCCEEDED, WorkItemStatus.FAILED, WorkItemStatus.SKIPPED}:
+        with self.unit_of_work():
+            item = self.get_workitem(workitem_id)
+            self._require_live_run(item.workflow_run_id)
+            if item.status in {WorkItemStatus.SUCCEEDED, WorkItemStatus.FAILED, WorkItemStatus.SKIPPED}:
+                return item
+            self._set_workitem_status(item, WorkItemStatus.SKIPPED)
+            if item.started_at is None:
+                item.started_at = now_utc()
+            item.finished_at = now_utc()
+            item.updated_at = now_utc()
+            item.metadata["skip_reason"] = reason
+            self._persist_workitem(item)
+            run = self.get_run(self._workitem_run[workitem_id])
+            self._refresh_run_status(run)
             return item
-        item.status = WorkItemStatus.SKIPPED
-        if item.started_at is None:
-            item.started_at = now_utc()
-        item.finished_at = now_utc()
-        item.updated_at = now_utc()
-        item.metadata["skip_reason"] = reason
-        self._persist_workitem(item)
-        run = self.get_run(self._workitem_run[workitem_id])
-        self._refresh_run_status(run)
-        return item
+
+    def list_ready_workitems(self, run_id: str) -> list[WorkItem]:
+        run = self.get_run(run_id)
+        return self._dependency_graph(run.id).ready_items()
+
+    def peek_ready_workitem(self, run_id: str) -> WorkItem | None:
+        run = self.get_run(run_id)
+        return self._dependency_graph(run.id).peek_ready()
+
+    def has_runnable_workitems(self, run_id: str) -> bool:
+        run = self.get_run(run_id)
+        return self._dependency_graph(run.id).has_runnable()
+
+    def list_dependent_workitems(self, workitem_id: str) -> list[WorkItem]:
+        item = self.get_workitem(workitem_id)
+        graph = self._dependency_graph(item.workflow_run_id)
+        return [self._workitems[item_id] for item_id in graph.dependent_ids(item.id)]
+
+    def list_active_run_ids(self) -> list[str]:
+        return [
+            run.id
+            for run in self._runs.values()
+            if run.status not in TERMINAL_RUN_STATUSES
+        ]
+
+    def requeue_running_workitems(self, run_id: str, *, reason: str) -> list[WorkItem]:
+        with self.unit_of_work():
+            run = self.get_run(run_id)
+            self._require_live_run(run.id)
+            if run.status == WorkflowRunStatus.CANCELED:
+                return []
+            requeued: list[WorkItem] = []
+            for item in self.list_workitems(run.id):
+                if item.status != WorkItemStatus.RUNNING:
+                    continue
+                self._set_workitem_status(item, WorkItemStatus.READY)
+                item.updated_at = now_utc()
+                item.metadata["requeue_reason"] = reason
+                self._persist_workitem(item)
+                requeued.append(item)
+            if requeued:
+                self._refresh_run_status(run)
+            return requeued
 
     def count_workitems_by_status(self, run_id: str, status: WorkItemStatus) -> int:
-        return sum(
-            1 for item in self.list_workitems(run_id) if item.status == status
-        )
+        run = self.get_run(run_id)
+        if run.id in self._archive_hydrated_run_ids:
+            return sum(1 for item in self.list_workitems(run.id) if item.status == status)
+        return self._status_counters.run_workitem_counts(run.id)[status]
 
     def list_workitem_ids_by_status(self, run_id: str, status: WorkItemStatus) -> list[str]:
         return [item.id for item in self.list_workitems(run_id) if item.status == status]
@@ -491,49 +715,51 @@ class WorkflowScheduler:
         reason: str | None = None,
         skip_non_terminal_workitems: bool = True,
     ) -> tuple[WorkflowRunStatus, WorkflowRunStatus, bool, list[str]]:
-        run = self.get_run(run_id)
-        previous_status = run.status
-        if run.status in {
-            WorkflowRunStatus.SUCCEEDED,
-            WorkflowRunStatus.FAILED,
-            WorkflowRunStatus.CANCELED,
-        }:
-            return previous_status, run.status, False, []
-
-        skipped_workitem_ids: list[str] = []
-        if skip_non_terminal_workitems:
-            for item in self.list_workitems(run_id):
-                if item.status in {
-                    WorkItemStatus.PENDING,
-                    WorkItemStatus.READY,
-                    WorkItemStatus.RUNNING,
-                    WorkItemStatus.NEEDS_DISCUSSION,
-                    WorkItemStatus.WAITING_APPROVAL,
-                }:
-                    item.status = WorkItemStatus.SKIPPED
-                    if item.started_at is None:
-                        item.started_at = now_utc()
-                    item.finished_at = now_utc()
-                    item.updated_at = now_utc()
-                    item.metadata["skip_reason"] = "workflow_run_interrupted"
-                    if requested_by:
-                        item.metadata["interrupt_requested_by"] = requested_by
-                    if reason:
-                        item.metadata["interrupt_reason"] = reason
-                    self._persist_workitem(item)
-                    skipped_workitem_ids.append(item.id)
-
-        run.status = WorkflowRunStatus.CANCELED
-        run.updated_at = now_utc()
-        run.metadata["interrupt"] = {
-            "requested_by": requested_by,
-            "reason": reason,
-            "applied": True,
-            "skip_non_terminal_workitems": bool(skip_non_terminal_workitems),
-            "skipped_workitem_ids": list(skipped_workitem_ids),
-        }
-        self._persist_run(run)
-        return previous_status, run.status, True, skipped_workitem_ids
+        with self.unit_of_work():
+            run = self.get_run(run_id)
+            previous_status = run.status
+            if run.status in {
+                WorkflowRunStatus.SUCCEEDED,
+                WorkflowRunStatus.FAILED,
+                WorkflowRunStatus.CANCELED,
+            }:
+                return previous_status, run.status, False, []
+
+            skipped_workitem_ids: list[str] = []
+            if skip_non_terminal_workitems:
+                for item in self.list_workitems(run_id):
+                    if item.status in {
+                        WorkItemStatus.PENDING,
+                        WorkItemStatus.READY,
+                        WorkItemStatus.RUNNING,
+                        WorkItemStatus.NEEDS_DISCUSSION,
+                        WorkItemStatus.WAITING_APPROVAL,
+                    }:
+                        self._set_workitem_status(item, WorkItemStatus.SKIPPED)
+                        if item.started_at is None:
+                            item.started_at = now_utc()
+                        item.finished_at = now_utc()
+                        item.updated_at = now_utc()
+                        item.metadata["skip_reason"] = "workflow_run_interrupted"
+                        if requested_by:
+                            item.metadata["interrupt_requested_by"] = requested_by
+                        if reason:
+                            item.metadata["interrupt_reason"] = reason
+                        self._persist_workitem(item)
+                        skipped_workitem_ids.append(item.id)
+
+            run.status = WorkflowRunStatus.CANCELED
+            run.updated_at = now_utc()
+            run.metadata["interrupt"] = {
+                "requested_by": requested_by,
+                "reason": reason,
+                "applied": True,
+                "skip_non_terminal_workitems": bool(skip_non_terminal_workitems),
+                "skipped_workitem_ids": list(skipped_workitem_ids),
+            }
+            self._persist_run(run)
+            self._track_terminal_run(run)
+            return previous_status, run.status, True, skipped_workitem_ids
 
     def restart_run(
         self,
@@ -543,39 +769,40 @@ class WorkflowScheduler:
         reason: str | None = None,
         copy_decomposition: bool = True,
     ) -> tuple[WorkflowRun, bool]:
-        source_run = self.get_run(run_id)
-        if source_run.status not in {
-            WorkflowRunStatus.FAILED,
-            WorkflowRunStatus.SUCCEEDED,
-            WorkflowRunStatus.CANCELED,
-        }:
-            raise ValueError(
-                "restart is only allowed for terminal workflow runs: "
-                "failed/succeeded/canceled"
+        with self.unit_of_work():
+            source_run = self.get_run(run_id)
+            if source_run.status not in {
+                WorkflowRunStatus.FAILED,
+                WorkflowRunStatus.SUCCEEDED,
+                WorkflowRunStatus.CANCELED,
+            }:
+                raise ValueError(
+                    "restart is only allowed for terminal workflow runs: "
+                    "failed/succeeded/canceled"
+                )
+
+            restarted_run = self.create_run(
+                project_id=source_run.project_id,
+                task_id=source_run.task_id,
+                template_id=source_run.template_id,
+                requested_by=requested_by or source_run.requested_by,
+                summary=source_run.summary,
             )
-
-        restarted_run = self.create_run(
-            project_id=source_run.project_id,
-            task_id=source_run.task_id,
-            template_id=source_run.template_id,
-            requested_by=requested_by or source_run.requested_by,
-            summary=source_run.summary,
-        )
-        restart_metadata: dict[str, object] = {
-            "source_run_id": source_run.id,
-            "requested_by": requested_by,
-            "reason": reason,
-            "copied_decomposition": False,
-        }
-        if copy_decomposition:
-            chief_decomposition = source_run.metadata.get("chief_decomposition")
-            if isinstance(chief_decomposition, dict):
-                restarted_run.metadata["chief_decomposition"] = deepcopy(chief_decomposition)
-                restart_metadata["copied_decomposition"] = True
-
-        restarted_run.metadata["restart"] = restart_metadata
-        self._persist_run(restarted_run)
-        return restarted_run, bool(restart_metadata["copied_decomposition"])
+            restart_metadata: dict[str, object] = {
+                "source_run_id": source_run.id,
+                "requested_by": requested_by,
+                "reason": reason,
+                "copied_decomposition": False,
+            }
+            if copy_decomposition:
+                chief_decomposition = source_run.metadata.get("chief_decomposition")
+                if isinstance(chief_decomposition, dict):
+                    restarted_run.metadata["chief_decomposition"] = deepcopy(chief_decomposition)
+                    restart_metadata["copied_decomposition"] = True
+
+            restarted_run.metadata["restart"] = restart_metadata
+            self._persist_run(restarted_run)
+            return restarted_run, bool(restart_metadata["copied_decomposition"])
 
     def _save_discussion(self, session: DiscussionSession) -> None:
         self._discussions[session.id] = session
@@ -612,14 +839,34 @@ class WorkflowScheduler:
             self._workitem_run,
         )
 
-    def _dependencies_satisfied(self, item: WorkItem) -> bool:
-        return dependencies_satisfied(item, self._workitems)
+    def _dependency_graph(self, run_id: str) -> RunDependencyGraph:
+        graph = self._run_graphs.get(run_id)
+        if graph is None:
+            graph = RunDependencyGraph.build(
+                self._workitems[item_id] for item_id in self._run_workitems[run_id]
+            )
+            self._run_graphs[run_id] = graph
+        return graph
+
+    def _set_workitem_status(self, item: WorkItem, status: WorkItemStatus) -> None:
+        previous = item.status
+        item.status = status
+        if previous == status:
+            return
+        self._status_counters.observe_workitem(item)
+        graph = self._run_graphs.get(item.workflow_run_id)
+        if graph is not None:
+            graph.on_status_change(item, previous)
+        for listener in self._transition_listeners:
+            listener(item, previous)
 
     def _refresh_run_status(self, run: WorkflowRun) -> None:
         if run.status == WorkflowRunStatus.CANCELED:
             self._persist_run(run)
             return
-        items = self.list_workitems(run.id)
-        run.status = derive_run_status(items)
+        run.status = derive_run_status_from_counts(
+            self._status_counters.run_workitem_counts(run.id)
+        )
         run.updated_at = now_utc()
         self._persist_run(run)
+        self._track_terminal_run(run)
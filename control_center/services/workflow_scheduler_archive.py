@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from control_center.models import WorkflowRun
+from control_center.services.workflow_run_archive import (
+    WorkflowRunArchive,
+    split_bundle_by_run,
+)
+from control_center.services.workflow_scheduler_hydration import (
+    TERMINAL_RUN_STATUSES,
+    RunStateBundle,
+    evict_run,
+    load_run_bundle,
+    merge_run_bundle,
+)
+
+
+def _require_archive(scheduler) -> WorkflowRunArchive:
+    archive = scheduler._run_archive
+    if archive is None:
+        raise RuntimeError("workflow run archive is not configured")
+    return archive
+
+
+def _select_store_runs(scheduler, *, cutoff: datetime, limit: int) -> list[WorkflowRun]:
+    return [
+        WorkflowRun(**payload)
+        for payload in scheduler._state_store.query(
+            scheduler.RUN_ENTITY_TYPE,
+            status=[status.value for status in TERMINAL_RUN_STATUSES],
+            updated_before=cutoff,
+            limit=limit,
+        )
+    ]
+
+
+def _select_memory_runs(scheduler, *, cutoff: datetime, limit: int) -> list[WorkflowRun]:
+    candidates = [
+        run
+        for run in scheduler._runs.values()
+        if run.status in TERMINAL_RUN_STATUSES
+        and run.updated_at < cutoff
+        and run.id not in scheduler._archive_hydrated_run_ids
+    ]
+    candidates.sort(key=lambda run: run.created_at)
+    return candidates[:limit]
+
+
+def _memory_run_bundle(scheduler, runs: list[WorkflowRun]) -> RunStateBundle:
+    bundle = RunStateBundle(runs=list(runs))
+    for run in runs:
+        for workitem_id in scheduler._run_workitems.get(run.id, []):
+            bundle.workitems.append(scheduler._workitems[workitem_id])
+            bundle.discussions.extend(
+                scheduler._discussions[discussion_id]
+                for discussion_id in scheduler._workitem_discussions.get(workitem_id, [])
+            )
+        bundle.gate_checks.extend(
+            scheduler._gate_checks[gate_id]
+            for gate_id in scheduler._run_gate_checks.get(run.id, [])
+        )
+        bundle.artifacts.extend(
+            scheduler._artifacts[artifact_id]
+            for artifact_id in scheduler._run_artifacts.get(run.id, [])
+        )
+    return bundle
+
+
+def _delete_bundle_from_store(scheduler, bundle: RunStateBundle) -> None:
+    state_store = scheduler._state_store
+    if state_store is None:
+        return
+    with state_store.unit_of_work():
+        state_store.delete(
+            scheduler.ARTIFACT_ENTITY_TYPE,
+            [artifact.id for artifact in bundle.artifacts],
+        )
+        state_store.delete(
+            scheduler.GATE_ENTITY_TYPE,
+            [gate.id for gate in bundle.gate_checks],
+        )
+        state_store.delete(
+            scheduler.DISCUSSION_ENTITY_TYPE,
+            [session.id for session in bundle.discussions],
+        )
+        state_store.delete(
+            scheduler.WORKITEM_ENTITY_TYPE,
+            [item.id for item in bundle.workitems],
+        )
+        state_store.delete(
+            scheduler.RUN_ENTITY_TYPE,
+            [run.id for run in bundle.runs],
+        )
+
+
+def archive_terminal_runs(
+    scheduler,
+    *,
+    cutoff: datetime,
+    limit: int | None = None,
+    batch_size: int = 200,
+) -> list[str]:
+    archive = _require_archive(scheduler)
+    batch_size = max(1, int(batch_size))
+    remaining = None if limit is None else max(0, int(limit))
+    archived: list[str] = []
+    while remaining is None or remaining > 0:
+        take = batch_size if remaining is None else min(batch_size, remaining)
+        if scheduler._state_store is not None:
+            runs = _select_store_runs(scheduler, cutoff=cutoff, limit=take)
+            bundle = load_run_bundle(scheduler._state_store, runs=runs)
+        else:
+            runs = _select_memory_runs(scheduler, cutoff=cutoff, limit=take)
+            bundle = _memory_run_bundle(scheduler, runs)
+        if not runs:
+            break
+
+        # The archive commit lands before the live delete, so a crash in between
+        # leaves a duplicate that the next pass skips rather than a lost run.
+        archive.append(split_bundle_by_run(bundle).values())
+        _delete_bundle_from_store(scheduler, bundle)
+        for run in runs:
+            evict_run(scheduler, run.id)
+            scheduler._hydrated_terminal_runs.pop(run.id, None)
+            archived.append(run.id)
+        if remaining is not None:
+            remaining -= len(runs)
+        if len(runs) < take:
+            break
+    return archived
+
+
+def hydrate_archived_run(scheduler, run_id: str) -> WorkflowRun | None:
+    archive = scheduler._run_archive
+    if archive is None:
+        return None
+    bundle = archive.get(run_id)
+    if bundle is None:
+        return None
+    # Archived runs are read-only copies that no longer count as live state.
+    merge_run_bundle(scheduler, bundle, observe_counters=False)
+    scheduler._archive_hydrated_run_ids.add(run_id)
+    return bundle.runs[0]
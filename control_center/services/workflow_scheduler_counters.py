@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Hashable, Iterable
+from enum import Enum
+
+from control_center.models import Artifact, GateCheck, WorkItem, WorkItemStatus, WorkflowRun
+
+
+class _LabelCounts:
+    def __init__(self, *, per_run: bool = False) -> None:
+        self._labels: dict[str, tuple[Hashable, str | None]] = {}
+        self._totals: Counter[Hashable] = Counter()
+        self._per_run: dict[str, Counter[Hashable]] | None = {} if per_run else None
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def set(self, entity_id: str, label: Hashable, run_id: str | None = None) -> None:
+        previous = self._labels.get(entity_id)
+        if previous == (label, run_id):
+            return
+        if previous is not None:
+            self.discard(entity_id)
+        self._labels[entity_id] = (label, run_id)
+        self._totals[label] += 1
+        if self._per_run is not None and run_id is not None:
+            self._per_run.setdefault(run_id, Counter())[label] += 1
+
+    def discard(self, entity_id: str) -> None:
+        previous = self._labels.pop(entity_id, None)
+        if previous is None:
+            return
+        label, run_id = previous
+        _decrement(self._totals, label)
+        if self._per_run is not None and run_id is not None:
+            run_counts = self._per_run.get(run_id)
+            if run_counts is not None:
+                _decrement(run_counts, label)
+
+    def discard_run(self, run_id: str) -> None:
+        if self._per_run is not None:
+            self._per_run.pop(run_id, None)
+
+    def run_counts(self, run_id: str) -> Counter[Hashable]:
+        if self._per_run is None:
+            return Counter()
+        return self._per_run.get(run_id) or Counter()
+
+    def totals(self) -> dict[str, int]:
+        return {_label_key(label): count for label, count in self._totals.items()}
+
+
+def _decrement(counts: Counter[Hashable], label: Hashable) -> None:
+    counts[label] -= 1
+    if counts[label] <= 0:
+        del counts[label]
+
+
+def _label_key(label: Hashable) -> str:
+    return label.value if isinstance(label, Enum) else str(label)
+
+
+class SchedulerStatusCounters:
+    def __init__(self) -> None:
+        self._runs = _LabelCounts()
+        self._workitems = _LabelCounts(per_run=True)
+        self._gate_checks = _LabelCounts()
+        self._artifacts = _LabelCounts()
+
+    def observe_run(self, run: WorkflowRun) -> None:
+        self._runs.set(run.id, run.status)
+
+    def observe_workitem(self, item: WorkItem) -> None:
+        self._workitems.set(item.id, item.status, item.workflow_run_id)
+
+    def observe_gate_check(self, gate: GateCheck) -> None:
+        self._gate_checks.set(gate.id, gate.status)
+
+    def observe_artifact(self, artifact: Artifact) -> None:
+        self._artifacts.set(artifact.id, artifact.artifact_type)
+
+    def observe_bundle(
+        self,
+        *,
+        runs: Iterable[WorkflowRun] = (),
+        workitems: Iterable[WorkItem] = (),
+        gate_checks: Iterable[GateCheck] = (),
+        artifacts: Iterable[Artifact] = (),
+    ) -> None:
+        for run in runs:
+            self.observe_run(run)
+        for item in workitems:
+            self.observe_workitem(item)
+        for gate in gate_checks:
+            self.observe_gate_check(gate)
+        for artifact in artifacts:
+            self.observe_artifact(artifact)
+
+    def forget_run(
+        self,
+        run_id: str,
+        *,
+        workitem_ids: Iterable[str] = (),
+        gate_ids: Iterable[str] = (),
+        artifact_ids: Iterable[str] = (),
+    ) -> None:
+        self._runs.discard(run_id)
+        for workitem_id in workitem_ids:
+            self._workitems.discard(workitem_id)
+        self._workitems.discard_run(run_id)
+        for gate_id in gate_ids:
+            self._gate_checks.discard(gate_id)
+        for artifact_id in artifact_ids:
+            self._artifacts.discard(artifact_id)
+
+    def run_workitem_counts(self, run_id: str) -> Counter[WorkItemStatus]:
+        return self._workitems.run_counts(run_id)  # type: ignore[return-value]
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "total_runs": len(self._runs),
+            "run_status_counts": self._runs.totals(),
+            "total_workitems": len(self._workitems),
+            "workitem_status_counts": self._workitems.totals(),
+            "total_gate_checks": len(self._gate_checks),
+            "gate_status_counts": self._gate_checks.totals(),
+            "total_artifacts": len(self._artifacts),
+            "artifact_type_counts": self._artifacts.totals(),
+        }
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from control_center.models import WorkItem, WorkItemStatus
+from control_center.models import WorkItem
 
 
 def validate_dependency_ids(
@@ -17,36 +17,6 @@ def validate_dependency_ids(
             raise ValueError(f"dependency workitem {dependency_id} is in another workflow run")
 
 
-def dependencies_satisfied(
-    item: WorkItem,
-    workitems: dict[str, WorkItem],
-) -> bool:
-    if not item.depends_on:
-        return True
-    for dependency_id in item.depends_on:
-        dependency = workitems.get(dependency_id)
-        if dependency is None:
-            return False
-        if dependency.status not in {WorkItemStatus.SUCCEEDED, WorkItemStatus.SKIPPED}:
-            return False
-    return True
-
-
-def select_pending_ready_for_transition(
-    *,
-    run_workitem_ids: list[str],
-    workitems: dict[str, WorkItem],
-) -> list[WorkItem]:
-    selected: list[WorkItem] = []
-    for item_id in run_workitem_ids:
-        item = workitems[item_id]
-        if item.status != WorkItemStatus.PENDING:
-            continue
-        if dependencies_satisfied(item, workitems):
-            selected.append(item)
-    return selected
-
-
 def normalize_dependency_update_ids(
     *,
     workitem_id: str,
@@ -17,12 +17,13 @@ def mark_needs_discussion(
     fingerprint: str | None = None,
 ) -> DiscussionSession:
     item = scheduler.get_workitem(workitem_id)
+    scheduler._require_live_run(item.workflow_run_id)
     if item.status not in {WorkItemStatus.RUNNING, WorkItemStatus.READY}:
         raise ValueError(f"workitem {workitem_id} is not executable for discussion")
 
     next_round = item.discussion_used + 1
     if next_round > item.discussion_budget:
-        item.status = WorkItemStatus.FAILED
+        scheduler._set_workitem_status(item, WorkItemStatus.FAILED)
         item.updated_at = now_utc()
         item.metadata["discussion_error"] = "discussion_budget_exhausted"
         scheduler._persist_workitem(item)
@@ -50,7 +51,7 @@ def mark_needs_discussion(
         if isinstance(value, str)
     ]
     if fingerprint and fingerprint in fingerprints:
-        item.status = WorkItemStatus.FAILED
+        scheduler._set_workitem_status(item, WorkItemStatus.FAILED)
         item.updated_at = now_utc()
         item.metadata["discussion_error"] = "discussion_loop_detected"
         scheduler._persist_workitem(item)
@@ -73,7 +74,7 @@ def mark_needs_discussion(
         return exhausted
 
     item.discussion_used = next_round
-    item.status = WorkItemStatus.NEEDS_DISCUSSION
+    scheduler._set_workitem_status(item, WorkItemStatus.NEEDS_DISCUSSION)
     item.updated_at = now_utc()
     if fingerprint:
         fingerprints.append(fingerprint)
@@ -108,6 +109,7 @@ def resolve_discussion(
     discussion_id: str | None = None,
 ) -> DiscussionSession:
     item = scheduler.get_workitem(workitem_id)
+    scheduler._require_live_run(item.workflow_run_id)
     if item.status != WorkItemStatus.NEEDS_DISCUSSION:
         raise ValueError(f"workitem {workitem_id} is not waiting discussion")
 
@@ -117,7 +119,7 @@ def resolve_discussion(
     if now > timeout_at:
         session.status = DiscussionStatus.TIMEOUT
         session.updated_at = now
-        item.status = WorkItemStatus.FAILED
+        scheduler._set_workitem_status(item, WorkItemStatus.FAILED)
         item.updated_at = now
         item.metadata["discussion_error"] = "discussion_timeout"
         scheduler._persist_discussion(session)
@@ -131,7 +133,7 @@ def resolve_discussion(
     session.resolved_by_role = resolved_by_role
     session.updated_at = now
 
-    item.status = WorkItemStatus.READY
+    scheduler._set_workitem_status(item, WorkItemStatus.READY)
     item.updated_at = now
     item.metadata["discussion_decision"] = decision
     item.metadata["discussion_resolved_by"] = resolved_by_role
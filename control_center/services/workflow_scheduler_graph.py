@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import heapq
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime
+from itertools import count
+
+from control_center.models import WorkItem, WorkItemStatus
+
+SATISFIED_STATUSES = frozenset({WorkItemStatus.SUCCEEDED, WorkItemStatus.SKIPPED})
+
+
+class RunDependencyGraph:
+    __slots__ = (
+        "_items",
+        "_order",
+        "_dependents",
+        "_unsatisfied",
+        "_satisfied",
+        "_pending_ready",
+        "_ready_heap",
+        "_ready_entries",
+        "_sequence",
+    )
+
+    def __init__(self) -> None:
+        self._items: dict[str, WorkItem] = {}
+        self._order: dict[str, int] = {}
+        self._dependents: defaultdict[str, set[str]] = defaultdict(set)
+        self._unsatisfied: dict[str, int] = {}
+        self._satisfied: set[str] = set()
+        self._pending_ready: set[str] = set()
+        self._ready_heap: list[tuple[int, datetime, int, str]] = []
+        self._ready_entries: dict[str, int] = {}
+        self._sequence = count()
+
+    @classmethod
+    def build(cls, items: Iterable[WorkItem]) -> RunDependencyGraph:
+        graph = cls()
+        for item in items:
+            graph.add(item)
+        return graph
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, item: WorkItem) -> None:
+        self._items[item.id] = item
+        self._order.setdefault(item.id, len(self._order))
+        for dependency_id in item.depends_on:
+            self._dependents[dependency_id].add(item.id)
+        self._unsatisfied[item.id] = self._count_unsatisfied(item.depends_on)
+        if item.status in SATISFIED_STATUSES:
+            self._mark_satisfied(item.id)
+        self._refresh_queues(item)
+
+    def on_status_change(self, item: WorkItem, previous: WorkItemStatus) -> None:
+        was_satisfied = previous in SATISFIED_STATUSES
+        is_satisfied = item.status in SATISFIED_STATUSES
+        if is_satisfied and not was_satisfied:
+            self._mark_satisfied(item.id)
+        elif was_satisfied and not is_satisfied:
+            self._mark_unsatisfied(item.id)
+        self._refresh_queues(item)
+
+    def on_dependencies_change(self, item: WorkItem, previous: Iterable[str]) -> None:
+        for dependency_id in previous:
+            dependents = self._dependents.get(dependency_id)
+            if dependents is not None:
+                dependents.discard(item.id)
+        for dependency_id in item.depends_on:
+            self._dependents[dependency_id].add(item.id)
+        self._unsatisfied[item.id] = self._count_unsatisfied(item.depends_on)
+        self._refresh_queues(item)
+
+    def unsatisfied_count(self, workitem_id: str) -> int:
+        return self._unsatisfied[workitem_id]
+
+    def dependent_ids(self, workitem_id: str) -> list[str]:
+        return sorted(
+            self._dependents.get(workitem_id, ()),
+            key=lambda item_id: self._order.get(item_id, 0),
+        )
+
+    def pending_ready_items(self) -> list[WorkItem]:
+        return [
+            self._items[item_id]
+            for item_id in sorted(self._pending_ready, key=self._order.__getitem__)
+        ]
+
+    def ready_items(self) -> list[WorkItem]:
+        self._compact_ready_heap()
+        return [
+            self._items[entry[3]]
+            for entry in sorted(self._ready_heap)
+            if self._ready_entries.get(entry[3]) == entry[2]
+        ]
+
+    def peek_ready(self) -> WorkItem | None:
+        while self._ready_heap:
+            entry = self._ready_heap[0]
+            if self._ready_entries.get(entry[3]) == entry[2]:
+                return self._items[entry[3]]
+            heapq.heappop(self._ready_heap)
+        return None
+
+    def has_runnable(self) -> bool:
+        return bool(self._pending_ready) or self.peek_ready() is not None
+
+    def _count_unsatisfied(self, dependency_ids: Iterable[str]) -> int:
+        return sum(
+            1 for dependency_id in dependency_ids if dependency_id not in self._satisfied
+        )
+
+    def _mark_satisfied(self, workitem_id: str) -> None:
+        if workitem_id in self._satisfied:
+            return
+        self._satisfied.add(workitem_id)
+        for dependent_id in self._dependents.get(workitem_id, ()):
+            if dependent_id not in self._unsatisfied:
+                continue
+            self._unsatisfied[dependent_id] -= 1
+            self._refresh_queues(self._items[dependent_id])
+
+    def _mark_unsatisfied(self, workitem_id: str) -> None:
+        if workitem_id not in self._satisfied:
+            return
+        self._satisfied.discard(workitem_id)
+        for dependent_id in self._dependents.get(workitem_id, ()):
+            if dependent_id not in self._unsatisfied:
+                continue
+            self._unsatisfied[dependent_id] += 1
+            self._refresh_queues(self._items[dependent_id])
+
+    def _refresh_queues(self, item: WorkItem) -> None:
+        if item.status == WorkItemStatus.PENDING and self._unsatisfied[item.id] == 0:
+            self._pending_ready.add(item.id)
+        else:
+            self._pending_ready.discard(item.id)
+
+        if item.status == WorkItemStatus.READY:
+            if item.id not in self._ready_entries:
+                sequence = next(self._sequence)
+                self._ready_entries[item.id] = sequence
+                heapq.heappush(
+                    self._ready_heap,
+                    (item.priority, item.created_at, sequence, item.id),
+                )
+        else:
+            self._ready_entries.pop(item.id, None)
+
+    def _compact_ready_heap(self) -> None:
+        if len(self._ready_heap) <= 2 * len(self._ready_entries):
+            return
+        self._ready_heap = [
+            entry
+            for entry in self._ready_heap
+            if self._ready_entries.get(entry[3]) == entry[2]
+        ]
+        heapq.heapify(self._ready_heap)
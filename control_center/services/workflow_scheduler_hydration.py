@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from control_center.models import (
+    Artifact,
+    DiscussionSession,
+    GateCheck,
+    WorkItem,
+    WorkflowRun,
+    WorkflowRunStatus,
+)
+from control_center.services.sqlite_state_store import SQLiteStateStore
+from control_center.services.workflow_scheduler_indexes import (
+    build_artifact_indexes,
+    build_discussion_indexes,
+    build_gate_indexes,
+    build_workitem_indexes,
+)
+
+HYDRATION_MODES = ("eager", "lazy")
+TERMINAL_RUN_STATUSES = frozenset(
+    {
+        WorkflowRunStatus.SUCCEEDED,
+        WorkflowRunStatus.FAILED,
+        WorkflowRunStatus.CANCELED,
+    }
+)
+_RUN_ID_CHUNK_SIZE = 500
+
+
+@dataclass(slots=True)
+class RunStateBundle:
+    runs: list[WorkflowRun] = field(default_factory=list)
+    workitems: list[WorkItem] = field(default_factory=list)
+    discussions: list[DiscussionSession] = field(default_factory=list)
+    gate_checks: list[GateCheck] = field(default_factory=list)
+    artifacts: list[Artifact] = field(default_factory=list)
+
+
+def normalize_hydration_mode(value: str) -> str:
+    normalized = value.strip().lower()
+    if normalized not in HYDRATION_MODES:
+        raise ValueError(
+            f"unsupported workflow hydration mode: {value} "
+            f"(expected one of {', '.join(HYDRATION_MODES)})"
+        )
+    return normalized
+
+
+def load_run_bundle(
+    state_store: SQLiteStateStore,
+    *,
+    runs: list[WorkflowRun],
+) -> RunStateBundle:
+    bundle = RunStateBundle(runs=list(runs))
+    run_ids = [run.id for run in runs]
+    for offset in range(0, len(run_ids), _RUN_ID_CHUNK_SIZE):
+        chunk = run_ids[offset : offset + _RUN_ID_CHUNK_SIZE]
+        bundle.workitems.extend(
+            WorkItem(**payload)
+            for payload in state_store.query("workitem", workflow_run_id=chunk)
+        )
+        bundle.discussions.extend(
+            DiscussionSession(**payload)
+            for payload in state_store.query("discussion_session", workflow_run_id=chunk)
+        )
+        bundle.gate_checks.extend(
+            GateCheck(**payload)
+            for payload in state_store.query("gate_check", workflow_run_id=chunk)
+        )
+        bundle.artifacts.extend(
+            Artifact(**payload)
+            for payload in state_store.query("artifact", workflow_run_id=chunk)
+        )
+    return bundle
+
+
+def load_active_run_bundle(state_store: SQLiteStateStore) -> RunStateBundle:
+    active_statuses = [
+        status.value for status in WorkflowRunStatus if status not in TERMINAL_RUN_STATUSES
+    ]
+    runs = [
+        WorkflowRun(**payload)
+        for payload in state_store.query("workflow_run", status=active_statuses)
+    ]
+    return load_run_bundle(state_store, runs=runs)
+
+
+def merge_run_bundle(
+    scheduler,
+    bundle: RunStateBundle,
+    *,
+    observe_counters: bool = True,
+) -> None:
+    for run in bundle.runs:
+        scheduler._runs[run.id] = run
+        scheduler._run_graphs.pop(run.id, None)
+    workitems = {item.id: item for item in bundle.workitems}
+    discussions = {session.id: session for session in bundle.discussions}
+    gate_checks = {gate.id: gate for gate in bundle.gate_checks}
+    artifacts = {artifact.id: artifact for artifact in bundle.artifacts}
+    scheduler._workitems.update(workitems)
+    scheduler._discussions.update(discussions)
+    scheduler._gate_checks.update(gate_checks)
+    scheduler._artifacts.update(artifacts)
+
+    run_workitems, workitem_run = build_workitem_indexes(workitems)
+    workitem_discussions = build_discussion_indexes(discussions)
+    run_gate_checks, workitem_gate_checks = build_gate_indexes(gate_checks)
+    run_artifacts, workitem_artifacts = build_artifact_indexes(artifacts, workitem_run)
+    for run in bundle.runs:
+        scheduler._run_workitems[run.id] = run_workitems.get(run.id, [])
+        scheduler._run_gate_checks[run.id] = run_gate_checks.get(run.id, [])
+        scheduler._run_artifacts[run.id] = run_artifacts.get(run.id, [])
+    scheduler._workitem_run.update(workitem_run)
+    for workitem_id in workitems:
+        scheduler._workitem_discussions[workitem_id] = workitem_discussions.get(
+            workitem_id, []
+        )
+        scheduler._workitem_gate_checks[workitem_id] = workitem_gate_checks.get(
+            workitem_id, []
+        )
+        scheduler._workitem_artifacts[workitem_id] = workitem_artifacts.get(
+            workitem_id, []
+        )
+    if not observe_counters:
+        return
+    scheduler._status_counters.observe_bundle(
+        runs=bundle.runs,
+        workitems=bundle.workitems,
+        gate_checks=bundle.gate_checks,
+        artifacts=bundle.artifacts,
+    )
+
+
+def evict_run(scheduler, run_id: str) -> None:
+    scheduler._runs.pop(run_id, None)
+    scheduler._run_graphs.pop(run_id, None)
+    workitem_ids = scheduler._run_workitems.pop(run_id, [])
+    for workitem_id in workitem_ids:
+        scheduler._workitems.pop(workitem_id, None)
+        scheduler._workitem_run.pop(workitem_id, None)
+        for discussion_id in scheduler._workitem_discussions.pop(workitem_id, []):
+            scheduler._discussions.pop(discussion_id, None)
+        scheduler._workitem_gate_checks.pop(workitem_id, None)
+        scheduler._workitem_artifacts.pop(workitem_id, None)
+    gate_ids = scheduler._run_gate_checks.pop(run_id, [])
+    for gate_id in gate_ids:
+        scheduler._gate_checks.pop(gate_id, None)
+    artifact_ids = scheduler._run_artifacts.pop(run_id, [])
+    for artifact_id in artifact_ids:
+        scheduler._artifacts.pop(artifact_id, None)
+    scheduler._status_counters.forget_run(
+        run_id,
+        workitem_ids=workitem_ids,
+        gate_ids=gate_ids,
+        artifact_ids=artifact_ids,
+    )
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections import Counter
+from collections.abc import Mapping
+
 from control_center.models import (
     Artifact,
     GateCheck,
@@ -8,13 +11,19 @@ from control_center.models import (
     WorkflowRun,
     WorkflowRunStatus,
 )
+from control_center.services.sqlite_state_store import SQLiteStateStore
 
 
 def derive_run_status(items: list[WorkItem]) -> WorkflowRunStatus:
-    if not items:
-        return WorkflowRunStatus.PLANNING
+    return derive_run_status_from_counts(Counter(item.status for item in items))
+
 
-    statuses = {item.status for item in items}
+def derive_run_status_from_counts(
+    counts: Mapping[WorkItemStatus, int],
+) -> WorkflowRunStatus:
+    statuses = {status for status, count in counts.items() if count > 0}
+    if not statuses:
+        return WorkflowRunStatus.PLANNING
     if WorkItemStatus.FAILED in statuses:
         return WorkflowRunStatus.FAILED
     if WorkItemStatus.NEEDS_DISCUSSION in statuses:
@@ -63,3 +72,20 @@ def build_scheduler_metrics(
         "total_artifacts": len(artifacts),
         "artifact_type_counts": artifact_type_counts,
     }
+
+
+def build_store_scheduler_metrics(state_store: SQLiteStateStore) -> dict[str, object]:
+    run_status_counts = state_store.group_counts("workflow_run", "status")
+    workitem_status_counts = state_store.group_counts("workitem", "status")
+    gate_status_counts = state_store.group_counts("gate_check", "status")
+    artifact_type_counts = state_store.group_counts("artifact", "artifact_type")
+    return {
+        "total_runs": sum(run_status_counts.values()),
+        "run_status_counts": run_status_counts,
+        "total_workitems": sum(workitem_status_counts.values()),
+        "workitem_status_counts": workitem_status_counts,
+        "total_gate_checks": sum(gate_status_counts.values()),
+        "gate_status_counts": gate_status_counts,
+        "total_artifacts": sum(artifact_type_counts.values()),
+        "artifact_type_counts": artifact_type_counts,
+    }
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from control_center.services.agent_router import AgentRouter, AgentRule
+
+WORDS = (
+    "module", "service", "deploy", "schema", "cache", "queue", "report", "login",
+    "billing", "search", "upload", "profile", "metrics", "gateway", "ledger", "invoice",
+)
+
+
+def _build_rules(count: int, keywords_per_rule: int, rng: random.Random) -> list[dict]:
+    return [
+        {
+            "id": f"rule_{index:04d}",
+            "agent": f"agent-{index % 12}",
+            "priority": rng.randint(1, 500),
+            "enabled": index % 17 != 0,
+            "keywords": [
+                f"{rng.choice(WORDS)}-{index}-{slot}" for slot in range(keywords_per_rule)
+            ],
+        }
+        for index in range(count)
+    ]
+
+
+def _build_commands(rules: list[dict], count: int, rng: random.Random) -> list[str]:
+    commands: list[str] = []
+    for index in range(count):
+        filler = " ".join(rng.choice(WORDS) for _ in range(24))
+        if index % 4 == 0:
+            commands.append(f"please handle {filler}")
+            continue
+        keyword = rng.choice(rng.choice(rules)["keywords"])
+        commands.append(f"please handle {filler} {keyword.upper()} and report back")
+    return commands
+
+
+def _linear_route(rules: list[AgentRule], default_agent: str, command_text: str):
+    lowered = command_text.lower()
+    for rule in rules:
+        if not rule.enabled:
+            continue
+        for keyword in rule.keywords:
+            if keyword in lowered:
+                return rule.agent, rule.rule_id, keyword
+    return default_agent, None, None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="compare the linear keyword scan with the compiled AgentRouter matcher",
+    )
+    parser.add_argument("--rules", type=int, default=500)
+    parser.add_argument("--keywords-per-rule", type=int, default=4)
+    parser.add_argument("--commands", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    raw_rules = _build_rules(max(1, args.rules), max(1, args.keywords_per_rule), rng)
+    commands = _build_commands(raw_rules, max(1, args.commands), rng)
+
+    with tempfile.TemporaryDirectory(prefix="wherecode-bench-router-") as tmp_dir:
+        config_path = Path(tmp_dir) / "agents.routing.json"
+        config_path.write_text(
+            json.dumps({"default_agent": "coding-agent", "rules": raw_rules}),
+            encoding="utf-8",
+        )
+        build_start = time.perf_counter()
+        router = AgentRouter(str(config_path), recheck_seconds=3600)
+        build_seconds = time.perf_counter() - build_start
+
+        rules = router.rules
+        default_agent = router.default_agent
+
+        start = time.perf_counter()
+        linear = [_linear_route(rules, default_agent, command) for command in commands]
+        linear_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        decisions = [router.route("auto", command) for command in commands]
+        compiled_seconds = time.perf_counter() - start
+
+    for expected, decision in zip(linear, decisions):
+        actual = (decision.agent, decision.rule_id, decision.matched_keyword)
+        if actual != expected:
+            raise RuntimeError(f"matcher disagrees with linear scan: {actual} != {expected}")
+
+    report = {
+        "rules": len(rules),
+        "keywords": sum(len(rule.keywords) for rule in rules),
+        "commands": len(commands),
+        "build_seconds": round(build_seconds, 4),
+        "linear_scan_seconds": round(linear_seconds, 4),
+        "compiled_matcher_seconds": round(compiled_seconds, 4),
+        "speedup": round(linear_seconds / compiled_seconds, 2) if compiled_seconds > 0 else None,
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from control_center.models.hierarchy import now_utc
+from control_center.services.metrics_alert_policy_store import MetricsAlertPolicyStore
+from control_center.services.metrics_alert_policy_store_policy import (
+    filter_rollback_approval_purge_audits,
+)
+from control_center.services.metrics_alert_policy_store_rollback import (
+    is_timestamp_after,
+    is_timestamp_before,
+)
+
+
+def _write_history(tmp_dir: Path, audits: int, purge_audits: int) -> None:
+    start = now_utc() - timedelta(days=30)
+    with (tmp_dir / "audit.jsonl").open("w", encoding="utf-8") as file:
+        for index in range(audits):
+            entry = {
+                "id": f"map_{index:08d}",
+                "updated_at": (start + timedelta(seconds=index)).isoformat(),
+                "updated_by": "ops-admin",
+                "reason": None,
+                "rollback_request_id": f"req-{index}" if index % 3 == 0 else None,
+                "policy": {"failed_run_delta_gt": index % 5},
+            }
+            file.write(json.dumps(entry) + "\n")
+    with (tmp_dir / "purge_audits.jsonl").open("w", encoding="utf-8") as file:
+        for index in range(purge_audits):
+            entry = {
+                "id": f"rpg_{index:08d}",
+                "event_type": "approval_purge" if index % 2 else "purge_audit_gc",
+                "requested_by": "ops-admin",
+                "created_at": (start + timedelta(seconds=30 * index)).isoformat(),
+            }
+            file.write(json.dumps(entry) + "\n")
+
+
+def _linear_get_audit(entries: list[dict], audit_id: str) -> dict | None:
+    for entry in reversed(entries):
+        if str(entry.get("id", "")).strip() == audit_id:
+            return dict(entry)
+    return None
+
+
+def _linear_find_request(entries: list[dict], request_id: str) -> dict | None:
+    for entry in reversed(entries):
+        if str(entry.get("rollback_request_id", "")).strip() == request_id:
+            return dict(entry)
+    return None
+
+
+def _timed(fn, items) -> tuple[float, list]:
+    start = time.perf_counter()
+    results = [fn(item) for item in items]
+    return time.perf_counter() - start, results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="compare linear scans with the MetricsAlertPolicyStore lookup indexes",
+    )
+    parser.add_argument("--audits", type=int, default=50_000)
+    parser.add_argument("--purge-audits", type=int, default=20_000)
+    parser.add_argument("--lookups", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    audits = max(1, args.audits)
+    purge_audits = max(1, args.purge_audits)
+    with tempfile.TemporaryDirectory(prefix="wherecode-bench-policy-store-") as tmp:
+        tmp_dir = Path(tmp)
+        _write_history(tmp_dir, audits, purge_audits)
+        load_start = time.perf_counter()
+        store = MetricsAlertPolicyStore(
+            str(tmp_dir / "policy.json"),
+            str(tmp_dir / "audit.jsonl"),
+            str(tmp_dir / "approvals.jsonl"),
+            str(tmp_dir / "purge_audits.jsonl"),
+        )
+        load_seconds = time.perf_counter() - load_start
+
+    audit_ids = [f"map_{rng.randrange(audits):08d}" for _ in range(args.lookups)]
+    request_ids = [f"req-{rng.randrange(audits)}" for _ in range(args.lookups)]
+    first = store._rollback_approval_purge_audits[0]["created_at"]
+    windows = []
+    for _ in range(max(1, args.lookups // 10)):
+        after = first + timedelta(seconds=30 * rng.randrange(purge_audits))
+        windows.append((after, after + timedelta(hours=2)))
+
+    report: dict[str, object] = {
+        "audits": audits,
+        "purge_audits": purge_audits,
+        "load_seconds": round(load_seconds, 4),
+    }
+    cases = {
+        "get_audit": (
+            lambda audit_id: _linear_get_audit(store._audit_entries, audit_id),
+            store.get_audit,
+            audit_ids,
+        ),
+        "rollback_request_lookup": (
+            lambda request_id: _linear_find_request(store._audit_entries, request_id),
+            store._find_rollback_by_request_id,
+            request_ids,
+        ),
+        "purge_audit_window": (
+            lambda window: list(
+                reversed(
+                    filter_rollback_approval_purge_audits(
+                        store._rollback_approval_purge_audits,
+                        event_type="approval_purge",
+                        created_after=window[0],
+                        created_before=window[1],
+                        is_timestamp_after_handler=is_timestamp_after,
+                        is_timestamp_before_handler=is_timestamp_before,
+                    )
+                )
+            )[:1000],
+            lambda window: store.list_rollback_approval_purge_audits(
+                limit=1000,
+                event_type="approval_purge",
+                created_after=window[0],
+                created_before=window[1],
+            ),
+            windows,
+        ),
+    }
+    for name, (linear_fn, indexed_fn, items) in cases.items():
+        linear_seconds, expected = _timed(linear_fn, items)
+        indexed_seconds, actual = _timed(indexed_fn, items)
+        if expected != actual:
+            raise RuntimeError(f"{name}: indexed lookup disagrees with linear scan")
+        report[name] = {
+            "calls": len(items),
+            "linear_seconds": round(linear_seconds, 4),
+            "indexed_seconds": round(indexed_seconds, 4),
+            "speedup": round(linear_seconds / indexed_seconds, 1) if indexed_seconds > 0 else None,
+        }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from control_center.services.sqlite_state_store import SQLiteStateStore
+
+_Rows = list[tuple[str, dict[str, object]]]
+
+
+def _build_payloads(count: int) -> _Rows:
+    return [
+        (
+            f"wi_{index:06d}",
+            {
+                "id": f"wi_{index:06d}",
+                "workflow_run_id": f"wfr_{index // 200:04d}",
+                "role": "module-dev",
+                "module_key": f"module-{index % 6}",
+                "status": "pending",
+                "metadata": {"task_objective": f"bench entity {index}"},
+            },
+        )
+        for index in range(count)
+    ]
+
+
+def _bench_per_row(db_path: Path, rows: _Rows, synchronous: str) -> float:
+    store = SQLiteStateStore(str(db_path), synchronous=synchronous)
+    start = time.perf_counter()
+    for entity_id, payload in rows:
+        store.upsert("workitem", entity_id, payload)
+    elapsed = time.perf_counter() - start
+    store.close()
+    return elapsed
+
+
+def _bench_batched(db_path: Path, rows: _Rows, synchronous: str, batch_size: int) -> float:
+    store = SQLiteStateStore(str(db_path), synchronous=synchronous)
+    start = time.perf_counter()
+    for offset in range(0, len(rows), batch_size):
+        store.upsert_many("workitem", rows[offset : offset + batch_size])
+    elapsed = time.perf_counter() - start
+    store.close()
+    return elapsed
+
+
+def _bench_unit_of_work(db_path: Path, rows: _Rows, synchronous: str, batch_size: int) -> float:
+    store = SQLiteStateStore(str(db_path), synchronous=synchronous)
+    start = time.perf_counter()
+    for offset in range(0, len(rows), batch_size):
+        with store.unit_of_work():
+            for entity_id, payload in rows[offset : offset + batch_size]:
+                store.upsert("workitem", entity_id, payload)
+    elapsed = time.perf_counter() - start
+    store.close()
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="compare per-row commits with batched commits in SQLiteStateStore",
+    )
+    parser.add_argument("--entities", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument(
+        "--synchronous",
+        default="NORMAL",
+        help="sqlite synchronous pragma (OFF|NORMAL|FULL|EXTRA)",
+    )
+    args = parser.parse_args()
+
+    rows = _build_payloads(max(1, args.entities))
+    batch_size = max(1, args.batch_size)
+    with tempfile.TemporaryDirectory(prefix="wherecode-bench-") as tmp:
+        tmp_dir = Path(tmp)
+        per_row = _bench_per_row(tmp_dir / "per_row.db", rows, args.synchronous)
+        batched = _bench_batched(tmp_dir / "batched.db", rows, args.synchronous, batch_size)
+        unit_of_work = _bench_unit_of_work(
+            tmp_dir / "unit_of_work.db", rows, args.synchronous, batch_size
+        )
+
+    report = {
+        "entities": len(rows),
+        "batch_size": batch_size,
+        "synchronous": args.synchronous.upper(),
+        "per_row_commit_seconds": round(per_row, 4),
+        "upsert_many_seconds": round(batched, 4),
+        "unit_of_work_seconds": round(unit_of_work, 4),
+        "upsert_many_speedup": round(per_row / batched, 2) if batched > 0 else None,
+        "unit_of_work_speedup": (
+            round(per_row / unit_of_work, 2) if unit_of_work > 0 else None
+        ),
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
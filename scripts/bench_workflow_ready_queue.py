@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from control_center.models import WorkItem, WorkItemStatus
+from control_center.services.workflow_engine import WorkflowEngine
+from control_center.services.workflow_scheduler_graph import RunDependencyGraph
+
+
+def _build_module_dag(nodes: int) -> list[WorkItem]:
+    stages = WorkflowEngine.MODULE_STAGES
+    module_count = max(1, (nodes - len(WorkflowEngine.GLOBAL_STAGES)) // len(stages))
+    items: list[WorkItem] = []
+    terminals: list[str] = []
+    for module_index in range(module_count):
+        depends_on: list[str] = []
+        for stage_index, role in enumerate(stages):
+            item = WorkItem(
+                workflow_run_id="wfr_bench",
+                role=role,
+                module_key=f"module-{module_index:05d}",
+                depends_on=depends_on,
+                priority=1 + (module_index + stage_index) % 5,
+            )
+            items.append(item)
+            depends_on = [item.id]
+        terminals.append(depends_on[0])
+    depends_on = terminals
+    for role in WorkflowEngine.GLOBAL_STAGES:
+        item = WorkItem(
+            workflow_run_id="wfr_bench",
+            role=role,
+            module_key="global",
+            depends_on=depends_on,
+        )
+        items.append(item)
+        depends_on = [item.id]
+    return items
+
+
+def _reset(items: list[WorkItem]) -> None:
+    for item in items:
+        item.status = WorkItemStatus.PENDING
+
+
+def _select_pending_ready(
+    run_workitem_ids: list[str],
+    workitems: dict[str, WorkItem],
+) -> list[WorkItem]:
+    # The per-tick rescan the dependency graph replaced, kept as the baseline.
+    selected: list[WorkItem] = []
+    for item_id in run_workitem_ids:
+        item = workitems[item_id]
+        if item.status != WorkItemStatus.PENDING:
+            continue
+        if all(
+            dependency_id in workitems
+            and workitems[dependency_id].status
+            in {WorkItemStatus.SUCCEEDED, WorkItemStatus.SKIPPED}
+            for dependency_id in item.depends_on
+        ):
+            selected.append(item)
+    return selected
+
+
+def _drive_full_scan(items: list[WorkItem], *, tick_per_completion: bool) -> tuple[float, int]:
+    workitems = {item.id: item for item in items}
+    run_workitem_ids = [item.id for item in items]
+
+    def _tick() -> None:
+        for item in _select_pending_ready(run_workitem_ids, workitems):
+            item.status = WorkItemStatus.READY
+
+    completed = 0
+    start = time.perf_counter()
+    while True:
+        ready = [item for item in items if item.status == WorkItemStatus.READY]
+        if not ready:
+            _tick()
+            ready = [item for item in items if item.status == WorkItemStatus.READY]
+        if not ready:
+            break
+        ready.sort(key=lambda item: (item.priority, item.created_at))
+        for item in ready:
+            item.status = WorkItemStatus.SUCCEEDED
+            completed += 1
+            if tick_per_completion:
+                _tick()
+    return time.perf_counter() - start, completed
+
+
+def _set_status(graph: RunDependencyGraph, item: WorkItem, status: WorkItemStatus) -> None:
+    previous = item.status
+    item.status = status
+    graph.on_status_change(item, previous)
+
+
+def _drive_graph(items: list[WorkItem], *, tick_per_completion: bool) -> tuple[float, int]:
+    completed = 0
+    start = time.perf_counter()
+    graph = RunDependencyGraph.build(items)
+
+    def _tick() -> None:
+        for item in graph.pending_ready_items():
+            _set_status(graph, item, WorkItemStatus.READY)
+
+    while True:
+        ready = graph.ready_items()
+        if not ready:
+            _tick()
+            ready = graph.ready_items()
+        if not ready:
+            break
+        for item in ready:
+            _set_status(graph, item, WorkItemStatus.SUCCEEDED)
+            completed += 1
+            if tick_per_completion:
+                _tick()
+    return time.perf_counter() - start, completed
+
+
+def _compare(items: list[WorkItem], *, repeat: int, tick_per_completion: bool) -> dict:
+    full_scan_runs: list[float] = []
+    graph_runs: list[float] = []
+    completed = 0
+    for _ in range(repeat):
+        _reset(items)
+        elapsed, completed = _drive_full_scan(items, tick_per_completion=tick_per_completion)
+        full_scan_runs.append(elapsed)
+        _reset(items)
+        elapsed, graph_completed = _drive_graph(items, tick_per_completion=tick_per_completion)
+        graph_runs.append(elapsed)
+        if graph_completed != completed:
+            raise RuntimeError(
+                f"graph completed {graph_completed} items, full scan completed {completed}"
+            )
+    full_scan = min(full_scan_runs)
+    graph = min(graph_runs)
+    return {
+        "completed": completed,
+        "full_scan_seconds": round(full_scan, 4),
+        "dependency_graph_seconds": round(graph, 4),
+        "speedup": round(full_scan / graph, 2) if graph > 0 else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="compare full-scan ready selection with the incremental dependency graph",
+    )
+    parser.add_argument("--nodes", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    items = _build_module_dag(max(len(WorkflowEngine.GLOBAL_STAGES) + 1, args.nodes))
+    repeat = max(1, args.repeat)
+    report = {
+        "nodes": len(items),
+        "repeat": repeat,
+        "tick_when_drained": _compare(items, repeat=repeat, tick_per_completion=False),
+        "tick_per_completion": _compare(items, repeat=repeat, tick_per_completion=True),
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
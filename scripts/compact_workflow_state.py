@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from control_center.models.hierarchy import now_utc
+from control_center.services.config_bootstrap import load_control_center_bootstrap_config
+from control_center.services.context_memory_store_tiering import (
+    purge_context_memory_tombstones,
+)
+from control_center.services.sqlite_state_store import SQLiteStateStore
+from control_center.services.workflow_run_archive import WorkflowRunArchive
+from control_center.services.workflow_scheduler import WorkflowScheduler
+
+
+def _sqlite_file_bytes(db_path: Path) -> int:
+    total = 0
+    for suffix in ("", "-wal", "-shm"):
+        candidate = db_path.with_name(db_path.name + suffix)
+        if candidate.exists():
+            total += candidate.stat().st_size
+    return total
+
+
+def compact_workflow_state(
+    *,
+    sqlite_path: str,
+    archive_path: str,
+    retention_days: float,
+    limit: int | None = None,
+    tombstone_retention_days: float | None = None,
+    vacuum: bool = True,
+    journal_mode: str = "WAL",
+    synchronous: str = "NORMAL",
+) -> dict[str, object]:
+    started = time.perf_counter()
+    state_store = SQLiteStateStore(
+        sqlite_path,
+        journal_mode=journal_mode,
+        synchronous=synchronous,
+    )
+    run_archive = WorkflowRunArchive(archive_path)
+    try:
+        live_bytes_before = _sqlite_file_bytes(state_store.db_path)
+        scheduler = WorkflowScheduler(
+            state_store=state_store,
+            hydration_mode="lazy",
+            run_archive=run_archive,
+        )
+        archived_run_ids = scheduler.archive_terminal_runs(
+            retention_seconds=max(0.0, float(retention_days)) * 86400,
+            limit=limit,
+        )
+        purged_tombstones = 0
+        if tombstone_retention_days is not None:
+            purged_tombstones = purge_context_memory_tombstones(
+                state_store,
+                cutoff=now_utc() - timedelta(days=max(0.0, float(tombstone_retention_days))),
+            )
+        if vacuum:
+            state_store.vacuum()
+        live_bytes_after = _sqlite_file_bytes(state_store.db_path)
+        archive_stats = run_archive.stats()
+    finally:
+        run_archive.close()
+        state_store.close()
+
+    return {
+        "sqlite_path": sqlite_path,
+        "archive_path": archive_path,
+        "retention_days": retention_days,
+        "archived_runs": len(archived_run_ids),
+        "archived_run_ids": archived_run_ids,
+        "context_memory_tombstones_purged": purged_tombstones,
+        "vacuumed": vacuum,
+        "live_bytes_before": live_bytes_before,
+        "live_bytes_after": live_bytes_after,
+        "archive": archive_stats,
+        "elapsed_seconds": round(time.perf_counter() - started, 4),
+    }
+
+
+def main() -> int:
+    config = load_control_center_bootstrap_config()
+    parser = argparse.ArgumentParser(
+        description=(
+            "move terminal workflow runs older than the retention window into the "
+            "compressed run archive, drop expired context memory tombstones, then "
+            "VACUUM the live sqlite state store"
+        ),
+    )
+    parser.add_argument("--sqlite-path", default=config.sqlite_path)
+    parser.add_argument("--archive-path", default=config.workflow_archive_path)
+    parser.add_argument(
+        "--retention-days",
+        type=float,
+        default=float(config.workflow_archive_retention_days),
+    )
+    parser.add_argument(
+        "--tombstone-retention-days",
+        type=float,
+        default=float(config.context_memory_tombstone_retention_days),
+    )
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--skip-vacuum", action="store_true")
+    args = parser.parse_args()
+
+    if not Path(args.sqlite_path).exists():
+        print(f"sqlite state store not found: {args.sqlite_path}", file=sys.stderr)
+        return 1
+
+    report = compact_workflow_state(
+        sqlite_path=args.sqlite_path,
+        archive_path=args.archive_path,
+        retention_days=args.retention_days,
+        limit=args.limit,
+        tombstone_retention_days=args.tombstone_retention_days,
+        vacuum=not args.skip_vacuum,
+        journal_mode=config.sqlite_journal_mode,
+        synchronous=config.sqlite_synchronous,
+    )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -15,6 +15,12 @@ from control_center.services.workflow_engine import WorkflowEngine
 
 
 class TestActionLayerClient:
+    async def start(self) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
     async def get_health(self) -> ActionLayerHealthResponse:
         return ActionLayerHealthResponse(
             status="ok",
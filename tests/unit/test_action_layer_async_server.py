@@ -0,0 +1,270 @@
+import asyncio
+import threading
+from http import HTTPStatus
+
+import httpx
+
+from action_layer.runtime_async import AsyncActionLayerServer
+from action_layer.services.execution_admission import (
+    AdmissionConfig,
+    ExecutionAdmissionController,
+    ExecutionRejectedError,
+)
+
+
+class _GatedExecutionService:
+    def __init__(self) -> None:
+        self.gate = threading.Event()
+        self.started = 0
+        self._lock = threading.Lock()
+
+    def build_health_payload(self) -> dict[str, object]:
+        return {"status": "ok", "layer": "action", "transport": "http"}
+
+    def build_capabilities_payload(self) -> dict[str, object]:
+        return {"agents": ["coding-agent"]}
+
+    def route_target(self, payload: dict[str, object]) -> str | None:
+        target = payload.get("target")
+        return str(target) if target else None
+
+    def execute(self, payload: dict[str, object]) -> tuple[HTTPStatus, dict[str, object]]:
+        with self._lock:
+            self.started += 1
+        if payload.get("block"):
+            self.gate.wait(timeout=5)
+        return HTTPStatus.OK, {"status": "success", "summary": str(payload.get("text", ""))}
+
+    async def execute_async(
+        self,
+        payload: dict[str, object],
+    ) -> tuple[HTTPStatus, dict[str, object]]:
+        return await asyncio.to_thread(self.execute, payload)
+
+    async def execute_stream(self, payload: dict[str, object]):
+        yield {"event": "status", "status": "success"}
+        if payload.get("block"):
+            await asyncio.to_thread(self.gate.wait, 5)
+        yield {
+            "event": "result",
+            "status_code": 200,
+            "result": {"status": "success", "summary": str(payload.get("text", ""))},
+        }
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+def _run(service, config: AdmissionConfig, scenario, **server_kwargs) -> None:
+    async def main() -> None:
+        admission = ExecutionAdmissionController(config)
+        server = AsyncActionLayerServer(
+            service,
+            admission,
+            host="127.0.0.1",
+            port=0,
+            **server_kwargs,
+        )
+        await server.start()
+        try:
+            async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{server.port}") as client:
+                await scenario(server, admission, client)
+        finally:
+            service.gate.set()
+            await server.shutdown()
+
+    asyncio.run(main())
+
+
+def test_async_server_keeps_execute_health_capabilities_contract() -> None:
+    service = _GatedExecutionService()
+
+    async def scenario(server, admission, client: httpx.AsyncClient) -> None:
+        health = await client.get("/healthz")
+        assert health.status_code == 200
+        assert health.json()["status"] == "ok"
+        assert health.json()["server_mode"] == "asyncio"
+        assert health.json()["admission"]["max_concurrency"] == 2
+
+        capabilities = await client.get("/capabilities")
+        assert capabilities.json() == {"agents": ["coding-agent"]}
+
+        executed = await client.post("/execute", json={"text": "hello"})
+        assert executed.status_code == 200
+        assert executed.json()["summary"] == "hello"
+
+        empty = await client.post("/execute", content=b"")
+        assert empty.status_code == 400
+        assert empty.json()["detail"] == "empty request body"
+        invalid = await client.post("/execute", content=b"{nope")
+        assert invalid.json()["detail"] == "invalid json body"
+        not_object = await client.post("/execute", json=[1, 2])
+        assert not_object.json()["detail"] == "json body must be an object"
+        missing = await client.get("/missing")
+        assert missing.status_code == 404
+
+    _run(service, AdmissionConfig(max_concurrency=2), scenario)
+
+
+def test_async_server_sheds_with_429_when_queue_is_full() -> None:
+    service = _GatedExecutionService()
+
+    async def scenario(server, admission, client: httpx.AsyncClient) -> None:
+        blocked = asyncio.create_task(
+            client.post("/execute", json={"text": "slow", "block": True})
+        )
+        await _wait_for(lambda: service.started == 1)
+
+        rejected = await client.post("/execute", json={"text": "extra"})
+        assert rejected.status_code == 429
+        assert rejected.headers["retry-after"] == "1"
+
+        health = await client.get("/healthz")
+        assert health.json()["admission"]["rejected_queue_full"] == 1
+
+        service.gate.set()
+        assert (await blocked).status_code == 200
+
+    _run(service, AdmissionConfig(max_concurrency=1, max_queue=0), scenario)
+
+
+def test_async_server_limits_concurrency_per_target() -> None:
+    service = _GatedExecutionService()
+
+    async def scenario(server, admission, client: httpx.AsyncClient) -> None:
+        slow_local = asyncio.create_task(
+            client.post("/execute", json={"target": "local", "block": True})
+        )
+        await _wait_for(lambda: service.started == 1)
+
+        queued_local = asyncio.create_task(
+            client.post("/execute", json={"target": "local", "text": "queued"})
+        )
+        await _wait_for(lambda: admission.snapshot()["waiting"] == 1)
+
+        other = await client.post("/execute", json={"target": "openai", "text": "free"})
+        assert other.status_code == 200
+        assert not queued_local.done()
+
+        service.gate.set()
+        assert (await slow_local).status_code == 200
+        assert (await queued_local).json()["summary"] == "queued"
+
+    _run(
+        service,
+        AdmissionConfig(max_concurrency=4, max_queue=4, target_limits={"local": 1}),
+        scenario,
+    )
+
+
+def test_async_server_queue_timeout_returns_503() -> None:
+    service = _GatedExecutionService()
+
+    async def scenario(server, admission, client: httpx.AsyncClient) -> None:
+        blocked = asyncio.create_task(
+            client.post("/execute", json={"text": "slow", "block": True})
+        )
+        await _wait_for(lambda: service.started == 1)
+
+        timed_out = await client.post("/execute", json={"text": "late"})
+        assert timed_out.status_code == 503
+        assert "timed out" in timed_out.json()["detail"]
+
+        service.gate.set()
+        assert (await blocked).status_code == 200
+
+    _run(
+        service,
+        AdmissionConfig(max_concurrency=1, max_queue=2, queue_timeout_seconds=0.1),
+        scenario,
+    )
+
+
+def test_async_server_drains_in_flight_work_and_rejects_new_requests() -> None:
+    service = _GatedExecutionService()
+
+    async def main() -> None:
+        admission = ExecutionAdmissionController(AdmissionConfig(max_concurrency=2))
+        server = AsyncActionLayerServer(
+            service,
+            admission,
+            host="127.0.0.1",
+            port=0,
+            drain_timeout_seconds=5,
+        )
+        await server.start()
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{server.port}") as client:
+            in_flight = asyncio.create_task(
+                client.post("/execute", json={"text": "finishing", "block": True})
+            )
+            await _wait_for(lambda: service.started == 1)
+
+            shutdown = asyncio.create_task(server.shutdown())
+            await _wait_for(lambda: admission.draining)
+            rejected = await admission_rejection(admission)
+            assert rejected == HTTPStatus.SERVICE_UNAVAILABLE
+            assert not shutdown.done()
+
+            service.gate.set()
+            response = await in_flight
+            assert response.status_code == 200
+            assert response.json()["summary"] == "finishing"
+            assert await shutdown is True
+
+    async def admission_rejection(admission: ExecutionAdmissionController) -> HTTPStatus:
+        try:
+            await admission.run(None, lambda: asyncio.sleep(0))
+        except ExecutionRejectedError as exc:
+            return exc.status
+        return HTTPStatus.OK
+
+    asyncio.run(main())
+
+
+def test_async_server_streams_execute_events_over_sse() -> None:
+    service = _GatedExecutionService()
+
+    async def scenario(server, admission, client: httpx.AsyncClient) -> None:
+        async with client.stream(
+            "POST",
+            "/execute/stream",
+            json={"text": "streamed", "block": True},
+        ) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/event-stream")
+            lines = response.aiter_lines()
+            assert await anext(lines) == "event: status"
+            # The first event arrives while execution is still blocked.
+            assert admission.snapshot()["running"] == 1
+            service.gate.set()
+            remaining = [line async for line in lines]
+
+        assert "event: result" in remaining
+        data_line = next(line for line in remaining if line.startswith("data:") and "result" in line)
+        assert '"summary": "streamed"' in data_line
+        await _wait_for(lambda: admission.snapshot()["running"] == 0)
+
+    _run(service, AdmissionConfig(max_concurrency=1, max_queue=0), scenario)
+
+
+def test_async_server_stream_is_rejected_before_headers_when_saturated() -> None:
+    service = _GatedExecutionService()
+
+    async def scenario(server, admission, client: httpx.AsyncClient) -> None:
+        blocked = asyncio.create_task(
+            client.post("/execute", json={"text": "slow", "block": True})
+        )
+        await _wait_for(lambda: service.started == 1)
+
+        rejected = await client.post("/execute/stream", json={"text": "extra"})
+        assert rejected.status_code == 429
+        assert rejected.json()["detail"] == "action layer execution queue is full"
+
+        service.gate.set()
+        assert (await blocked).status_code == 200
+
+    _run(service, AdmissionConfig(max_concurrency=1, max_queue=0), scenario)
@@ -0,0 +1,177 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from control_center.models import ActionExecuteRequest
+from control_center.services import ActionLayerClient, ActionLayerClientError
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/healthz":
+        return httpx.Response(200, json={"status": "ok", "layer": "action", "transport": "http"})
+    if request.url.path == "/execute/stream":
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            content=(
+                b'event: status\ndata: {"event": "status", "status": "success"}\n\n'
+                b'event: result\ndata: {"event": "result", "status_code": 200, '
+                b'"result": {"status": "success", "summary": "streamed"}}\n\n'
+            ),
+        )
+    if request.url.path == "/execute":
+        return httpx.Response(
+            200,
+            json={
+                "status": "success",
+                "summary": "done",
+                "agent": "coding-agent",
+                "trace_id": "act_pool",
+            },
+        )
+    return httpx.Response(500)
+
+
+def test_client_reuses_pooled_connection_and_records_latency() -> None:
+    client = ActionLayerClient(
+        "http://action.test/",
+        timeout_seconds=5.0,
+        max_connections=8,
+        transport=httpx.MockTransport(_handler),
+    )
+
+    async def scenario() -> None:
+        await client.start()
+        try:
+            await asyncio.gather(
+                *(client.execute(ActionExecuteRequest(text=f"job {index}")) for index in range(10))
+            )
+            health = await client.get_health()
+            assert health.status == "ok"
+            with pytest.raises(ActionLayerClientError, match="HTTP 500"):
+                await client._request("GET", "/missing")
+
+            metrics = client.metrics_snapshot()
+            assert metrics.client_open is True
+            assert metrics.clients_created == 1
+            assert metrics.max_connections == 8
+            assert metrics.in_flight == 0
+            assert metrics.requests_total == 12
+            assert metrics.errors_total == 1
+            assert metrics.endpoints["POST /execute"].count == 10
+            assert metrics.endpoints["GET /missing"].error_count == 1
+            assert metrics.in_flight_utilization == 0.0
+        finally:
+            await client.close()
+        assert client.metrics_snapshot().client_open is False
+
+    asyncio.run(scenario())
+
+
+def test_client_rebinds_pool_when_event_loop_changes() -> None:
+    client = ActionLayerClient("http://action.test", transport=httpx.MockTransport(_handler))
+
+    asyncio.run(client.get_health())
+    asyncio.run(client.get_health())
+
+    metrics = client.metrics_snapshot()
+    assert metrics.clients_created == 2
+    assert metrics.requests_total == 2
+
+
+def test_close_from_another_loop_closes_client_on_its_owning_loop() -> None:
+    client = ActionLayerClient("http://action.test", transport=httpx.MockTransport(_handler))
+    loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    loop_thread.start()
+    try:
+        asyncio.run_coroutine_threadsafe(client.get_health(), loop).result(timeout=5)
+        owned = client._client
+        assert owned is not None
+
+        asyncio.run(client.close())
+
+        assert owned.is_closed
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        loop_thread.join()
+        loop.close()
+
+
+def test_rebinding_closes_the_client_of_a_stopped_loop() -> None:
+    client = ActionLayerClient("http://action.test", transport=httpx.MockTransport(_handler))
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(client.get_health())
+        previous = client._client
+        assert previous is not None
+
+        async def scenario() -> None:
+            await client.get_health()
+            await client.close()
+
+        asyncio.run(scenario())
+
+        assert previous.is_closed
+        assert client.metrics_snapshot().clients_created == 2
+    finally:
+        loop.close()
+
+
+def test_unlimited_pool_reports_no_in_flight_utilization() -> None:
+    client = ActionLayerClient(
+        "http://action.test",
+        max_connections=None,
+        transport=httpx.MockTransport(_handler),
+    )
+
+    metrics = client.metrics_snapshot()
+
+    assert metrics.max_connections is None
+    assert metrics.in_flight_utilization is None
+
+
+def test_http2_falls_back_without_h2_package(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "control_center.services.action_layer_client.importlib.util.find_spec",
+        lambda name: None,
+    )
+    client = ActionLayerClient("http://action.test", http2=True)
+    assert client.http2 is False
+
+
+def test_client_consumes_execute_stream_events() -> None:
+    client = ActionLayerClient("http://action.test", transport=httpx.MockTransport(_handler))
+
+    async def scenario() -> list:
+        try:
+            return [
+                event
+                async for event in client.execute_stream(ActionExecuteRequest(text="stream it"))
+            ]
+        finally:
+            await client.close()
+
+    events = asyncio.run(scenario())
+
+    assert [event.event for event in events] == ["status", "result"]
+    assert events[1].data["result"]["summary"] == "streamed"
+    metrics = client.metrics_snapshot()
+    assert metrics.endpoints["POST /execute/stream"].count == 1
+    assert metrics.errors_total == 0
+
+
+def test_client_stream_raises_on_rejection() -> None:
+    client = ActionLayerClient(
+        "http://action.test",
+        transport=httpx.MockTransport(lambda request: httpx.Response(429, json={"detail": "full"})),
+    )
+
+    async def scenario() -> None:
+        async for _ in client.execute_stream(ActionExecuteRequest(text="stream it")):
+            pass
+
+    with pytest.raises(ActionLayerClientError, match="HTTP 429"):
+        asyncio.run(scenario())
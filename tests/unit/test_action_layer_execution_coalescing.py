@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from action_layer.services import (
+    AgentProfileLoader,
+    AgentRegistry,
+    LLMProviderConfig,
+    LLMRoutingConfig,
+    RoutedLLMExecutor,
+)
+from action_layer.services.execution_coalescing import ExecutionCoalescer
+from action_layer.services.runtime_execution import ActionRuntimeExecutionService
+
+
+class _GatedHttpPost:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.gate = threading.Event()
+
+    def __call__(
+        self,
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, object],
+        timeout_seconds: float,
+    ) -> dict[str, object]:
+        self.calls += 1
+        self.gate.wait(timeout=5)
+        content = f'{{"status":"success","summary":"call {self.calls}"}}'
+        return {"choices": [{"message": {"content": content}}]}
+
+
+def _service(
+    http_post: _GatedHttpPost,
+    coalescer: ExecutionCoalescer,
+) -> ActionRuntimeExecutionService:
+    config = LLMRoutingConfig(
+        mode="llm",
+        targets={
+            "default": LLMProviderConfig(
+                target="default",
+                provider="openai-compatible",
+                base_url="http://llm.test",
+                model="test-model",
+                api_key=None,
+                timeout_seconds=5.0,
+                temperature=0.2,
+                max_tokens=100,
+                system_prompt="system",
+            )
+        },
+        default_target="default",
+        role_routes={},
+        module_prefix_routes={},
+    )
+    return ActionRuntimeExecutionService(
+        registry=AgentRegistry(),
+        profile_loader=AgentProfileLoader(".agents/roles"),
+        llm_config=config,
+        llm_executor=RoutedLLMExecutor(config, http_post=http_post),
+        llm_init_error=None,
+        coalescer=coalescer,
+    )
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_concurrent_identical_executions_share_one_provider_call() -> None:
+    http_post = _GatedHttpPost()
+    coalescer = ExecutionCoalescer()
+    service = _service(http_post, coalescer)
+    results: list[dict[str, object]] = []
+
+    def call() -> None:
+        status, payload = service.execute(
+            {"text": "implement module", "role": "module-dev", "task_id": "t1"}
+        )
+        assert int(status) == 200
+        results.append(payload)
+
+    workers = [threading.Thread(target=call) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    _wait_for(lambda: coalescer.snapshot()["coalesced"] == 3)
+    http_post.gate.set()
+    for worker in workers:
+        worker.join()
+
+    assert http_post.calls == 1
+    assert {payload["summary"] for payload in results} == {"call 1"}
+    assert len({payload["trace_id"] for payload in results}) == 4
+    assert sum(1 for payload in results if payload["metadata"].get("coalesced")) == 3
+    snapshot = coalescer.snapshot()
+    assert snapshot["leaders"] == 1
+    assert snapshot["in_flight"] == 0
+
+
+def test_async_executions_coalesce_and_sequential_calls_do_not() -> None:
+    http_post = _GatedHttpPost()
+    http_post.gate.set()
+    coalescer = ExecutionCoalescer()
+    service = _service(http_post, coalescer)
+
+    async def scenario() -> list[dict[str, object]]:
+        outcomes = await asyncio.gather(
+            *(service.execute_async({"text": "review diff"}) for _ in range(3))
+        )
+        return [payload for _, payload in outcomes]
+
+    results = asyncio.run(scenario())
+    assert http_post.calls == 1
+    assert len({payload["trace_id"] for payload in results}) == 3
+
+    service.execute({"text": "review diff"})
+    assert http_post.calls == 2
+    assert service.build_capabilities_payload()["execution_coalescing"]["coalesced"] == 2
+
+
+def test_executions_for_different_tasks_are_not_coalesced() -> None:
+    # task_id reaches the provider prompt, so requests that differ only in it
+    # must not share a response.
+    http_post = _GatedHttpPost()
+    http_post.gate.set()
+    coalescer = ExecutionCoalescer()
+    service = _service(http_post, coalescer)
+
+    async def scenario() -> None:
+        await asyncio.gather(
+            *(
+                service.execute_async({"text": "implement", "task_id": f"t{index}"})
+                for index in range(3)
+            )
+        )
+
+    asyncio.run(scenario())
+    assert http_post.calls == 3
+    assert coalescer.snapshot()["coalesced"] == 0
+
+
+def test_disabled_roles_are_never_coalesced() -> None:
+    http_post = _GatedHttpPost()
+    http_post.gate.set()
+    coalescer = ExecutionCoalescer(disabled_roles={"module-dev"})
+    service = _service(http_post, coalescer)
+
+    async def scenario() -> None:
+        await asyncio.gather(
+            *(
+                service.execute_async({"text": "implement", "role": "module-dev"})
+                for _ in range(3)
+            )
+        )
+
+    asyncio.run(scenario())
+    assert http_post.calls == 3
+    assert coalescer.snapshot()["bypassed"] == 3
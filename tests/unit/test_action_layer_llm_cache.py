@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from action_layer.services import (
+    InMemoryLLMResponseCacheBackend,
+    LLMProviderConfig,
+    LLMResponseCache,
+    LLMRoutingConfig,
+    RoutedLLMExecutor,
+    SqliteLLMResponseCacheBackend,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingHttpPost:
+    def __init__(self, status: str = "success") -> None:
+        self.calls = 0
+        self.status = status
+
+    def __call__(
+        self,
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, object],
+        timeout_seconds: float,
+    ) -> dict[str, object]:
+        self.calls += 1
+        content = f'{{"status":"{self.status}","summary":"call {self.calls}"}}'
+        return {"choices": [{"message": {"content": content}}]}
+
+
+def _routed(cache: LLMResponseCache, http_post: _CountingHttpPost) -> RoutedLLMExecutor:
+    config = LLMRoutingConfig(
+        mode="llm",
+        targets={
+            "default": LLMProviderConfig(
+                target="default",
+                provider="openai-compatible",
+                base_url="http://llm.test",
+                model="test-model",
+                api_key=None,
+                timeout_seconds=5.0,
+                temperature=0.2,
+                max_tokens=100,
+                system_prompt="system",
+            )
+        },
+        default_target="default",
+        role_routes={},
+        module_prefix_routes={},
+    )
+    return RoutedLLMExecutor(config, http_post=http_post, cache=cache)
+
+
+def test_routed_executor_serves_repeated_prompts_from_cache() -> None:
+    http_post = _CountingHttpPost()
+    cache = LLMResponseCache(InMemoryLLMResponseCacheBackend())
+    executor = _routed(cache, http_post)
+
+    first = executor.execute(
+        {"text": "plan", "role": "module-dev", "task_id": "t1"},
+        profile_hash="p1",
+    )
+    second = executor.execute(
+        {"text": "plan", "role": "module-dev", "task_id": "t2"},
+        profile_hash="p1",
+    )
+    third = asyncio.run(
+        executor.execute_async({"text": "plan", "role": "module-dev"}, profile_hash="p1")
+    )
+
+    assert http_post.calls == 1
+    assert second["summary"] == third["summary"] == "call 1"
+    assert second["metadata"]["llm_cache"] == "hit"
+    assert "llm_cache" not in first["metadata"]
+    assert second["trace_id"] != first["trace_id"]
+    assert executor.cache_snapshot()["hits"] == 2
+
+
+def test_cache_key_tracks_profile_hash_and_prompt() -> None:
+    http_post = _CountingHttpPost()
+    executor = _routed(LLMResponseCache(InMemoryLLMResponseCacheBackend()), http_post)
+
+    executor.execute({"text": "plan"}, profile_hash="p1")
+    executor.execute({"text": "plan"}, profile_hash="p2")
+    executor.execute({"text": "plan again"}, profile_hash="p2")
+
+    assert http_post.calls == 3
+
+
+def test_failed_results_and_disabled_roles_are_not_cached() -> None:
+    failing = _CountingHttpPost(status="failed")
+    executor = _routed(LLMResponseCache(InMemoryLLMResponseCacheBackend()), failing)
+    executor.execute({"text": "plan"})
+    executor.execute({"text": "plan"})
+    assert failing.calls == 2
+
+    http_post = _CountingHttpPost()
+    cache = LLMResponseCache(InMemoryLLMResponseCacheBackend(), disabled_roles={"QA-Test"})
+    executor = _routed(cache, http_post)
+    executor.execute({"text": "plan", "role": "qa-test"})
+    executor.execute({"text": "plan", "role": "qa-test"})
+    assert http_post.calls == 2
+    assert cache.snapshot()["bypassed"] == 2
+
+
+def test_memory_backend_evicts_least_recent_and_expired_entries() -> None:
+    clock = _Clock()
+    cache = LLMResponseCache(
+        InMemoryLLMResponseCacheBackend(max_entries=2, ttl_seconds=60),
+        clock=clock,
+    )
+    for key in ("a", "b"):
+        cache.put(key, {"status": "success", "summary": key})
+    assert cache.get("a") is not None
+    cache.put("c", {"status": "success", "summary": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    clock.now += 61
+    assert cache.get("c") is None
+    snapshot = cache.snapshot()
+    assert snapshot["evictions"] == 1
+    assert snapshot["entries"] == 1
+
+
+def test_sqlite_backend_persists_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite3"
+    clock = _Clock()
+    first = LLMResponseCache(
+        SqliteLLMResponseCacheBackend(path, max_entries=2, ttl_seconds=60),
+        backend_name="sqlite",
+        clock=clock,
+    )
+    for key in ("a", "b", "c"):
+        clock.now += 1
+        first.put(key, {"status": "success", "summary": key, "metadata": {}})
+    assert first.snapshot()["evictions"] == 1
+    first.close()
+
+    second = LLMResponseCache(
+        SqliteLLMResponseCacheBackend(path, max_entries=2, ttl_seconds=60),
+        backend_name="sqlite",
+        clock=clock,
+    )
+    assert second.get("a") is None
+    cached = second.get("c")
+    assert cached is not None and cached["summary"] == "c"
+    clock.now += 120
+    assert second.get("b") is None
+    second.close()
@@ -0,0 +1,142 @@
+import asyncio
+import json
+
+from action_layer.services.llm_executor import (
+    LLMProviderConfig,
+    OllamaLLMExecutor,
+    OpenAICompatibleLLMExecutor,
+)
+from action_layer.services.llm_executor_streaming import StreamingResultScanner
+from action_layer.services.llm_executor_transport import AsyncLLMTransport, RetryPolicy
+
+ANSWER = json.dumps(
+    {
+        "metadata": {"status": "nested-ignored"},
+        "agent_trace": {
+            "standard": "ReAct",
+            "steps": [
+                {"index": 1, "phase": "plan", "content": "read } the { code", "status": "ok"},
+                {"index": 2, "phase": "act", "tool": "edit", "status": "ok"},
+            ],
+        },
+        "status": "success",
+        "summary": "streamed",
+    }
+)
+
+
+def _config(base_url: str, provider: str = "openai-compatible") -> LLMProviderConfig:
+    return LLMProviderConfig(
+        target="stream",
+        provider=provider,
+        base_url=base_url,
+        model="test-model",
+        api_key=None,
+        timeout_seconds=2.0,
+        temperature=0.2,
+        max_tokens=100,
+        system_prompt="system",
+    )
+
+
+async def _start_stream_server(lines: list[bytes], requests: list[dict[str, object]]):
+    finished = asyncio.Event()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        headers: dict[str, str] = {}
+        await reader.readline()
+        while (line := await reader.readline()) not in {b"\r\n", b""}:
+            name, _, value = line.decode().partition(":")
+            headers[name.strip().lower()] = value.strip()
+        requests.append(json.loads(await reader.readexactly(int(headers["content-length"]))))
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+            b"Transfer-Encoding: chunked\r\n\r\n"
+        )
+        try:
+            for line in lines:
+                chunk = line + b"\n"
+                writer.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+                await writer.drain()
+                await asyncio.sleep(0)
+            # Never send [DONE] or the terminating chunk: the client has to stop
+            # on the parsed result and close the connection itself.
+            await asyncio.wait_for(reader.read(), timeout=5)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            finished.set()
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}", finished
+
+
+def _pieces(text: str, size: int = 7) -> list[str]:
+    return [text[index : index + size] for index in range(0, len(text), size)]
+
+
+def test_scanner_reports_top_level_status_and_trace_steps_incrementally() -> None:
+    scanner = StreamingResultScanner()
+    events: list[dict[str, object]] = []
+    for piece in _pieces("```json\n" + ANSWER + "\n``` trailing", size=3):
+        events.extend(scanner.feed(piece))
+
+    assert [event["event"] for event in events] == ["trace_step", "trace_step", "status"]
+    assert events[0]["step"]["content"] == "read } the { code"
+    assert events[2]["status"] == "success"
+    assert scanner.complete
+    assert json.loads(scanner.text)["summary"] == "streamed"
+
+
+def test_openai_stream_emits_steps_and_aborts_after_terminal_object() -> None:
+    async def scenario() -> None:
+        requests: list[dict[str, object]] = []
+        lines = [
+            b"data: " + json.dumps({"choices": [{"delta": {"content": piece}}]}).encode()
+            for piece in _pieces(ANSWER)
+        ]
+        server, url, finished = await _start_stream_server(lines, requests)
+        transport = AsyncLLMTransport(retry_policy=RetryPolicy(max_retries=0))
+        executor = OpenAICompatibleLLMExecutor(_config(url), transport=transport)
+        try:
+            events = [event async for event in executor.stream({"text": "go"})]
+            await asyncio.wait_for(finished.wait(), timeout=1.0)
+        finally:
+            server.close()
+
+        assert requests[0]["stream"] is True
+        kinds = [event["event"] for event in events if event["event"] != "delta"]
+        assert kinds == ["trace_step", "trace_step", "status", "result"]
+        result = events[-1]["result"]
+        assert result["summary"] == "streamed"
+        assert result["metadata"]["llm_wire_api"] == "chat_completions"
+        assert transport.snapshot()["idle_connections"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_ollama_stream_reads_ndjson_chunks() -> None:
+    async def scenario() -> None:
+        requests: list[dict[str, object]] = []
+        lines = [
+            json.dumps({"message": {"content": piece}, "done": False}).encode()
+            for piece in _pieces('{"status":"failed","summary":"local model"}')
+        ]
+        lines.append(json.dumps({"message": {"content": ""}, "done": True}).encode())
+        server, url, _ = await _start_stream_server(lines, requests)
+        executor = OllamaLLMExecutor(
+            _config(url, provider="ollama"),
+            transport=AsyncLLMTransport(retry_policy=RetryPolicy(max_retries=0)),
+        )
+        try:
+            events = [event async for event in executor.stream({"text": "go"})]
+        finally:
+            server.close()
+
+        assert requests[0]["stream"] is True
+        assert events[-1]["result"]["status"] == "failed"
+        assert events[-1]["result"]["summary"] == "local model"
+
+    asyncio.run(scenario())
@@ -0,0 +1,318 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from action_layer.services.llm_executor import (
+    LLMExecutionError,
+    LLMProviderConfig,
+    OpenAICompatibleLLMExecutor,
+)
+from action_layer.services import llm_executor_transport
+from action_layer.services.llm_executor_transport import (
+    AsyncLLMTransport,
+    RetryPolicy,
+    parse_retry_after,
+    resolve_proxy,
+)
+
+
+class _ScriptedServer:
+    def __init__(self, responses: list[tuple[int, dict[str, str], dict[str, object]]]) -> None:
+        self.responses = list(responses)
+        self.connections = 0
+        self.requests: list[dict[str, object]] = []
+        self.delay_seconds = 0.0
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        assert self._server is not None
+        self._server.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    return
+                headers: dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in {b"\r\n", b""}:
+                        break
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", "0")))
+                self.requests.append(json.loads(body))
+                if self.delay_seconds:
+                    await asyncio.sleep(self.delay_seconds)
+                status, extra_headers, payload = (
+                    self.responses.pop(0) if self.responses else (200, {}, {"ok": True})
+                )
+                response_body = json.dumps(payload).encode()
+                head = [f"HTTP/1.1 {status} X", f"Content-Length: {len(response_body)}"]
+                head.extend(f"{key}: {value}" for key, value in extra_headers.items())
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + response_body)
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+
+def _fast_policy(max_retries: int = 2) -> RetryPolicy:
+    return RetryPolicy(max_retries=max_retries, base_delay_seconds=0.01, max_delay_seconds=1.0)
+
+
+def test_transport_reuses_keepalive_connection_per_origin() -> None:
+    async def scenario() -> None:
+        server = _ScriptedServer([])
+        await server.start()
+        transport = AsyncLLMTransport(max_connections=2, retry_policy=_fast_policy())
+        try:
+            for index in range(5):
+                payload = await transport.post(f"{server.url}/v1/chat", {}, {"n": index}, 5.0)
+                assert payload == {"ok": True}
+        finally:
+            await transport.aclose()
+            await server.stop()
+        assert server.connections == 1
+        assert [item["n"] for item in server.requests] == [0, 1, 2, 3, 4]
+        assert transport.snapshot()["connections_opened"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_transport_keeps_one_pool_per_loop_and_closes_pools_of_closed_loops() -> None:
+    loop = asyncio.new_event_loop()
+    server = _ScriptedServer([])
+    loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    loop_thread.start()
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+    transport = AsyncLLMTransport(retry_policy=_fast_policy())
+    try:
+        for _ in range(2):
+            assert asyncio.run(transport.post(f"{server.url}/x", {}, {}, 5.0)) == {"ok": True}
+            # The pool of the finished loop is pruned when the next loop binds.
+            assert transport.snapshot()["idle_connections"] == 1
+        assert server.connections == 2
+    finally:
+        asyncio.run(transport.aclose())
+        asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        loop_thread.join()
+    assert transport.snapshot()["idle_connections"] == 0
+
+
+def test_transport_falls_back_to_urllib_when_a_proxy_applies(monkeypatch) -> None:
+    calls: list[str] = []
+
+    def fake_http_post(url, headers, payload, timeout_seconds):
+        calls.append(url)
+        return {"ok": "proxied"}
+
+    monkeypatch.setattr(llm_executor_transport, "default_http_post", fake_http_post)
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    monkeypatch.setenv("NO_PROXY", "llm.local")
+    assert resolve_proxy("https://api.example.com/v1") == "http://proxy.internal:3128"
+    assert resolve_proxy("https://llm.local/v1") is None
+
+    async def scenario() -> None:
+        transport = AsyncLLMTransport(retry_policy=_fast_policy())
+        try:
+            assert await transport.post("https://api.example.com/v1", {}, {}, 5.0) == {
+                "ok": "proxied"
+            }
+            with pytest.raises(LLMExecutionError, match="http proxy"):
+                async for _ in transport.stream_lines("https://api.example.com/v1", {}, {}, 5.0):
+                    pass
+        finally:
+            await transport.aclose()
+        assert transport.snapshot()["connections_opened"] == 0
+
+    asyncio.run(scenario())
+    assert calls == ["https://api.example.com/v1"]
+
+
+def test_transport_stream_reports_malformed_chunk_size() -> None:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        headers: dict[str, str] = {}
+        await reader.readline()
+        while (line := await reader.readline()) not in {b"\r\n", b""}:
+            name, _, value = line.decode().partition(":")
+            headers[name.strip().lower()] = value.strip()
+        await reader.readexactly(int(headers["content-length"]))
+        writer.write(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\nzz\r\n")
+        await writer.drain()
+        writer.close()
+
+    async def scenario() -> None:
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        transport = AsyncLLMTransport(retry_policy=_fast_policy())
+        try:
+            with pytest.raises(LLMExecutionError, match="malformed chunk size"):
+                async for _ in transport.stream_lines(f"http://127.0.0.1:{port}/x", {}, {}, 5.0):
+                    pass
+        finally:
+            await transport.aclose()
+            server.close()
+
+    asyncio.run(scenario())
+
+
+def test_transport_retries_server_errors_and_honours_retry_after() -> None:
+    async def scenario() -> None:
+        server = _ScriptedServer(
+            [
+                (503, {}, {"error": "busy"}),
+                (429, {"Retry-After": "0"}, {"error": "slow down"}),
+                (200, {}, {"ok": "third"}),
+            ]
+        )
+        await server.start()
+        transport = AsyncLLMTransport(retry_policy=_fast_policy())
+        try:
+            assert await transport.post(f"{server.url}/x", {}, {}, 5.0) == {"ok": "third"}
+        finally:
+            await transport.aclose()
+            await server.stop()
+        assert transport.snapshot()["retries_total"] == 2
+
+    asyncio.run(scenario())
+
+
+def test_transport_gives_up_when_retry_after_exceeds_max_delay() -> None:
+    async def scenario() -> None:
+        server = _ScriptedServer([(429, {"Retry-After": "120"}, {"error": "quota"})])
+        await server.start()
+        transport = AsyncLLMTransport(retry_policy=_fast_policy())
+        try:
+            with pytest.raises(LLMExecutionError, match="retry-after 120.0s"):
+                await transport.post(f"{server.url}/x", {}, {}, 5.0)
+        finally:
+            await transport.aclose()
+            await server.stop()
+        assert len(server.requests) == 1
+
+    asyncio.run(scenario())
+
+
+def test_transport_does_not_retry_client_errors() -> None:
+    async def scenario() -> None:
+        server = _ScriptedServer([(401, {}, {"error": "bad key"})])
+        await server.start()
+        transport = AsyncLLMTransport(retry_policy=_fast_policy())
+        try:
+            with pytest.raises(LLMExecutionError, match="HTTP 401"):
+                await transport.post(f"{server.url}/x", {}, {}, 5.0)
+        finally:
+            await transport.aclose()
+            await server.stop()
+        assert len(server.requests) == 1
+
+    asyncio.run(scenario())
+
+
+def test_transport_enforces_total_timeout() -> None:
+    async def scenario() -> None:
+        server = _ScriptedServer([])
+        server.delay_seconds = 1.0
+        await server.start()
+        transport = AsyncLLMTransport(retry_policy=_fast_policy(max_retries=0))
+        try:
+            with pytest.raises(LLMExecutionError, match="timed out after 0.1s"):
+                await transport.post(f"{server.url}/x", {}, {}, 0.1)
+        finally:
+            await transport.aclose()
+            await server.stop()
+
+    asyncio.run(scenario())
+
+
+def test_transport_is_usable_as_blocking_http_post_from_threads() -> None:
+    loop = asyncio.new_event_loop()
+    server = _ScriptedServer([])
+    loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    loop_thread.start()
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+    transport = AsyncLLMTransport(retry_policy=_fast_policy())
+    try:
+        results: list[dict[str, object]] = []
+        workers = [
+            threading.Thread(
+                target=lambda index=index: results.append(
+                    transport(f"{server.url}/x", {}, {"n": index}, 5.0)
+                )
+            )
+            for index in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        assert results == [{"ok": True}] * 4
+        assert transport(f"{server.url}/x", {}, {}, 5.0) == {"ok": True}
+        assert server.connections <= 4
+    finally:
+        transport.close()
+        asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        loop_thread.join()
+
+
+def test_executor_execute_async_uses_pooled_transport() -> None:
+    async def scenario() -> None:
+        server = _ScriptedServer(
+            [
+                (
+                    200,
+                    {},
+                    {"choices": [{"message": {"content": '{"status":"success","summary":"pooled"}'}}]},
+                )
+            ]
+        )
+        await server.start()
+        executor = OpenAICompatibleLLMExecutor(
+            LLMProviderConfig(
+                target="local",
+                provider="openai-compatible",
+                base_url=server.url,
+                model="test-model",
+                api_key=None,
+                timeout_seconds=5.0,
+                temperature=0.2,
+                max_tokens=100,
+                system_prompt="system",
+            ),
+            transport=AsyncLLMTransport(retry_policy=_fast_policy()),
+        )
+        try:
+            result = await executor.execute_async({"text": "hello"})
+        finally:
+            assert executor.transport is not None
+            await executor.transport.aclose()
+            await server.stop()
+        assert result["summary"] == "pooled"
+        assert result["metadata"]["llm_target"] == "local"
+        assert server.requests[0]["model"] == "test-model"
+
+    asyncio.run(scenario())
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates() -> None:
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("") is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Thu, 01 Jan 1970 00:00:10 GMT", now=4.0) == 6.0
@@ -4,6 +4,7 @@ import control_center.main as main_module
 from control_center.main import app
 from control_center.models import (
     ActionExecuteResponse,
+    ActionExecuteStreamEvent,
     ActionLayerHealthResponse,
 )
 from control_center.services import ActionLayerClientError
@@ -29,6 +30,15 @@ class StubActionLayerOk:
         )
 
 
+class StubActionLayerStream(StubActionLayerOk):
+    async def execute_stream(self, payload):
+        yield ActionExecuteStreamEvent(event="status", data={"status": "success"})
+        yield ActionExecuteStreamEvent(
+            event="result",
+            data={"status_code": 200, "result": {"summary": f"executed: {payload.text}"}},
+        )
+
+
 class StubActionLayerError:
     async def get_health(self) -> ActionLayerHealthResponse:
         raise ActionLayerClientError("action layer unavailable: connect timeout")
@@ -36,6 +46,10 @@ class StubActionLayerError:
     async def execute(self, payload) -> ActionExecuteResponse:
         raise ActionLayerClientError("action layer request failed: HTTP 500")
 
+    async def execute_stream(self, payload):
+        raise ActionLayerClientError("action layer request failed: HTTP 429")
+        yield  # pragma: no cover
+
 
 def test_action_layer_health_proxy_success(monkeypatch) -> None:
     monkeypatch.setattr(main_module, "action_layer", StubActionLayerOk())
@@ -78,3 +92,21 @@ def test_action_layer_execute_validation_422() -> None:
     detail = response.json()["detail"]
     assert isinstance(detail, list)
     assert any(item.get("loc", [None])[-1] == "text" for item in detail)
+
+
+def test_action_layer_execute_stream_proxy_relays_sse(monkeypatch) -> None:
+    monkeypatch.setattr(main_module, "action_layer", StubActionLayerStream())
+    response = client.post("/action-layer/execute/stream", json={"text": "stream it"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    frames = [frame for frame in response.text.split("\n\n") if frame]
+    assert frames[0] == 'event: status\ndata: {"status": "success"}'
+    assert frames[1].startswith("event: result\n")
+    assert "executed: stream it" in frames[1]
+
+
+def test_action_layer_execute_stream_proxy_maps_errors_to_503(monkeypatch) -> None:
+    monkeypatch.setattr(main_module, "action_layer", StubActionLayerError())
+    response = client.post("/action-layer/execute/stream", json={"text": "stream it"})
+    assert response.status_code == 503
+    assert "HTTP 429" in response.json()["detail"]
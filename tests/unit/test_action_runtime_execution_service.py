@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import os
 
-from action_layer.services import AgentProfileLoader, AgentRegistry
+from action_layer.services import (
+    AgentProfileLoader,
+    AgentRegistry,
+    LLMProviderConfig,
+    LLMRoutingConfig,
+    RoutedLLMExecutor,
+)
 from action_layer.services.runtime_execution import ActionRuntimeExecutionService
 
 
@@ -83,3 +90,49 @@ def test_action_runtime_execution_service_mock_response_has_agent_trace() -> Non
             os.environ.pop("ACTION_LAYER_REQUIRE_LLM", None)
         else:
             os.environ["ACTION_LAYER_REQUIRE_LLM"] = previous
+
+
+def test_action_runtime_execution_service_execute_async_matches_sync_contract() -> None:
+    config = LLMRoutingConfig(
+        mode="llm",
+        targets={
+            "default": LLMProviderConfig(
+                target="default",
+                provider="openai-compatible",
+                base_url="http://llm.test",
+                model="test-model",
+                api_key=None,
+                timeout_seconds=5.0,
+                temperature=0.2,
+                max_tokens=100,
+                system_prompt="system",
+            )
+        },
+        default_target="default",
+        role_routes={},
+        module_prefix_routes={},
+    )
+
+    def fake_http_post(
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, object],
+        timeout_seconds: float,
+    ) -> dict[str, object]:
+        return {"choices": [{"message": {"content": '{"status":"success","summary":"async ok"}'}}]}
+
+    service = ActionRuntimeExecutionService(
+        registry=AgentRegistry(),
+        profile_loader=AgentProfileLoader(".agents/roles"),
+        llm_config=config,
+        llm_executor=RoutedLLMExecutor(config, http_post=fake_http_post),
+        llm_init_error=None,
+    )
+
+    sync_status, sync_payload = service.execute({"text": "implement"})
+    async_status, async_payload = asyncio.run(service.execute_async({"text": "implement"}))
+
+    assert int(sync_status) == int(async_status) == 200
+    assert sync_payload["summary"] == async_payload["summary"] == "async ok"
+    assert async_payload["metadata"]["llm_route_reason"] == "default"
+    assert async_payload["agent_trace"]["standard"] == "ReAct"
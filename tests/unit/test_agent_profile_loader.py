@@ -100,6 +100,55 @@ def test_loader_falls_back_to_secondary_root(tmp_path: Path) -> None:
     assert profile.content == "legacy rules"
 
 
+def test_profile_cache_reuses_content_until_file_changes(tmp_path: Path) -> None:
+    profiles_root = tmp_path / "agents"
+    profile_path = _write_profile(profiles_root, "module-dev", "dev rules")
+    now = [100.0]
+    loader = AgentProfileLoader(
+        str(profiles_root),
+        fallback_roots=None,
+        revalidate_seconds=5.0,
+        clock=lambda: now[0],
+    )
+
+    first = loader.load("module-dev")
+    profile_path.write_text("dev rules v2 with more text", encoding="utf-8")
+    assert loader.load("module-dev") is first
+
+    now[0] += 10
+    refreshed = loader.load("module-dev")
+    assert refreshed.content == "dev rules v2 with more text"
+    assert refreshed.profile_hash != first.profile_hash
+
+    now[0] += 10
+    assert loader.load("module-dev") is refreshed
+
+
+def test_profile_cache_picks_up_standard_profile_added_after_legacy(tmp_path: Path) -> None:
+    profiles_root = tmp_path / "agents"
+    role_dir = profiles_root / "module-dev"
+    role_dir.mkdir(parents=True)
+    (role_dir / "agent.md").write_text("legacy rules", encoding="utf-8")
+    loader = AgentProfileLoader(str(profiles_root), fallback_roots=None, revalidate_seconds=0)
+
+    assert loader.load("module-dev").content == "legacy rules"
+    _write_profile(profiles_root, "module-dev", "standard rules")
+    assert loader.load("module-dev").content == "standard rules"
+
+
+def test_audit_events_are_bounded(tmp_path: Path) -> None:
+    profiles_root = tmp_path / "agents"
+    _write_profile(profiles_root, "module-dev", "dev rules")
+    loader = AgentProfileLoader(str(profiles_root), audit_limit=3)
+
+    for _ in range(10):
+        loader.load("module-dev")
+
+    events = loader.get_audit_events()
+    assert len(events) == 3
+    assert all(event.action == "allow" for event in events)
+
+
 def test_default_registry_roles_have_profiles_in_repo() -> None:
     repo_root = Path(__file__).resolve().parents[2]
     profiles_root = repo_root / ".agents" / "roles"
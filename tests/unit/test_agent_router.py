@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 from control_center.services import AgentRouter
@@ -103,3 +104,26 @@ def test_agent_router_can_update_and_read_config(tmp_path: Path) -> None:
     config = router.get_config()
     assert config["default_agent"] == "coding-agent"
     assert config["rules"][0]["id"] == "rule_review_only"
+
+
+def test_agent_router_matcher_matches_linear_scan_precedence(tmp_path: Path) -> None:
+    config_path = tmp_path / "agents.routing.json"
+    rules = [
+        {"id": "late", "agent": "late-agent", "priority": 30, "keywords": ["auth", "login"]},
+        {"id": "overlap", "agent": "overlap-agent", "priority": 10, "keywords": ["ogin", "xyz"]},
+        {"id": "off", "agent": "off-agent", "priority": 1, "enabled": False, "keywords": ["a"]},
+        {"id": "suffix", "agent": "suffix-agent", "priority": 20, "keywords": ["in fix"]},
+    ]
+    config_path.write_text(
+        json.dumps({"default_agent": "coding-agent", "rules": rules}),
+        encoding="utf-8",
+    )
+    router = AgentRouter(str(config_path))
+
+    decision = router.route("auto", "Fix LOGIN in fix mode")
+    assert (decision.rule_id, decision.matched_keyword) == ("overlap", "ogin")
+    decision = router.route("auto", "auth in fixtures")
+    assert (decision.rule_id, decision.matched_keyword) == ("suffix", "in fix")
+    decision = router.route("auto", "auth only")
+    assert (decision.rule_id, decision.matched_keyword) == ("late", "auth")
+    assert router.route("auto", "nothing relevant").reason == "default_agent"
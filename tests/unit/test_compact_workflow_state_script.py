@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+from control_center.services import SQLiteStateStore, WorkflowScheduler
+from control_center.services.context_memory_store import ContextMemoryStore
+
+
+def test_compact_workflow_state_script_archives_and_vacuums(tmp_path: Path) -> None:
+    repo_root = Path(__file__).resolve().parents[2]
+    db_path = tmp_path / "state.db"
+    archive_path = tmp_path / "state.archive.db"
+
+    state_store = SQLiteStateStore(str(db_path))
+    scheduler = WorkflowScheduler(state_store=state_store)
+    finished = scheduler.create_run(project_id="proj-finished")
+    item = scheduler.add_workitem(finished.id, role="module-dev", module_key="core")
+    scheduler.tick(finished.id)
+    scheduler.start_workitem(item.id)
+    scheduler.complete_workitem(item.id, success=True)
+    active = scheduler.create_run(project_id="proj-active")
+    memory = ContextMemoryStore(state_store=state_store)
+    memory.upsert(scope="shared", key="stale", value=1, updated_by="ops")
+    memory.delete(scope="shared", key="stale")
+    state_store.close()
+
+    env = os.environ.copy()
+    env["WHERECODE_SQLITE_PATH"] = str(db_path)
+    env["WHERECODE_WORKFLOW_ARCHIVE_PATH"] = str(archive_path)
+    completed = subprocess.run(
+        [
+            "python3",
+            "scripts/compact_workflow_state.py",
+            "--retention-days",
+            "0",
+            "--tombstone-retention-days",
+            "0",
+        ],
+        cwd=repo_root,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert completed.returncode == 0, completed.stderr
+    report = json.loads(completed.stdout)
+    assert report["archived_run_ids"] == [finished.id]
+    assert report["vacuumed"] is True
+    assert report["context_memory_tombstones_purged"] == 1
+    assert report["archive"]["runs"] == 1
+
+    reopened = SQLiteStateStore(str(db_path))
+    assert reopened.query_ids("workflow_run") == [active.id]
+    assert reopened.count("workitem") == 0
+    assert reopened.count("context_memory_item") == 0
+    reopened.close()
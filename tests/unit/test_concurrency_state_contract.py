@@ -1,11 +1,19 @@
 import time
 
+import pytest
 from fastapi.testclient import TestClient
 
 from control_center.main import app
 
 
 client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def app_lifespan():
+    # Command workers start with the app lifespan, not on the first request.
+    with client:
+        yield
 FINAL_STATUSES = {"success", "failed", "canceled"}
 
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from control_center.services.config_bootstrap import load_control_center_bootstrap_config
 
 
@@ -15,6 +17,10 @@ def test_config_bootstrap_defaults() -> None:
     assert config.log_level == "INFO"
     assert config.action_layer_timeout_seconds == 180.0
     assert config.action_layer_base_url == "http://127.0.0.1:8100"
+    assert config.action_layer_max_connections == 100
+    assert config.action_layer_max_keepalive_connections == 20
+    assert config.action_layer_keepalive_expiry_seconds == 30.0
+    assert config.action_layer_http2 is False
     assert config.auth_enabled is True
     assert config.auth_token == "change-me"
     assert config.command_orchestrate_default_max_modules == 6
@@ -27,6 +33,20 @@ def test_config_bootstrap_defaults() -> None:
     assert config.role_routing_policy_file == ".agents/policies/role_routing.v3.json"
     assert config.state_backend == "memory"
     assert config.sqlite_path == ".wherecode/state.db"
+    assert config.sqlite_journal_mode == "WAL"
+    assert config.sqlite_synchronous == "NORMAL"
+    assert config.workflow_hydration_mode == "eager"
+    assert config.workflow_terminal_run_cache_size == 64
+    assert config.workflow_archive_path == ".wherecode/state.archive.db"
+    assert config.workflow_archive_retention_days == 30
+    assert config.workflow_max_parallel_workitems == 1
+    assert config.workflow_global_max_parallel_workitems == 0
+    assert config.workflow_role_parallel_limits == {}
+    assert config.workflow_module_parallel_limit == 0
+    assert config.workflow_run_executor_enabled is True
+    assert config.workflow_run_executor_workers == 2
+    assert config.workflow_run_executor_drain_seconds == 30
+    assert config.command_worker_count == 4
 
 
 def test_config_bootstrap_parsing_and_clamping() -> None:
@@ -34,6 +54,8 @@ def test_config_bootstrap_parsing_and_clamping() -> None:
         _env_get_factory(
             {
                 "ACTION_LAYER_TIMEOUT_SECONDS": "12.5",
+                "ACTION_LAYER_MAX_CONNECTIONS": "5000",
+                "ACTION_LAYER_HTTP2": "true",
                 "WHERECODE_AUTH_ENABLED": "false",
                 "WHERECODE_COMMAND_ORCHESTRATE_DEFAULT_MAX_MODULES": "100",
                 "WHERECODE_COMMAND_ORCHESTRATE_PREFIXES": "/a,/b,,",
@@ -42,12 +64,24 @@ def test_config_bootstrap_parsing_and_clamping() -> None:
                 "WHERECODE_METRICS_ROLLBACK_APPROVER_ROLES": "release-manager,ops-admin",
                 "WHERECODE_METRICS_ROLLBACK_APPROVAL_TTL_SECONDS": "bad-int",
                 "WHERECODE_STATE_BACKEND": "SQLITE",
+                "WHERECODE_SQLITE_SYNCHRONOUS": "full",
+                "WHERECODE_SQLITE_JOURNAL_MODE": "delete",
+                "WHERECODE_WORKFLOW_HYDRATION_MODE": "LAZY",
+                "WHERECODE_WORKFLOW_TERMINAL_RUN_CACHE_SIZE": "0",
+                "WHERECODE_WORKFLOW_ARCHIVE_RETENTION_DAYS": "-5",
+                "WHERECODE_WORKFLOW_MAX_PARALLEL_WORKITEMS": "500",
+                "WHERECODE_WORKFLOW_ROLE_PARALLEL_LIMITS": "Module-Dev=4, qa-test=x,,release=0",
+                "WHERECODE_WORKFLOW_RUN_EXECUTOR_ENABLED": "false",
+                "WHERECODE_WORKFLOW_RUN_EXECUTOR_WORKERS": "99",
+                "WHERECODE_COMMAND_WORKERS": "0",
                 "WHERECODE_MAX_MODULE_REFLOWS": "3",
                 "WHERECODE_RELEASE_APPROVAL_REQUIRED": "true",
             }
         )
     )
     assert config.action_layer_timeout_seconds == 12.5
+    assert config.action_layer_max_connections == 1000
+    assert config.action_layer_http2 is True
     assert config.auth_enabled is False
     assert config.command_orchestrate_default_max_modules == 20
     assert config.command_orchestrate_prefixes == ("/a", "/b")
@@ -56,5 +90,27 @@ def test_config_bootstrap_parsing_and_clamping() -> None:
     assert config.metrics_rollback_approver_roles == {"release-manager", "ops-admin"}
     assert config.metrics_rollback_approval_ttl_seconds == 86400
     assert config.state_backend == "sqlite"
+    assert config.sqlite_synchronous == "FULL"
+    assert config.sqlite_journal_mode == "DELETE"
+    assert config.workflow_hydration_mode == "lazy"
+    assert config.workflow_terminal_run_cache_size == 1
+    assert config.workflow_archive_retention_days == 0
+    assert config.workflow_max_parallel_workitems == 64
+    assert config.workflow_role_parallel_limits == {"module-dev": 4}
+    assert config.workflow_run_executor_enabled is False
+    assert config.workflow_run_executor_workers == 32
+    assert config.command_worker_count == 1
     assert config.max_module_reflows == 3
     assert config.release_approval_required is True
+
+
+@pytest.mark.parametrize(
+    ("key", "value"),
+    [
+        ("WHERECODE_SQLITE_JOURNAL_MODE", "bogus"),
+        ("WHERECODE_SQLITE_SYNCHRONOUS", "sometimes"),
+    ],
+)
+def test_bootstrap_config_rejects_unknown_sqlite_modes(key: str, value: str) -> None:
+    with pytest.raises(ValueError, match="unsupported sqlite"):
+        load_control_center_bootstrap_config(_env_get_factory({key: value}))
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from control_center.core.config_watch import ConfigFileWatcher
+from control_center.executors.role_routing import RoleRoutingPolicyService
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_watcher_skips_filesystem_until_recheck_interval(tmp_path: Path) -> None:
+    path = tmp_path / "config.json"
+    path.write_text('{"value": 1}', encoding="utf-8")
+    clock = _Clock()
+    loads: list[int] = []
+
+    def load() -> int:
+        value = json.loads(path.read_text(encoding="utf-8"))["value"]
+        loads.append(value)
+        return value
+
+    watcher = ConfigFileWatcher(path, load, min_recheck_seconds=5.0, clock=clock)
+    path.write_text('{"value": 22}', encoding="utf-8")
+    assert watcher.current() == 1
+
+    clock.now += 6
+    assert watcher.current() == 22
+    clock.now += 6
+    assert watcher.current() == 22
+    assert loads == [1, 22]
+    assert watcher.reload_count == 2
+
+
+def test_watcher_keeps_previous_snapshot_when_reload_fails(tmp_path: Path) -> None:
+    path = tmp_path / "config.json"
+    path.write_text('{"value": 1}', encoding="utf-8")
+    clock = _Clock()
+    watcher = ConfigFileWatcher(
+        path,
+        lambda: json.loads(path.read_text(encoding="utf-8"))["value"],
+        min_recheck_seconds=0,
+        clock=clock,
+    )
+
+    path.write_text("{broken", encoding="utf-8")
+    assert watcher.current() == 1
+    path.write_text('{"value": 3}', encoding="utf-8")
+    assert watcher.current() == 3
+
+
+def test_role_routing_policy_picks_up_edits_after_recheck(tmp_path: Path) -> None:
+    policy_path = tmp_path / "role_routing.json"
+    policy_path.write_text(
+        json.dumps({"roles": {"module-dev": {"executor": "opencode", "strategy": "native"}}}),
+        encoding="utf-8",
+    )
+    service = RoleRoutingPolicyService(str(policy_path), recheck_seconds=0)
+    assert service.resolve("module-dev").strategy.value == "native"
+
+    policy_path.write_text(
+        json.dumps(
+            {"roles": {"module-dev": {"executor": "opencode", "strategy": "ohmy", "agent": "x"}}}
+        ),
+        encoding="utf-8",
+    )
+    route = service.resolve("module-dev")
+    assert route.strategy.value == "ohmy"
+    assert route.agent == "x"
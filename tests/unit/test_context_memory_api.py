@@ -41,6 +41,42 @@ def test_context_memory_upsert_get_and_list_namespace() -> None:
     assert "preferred_lang" in keys
 
 
+def test_context_memory_list_namespace_returns_next_cursor_header() -> None:
+    for index in range(3):
+        client.put(
+            "/context/memory/items",
+            json={
+                "scope": "project",
+                "project_id": "p_ctx_page",
+                "key": f"page_{index}",
+                "value": index,
+                "updated_by": "ops",
+            },
+            headers=HEADERS,
+        )
+    params = {"project_id": "p_ctx_page", "limit": 2}
+    first = client.get("/context/memory/namespaces/project/items", params=params, headers=HEADERS)
+    cursor = first.headers["X-WhereCode-Next-Cursor"]
+    second = client.get(
+        "/context/memory/namespaces/project/items",
+        params={**params, "cursor": cursor},
+        headers=HEADERS,
+    )
+
+    assert len(first.json()) == 2
+    assert len(second.json()) == 1
+    assert "X-WhereCode-Next-Cursor" not in second.headers
+    keys = {item["key"] for item in first.json() + second.json()}
+    assert keys == {"page_0", "page_1", "page_2"}
+
+    invalid = client.get(
+        "/context/memory/namespaces/project/items",
+        params={**params, "cursor": "%%%"},
+        headers=HEADERS,
+    )
+    assert invalid.status_code == 422
+
+
 def test_context_memory_resolve_overrides_and_delete() -> None:
     client.put(
         "/context/memory/items",
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from datetime import timedelta
 from pathlib import Path
 
 import pytest
 
+from control_center.models.hierarchy import now_utc
+
 from control_center.services.context_memory_store import ContextMemoryStore
 from control_center.services.sqlite_state_store import SQLiteStateStore
+from control_center.services.workflow_scheduler import WorkflowScheduler
 
 
 def test_context_memory_upsert_get_and_version_increment() -> None:
@@ -105,3 +109,126 @@ def test_context_memory_delete_persists_tombstone_for_reload(tmp_path: Path) ->
 
     reloaded = ContextMemoryStore(state_store=state_store)
     assert reloaded.get(scope="project", project_id="p1", key="budget") is None
+
+
+def _ticking_clock(step_seconds: int = 1):
+    state = {"now": now_utc()}
+
+    def tick():
+        state["now"] = state["now"] + timedelta(seconds=step_seconds)
+        return state["now"]
+
+    return tick
+
+
+def test_context_memory_list_pages_newest_first_with_cursor() -> None:
+    store = ContextMemoryStore(now_utc_handler=_ticking_clock())
+    for index in range(7):
+        store.upsert(scope="shared", key=f"k{index}", value=index, updated_by="ops")
+    store.upsert(scope="shared", key="k2", value="bumped", updated_by="ops")
+    store.delete(scope="shared", key="k4", deleted_by="ops")
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        page, cursor = store.list_namespace_page(scope="shared", limit=2, cursor=cursor)
+        seen.extend(item["key"] for item in page)
+        if cursor is None:
+            break
+
+    assert seen == ["k2", "k6", "k5", "k3", "k1", "k0"]
+    assert [item["key"] for item in store.list_namespace(scope="shared", limit=3)] == seen[:3]
+    with pytest.raises(ValueError):
+        store.list_namespace_page(scope="shared", cursor="not-a-cursor")
+
+
+def test_context_memory_prefix_listing_uses_key_range() -> None:
+    fixed = now_utc()
+    store = ContextMemoryStore(now_utc_handler=lambda: fixed)
+    for key in ("plan.a", "plan.b", "plan.c", "plans", "pla", "risk"):
+        store.upsert(scope="project", project_id="p1", key=key, value=key, updated_by="ops")
+
+    first, cursor = store.list_namespace_page(
+        scope="project",
+        project_id="p1",
+        prefix="plan.",
+        limit=2,
+    )
+    rest, end = store.list_namespace_page(
+        scope="project",
+        project_id="p1",
+        prefix="plan.",
+        limit=2,
+        cursor=cursor,
+    )
+
+    assert [item["key"] for item in first] == ["plan.c", "plan.b"]
+    assert [item["key"] for item in rest] == ["plan.a"]
+    assert end is None
+
+
+def test_context_memory_resolve_with_keys_only_reads_requested_keys() -> None:
+    store = ContextMemoryStore()
+    for index in range(50):
+        store.upsert(scope="shared", key=f"noise{index}", value=index, updated_by="ops")
+    store.upsert(scope="shared", key="lang", value="python", updated_by="ops")
+    store.upsert(scope="run", run_id="r1", key="lang", value="rust", updated_by="ops")
+
+    resolved = store.resolve(run_id="r1", keys=["lang", "missing", "lang"])
+
+    assert resolved["values"] == {"lang": "rust"}
+    assert resolved["source_namespaces"] == {"lang": "run:r1"}
+    assert store.resolve(keys=[])["values"] == {}
+
+
+def test_context_memory_rejects_oversized_values_and_full_namespaces() -> None:
+    store = ContextMemoryStore(max_items_per_namespace=2, max_value_bytes=16)
+    store.upsert(scope="shared", key="a", value="x", updated_by="ops")
+    store.upsert(scope="shared", key="b", value="y", updated_by="ops")
+
+    with pytest.raises(ValueError, match="exceeds 16 bytes"):
+        store.upsert(scope="shared", key="a", value="x" * 32, updated_by="ops")
+    with pytest.raises(ValueError, match="is full"):
+        store.upsert(scope="shared", key="c", value="z", updated_by="ops")
+
+    assert store.upsert(scope="shared", key="b", value="w", updated_by="ops")["version"] == 2
+    store.delete(scope="shared", key="a")
+    assert store.upsert(scope="shared", key="c", value="z", updated_by="ops")["version"] == 1
+
+
+def test_context_memory_run_namespaces_are_cold_tier_with_lru(tmp_path: Path) -> None:
+    state_store = SQLiteStateStore(str(tmp_path / "state.db"))
+    store = ContextMemoryStore(state_store=state_store, max_resident_run_namespaces=2)
+    for run_id in ("r1", "r2", "r3"):
+        store.upsert(scope="run", run_id=run_id, key="k", value=run_id, updated_by="ops")
+    store.upsert(scope="project", project_id="p1", key="k", value="p", updated_by="ops")
+
+    assert store.resident_run_namespace_ids() == ["run:r2", "run:r3"]
+    assert store.get(scope="run", run_id="r1", key="k")["value"] == "r1"
+    assert store.resident_run_namespace_ids() == ["run:r3", "run:r1"]
+
+    reloaded = ContextMemoryStore(state_store=state_store)
+    assert reloaded.resident_run_namespace_ids() == []
+    assert reloaded.get(scope="project", project_id="p1", key="k")["value"] == "p"
+    resolved = reloaded.resolve(project_id="p1", run_id="r2")
+    assert resolved["values"] == {"k": "r2"}
+    assert reloaded.get(scope="run", run_id="missing", key="k") is None
+    assert reloaded.resident_run_namespace_ids() == ["run:r2"]
+
+
+def test_context_memory_evicts_namespaces_of_terminal_runs(tmp_path: Path) -> None:
+    state_store = SQLiteStateStore(str(tmp_path / "state.db"))
+    scheduler = WorkflowScheduler(state_store=state_store)
+    store = ContextMemoryStore(state_store=state_store)
+    store.attach_workflow_scheduler(scheduler)
+    run = scheduler.create_run(project_id="p1")
+    item = scheduler.add_workitem(run.id, role="module-dev", module_key="core")
+    store.upsert(scope="run", run_id=run.id, key="plan", value="v1", updated_by="ops")
+
+    scheduler.tick(run.id)
+    scheduler.start_workitem(item.id)
+    assert store.resident_run_namespace_ids() == [f"run:{run.id}"]
+
+    scheduler.complete_workitem(item.id, success=True)
+    assert store.resident_run_namespace_ids() == []
+    assert store.get(scope="run", run_id=run.id, key="plan")["value"] == "v1"
@@ -1,11 +1,40 @@
 from __future__ import annotations
 
 import json
+import random
 
 from control_center.services.dev_routing_matrix import (
     DevRoutingMatrixService,
     normalize_task_routing,
 )
+from control_center.services.dev_routing_matrix_index import (
+    CompiledRoutingMatrix,
+    normalize_text_list,
+)
+
+
+def _target(capability_id: str) -> dict[str, str]:
+    return {"role": "module-dev", "capability_id": capability_id, "executor": "coding-agent"}
+
+
+def _linear_select(matrix: dict[str, object], signals: dict[str, list[str]]) -> str:
+    rules = sorted(
+        matrix["rules"],
+        key=lambda item: item["priority"] if isinstance(item.get("priority"), int) else 9999,
+    )
+    for rule in rules:
+        if not isinstance(rule.get("match"), dict) or not rule["target"].get("capability_id"):
+            continue
+        matched = True
+        for key, expected_raw in rule["match"].items():
+            expected = normalize_text_list(expected_raw)
+            actual = normalize_text_list(signals.get(key, []))
+            if expected and actual and set(actual).isdisjoint(expected):
+                matched = False
+                break
+        if matched:
+            return rule["id"]
+    return "default"
 
 
 def test_dev_routing_matrix_service_apply_adds_routing_fields(tmp_path) -> None:
@@ -102,3 +131,73 @@ def test_normalize_task_routing_drops_empty_values() -> None:
     assert normalized["required_checks"] == ["backend-quick"]
     assert normalized["handoff_roles"] == ["qa-test"]
     assert normalized["signals"] == {"domain": ["data"]}
+
+
+def test_compiled_matrix_keeps_priority_and_skips_invalid_rules() -> None:
+    compiled = CompiledRoutingMatrix.compile(
+        {
+            "default_target": _target("builtin.skill.general-dev"),
+            "rules": [
+                {"id": "late", "priority": 20, "match": {"domain": ["DATA"]}, "target": _target("late")},
+                {"id": "broken", "priority": 1, "match": {"domain": ["data"]}, "target": _target("")},
+                {"id": "tie-a", "priority": 5, "match": {"risk": "high"}, "target": _target("a")},
+                {"id": "tie-b", "priority": 5, "match": {"risk": ["high"]}, "target": _target("b")},
+                {"id": "no-priority", "match": {}, "target": _target("catch-all")},
+            ],
+        }
+    )
+
+    assert compiled.select({"domain": ["data"], "risk": ["high"]}).rule_id == "tie-a"
+    assert compiled.select({"domain": ["data"], "risk": ["normal"]}).rule_id == "late"
+    assert compiled.select({"domain": ["web"], "risk": ["normal"]}).rule_id == "no-priority"
+    selection = compiled.select({"domain": ["data"], "risk": ["high"]})
+    assert selection.target["capability_id"] == "a"
+
+
+def test_compiled_matrix_matches_linear_rule_scan() -> None:
+    rng = random.Random(11)
+    vocab = {
+        "domain": ["backend", "frontend", "data", "infra"],
+        "stack": ["react", "fastapi", "go"],
+        "risk": ["high", "normal"],
+        "task_type": ["feature", "bugfix"],
+    }
+    rules = []
+    for index in range(60):
+        match = {
+            key: rng.sample(values, rng.randint(0, 2))
+            for key, values in vocab.items()
+            if rng.random() < 0.5
+        }
+        rules.append(
+            {
+                "id": f"rule-{index}",
+                "priority": rng.randint(1, 30) if index % 7 else "high",
+                "match": match,
+                "target": _target(f"cap-{index}" if index % 9 else ""),
+            }
+        )
+    matrix = {"default_target": _target("builtin.skill.general-dev"), "rules": rules}
+    compiled = CompiledRoutingMatrix.compile(matrix)
+
+    for _ in range(500):
+        signals = {
+            key: rng.sample(values, rng.randint(0, 2))
+            for key, values in vocab.items()
+            if rng.random() < 0.8
+        }
+        assert compiled.select(signals).rule_id == _linear_select(matrix, signals)
+
+
+def test_module_signals_are_memoized_per_profile(tmp_path) -> None:
+    service = DevRoutingMatrixService(str(tmp_path / "missing.json"))
+
+    first = service._module_signals(module_key="auth-api", profile={"stack": ["fastapi"]})
+    first["domain"].append("mutated")
+    second = service._module_signals(module_key="auth-api", profile={"stack": ["FastAPI"]})
+    other = service._module_signals(module_key="auth-api", profile={"stack": ["go"]})
+
+    assert second["domain"] == ["security"]
+    assert second["risk"] == ["high"]
+    assert other["language"] == ["go"]
+    assert len(service._signal_cache) == 2
@@ -1,15 +1,31 @@
+import asyncio
+import threading
 import time
 
+import pytest
 from fastapi.testclient import TestClient
 
+from control_center import main as control_center_main
 from control_center.main import app
+from control_center.models import ActionExecuteResponse
 
 
 client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def app_lifespan():
+    # Command workers start with the app lifespan, not on the first request.
+    with client:
+        yield
 FINAL_STATUSES = {"success", "failed", "canceled"}
 
 
-def wait_for_command_terminal_status(command_id: str, timeout: float = 2.0) -> dict:
+def wait_for_command_status(
+    command_id: str,
+    statuses: set[str],
+    timeout: float = 2.0,
+) -> dict:
     deadline = time.time() + timeout
     last_payload: dict = {}
     while time.time() < deadline:
@@ -17,10 +33,19 @@ def wait_for_command_terminal_status(command_id: str, timeout: float = 2.0) -> d
         assert response.status_code == 200
         payload = response.json()
         last_payload = payload
-        if payload["status"] in FINAL_STATUSES:
+        if payload["status"] in statuses:
             return payload
         time.sleep(0.05)
-    raise AssertionError(f"command {command_id} not terminal within timeout, last={last_payload}")
+    raise AssertionError(
+        f"command {command_id} not in {statuses} within timeout, last={last_payload}"
+    )
+
+
+def wait_for_command_terminal_status(
+    command_id: str,
+    timeout: float = 2.0,
+) -> dict:
+    return wait_for_command_status(command_id, FINAL_STATUSES, timeout)
 
 
 def test_http_async_command_flow() -> None:
@@ -102,7 +127,24 @@ def test_approve_non_approval_command_returns_409() -> None:
     assert response.json()["detail"] == "command does not require approval"
 
 
-def test_project_active_task_count_refreshes_on_waiting_approval() -> None:
+def test_project_active_task_count_refreshes_on_waiting_approval(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    release = threading.Event()
+
+    async def gated_executor(command, task) -> ActionExecuteResponse:
+        # Hold the approved command in RUNNING until the test releases it.
+        if "requires approval" in command.text:
+            while not release.is_set():
+                await asyncio.sleep(0.01)
+        return ActionExecuteResponse(
+            status="success",
+            summary=f"done:{command.text}",
+            agent="coding-agent",
+            trace_id="act_active_count",
+        )
+
+    monkeypatch.setattr(control_center_main.store, "_action_executor", gated_executor)
     project = client.post("/projects", json={"name": "proj-active-count"}).json()
     project_id = project["id"]
     task = client.post(
@@ -111,16 +153,19 @@ def test_project_active_task_count_refreshes_on_waiting_approval() -> None:
     ).json()
     task_id = task["id"]
 
+    def active_task_count() -> int:
+        projects = client.get("/projects").json()
+        return next(item for item in projects if item["id"] == project_id)[
+            "active_task_count"
+        ]
+
     first_command = client.post(
         f"/tasks/{task_id}/commands",
         json={"text": "first success"},
     )
     assert first_command.status_code == 202
     wait_for_command_terminal_status(first_command.json()["command_id"])
-
-    projects_after_first = client.get("/projects").json()
-    project_after_first = next(item for item in projects_after_first if item["id"] == project_id)
-    assert project_after_first["active_task_count"] == 0
+    assert active_task_count() == 0
 
     waiting_command = client.post(
         f"/tasks/{task_id}/commands",
@@ -128,10 +173,7 @@ def test_project_active_task_count_refreshes_on_waiting_approval() -> None:
     )
     assert waiting_command.status_code == 202
     waiting_id = waiting_command.json()["command_id"]
-
-    projects_waiting = client.get("/projects").json()
-    project_waiting = next(item for item in projects_waiting if item["id"] == project_id)
-    assert project_waiting["active_task_count"] == 1
+    assert active_task_count() == 1
 
     waiting_detail = client.get(f"/commands/{waiting_id}").json()
     assert waiting_detail["status"] == "waiting_approval"
@@ -141,12 +183,12 @@ def test_project_active_task_count_refreshes_on_waiting_approval() -> None:
         json={"approved_by": "owner"},
     )
     assert approved.status_code == 200
+    assert approved.json()["status"] == "queued"
 
-    projects_running = client.get("/projects").json()
-    project_running = next(item for item in projects_running if item["id"] == project_id)
-    assert project_running["active_task_count"] == 1
+    wait_for_command_status(waiting_id, {"running"})
+    assert active_task_count() == 1
 
-    wait_for_command_terminal_status(waiting_id)
-    projects_done = client.get("/projects").json()
-    project_done = next(item for item in projects_done if item["id"] == project_id)
-    assert project_done["active_task_count"] == 0
+    release.set()
+    done = wait_for_command_terminal_status(waiting_id)
+    assert done["status"] == "success"
+    assert active_task_count() == 0
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import timedelta
+from pathlib import Path
+
+from control_center.models.hierarchy import now_utc
+from control_center.services.metrics_alert_policy_store import MetricsAlertPolicyStore
+from control_center.services.metrics_alert_policy_store_expiry import (
+    RollbackApprovalExpiryHeap,
+)
+
+
+def _build_store(tmp_path: Path) -> MetricsAlertPolicyStore:
+    return MetricsAlertPolicyStore(
+        str(tmp_path / "policy.json"),
+        str(tmp_path / "audit.jsonl"),
+        str(tmp_path / "approvals.jsonl"),
+        str(tmp_path / "approval_purge_audits.jsonl"),
+        rollback_approval_ttl_seconds=3600,
+    )
+
+
+def _seed_audit(store: MetricsAlertPolicyStore) -> str:
+    store.update_policy(
+        {
+            "failed_run_delta_gt": 1,
+            "failed_run_count_gte": 1,
+            "blocked_run_count_gte": 1,
+            "waiting_approval_count_gte": 1,
+            "in_flight_command_count_gte": 1,
+        },
+        updated_by="ops-admin",
+    )
+    return str(store.list_audits(limit=1)[0]["id"])
+
+
+def test_expiry_heap_pops_only_due_active_approvals() -> None:
+    now = now_utc()
+    approvals = {
+        "due": {"id": "due", "status": "pending", "expires_at": now - timedelta(seconds=5)},
+        "used": {"id": "used", "status": "used", "expires_at": now - timedelta(seconds=9)},
+        "later": {"id": "later", "status": "approved", "expires_at": now + timedelta(hours=1)},
+        "moved": {"id": "moved", "status": "pending", "expires_at": now - timedelta(seconds=1)},
+    }
+    heap = RollbackApprovalExpiryHeap()
+    heap.rebuild(approvals.values())
+    assert len(heap) == 3
+    approvals["moved"]["expires_at"] = now + timedelta(minutes=5)
+
+    expired = heap.pop_expired(now, approvals.get)
+
+    assert [entry["id"] for entry in expired] == ["due"]
+    assert len(heap) == 2
+    assert heap.pop_expired(now + timedelta(minutes=10), approvals.get)[0]["id"] == "moved"
+
+
+def test_dry_run_expiry_is_persisted_by_next_refresh(tmp_path: Path) -> None:
+    store = _build_store(tmp_path)
+    audit_id = _seed_audit(store)
+    created = store.create_rollback_approval(audit_id=audit_id, requested_by="ops-admin")
+    store._rollback_approvals[0]["expires_at"] = now_utc().replace(year=2000)
+    store._persist_rollback_approvals()
+
+    store.purge_rollback_approvals(dry_run=True, remove_expired=False)
+    assert store._find_rollback_approval(created["id"])["status"] == "expired"
+    assert _build_store(tmp_path)._rollback_approvals[0]["status"] == "pending"
+
+    assert store.get_rollback_approval_stats()["expired"] == 1
+    assert _build_store(tmp_path)._rollback_approvals[0]["status"] == "expired"
+
+
+def test_background_expiry_task_appends_one_batch(tmp_path: Path) -> None:
+    store = _build_store(tmp_path)
+    audit_id = _seed_audit(store)
+    for _ in range(3):
+        store.create_rollback_approval(audit_id=audit_id, requested_by="ops-admin")
+    for entry in store._rollback_approvals:
+        entry["expires_at"] = now_utc() - timedelta(seconds=1)
+    store._persist_rollback_approvals()
+
+    async def scenario() -> None:
+        await store.start_rollback_approval_expiry(interval_seconds=0.05)
+        for _ in range(100):
+            if all(entry["status"] == "expired" for entry in store._rollback_approvals):
+                break
+            await asyncio.sleep(0.01)
+        await store.stop_rollback_approval_expiry()
+
+    asyncio.run(scenario())
+
+    lines = (tmp_path / "approvals.jsonl").read_text(encoding="utf-8").splitlines()
+    deltas = [json.loads(line) for line in lines[3:]]
+    assert len(deltas) == 3
+    assert {delta["fields"]["status"] for delta in deltas} == {"expired"}
+    assert len(store._rollback_approval_expiry) == 0
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import random
+from datetime import timedelta
+from pathlib import Path
+
+from control_center.models.hierarchy import now_utc
+from control_center.services.metrics_alert_policy_store import MetricsAlertPolicyStore
+from control_center.services.metrics_alert_policy_store_policy import (
+    filter_rollback_approval_purge_audits,
+)
+from control_center.services.metrics_alert_policy_store_rollback import (
+    is_timestamp_after,
+    is_timestamp_before,
+)
+
+
+def _build_store(tmp_path: Path) -> MetricsAlertPolicyStore:
+    return MetricsAlertPolicyStore(
+        str(tmp_path / "policy.json"),
+        str(tmp_path / "audit.jsonl"),
+        str(tmp_path / "approvals.jsonl"),
+        str(tmp_path / "approval_purge_audits.jsonl"),
+        rollback_approval_ttl_seconds=3600,
+    )
+
+
+def _policy(value: int) -> dict[str, int]:
+    return {
+        "failed_run_delta_gt": value,
+        "failed_run_count_gte": 1,
+        "blocked_run_count_gte": 1,
+        "waiting_approval_count_gte": 1,
+        "in_flight_command_count_gte": 1,
+    }
+
+
+def test_audit_and_rollback_request_lookups_survive_reload(tmp_path: Path) -> None:
+    store = _build_store(tmp_path)
+    store.update_policy(_policy(1), updated_by="ops-admin")
+    first_id = store.list_audits(limit=1)[0]["id"]
+    store.update_policy(_policy(2), updated_by="ops-admin")
+
+    applied = store.rollback_to_audit(first_id, updated_by="ops-admin", idempotency_key="req-1")
+    replay = store.rollback_to_audit(first_id, updated_by="ops-admin", idempotency_key="req-1")
+
+    assert applied["idempotent_replay"] is False
+    assert replay["idempotent_replay"] is True
+    assert replay["audit_count"] == 3
+
+    reloaded = _build_store(tmp_path)
+    assert reloaded.get_audit(first_id)["policy"]["failed_run_delta_gt"] == 1
+    assert reloaded.get_audit("map_missing") is None
+    assert reloaded._find_rollback_by_request_id("req-1")["rollback_from_audit_id"] == first_id
+    assert reloaded._find_rollback_by_request_id("req-2") is None
+
+
+def test_approval_index_follows_create_and_purge(tmp_path: Path) -> None:
+    store = _build_store(tmp_path)
+    store.update_policy(_policy(1), updated_by="ops-admin")
+    audit_id = store.list_audits(limit=1)[0]["id"]
+    used = store.create_rollback_approval(audit_id=audit_id, requested_by="ops-admin")
+    kept = store.create_rollback_approval(audit_id=audit_id, requested_by="ops-admin")
+    store.approve_rollback_approval(used["id"], approved_by="release-manager")
+    store.consume_rollback_approval(used["id"], audit_id=audit_id, used_by="ops-admin")
+
+    store.purge_rollback_approvals()
+
+    assert store._find_rollback_approval(used["id"]) is None
+    assert store.approve_rollback_approval(kept["id"], approved_by="release-manager")[
+        "status"
+    ] == "approved"
+
+
+def test_purge_audit_time_window_matches_linear_filter(tmp_path: Path) -> None:
+    store = _build_store(tmp_path)
+    for _ in range(30):
+        store.purge_rollback_approvals(dry_run=True, requested_by="ops-admin")
+    rng = random.Random(5)
+    base = now_utc()
+    # Out-of-order edits in place, as the GC tooling does before persisting.
+    for entry in store._rollback_approval_purge_audits:
+        entry["created_at"] = base - timedelta(minutes=rng.randint(0, 120))
+    store._persist_rollback_approval_purge_audits()
+    store.purge_rollback_approval_purge_audits(dry_run=True, requested_by="ops-admin")
+
+    for _ in range(50):
+        after = base - timedelta(minutes=rng.randint(0, 130))
+        before = after + timedelta(minutes=rng.randint(0, 60))
+        for window in ({"created_after": after}, {"created_before": before}, {
+            "created_after": after,
+            "created_before": before,
+        }):
+            expected = filter_rollback_approval_purge_audits(
+                store._rollback_approval_purge_audits,
+                event_type="approval_purge",
+                created_after=window.get("created_after"),
+                created_before=window.get("created_before"),
+                is_timestamp_after_handler=is_timestamp_after,
+                is_timestamp_before_handler=is_timestamp_before,
+            )
+            actual = store.list_rollback_approval_purge_audits(
+                limit=1000,
+                event_type="approval_purge",
+                **window,
+            )
+            assert actual == list(reversed(expected))
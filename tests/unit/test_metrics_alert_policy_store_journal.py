@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from control_center.models.hierarchy import now_utc
+from control_center.services import metrics_alert_policy_store_journal as journal
+from control_center.services.metrics_alert_policy_store import MetricsAlertPolicyStore
+
+
+def _build_store(tmp_path: Path) -> MetricsAlertPolicyStore:
+    return MetricsAlertPolicyStore(
+        str(tmp_path / "policy.json"),
+        str(tmp_path / "audit.jsonl"),
+        str(tmp_path / "approvals.jsonl"),
+        str(tmp_path / "approval_purge_audits.jsonl"),
+        rollback_approval_ttl_seconds=3600,
+    )
+
+
+def _seed_audit(store: MetricsAlertPolicyStore) -> str:
+    store.update_policy(
+        {
+            "failed_run_delta_gt": 1,
+            "failed_run_count_gte": 1,
+            "blocked_run_count_gte": 1,
+            "waiting_approval_count_gte": 1,
+            "in_flight_command_count_gte": 1,
+        },
+        updated_by="ops-admin",
+    )
+    return str(store.list_audits(limit=1)[0]["id"])
+
+
+def _lines(path: Path) -> list[str]:
+    return [line for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+def test_approval_changes_append_deltas_and_replay_on_load(tmp_path: Path) -> None:
+    store = _build_store(tmp_path)
+    audit_id = _seed_audit(store)
+    approval_path = tmp_path / "approvals.jsonl"
+
+    first = store.create_rollback_approval(audit_id=audit_id, requested_by="ops-admin")
+    second = store.create_rollback_approval(audit_id=audit_id, requested_by="ops-admin")
+    before = _lines(approval_path)
+    store.approve_rollback_approval(first["id"], approved_by="release-manager")
+    store.consume_rollback_approval(first["id"], audit_id=audit_id, used_by="ops-admin")
+
+    after = _lines(approval_path)
+    assert after[: len(before)] == before
+    assert [json.loads(line)["op"] for line in after[len(before) :]] == ["set", "set"]
+
+    reloaded = _build_store(tmp_path)
+    by_id = {entry["id"]: entry for entry in reloaded._rollback_approvals}
+    assert [entry["id"] for entry in reloaded._rollback_approvals] == [first["id"], second["id"]]
+    assert by_id[first["id"]]["status"] == "used"
+    assert by_id[first["id"]]["used_by"] == "ops-admin"
+    assert by_id[second["id"]]["status"] == "pending"
+    assert hasattr(by_id[first["id"]]["updated_at"], "tzinfo")
+
+
+def test_expiry_from_read_path_appends_instead_of_rewriting(tmp_path: Path) -> None:
+    store = _build_store(tmp_path)
+    audit_id = _seed_audit(store)
+    approval_path = tmp_path / "approvals.jsonl"
+    created = store.create_rollback_approval(audit_id=audit_id, requested_by="ops-admin")
+    store._rollback_approvals[0]["expires_at"] = now_utc().replace(year=2000)
+    store._persist_rollback_approvals()
+    snapshot = _lines(approval_path)
+
+    assert store.get_rollback_approval_stats()["expired"] == 1
+    assert store.get_rollback_approval_stats()["expired"] == 1
+
+    lines = _lines(approval_path)
+    assert lines[:1] == snapshot
+    assert len(lines) == 2
+    reloaded = _build_store(tmp_path)
+    assert reloaded._find_rollback_approval(created["id"])["status"] == "expired"
+
+
+def test_torn_tail_record_is_skipped(tmp_path: Path) -> None:
+    store = _build_store(tmp_path)
+    audit_id = _seed_audit(store)
+    created = store.create_rollback_approval(audit_id=audit_id, requested_by="ops-admin")
+    with (tmp_path / "approvals.jsonl").open("a", encoding="utf-8") as file:
+        file.write('{"op": "set", "id": "')
+    with (tmp_path / "audit.jsonl").open("a", encoding="utf-8") as file:
+        file.write('{"id": "map_torn", "upda')
+
+    reloaded = _build_store(tmp_path)
+    assert [entry["id"] for entry in reloaded._rollback_approvals] == [created["id"]]
+    assert [entry["id"] for entry in reloaded.list_audits()] == [audit_id]
+
+    reloaded.approve_rollback_approval(created["id"], approved_by="release-manager")
+    assert _build_store(tmp_path)._rollback_approvals[0]["status"] == "approved"
+
+
+def test_log_is_compacted_into_snapshot(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(journal, "ROLLBACK_APPROVAL_COMPACT_MIN_RECORDS", 6)
+    store = _build_store(tmp_path)
+    audit_id = _seed_audit(store)
+    approval_path = tmp_path / "approvals.jsonl"
+
+    created = [
+        store.create_rollback_approval(audit_id=audit_id, requested_by="ops-admin")
+        for _ in range(2)
+    ]
+    for entry in created:
+        store.approve_rollback_approval(entry["id"], approved_by="release-manager")
+    assert len(_lines(approval_path)) == 4
+    for entry in created:
+        store.consume_rollback_approval(entry["id"], audit_id=audit_id, used_by="ops-admin")
+
+    records = [json.loads(line) for line in _lines(approval_path)]
+    assert [record["status"] for record in records] == ["used", "used"]
+    assert all("op" not in record for record in records)
+    assert store._rollback_approval_log_records == 2
+    assert not list(tmp_path.glob(".approvals.jsonl.*"))
+    reloaded = _build_store(tmp_path)
+    assert [entry["id"] for entry in reloaded._rollback_approvals] == [
+        entry["id"] for entry in created
+    ]
@@ -1,5 +1,6 @@
 import time
 
+import pytest
 from fastapi.testclient import TestClient
 
 from control_center.main import app
@@ -8,6 +9,13 @@ from control_center.main import app
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def app_lifespan():
+    # Command workers start with the app lifespan, not on the first request.
+    with client:
+        yield
+
+
 def wait_terminal(command_id: str, timeout: float = 2.5) -> dict:
     deadline = time.time() + timeout
     payload: dict = {}
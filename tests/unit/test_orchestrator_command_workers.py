@@ -0,0 +1,156 @@
+import asyncio
+from pathlib import Path
+
+from control_center.models import (
+    ActionExecuteResponse,
+    CommandStatus,
+    CreateCommandRequest,
+    CreateProjectRequest,
+    CreateTaskRequest,
+    TaskStatus,
+)
+from control_center.services import InMemoryOrchestrator, SQLiteStateStore
+
+
+class _GatedActionExecutor:
+    def __init__(self) -> None:
+        self.gates: dict[str, asyncio.Event] = {}
+        self.started: list[str] = []
+
+    async def __call__(self, command, task) -> ActionExecuteResponse:
+        self.started.append(command.text)
+        gate = self.gates.setdefault(command.text, asyncio.Event())
+        await gate.wait()
+        return ActionExecuteResponse(
+            status="success",
+            summary=f"done:{command.text}",
+            agent="coding-agent",
+            trace_id=f"act_{command.text}",
+        )
+
+
+async def _wait_for(predicate, *, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.005)
+
+
+async def _create_task(orchestrator: InMemoryOrchestrator, name: str):
+    project = await orchestrator.create_project(CreateProjectRequest(name=name))
+    return await orchestrator.create_task(project.id, CreateTaskRequest(title=f"{name}-task"))
+
+
+def test_slow_command_does_not_block_reads_or_other_projects() -> None:
+    executor = _GatedActionExecutor()
+    orchestrator = InMemoryOrchestrator(action_executor=executor, command_worker_count=2)
+
+    async def scenario() -> None:
+        await orchestrator.start_command_workers()
+        try:
+            slow_task = await _create_task(orchestrator, "slow")
+            fast_task = await _create_task(orchestrator, "fast")
+            slow = await orchestrator.create_command(
+                slow_task.id,
+                CreateCommandRequest(text="slow"),
+            )
+            await _wait_for(lambda: executor.started == ["slow"])
+            assert slow.status == CommandStatus.RUNNING
+
+            # Reads are plain lookups while the action call is in flight.
+            projects = await asyncio.wait_for(orchestrator.list_projects(), timeout=0.1)
+            assert len(projects) == 2
+            summary = await asyncio.wait_for(orchestrator.get_metrics_summary(), timeout=0.1)
+            assert summary.in_flight_command_count == 1
+
+            executor.gates["fast"] = asyncio.Event()
+            executor.gates["fast"].set()
+            fast = await orchestrator.create_command(
+                fast_task.id,
+                CreateCommandRequest(text="fast"),
+            )
+            await _wait_for(lambda: fast.status == CommandStatus.SUCCESS)
+            assert slow.status == CommandStatus.RUNNING
+            assert (await orchestrator.get_task(fast_task.id)).status == TaskStatus.DONE
+            assert (await orchestrator.get_task(slow_task.id)).status == TaskStatus.IN_PROGRESS
+
+            executor.gates["slow"].set()
+            await _wait_for(lambda: slow.status == CommandStatus.SUCCESS)
+            assert slow.output_summary == "done:slow"
+            assert slow.finished_at is not None and slow.started_at is not None
+        finally:
+            await orchestrator.stop_command_workers()
+
+    asyncio.run(scenario())
+
+
+def test_commands_interrupted_by_shutdown_resume_after_restart(tmp_path: Path) -> None:
+    state_store = SQLiteStateStore(str(tmp_path / "state.db"))
+    executor = _GatedActionExecutor()
+    orchestrator = InMemoryOrchestrator(action_executor=executor, state_store=state_store)
+
+    async def interrupted() -> str:
+        await orchestrator.start_command_workers()
+        task = await _create_task(orchestrator, "resume")
+        command = await orchestrator.create_command(
+            task.id,
+            CreateCommandRequest(text="resume"),
+        )
+        await _wait_for(lambda: executor.started == ["resume"])
+        await orchestrator.stop_command_workers(timeout_seconds=0.01)
+        assert command.status == CommandStatus.QUEUED
+        return command.id
+
+    command_id = asyncio.run(interrupted())
+
+    resumed_executor = _GatedActionExecutor()
+    resumed_executor.gates["resume"] = asyncio.Event()
+    resumed_executor.gates["resume"].set()
+    restored = InMemoryOrchestrator(action_executor=resumed_executor, state_store=state_store)
+
+    async def resumed() -> None:
+        await restored.start_command_workers()
+        try:
+            command = await restored.get_command(command_id)
+            await _wait_for(lambda: command.status == CommandStatus.SUCCESS)
+        finally:
+            await restored.stop_command_workers()
+
+    asyncio.run(resumed())
+    assert resumed_executor.started == ["resume"]
+
+
+def test_commands_of_one_task_run_one_at_a_time_in_order() -> None:
+    executor = _GatedActionExecutor()
+    orchestrator = InMemoryOrchestrator(action_executor=executor, command_worker_count=4)
+
+    async def scenario() -> None:
+        await orchestrator.start_command_workers()
+        try:
+            task = await _create_task(orchestrator, "serial")
+            other_task = await _create_task(orchestrator, "other")
+            first = await orchestrator.create_command(task.id, CreateCommandRequest(text="a"))
+            second = await orchestrator.create_command(task.id, CreateCommandRequest(text="b"))
+            other = await orchestrator.create_command(
+                other_task.id,
+                CreateCommandRequest(text="c"),
+            )
+            await _wait_for(lambda: sorted(executor.started) == ["a", "c"])
+            await asyncio.sleep(0.02)
+            assert second.status == CommandStatus.QUEUED
+            assert other.status == CommandStatus.RUNNING
+
+            executor.gates["b"] = asyncio.Event()
+            executor.gates["b"].set()
+            await asyncio.sleep(0.02)
+            assert "b" not in executor.started
+
+            executor.gates["a"].set()
+            await _wait_for(lambda: second.status == CommandStatus.SUCCESS)
+            assert first.finished_at <= second.started_at
+            executor.gates["c"].set()
+            await _wait_for(lambda: other.status == CommandStatus.SUCCESS)
+        finally:
+            await orchestrator.stop_command_workers()
+
+    asyncio.run(scenario())
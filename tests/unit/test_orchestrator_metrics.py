@@ -0,0 +1,118 @@
+import random
+from datetime import timedelta
+
+from control_center.models import Command, CommandStatus
+from control_center.models.hierarchy import now_utc
+from control_center.services.orchestrator_metrics import CommandMetricsAggregator
+
+
+def _scan_summary(commands: list[Command], now) -> dict:
+    resolved = [c for c in commands if c.status in {CommandStatus.SUCCESS, CommandStatus.FAILED}]
+    success = sum(1 for c in resolved if c.status == CommandStatus.SUCCESS)
+    durations = [
+        (c.finished_at - c.started_at).total_seconds() * 1000
+        for c in resolved
+        if c.started_at is not None and c.finished_at is not None
+    ]
+    windows = []
+    for minutes in (5, 15, 60):
+        start = now - timedelta(minutes=minutes)
+        finished = [c for c in resolved if c.finished_at is not None and c.finished_at >= start]
+        window_success = sum(1 for c in finished if c.status == CommandStatus.SUCCESS)
+        window_durations = [
+            (c.finished_at - c.started_at).total_seconds() * 1000
+            for c in finished
+            if c.started_at is not None
+        ]
+        windows.append(
+            {
+                "window_minutes": minutes,
+                "total_commands": sum(1 for c in commands if c.created_at >= start),
+                "success_count": window_success,
+                "failed_count": len(finished) - window_success,
+                "success_rate": round(window_success / len(finished), 4) if finished else 0.0,
+                "average_duration_ms": (
+                    round(sum(window_durations) / len(window_durations), 2)
+                    if window_durations
+                    else 0.0
+                ),
+            }
+        )
+    agents: dict[str, int] = {}
+    reasons: dict[str, int] = {}
+    for command in commands:
+        if command.executor_agent:
+            agents[command.executor_agent] = agents.get(command.executor_agent, 0) + 1
+        reason = command.metadata.get("routing_reason")
+        if reason:
+            reasons[reason] = reasons.get(reason, 0) + 1
+    return {
+        "total_commands": len(commands),
+        "in_flight_command_count": sum(
+            1 for c in commands if c.status in {CommandStatus.QUEUED, CommandStatus.RUNNING}
+        ),
+        "waiting_approval_count": sum(
+            1 for c in commands if c.status == CommandStatus.WAITING_APPROVAL
+        ),
+        "success_count": success,
+        "failed_count": len(resolved) - success,
+        "success_rate": round(success / len(resolved), 4) if resolved else 0.0,
+        "average_duration_ms": round(sum(durations) / len(durations), 2) if durations else 0.0,
+        "executor_agent_counts": agents,
+        "routing_reason_counts": reasons,
+        "routing_keyword_counts": {},
+        "routing_rule_counts": {},
+        "recent_windows": windows,
+    }
+
+
+def test_incremental_summary_matches_full_scan_across_transitions() -> None:
+    rng = random.Random(7)
+    now = now_utc()
+    aggregator = CommandMetricsAggregator()
+    commands: list[Command] = []
+
+    for index in range(400):
+        created_at = now - timedelta(seconds=rng.uniform(0, 2 * 3600))
+        command = Command(
+            project_id="proj_metrics",
+            task_id="task_metrics",
+            sequence=index + 1,
+            text=f"cmd-{index}",
+            status=CommandStatus.QUEUED,
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        commands.append(command)
+        aggregator.observe(command)
+
+    for command in commands:
+        outcome = rng.random()
+        if outcome < 0.15:
+            command.status = CommandStatus.WAITING_APPROVAL
+        elif outcome < 0.3:
+            command.status = CommandStatus.RUNNING
+            command.started_at = command.created_at
+        elif outcome > 0.3:
+            command.status = CommandStatus.RUNNING
+            command.started_at = command.created_at + timedelta(seconds=rng.uniform(0, 5))
+            aggregator.observe(command)
+            command.status = rng.choice([CommandStatus.SUCCESS, CommandStatus.FAILED])
+            command.executor_agent = rng.choice(["coding-agent", "test-agent"])
+            command.metadata["routing_reason"] = rng.choice(["default_agent", "keyword"])
+            aggregator.observe(command)
+            command.finished_at = min(
+                now,
+                command.started_at + timedelta(seconds=rng.uniform(0, 600)),
+            )
+            if rng.random() < 0.1:
+                command.started_at = None
+        aggregator.observe(command)
+
+    assert aggregator.snapshot(now) == _scan_summary(commands, now)
+
+    later = now + timedelta(minutes=7)
+    assert aggregator.snapshot(later) == _scan_summary(commands, later)
+
+    aggregator.rebuild(commands)
+    assert aggregator.snapshot(now) == _scan_summary(commands, now)
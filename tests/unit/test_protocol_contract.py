@@ -1,5 +1,6 @@
 import time
 
+import pytest
 from fastapi.testclient import TestClient
 
 import control_center.main as main_module
@@ -8,10 +9,23 @@ from control_center.models import ActionExecuteResponse
 
 
 client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def app_lifespan():
+    # Command workers start with the app lifespan, not on the first request.
+    with client:
+        yield
 FINAL_STATUSES = {"success", "failed", "canceled"}
 
 
 class StubOrchestratePolicyActionLayer:
+    async def start(self) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
     async def execute(self, request):
         lowered = request.text.lower()
         if "role: chief-architect" in lowered:
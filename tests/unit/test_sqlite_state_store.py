@@ -1,16 +1,29 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import sqlite3
 from pathlib import Path
 
+import pytest
+
 from control_center.models import (
     CreateCommandRequest,
     CreateProjectRequest,
     CreateTaskRequest,
+    WorkItemStatus,
 )
 from control_center.services import InMemoryOrchestrator, SQLiteStateStore
 
 
+def _count_committed_rows(db_path: Path) -> int:
+    with sqlite3.connect(db_path) as conn:
+        return sum(
+            conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("entities", "wf_run", "wf_workitem")
+        )
+
+
 def test_sqlite_state_store_upsert_list_clear(tmp_path: Path) -> None:
     db_path = tmp_path / "state.db"
     store = SQLiteStateStore(str(db_path))
@@ -24,6 +37,57 @@ def test_sqlite_state_store_upsert_list_clear(tmp_path: Path) -> None:
     assert store.list("project") == []
 
 
+def test_sqlite_state_store_uses_wal_and_configured_synchronous(tmp_path: Path) -> None:
+    store = SQLiteStateStore(str(tmp_path / "state.db"), synchronous="full")
+    assert store.journal_mode == "WAL"
+    assert store.synchronous == "FULL"
+
+    with pytest.raises(ValueError):
+        SQLiteStateStore(str(tmp_path / "other.db"), synchronous="sometimes")
+
+
+def test_sqlite_state_store_upsert_many_batches_rows(tmp_path: Path) -> None:
+    store = SQLiteStateStore(str(tmp_path / "state.db"))
+
+    written = store.upsert_many(
+        "workitem",
+        [(f"wi_{index}", {"id": f"wi_{index}", "n": index}) for index in range(50)],
+    )
+    assert written == 50
+    assert store.upsert_many("workitem", []) == 0
+
+    store.upsert_many("workitem", [("wi_3", {"id": "wi_3", "n": 300})])
+    rows = {row["id"]: row for row in store.list("workitem")}
+    assert len(rows) == 50
+    assert rows["wi_3"]["n"] == 300
+
+
+def test_sqlite_state_store_unit_of_work_commits_once_and_rolls_back(
+    tmp_path: Path,
+) -> None:
+    db_path = tmp_path / "state.db"
+    store = SQLiteStateStore(str(db_path))
+
+    with store.unit_of_work():
+        store.upsert("project", "proj_1", {"id": "proj_1"})
+        with store.unit_of_work():
+            store.upsert("task", "task_1", {"id": "task_1"})
+        assert store.in_transaction
+        assert _count_committed_rows(db_path) == 0
+    assert not store.in_transaction
+    assert _count_committed_rows(db_path) == 2
+
+    with pytest.raises(RuntimeError):
+        with store.unit_of_work():
+            store.upsert("project", "proj_2", {"id": "proj_2"})
+            raise RuntimeError("boom")
+    assert [row["id"] for row in store.list("project")] == ["proj_1"]
+
+    store.close()
+    with pytest.raises(RuntimeError):
+        store.list("project")
+
+
 def test_orchestrator_restores_state_from_sqlite(tmp_path: Path) -> None:
     db_path = tmp_path / "state.db"
     state_store = SQLiteStateStore(str(db_path))
@@ -57,3 +121,91 @@ def test_orchestrator_restores_state_from_sqlite(tmp_path: Path) -> None:
 
     commands = asyncio.run(restored.list_commands(task.id))
     assert any(item.id == accepted.id for item in commands)
+
+
+def test_sqlite_state_store_indexes_workflow_entities_by_run_and_status(
+    tmp_path: Path,
+) -> None:
+    store = SQLiteStateStore(str(tmp_path / "state.db"))
+    assert store.schema_version == 3
+
+    store.upsert_many(
+        "workitem",
+        [
+            (
+                f"wi_{index}",
+                {
+                    "id": f"wi_{index}",
+                    "workflow_run_id": "wfr_a" if index < 3 else "wfr_b",
+                    "status": "succeeded" if index % 2 == 0 else "pending",
+                    "role": "module-dev",
+                    "module_key": "auth",
+                    "created_at": f"2026-01-01T00:00:0{index}Z",
+                },
+            )
+            for index in range(5)
+        ],
+    )
+    store.upsert(
+        "artifact",
+        "art_1",
+        {"id": "art_1", "owner_type": "workitem", "owner_id": "wi_4"},
+    )
+
+    assert [row["id"] for row in store.query("workitem", workflow_run_id="wfr_a")] == [
+        "wi_0",
+        "wi_1",
+        "wi_2",
+    ]
+    assert store.query_ids(
+        "workitem", workflow_run_id="wfr_b", status=WorkItemStatus.SUCCEEDED
+    ) == ["wi_4"]
+    assert store.count("workitem", status=["pending", "running"]) == 2
+    assert store.query_ids("artifact", workflow_run_id="wfr_b") == ["art_1"]
+    assert store.get("workitem", "wi_3")["workflow_run_id"] == "wfr_b"
+    assert store.get("workitem", "missing") is None
+
+    with pytest.raises(ValueError):
+        store.query("project", status="x")
+
+
+def test_sqlite_state_store_migrates_legacy_entities_table(tmp_path: Path) -> None:
+    db_path = tmp_path / "legacy.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE entities (
+              entity_type TEXT NOT NULL,
+              entity_id TEXT NOT NULL,
+              payload TEXT NOT NULL,
+              PRIMARY KEY (entity_type, entity_id)
+            )
+            """
+        )
+        conn.executemany(
+            "INSERT INTO entities (entity_type, entity_id, payload) VALUES (?, ?, ?)",
+            [
+                ("project", "proj_1", json.dumps({"id": "proj_1"})),
+                (
+                    "workflow_run",
+                    "wfr_1",
+                    json.dumps({"id": "wfr_1", "project_id": "proj_1", "status": "running"}),
+                ),
+                (
+                    "workitem",
+                    "wi_1",
+                    json.dumps({"id": "wi_1", "workflow_run_id": "wfr_1", "status": "ready"}),
+                ),
+            ],
+        )
+
+    store = SQLiteStateStore(str(db_path))
+    assert store.schema_version == 3
+    assert [row["id"] for row in store.list("project")] == ["proj_1"]
+    assert store.query_ids("workflow_run", status="running") == ["wfr_1"]
+    assert store.query_ids("workitem", workflow_run_id="wfr_1") == ["wi_1"]
+    with sqlite3.connect(db_path) as conn:
+        legacy_types = {
+            row[0] for row in conn.execute("SELECT DISTINCT entity_type FROM entities")
+        }
+    assert legacy_types == {"project"}
@@ -1,8 +1,14 @@
+import time
+from datetime import timedelta
+
 from fastapi.testclient import TestClient
 
 import control_center.main as main_module
 from control_center.main import app
 from control_center.models import ActionExecuteResponse
+from control_center.models.hierarchy import now_utc
+from control_center.services import WorkflowScheduler
+from control_center.services.workflow_run_archive import WorkflowRunArchive
 
 
 client = TestClient(app)
@@ -141,6 +147,35 @@ def test_v3_run_visibility_api_contract() -> None:
     assert "artifact_type_counts" in report_payload
 
 
+def test_v3_run_visibility_api_reads_archived_run(monkeypatch, tmp_path) -> None:
+    scheduler = WorkflowScheduler(
+        run_archive=WorkflowRunArchive(str(tmp_path / "archive.db")),
+    )
+    monkeypatch.setattr(main_module, "workflow_scheduler", scheduler)
+    run = scheduler.create_run(project_id="proj_archived_api")
+    item = scheduler.add_workitem(run.id, role="module-dev", module_key="auth")
+    scheduler.tick(run.id)
+    scheduler.start_workitem(item.id)
+    scheduler.complete_workitem(item.id, success=True)
+    assert scheduler.archive_terminal_runs(
+        retention_seconds=60,
+        now=now_utc() + timedelta(minutes=5),
+    ) == [run.id]
+    assert scheduler.list_hydrated_run_ids() == []
+
+    report = client.get(f"/v3/runs/{run.id}/report")
+    assert report.status_code == 200
+    assert report.json()["run_status"] == "succeeded"
+    assert report.json()["workitem_status_counts"] == {"succeeded": 1}
+
+    timeline = client.get(f"/v3/runs/{run.id}/timeline")
+    assert timeline.status_code == 200
+    assert [event["source"] for event in timeline.json()["events"]] == [
+        "workflow_run",
+        "workitem",
+    ]
+
+
 def test_v3_workflow_engine_rejects_duplicate_bootstrap() -> None:
     run = client.post(
         "/v3/workflows/runs",
@@ -277,6 +312,80 @@ def test_v3_workflow_engine_release_approval_switch() -> None:
         main_module.workflow_engine._release_requires_approval = False
 
 
+def _poll_execution(api_client: TestClient, run_id: str, predicate) -> dict:
+    deadline = time.monotonic() + 5.0
+    while True:
+        response = api_client.get(f"/v3/workflows/runs/{run_id}/execution")
+        assert response.status_code == 200
+        payload = response.json()
+        if predicate(payload):
+            return payload
+        assert time.monotonic() < deadline, payload
+        time.sleep(0.02)
+
+
+def test_v3_workflow_run_submit_is_driven_by_background_executor() -> None:
+    assert client.post(
+        "/v3/workflows/runs/wfr_missing/submit",
+        json={"max_loops": 10},
+    ).status_code == 503
+
+    main_module.workflow_engine._release_requires_approval = True
+    try:
+        with TestClient(app) as lifespan_client:
+            run_id = lifespan_client.post(
+                "/v3/workflows/runs",
+                json={"project_id": "proj_background_submit", "requested_by": "andy"},
+            ).json()["id"]
+            assert lifespan_client.post(
+                f"/v3/workflows/runs/{run_id}/bootstrap",
+                json={"modules": ["auth"]},
+            ).status_code == 200
+
+            idle = lifespan_client.get(f"/v3/workflows/runs/{run_id}/execution")
+            assert idle.json()["executor_state"] == "not_submitted"
+            assert idle.json()["executor_running"] is True
+
+            submit = lifespan_client.post(
+                f"/v3/workflows/runs/{run_id}/submit",
+                json={"max_loops": 30, "submitted_by": "andy"},
+            )
+            assert submit.status_code == 202
+            assert submit.json()["background_enabled"] is True
+
+            waiting = _poll_execution(
+                lifespan_client,
+                run_id,
+                lambda payload: payload["run_status"] == "waiting_approval"
+                and payload["executor_state"] == "idle",
+            )
+            assert waiting["drives"] == 1
+            assert waiting["next_action_hint"] == "approve_waiting_workitems"
+
+            workitems = lifespan_client.get(f"/v3/workflows/runs/{run_id}/workitems").json()
+            target = next(item["id"] for item in workitems if item["status"] == "waiting_approval")
+            assert lifespan_client.post(
+                f"/v3/workflows/workitems/{target}/approve",
+                json={"approved_by": "owner"},
+            ).status_code == 200
+
+            finished = _poll_execution(
+                lifespan_client,
+                run_id,
+                lambda payload: payload["executor_state"] == "finished",
+            )
+            assert finished["run_status"] == "succeeded"
+            assert finished["drives"] == 2
+
+            resubmit = lifespan_client.post(
+                f"/v3/workflows/runs/{run_id}/submit",
+                json={"max_loops": 30},
+            )
+            assert resubmit.status_code == 409
+    finally:
+        main_module.workflow_engine._release_requires_approval = False
+
+
 def test_v3_workflow_run_interrupt_cancels_execution() -> None:
     run = client.post(
         "/v3/workflows/runs",
@@ -1,7 +1,12 @@
 import asyncio
+import time
 
 from control_center.models import ActionExecuteResponse, DiscussionPrompt
 from control_center.services import WorkflowEngine, WorkflowScheduler
+from control_center.services.workflow_engine_concurrency import (
+    WorkitemConcurrencyLimiter,
+    WorkitemConcurrencyLimits,
+)
 
 
 async def _ok_executor(request) -> ActionExecuteResponse:
@@ -183,3 +188,152 @@ def test_execute_until_blocked_returns_canceled_after_interrupt() -> None:
     assert response.run_status == "canceled"
     assert response.executed_count == 0
     assert response.failed_count == 0
+
+
+class _SlowExecutor:
+    def __init__(
+        self,
+        delay_seconds: float,
+        module_delays: dict[str, float] | None = None,
+    ) -> None:
+        self.delay_seconds = delay_seconds
+        self.module_delays = module_delays or {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.max_in_flight_by_role: dict[str, int] = {}
+        self._by_role: dict[str, int] = {}
+
+    async def __call__(self, request) -> ActionExecuteResponse:
+        role = request.role or ""
+        self.in_flight += 1
+        self._by_role[role] = self._by_role.get(role, 0) + 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.max_in_flight_by_role[role] = max(
+            self.max_in_flight_by_role.get(role, 0),
+            self._by_role[role],
+        )
+        try:
+            await asyncio.sleep(
+                self.module_delays.get(request.module_key or "", self.delay_seconds)
+            )
+        finally:
+            self.in_flight -= 1
+            self._by_role[role] -= 1
+        return await _ok_executor(request)
+
+
+def _run_six_module_pipeline(
+    limits: WorkitemConcurrencyLimits | None,
+    executor: _SlowExecutor,
+) -> tuple[float, list[tuple[str, str | None]], str]:
+    scheduler = WorkflowScheduler()
+    engine = WorkflowEngine(
+        scheduler=scheduler,
+        action_executor=executor,
+        concurrency_limits=limits,
+    )
+    run = scheduler.create_run(project_id="proj_parallel")
+    modules = ["auth", "billing", "search", "profile", "notify", "report"]
+    engine.bootstrap_standard_pipeline(run.id, modules)
+
+    started = time.perf_counter()
+    response = asyncio.run(engine.execute_until_blocked(run.id, max_loops=50))
+    elapsed = time.perf_counter() - started
+    executed = [
+        (scheduler.get_workitem(item_id).role, scheduler.get_workitem(item_id).module_key)
+        for item_id in response.executed_workitem_ids
+    ]
+    return elapsed, executed, response.run_status
+
+
+def test_parallel_execution_matches_serial_outcome_and_cuts_wall_clock() -> None:
+    serial_executor = _SlowExecutor(0.02)
+    serial_elapsed, serial_executed, serial_status = _run_six_module_pipeline(
+        None,
+        serial_executor,
+    )
+    parallel_executor = _SlowExecutor(0.02)
+    parallel_elapsed, parallel_executed, parallel_status = _run_six_module_pipeline(
+        WorkitemConcurrencyLimits(per_run=8),
+        parallel_executor,
+    )
+
+    assert serial_status == parallel_status == "succeeded"
+    assert parallel_executed == serial_executed
+    assert serial_executor.max_in_flight == 1
+    assert parallel_executor.max_in_flight == 6
+    assert parallel_elapsed < serial_elapsed / 3
+
+
+def test_parallel_execution_finalizes_in_serial_order_despite_latency_jitter() -> None:
+    # Later modules finish first, so completion order is the reverse of the
+    # order serial mode finalizes them in.
+    jitter = {"auth": 0.05, "billing": 0.04, "search": 0.03, "profile": 0.02, "notify": 0.01}
+    _, serial_executed, serial_status = _run_six_module_pipeline(None, _SlowExecutor(0.0))
+    _, parallel_executed, parallel_status = _run_six_module_pipeline(
+        WorkitemConcurrencyLimits(per_run=8),
+        _SlowExecutor(0.0, jitter),
+    )
+
+    assert serial_status == parallel_status == "succeeded"
+    assert parallel_executed == serial_executed
+
+
+def test_parallel_execution_respects_role_and_global_caps() -> None:
+    executor = _SlowExecutor(0.01)
+    _, executed, status = _run_six_module_pipeline(
+        WorkitemConcurrencyLimits(per_run=8, global_limit=4, per_role={"qa-test": 2}),
+        executor,
+    )
+
+    assert status == "succeeded"
+    assert len(executed) == 27
+    assert executor.max_in_flight == 4
+    assert executor.max_in_flight_by_role["qa-test"] == 2
+
+
+def test_parallel_execution_dispatches_items_released_mid_wave() -> None:
+    # "fast" is ahead of "slow" in finalize order, so its dependent starts as
+    # soon as it finishes instead of waiting for the whole first generation.
+    loop_time: dict[str, float] = {}
+
+    async def executor(request) -> ActionExecuteResponse:
+        module = request.module_key or ""
+        loop_time[f"{module}:start"] = asyncio.get_running_loop().time()
+        await asyncio.sleep(0.2 if module == "slow" else 0.01)
+        loop_time[f"{module}:end"] = asyncio.get_running_loop().time()
+        return await _ok_executor(request)
+
+    scheduler = WorkflowScheduler()
+    engine = WorkflowEngine(
+        scheduler=scheduler,
+        action_executor=executor,
+        concurrency_limits=WorkitemConcurrencyLimits(per_run=4),
+    )
+    run = scheduler.create_run(project_id="proj_mid_wave")
+    fast = scheduler.add_workitem(run.id, role="module-dev", module_key="fast")
+    scheduler.add_workitem(run.id, role="module-dev", module_key="slow")
+    scheduler.add_workitem(
+        run.id,
+        role="module-dev",
+        module_key="follow",
+        depends_on=[fast.id],
+    )
+
+    response = asyncio.run(engine.execute_until_blocked(run.id, max_loops=5))
+
+    assert response.executed_count == 3
+    assert loop_time["follow:end"] < loop_time["slow:end"]
+
+
+def test_concurrency_limiter_shares_run_slots_until_closed() -> None:
+    limiter = WorkitemConcurrencyLimiter(WorkitemConcurrencyLimits(per_run=2, per_module=1))
+
+    async def scenario() -> None:
+        first = limiter.open_run("wfr_1")
+        assert limiter.open_run("wfr_1") is first
+        assert limiter.open_run("wfr_2") is not first
+        limiter.close_run("wfr_1")
+        assert limiter.open_run("wfr_1") is not first
+
+    asyncio.run(scenario())
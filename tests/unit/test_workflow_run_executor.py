@@ -0,0 +1,159 @@
+import asyncio
+
+from control_center.models import ActionExecuteResponse, WorkItemStatus, WorkflowRunStatus
+from control_center.services import SQLiteStateStore, WorkflowEngine, WorkflowScheduler
+from control_center.services.workflow_run_executor import (
+    BACKGROUND_EXECUTION_KEY,
+    WorkflowRunExecutor,
+)
+
+
+async def _ok_executor(request) -> ActionExecuteResponse:
+    return ActionExecuteResponse(
+        status="success",
+        summary=f"ok:{request.role}:{request.module_key}",
+        agent=request.agent or "coding-agent",
+        trace_id="act_run_executor_ok",
+    )
+
+
+class _GatedExecutor:
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.calls = 0
+
+    async def __call__(self, request) -> ActionExecuteResponse:
+        self.calls += 1
+        await self.release.wait()
+        return await _ok_executor(request)
+
+
+async def _wait_for(predicate, *, timeout: float = 5.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not reached before timeout")
+        await asyncio.sleep(0.01)
+
+
+def _executor(scheduler: WorkflowScheduler, engine: WorkflowEngine, **kwargs) -> WorkflowRunExecutor:
+    return WorkflowRunExecutor(
+        workflow_scheduler_provider=lambda: scheduler,
+        workflow_engine_provider=lambda: engine,
+        **kwargs,
+    )
+
+
+def test_submitted_run_is_driven_and_woken_by_approval() -> None:
+    scheduler = WorkflowScheduler()
+    engine = WorkflowEngine(
+        scheduler=scheduler,
+        action_executor=_ok_executor,
+        release_requires_approval=True,
+    )
+    run = scheduler.create_run(project_id="proj_run_executor")
+    engine.bootstrap_standard_pipeline(run.id, ["auth", "billing"])
+    finalized: list[str] = []
+
+    async def scenario() -> None:
+        executor = _executor(scheduler, engine, after_drive_handler=finalized.append)
+        await executor.start()
+        try:
+            executor.submit(run.id, max_loops=50, submitted_by="owner")
+            await _wait_for(
+                lambda: scheduler.get_run(run.id).status == WorkflowRunStatus.WAITING_APPROVAL
+                and executor.executor_state(scheduler.get_run(run.id)) == "idle"
+            )
+            waiting = scheduler.list_workitem_ids_by_status(
+                run.id,
+                WorkItemStatus.WAITING_APPROVAL,
+            )
+            assert len(waiting) == 1
+
+            scheduler.approve_workitem(waiting[0], approved_by="owner")
+            await _wait_for(
+                lambda: executor.executor_state(scheduler.get_run(run.id)) == "finished"
+            )
+            assert executor.snapshot()["tracked_runs"] == 0
+        finally:
+            await executor.stop()
+
+    asyncio.run(scenario())
+
+    run_after = scheduler.get_run(run.id)
+    assert run_after.status == WorkflowRunStatus.SUCCEEDED
+    state = run_after.metadata[BACKGROUND_EXECUTION_KEY]
+    assert state["enabled"] is True
+    assert state["submitted_by"] == "owner"
+    assert state["drives"] == 2
+    assert state["last_error"] is None
+    assert finalized == [run.id, run.id]
+
+
+def test_transitions_of_unsubmitted_runs_do_not_enqueue() -> None:
+    scheduler = WorkflowScheduler()
+    engine = WorkflowEngine(scheduler=scheduler, action_executor=_ok_executor)
+    run = scheduler.create_run(project_id="proj_run_executor_idle")
+    engine.bootstrap_standard_pipeline(run.id, ["auth"])
+
+    async def scenario() -> None:
+        executor = _executor(scheduler, engine)
+        await executor.start()
+        try:
+            scheduler.tick(run.id)
+            await asyncio.sleep(0.05)
+            assert executor.snapshot()["drives"] == 0
+            assert executor.executor_state(scheduler.get_run(run.id)) == "not_submitted"
+        finally:
+            await executor.stop()
+
+    asyncio.run(scenario())
+    assert scheduler.get_run(run.id).status == WorkflowRunStatus.RUNNING
+
+
+def test_stop_cancels_in_flight_drive_and_restart_resumes(tmp_path) -> None:
+    db_path = tmp_path / "state.db"
+    first_store = SQLiteStateStore(str(db_path))
+    scheduler = WorkflowScheduler(state_store=first_store)
+    gated = _GatedExecutor()
+    engine = WorkflowEngine(scheduler=scheduler, action_executor=gated)
+    run = scheduler.create_run(project_id="proj_run_executor_resume")
+    engine.bootstrap_standard_pipeline(run.id, ["auth"])
+
+    async def interrupted() -> None:
+        executor = _executor(scheduler, engine, drain_timeout_seconds=0.05)
+        await executor.start()
+        executor.submit(run.id, max_loops=50)
+        await _wait_for(lambda: gated.calls == 1)
+        await executor.stop()
+
+    asyncio.run(interrupted())
+    first_store.close()
+
+    second_store = SQLiteStateStore(str(db_path))
+    restarted = WorkflowScheduler(state_store=second_store)
+    assert restarted.count_workitems_by_status(run.id, WorkItemStatus.RUNNING) == 1
+    resumed_engine = WorkflowEngine(scheduler=restarted, action_executor=_ok_executor)
+
+    async def resumed() -> None:
+        executor = _executor(restarted, resumed_engine)
+        await executor.start()
+        try:
+            assert executor.snapshot()["resumed_runs"] == 1
+            await _wait_for(
+                lambda: executor.executor_state(restarted.get_run(run.id)) == "finished"
+            )
+        finally:
+            await executor.stop()
+
+    asyncio.run(resumed())
+    second_store.close()
+
+    run_after = restarted.get_run(run.id)
+    assert run_after.status == WorkflowRunStatus.SUCCEEDED
+    requeued = [
+        item
+        for item in restarted.list_workitems(run.id)
+        if item.metadata.get("requeue_reason") == "run_executor_resume"
+    ]
+    assert len(requeued) == 1
@@ -1,7 +1,9 @@
 from control_center.models import DiscussionStatus, WorkItemStatus, WorkflowRunStatus
 from control_center.services import WorkflowScheduler
 from control_center.models.hierarchy import now_utc
-from control_center.models import ArtifactType
+from control_center.models import ArtifactType, GateType
+from control_center.services.workflow_scheduler_hydration import evict_run
+from control_center.services.workflow_scheduler_status import build_scheduler_metrics
 
 
 def test_scheduler_supports_two_parallel_and_one_join() -> None:
@@ -316,3 +318,103 @@ def test_restart_run_rejects_non_terminal_source() -> None:
         with_validation_error = True
 
     assert with_validation_error
+
+
+def test_ready_queue_tracks_dependency_counters_incrementally() -> None:
+    scheduler = WorkflowScheduler()
+    run = scheduler.create_run(project_id="proj_graph")
+
+    low = scheduler.add_workitem(run.id, role="module-dev", module_key="auth", priority=5)
+    high = scheduler.add_workitem(run.id, role="module-dev", module_key="billing", priority=1)
+    join = scheduler.add_workitem(
+        run.id,
+        role="integration-test",
+        module_key="integration",
+        depends_on=[low.id, high.id],
+    )
+
+    assert scheduler.list_ready_workitems(run.id) == []
+    assert [item.id for item in scheduler.tick(run.id)] == [high.id, low.id]
+    assert [item.id for item in scheduler.list_ready_workitems(run.id)] == [high.id, low.id]
+    assert scheduler.peek_ready_workitem(run.id).id == high.id
+    assert [item.id for item in scheduler.list_dependent_workitems(low.id)] == [join.id]
+
+    scheduler.start_workitem(high.id)
+    assert [item.id for item in scheduler.list_ready_workitems(run.id)] == [low.id]
+    scheduler.complete_workitem(high.id, success=True)
+    scheduler.mark_workitem_skipped(low.id, reason="not needed")
+    assert scheduler.list_ready_workitems(run.id) == []
+
+    late = scheduler.add_workitem(run.id, role="module-dev", module_key="late")
+    scheduler.update_workitem_dependencies(join.id, [high.id, late.id])
+    assert scheduler.list_dependent_workitems(low.id) == []
+    assert [item.id for item in scheduler.tick(run.id)] == [late.id]
+
+    scheduler.start_workitem(late.id)
+    scheduler.complete_workitem(late.id, success=True)
+    assert [item.id for item in scheduler.tick(run.id)] == [join.id]
+    assert scheduler.peek_ready_workitem(run.id).id == join.id
+
+
+def test_incremental_status_counters_match_full_scan() -> None:
+    def full_scan(target: WorkflowScheduler) -> dict[str, object]:
+        return build_scheduler_metrics(
+            runs=target._runs,
+            workitems=target._workitems,
+            gate_checks=target._gate_checks,
+            artifacts=target._artifacts,
+        )
+
+    scheduler = WorkflowScheduler()
+    done = scheduler.create_run(project_id="proj_counters")
+    first = scheduler.add_workitem(done.id, role="module-dev", module_key="auth")
+    second = scheduler.add_workitem(done.id, role="module-dev", depends_on=[first.id])
+    scheduler.tick(done.id)
+    scheduler.start_workitem(first.id)
+    scheduler.complete_workitem(first.id, success=True)
+    scheduler.create_gate_check(
+        first.id,
+        gate_type=GateType.TEST,
+        passed=False,
+        summary="flaky",
+        executed_by="qa",
+    )
+    scheduler.create_artifact(
+        first.id,
+        artifact_type=ArtifactType.ACCEPTANCE_REPORT,
+        title="report",
+        uri_or_path="artifacts/report.md",
+        created_by="qa",
+    )
+    assert scheduler.count_workitems_by_status(done.id, WorkItemStatus.PENDING) == 1
+    scheduler.tick(done.id)
+    scheduler.start_workitem(second.id)
+    scheduler.complete_workitem(second.id, success=True)
+    assert scheduler.get_run(done.id).status == WorkflowRunStatus.SUCCEEDED
+    assert scheduler.count_workitems_by_status(done.id, WorkItemStatus.SUCCEEDED) == 2
+
+    waiting = scheduler.create_run(project_id="proj_counters")
+    scheduler.add_workitem(waiting.id, role="release", requires_approval=True)
+    scheduler.tick(waiting.id)
+    assert scheduler.get_run(waiting.id).status == WorkflowRunStatus.WAITING_APPROVAL
+
+    canceled = scheduler.create_run(project_id="proj_counters")
+    scheduler.add_workitem(canceled.id, role="module-dev")
+    scheduler.interrupt_run(canceled.id, reason="stop")
+
+    metrics = scheduler.get_metrics()
+    assert metrics == full_scan(scheduler)
+    assert metrics["run_status_counts"] == {
+        "succeeded": 1,
+        "waiting_approval": 1,
+        "canceled": 1,
+    }
+    assert metrics["workitem_status_counts"] == {
+        "succeeded": 2,
+        "waiting_approval": 1,
+        "skipped": 1,
+    }
+
+    evict_run(scheduler, done.id)
+    assert scheduler.get_metrics() == full_scan(scheduler)
+    assert scheduler.get_metrics()["total_gate_checks"] == 0
@@ -1,5 +1,8 @@
+from datetime import timedelta
 from pathlib import Path
 
+import pytest
+
 from control_center.models import (
     ArtifactType,
     DiscussionStatus,
@@ -7,7 +10,9 @@ from control_center.models import (
     WorkItemStatus,
     WorkflowRunStatus,
 )
+from control_center.models.hierarchy import now_utc
 from control_center.services import SQLiteStateStore, WorkflowScheduler
+from control_center.services.workflow_run_archive import WorkflowRunArchive
 
 
 def _build_scheduler(db_path: Path) -> WorkflowScheduler:
@@ -113,3 +118,142 @@ def test_scheduler_restores_v3_entities_after_restart(tmp_path: Path) -> None:
     assert metrics["total_gate_checks"] == 2
     assert metrics["total_artifacts"] == 2
     assert metrics["run_status_counts"]["succeeded"] == 1
+
+
+def _complete_single_item_run(scheduler: WorkflowScheduler, project_id: str) -> str:
+    run = scheduler.create_run(project_id=project_id)
+    item = scheduler.add_workitem(run.id, role="module-dev", module_key="core")
+    scheduler.tick(run.id)
+    scheduler.start_workitem(item.id)
+    scheduler.complete_workitem(item.id, success=True)
+    scheduler.create_artifact(
+        item.id,
+        artifact_type=ArtifactType.TEST_REPORT,
+        title="report",
+        uri_or_path=f"artifacts/{run.id}/report.md",
+        created_by="qa-test",
+    )
+    return run.id
+
+
+def test_lazy_scheduler_hydrates_terminal_runs_on_demand(tmp_path: Path) -> None:
+    db_path = tmp_path / "workflow-state.db"
+    scheduler = _build_scheduler(db_path)
+    terminal_ids = [_complete_single_item_run(scheduler, f"proj-{idx}") for idx in range(3)]
+    active = scheduler.create_run(project_id="proj-active")
+    pending = scheduler.add_workitem(active.id, role="module-dev", module_key="auth")
+
+    lazy = WorkflowScheduler(
+        state_store=SQLiteStateStore(str(db_path)),
+        hydration_mode="lazy",
+        terminal_run_cache_size=2,
+    )
+    assert lazy.hydration_mode == "lazy"
+    assert lazy.list_hydrated_run_ids() == [active.id]
+    assert lazy.get_workitem(pending.id).status == WorkItemStatus.PENDING
+
+    first_items = lazy.list_workitems(terminal_ids[0])
+    assert [item.status for item in first_items] == [WorkItemStatus.SUCCEEDED]
+    assert len(lazy.list_artifacts(terminal_ids[0])) == 1
+    assert lazy.get_run(terminal_ids[1]).status == WorkflowRunStatus.SUCCEEDED
+    assert lazy.get_run(terminal_ids[2]).status == WorkflowRunStatus.SUCCEEDED
+    assert set(lazy.list_hydrated_run_ids()) == {active.id, terminal_ids[1], terminal_ids[2]}
+
+    evicted_item_id = first_items[0].id
+    assert lazy.get_workitem(evicted_item_id).workflow_run_id == terminal_ids[0]
+    assert terminal_ids[0] in lazy.list_hydrated_run_ids()
+
+    metrics = lazy.get_metrics()
+    assert metrics["total_runs"] == 4
+    assert metrics["total_workitems"] == 4
+    assert metrics["total_artifacts"] == 3
+    assert metrics["run_status_counts"]["succeeded"] == 3
+
+    with pytest.raises(KeyError):
+        lazy.get_run("wfr_missing")
+
+
+def test_lazy_scheduler_evicts_runs_that_finish_while_resident(tmp_path: Path) -> None:
+    scheduler = WorkflowScheduler(
+        state_store=SQLiteStateStore(str(tmp_path / "workflow-state.db")),
+        hydration_mode="lazy",
+        terminal_run_cache_size=1,
+    )
+    active = scheduler.create_run(project_id="proj-active")
+    terminal_ids = [_complete_single_item_run(scheduler, f"proj-{idx}") for idx in range(3)]
+
+    assert set(scheduler.list_hydrated_run_ids()) == {active.id, terminal_ids[2]}
+    assert scheduler.get_run(terminal_ids[0]).status == WorkflowRunStatus.SUCCEEDED
+    assert set(scheduler.list_hydrated_run_ids()) == {active.id, terminal_ids[0]}
+    assert scheduler.get_metrics()["total_runs"] == 4
+
+
+def test_scheduler_archives_terminal_runs_and_reads_them_back(tmp_path: Path) -> None:
+    db_path = tmp_path / "workflow-state.db"
+    archive_path = tmp_path / "workflow-archive.db"
+    state_store = SQLiteStateStore(str(db_path))
+    scheduler = WorkflowScheduler(
+        state_store=state_store,
+        run_archive=WorkflowRunArchive(str(archive_path)),
+    )
+    terminal_ids = [_complete_single_item_run(scheduler, f"proj-{idx}") for idx in range(3)]
+    active = scheduler.create_run(project_id="proj-active")
+    scheduler.add_workitem(active.id, role="module-dev", module_key="auth")
+
+    assert scheduler.archive_terminal_runs(retention_seconds=3600) == []
+    archived = scheduler.archive_terminal_runs(
+        retention_seconds=3600,
+        limit=2,
+        now=now_utc() + timedelta(hours=2),
+    )
+    assert archived == terminal_ids[:2]
+    assert state_store.count("workflow_run") == 2
+    assert state_store.count("workitem") == 2
+    assert state_store.count("artifact") == 1
+    assert scheduler.get_metrics()["total_runs"] == 2
+    before_readback = scheduler.get_metrics()
+    assert scheduler.get_run(terminal_ids[0]).status == WorkflowRunStatus.SUCCEEDED
+    assert scheduler.get_metrics() == before_readback
+    assert (
+        scheduler.count_workitems_by_status(terminal_ids[0], WorkItemStatus.SUCCEEDED) == 1
+    )
+    archived_item = scheduler.list_workitems(terminal_ids[0])[0]
+    read_only_mutations = [
+        lambda: scheduler.add_workitem(terminal_ids[0], role="module-dev", module_key="late"),
+        lambda: scheduler.persist_run(terminal_ids[0]),
+        lambda: scheduler.tick(terminal_ids[0]),
+        lambda: scheduler.mark_workitem_skipped(archived_item.id, reason="late"),
+        lambda: scheduler.create_artifact(
+            archived_item.id,
+            artifact_type=ArtifactType.TEST_REPORT,
+            title="late",
+            uri_or_path="artifacts/late.md",
+            created_by="qa-test",
+        ),
+    ]
+    for mutation in read_only_mutations:
+        with pytest.raises(ValueError, match="archived and read-only"):
+            mutation()
+    assert state_store.count("workflow_run") == 2
+    assert state_store.count("workitem") == 2
+    assert scheduler.get_metrics() == before_readback
+    state_store.vacuum()
+
+    restored = WorkflowScheduler(
+        state_store=SQLiteStateStore(str(db_path)),
+        run_archive=WorkflowRunArchive(str(archive_path)),
+    )
+    assert set(restored.list_hydrated_run_ids()) == {terminal_ids[2], active.id}
+    archived_run = restored.get_run(terminal_ids[0])
+    assert archived_run.status == WorkflowRunStatus.SUCCEEDED
+    archived_items = restored.list_workitems(terminal_ids[0])
+    assert [item.status for item in archived_items] == [WorkItemStatus.SUCCEEDED]
+    assert len(restored.list_artifacts(terminal_ids[0])) == 1
+    assert restored.archive_terminal_runs(
+        retention_seconds=0,
+        now=now_utc() + timedelta(hours=2),
+    ) == [terminal_ids[2]]
+    assert restored.run_archive.stats()["runs"] == 3
+
+    with pytest.raises(RuntimeError):
+        WorkflowScheduler().archive_terminal_runs(retention_seconds=0)